@@ -0,0 +1,53 @@
+"""
+avm — in-process execution of AlgoLegacy's TEAL programs
+=========================================================
+A small Algorand Virtual Machine and in-memory ledger, so the contract can
+be exercised without a running algod: no network, no block waits, and a
+`latest_timestamp` that tests move forward explicitly.
+
+    from avm import AppClient, Ledger
+    from contracts.algolegacy import app
+
+    ledger = Ledger()
+    owner  = ledger.new_account(10_000_000)
+    client = AppClient(ledger, app, sender=owner)
+    client.create()
+    ledger.advance(3600)        # one hour passes, instantly
+
+`assemble(teal)` turns the same TEAL into deployable bytecode, offline, and
+`AlgodStandIn(ledger)` serves a ledger over algod's HTTP API for tooling
+that talks to a node through algosdk.
+"""
+
+from .algod import AlgodStandIn
+from .assembler import AssemblerError, assemble
+from .client import AppClient, CallResult
+from .ledger import (
+    AppCall,
+    AssetCreate,
+    AssetTransfer,
+    Ledger,
+    LedgerError,
+    LogicError,
+    Payment,
+    TxnResult,
+)
+from .program import Program, TealParseError
+
+__all__ = [
+    "AlgodStandIn",
+    "AppCall",
+    "AppClient",
+    "AssemblerError",
+    "AssetCreate",
+    "AssetTransfer",
+    "CallResult",
+    "Ledger",
+    "LedgerError",
+    "LogicError",
+    "Payment",
+    "Program",
+    "TealParseError",
+    "TxnResult",
+    "assemble",
+]
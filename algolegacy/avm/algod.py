@@ -0,0 +1,450 @@
+"""
+algod.py — an algod stand-in serving an in-memory Ledger over HTTP
+===================================================================
+Lets tooling that talks to algod through algosdk (deploy scripts, batch
+submitters, confirmation waiters) run end to end against `avm.Ledger`:
+
+    ledger = Ledger()
+    with AlgodStandIn(ledger, programs=[spec.approval_program, spec.clear_program]) as node:
+        algod = AlgodClient("", node.url)
+        ...
+
+Endpoints (the subset algosdk's deploy path uses):
+    GET  /v2/transactions/params
+    POST /v2/transactions                     a signed group, msgpack
+    POST /v2/transactions/simulate            one group, evaluated and discarded
+    GET  /v2/transactions/pending/{txid}
+    GET  /v2/blocks/{round}                   JSON or msgpack: txns, apply data, state deltas
+    GET  /v2/blocks/{round}/txids
+    GET  /v2/status
+    GET  /v2/status/wait-for-block-after/{round}
+    GET  /v2/accounts/{address}
+    GET  /v2/applications/{app-id}
+    GET  /v2/applications/{app-id}/box?name=b64:...
+    GET  /v2/applications/{app-id}/boxes?prefix=b64:...&max=N&next=...
+
+Submitted groups are evaluated at once, and rejected with HTTP 400 as
+algod would.  Confirmation is per block: with `block_time=0` every group
+gets a block of its own; otherwise blocks close every `block_time`
+seconds of wall-clock and a group is confirmed in the next one, so
+callers pay the same round waits as on a live network.
+
+A block's timestamp is the ledger's `timestamp` when its last group was
+submitted, so tests move chain time with `ledger.advance`.  Signatures
+are not checked.  Application bytecode is mapped back to TEAL
+through `programs`, the sources the stand-in may be asked to create.
+"""
+
+import base64
+import json
+import socket
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterable
+
+import msgpack
+from algosdk import encoding, transaction
+
+from .assembler import assemble
+from .ledger import AppCall, AssetTransfer, Ledger, Payment, Transaction, TxnResult
+from .program import Program
+
+GENESIS_ID   = "avm-standin"
+GENESIS_HASH = base64.b64encode(bytes(32)).decode()
+WAIT_TIMEOUT = 5.0        # seconds wait-for-block-after holds a request open
+
+
+class AlgodStandIn:
+    """An HTTP server on 127.0.0.1 answering algod requests from `ledger`."""
+
+    def __init__(
+        self, ledger: Ledger, programs: Iterable[str] = (), *, block_time: float = 0.0,
+    ):
+        self.ledger     = ledger
+        self.block_time = block_time
+        parsed          = [Program(teal) for teal in programs]       # parsed once, not per create
+        self.programs   = {assemble(program): program for program in parsed}
+        self._bytecode  = {program: code for code, program in self.programs.items()}
+        self.submitted  = 0                                  # groups accepted
+        self.simulated  = 0                                  # simulate requests answered
+        self.requests   = 0                                  # HTTP requests served
+        self._lock      = threading.Condition()                 # notified on every new block
+        self._pending: dict[str, tuple[int, TxnResult]] = {} # txid -> (round, result)
+        self._blocks: dict[int, list[str]] = {}              # round -> txids, in order
+        self._block_ts: dict[int, int] = {}                  # round -> block timestamp
+        self._round     = 0
+        self._started   = time.monotonic()
+        self._server    = ThreadingHTTPServer(("127.0.0.1", 0), _handler(self))
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def start(self) -> "AlgodStandIn":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "AlgodStandIn":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    # ── Rounds ───────────────────────────────────────────────────────────────
+    def last_round(self) -> int:
+        if self.block_time:
+            return int((time.monotonic() - self._started) / self.block_time)
+        return self._round
+
+    def wait_for_block_after(self, rnd: int, timeout: float = WAIT_TIMEOUT) -> int:
+        """Block until round `rnd + 1` exists, or `timeout` seconds pass (as algod)."""
+        if self.block_time:
+            time.sleep(min(timeout, max(0.0, self._started + (rnd + 1) * self.block_time - time.monotonic())))
+        else:
+            with self._lock:
+                self._lock.wait_for(lambda: self._round > rnd, timeout)
+        return self.last_round()
+
+    # ── Transactions ─────────────────────────────────────────────────────────
+    def submit(self, raw: bytes) -> str:
+        """Evaluate one signed group; returns the first txid (raises on rejection)."""
+        unpacker = msgpack.Unpacker(raw=False)
+        unpacker.feed(raw)
+        signed = [encoding.msgpack_decode(obj) for obj in unpacker]
+        txns = [self._to_avm(stxn.transaction) for stxn in signed]
+        with self._lock:
+            results = self.ledger.send(txns)
+            if self.block_time:
+                confirmed = self.last_round() + 1
+            else:
+                self._round += 1
+                confirmed = self._round
+            for stxn, result in zip(signed, results):
+                self._pending[stxn.get_txid()] = (confirmed, result)
+                self._blocks.setdefault(confirmed, []).append(stxn.get_txid())
+            self._block_ts[confirmed] = self.ledger.timestamp
+            self.submitted += 1
+            self._lock.notify_all()
+        return signed[0].get_txid()
+
+    def simulate(self, raw: bytes) -> dict:
+        """
+        `/v2/transactions/simulate` for a request of one group (as algod
+        accepts).  Signatures may be empty; `allow-unnamed-resources` is
+        honoured for boxes.  A rejected group reports `failure-message`.
+        """
+        request = msgpack.unpackb(raw, raw=False)
+        groups  = request.get("txn-groups", [])
+        if len(groups) != 1:
+            raise ValueError(f"expected 1 transaction group, got {len(groups)}")
+        decoded = [encoding.msgpack_decode(obj) for obj in groups[0]["txns"]]
+        txns    = [getattr(stxn, "transaction", stxn) for stxn in decoded]
+        unnamed = bool(request.get("allow-unnamed-resources"))
+        group: dict = {"txn-results": []}
+        with self._lock:
+            try:
+                results = self.ledger.simulate([self._to_avm(txn) for txn in txns], allow_unnamed_resources=unnamed)
+            except Exception as exc:
+                group["failure-message"] = str(exc)
+            else:
+                group["txn-results"] = [
+                    {"txn-result": {"pool-error": "", "logs": [base64.b64encode(log).decode() for log in r.logs]},
+                     "app-budget-consumed": r.cost}
+                    for r in results
+                ]
+            self.simulated += 1
+        return {
+            "version": 2, "last-round": self.last_round(), "txn-groups": [group],
+            "eval-overrides": {"allow-unnamed-resources": True} if unnamed else {},
+        }
+
+    def pending(self, txid: str) -> dict | None:
+        with self._lock:
+            entry = self._pending.get(txid)
+        if entry is None:
+            return None
+        confirmed, result = entry
+        info: dict = {
+            "confirmed-round": confirmed if confirmed <= self.last_round() else 0,
+            "pool-error": "",
+        }
+        if confirmed > self.last_round():
+            return info
+        if result.application_index is not None:
+            info["application-index"] = result.application_index
+        if result.asset_index is not None:
+            info["asset-index"] = result.asset_index
+        if result.logs:
+            info["logs"] = [base64.b64encode(log).decode() for log in result.logs]
+        return info
+
+    def block_txids(self, rnd: int) -> list[str] | None:
+        """Txids confirmed in round `rnd`, or None if it has not closed yet."""
+        if rnd > self.last_round():
+            return None
+        with self._lock:
+            return list(self._blocks.get(rnd, []))
+
+    def block(self, rnd: int, *, msgpack_format: bool = False) -> dict | None:
+        """
+        Round `rnd` in algod's block shape: header, then per transaction its
+        `txn` fields (with the programs of an app create or update), created
+        `apid`, and `dt` (global-state delta, inner txns).  With `msgpack_format`, byte fields stay bytes (as algod's
+        msgpack encoding); otherwise addresses and bytes are JSON strings.
+        """
+        if rnd > self.last_round():
+            return None
+        with self._lock:
+            results = [self._pending[txid][1] for txid in self._blocks.get(rnd, [])]
+            ts      = self._block_ts.get(rnd, self.ledger.timestamp)
+        txns = [_in_block(result, msgpack_format, self._bytecode) for result in results]
+        return {"block": {"rnd": rnd, "ts": ts, "txns": txns}}
+
+    def application(self, app_id: int) -> dict | None:
+        """`/v2/applications/{id}`: creator, programs and global state."""
+        with self._lock:
+            app = self.ledger.apps.get(app_id)
+            if app is None:
+                return None
+            state = dict(app.global_state)
+        return {"id": app_id, "params": {
+            "creator": app.creator,
+            "approval-program": base64.b64encode(self._bytecode.get(app.approval, b"")).decode(),
+            "clear-state-program": base64.b64encode(self._bytecode.get(app.clear, b"")).decode(),
+            "global-state": [
+                {"key": base64.b64encode(key).decode(),
+                 "value": {"type": 1, "bytes": base64.b64encode(value).decode(), "uint": 0}
+                 if isinstance(value, bytes) else {"type": 2, "bytes": "", "uint": value}}
+                for key, value in state.items()
+            ],
+        }}
+
+    def box(self, app_id: int, name: bytes) -> dict | None:
+        """`/v2/applications/{id}/box`: one box value."""
+        with self._lock:
+            app   = self.ledger.apps.get(app_id)
+            value = app.boxes.get(name) if app else None
+        if value is None:
+            return None
+        return {"name": base64.b64encode(name).decode(), "round": self.last_round(),
+                "value": base64.b64encode(value).decode()}
+
+    def boxes(self, app_id: int, prefix: bytes = b"", limit: int = 0, after: bytes | None = None) -> dict | None:
+        """
+        `/v2/applications/{id}/boxes`: the app's box names starting with
+        `prefix`, in name order from `after` on.  With `limit`, at most that
+        many, and `next-token` names where the next page starts (as algod).
+        """
+        with self._lock:
+            app = self.ledger.apps.get(app_id)
+            if app is None:
+                return None
+            names = sorted(name for name in app.boxes if name.startswith(prefix))
+        if after is not None:
+            names = [name for name in names if name >= after]
+        page: dict = {"round": self.last_round()}
+        if limit and len(names) > limit:
+            page["next-token"] = "b64:" + base64.b64encode(names[limit]).decode()
+            names = names[:limit]
+        page["boxes"] = [{"name": base64.b64encode(name).decode()} for name in names]
+        return page
+
+    def _to_avm(self, txn: transaction.Transaction) -> Transaction:
+        note = txn.note or b""
+        if isinstance(txn, transaction.PaymentTxn):
+            return Payment(
+                sender=txn.sender, receiver=txn.receiver, amount=txn.amt, fee=txn.fee,
+                close_remainder_to=txn.close_remainder_to, note=note,
+            )
+        if isinstance(txn, transaction.ApplicationCallTxn):
+            apps = [txn.index] + list(txn.foreign_apps or [])
+            gs, ls = txn.global_schema, txn.local_schema
+            return AppCall(
+                sender=txn.sender,
+                app_id=txn.index,
+                on_complete=int(txn.on_complete),
+                args=list(txn.app_args or []),
+                accounts=list(txn.accounts or []),
+                foreign_apps=list(txn.foreign_apps or []),
+                foreign_assets=list(txn.foreign_assets or []),
+                boxes=[(apps[b.app_index] if b.app_index else 0, b.name) for b in txn.boxes or []],
+                approval_program=self._teal(txn.approval_program),
+                clear_program=self._teal(txn.clear_program),
+                global_schema=(gs.num_uints, gs.num_byte_slices) if gs else (0, 0),
+                local_schema=(ls.num_uints, ls.num_byte_slices) if ls else (0, 0),
+                extra_pages=txn.extra_pages or 0,
+                fee=txn.fee,
+                note=note,
+            )
+        raise ValueError(f"transaction type {txn.type!r} is not supported by the stand-in")
+
+    def _teal(self, bytecode: bytes | None) -> Program | None:
+        if not bytecode:
+            return None
+        try:
+            return self.programs[bytecode]
+        except KeyError:
+            raise ValueError("unknown program bytecode (pass its TEAL in `programs`)") from None
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Block encoding
+# ─────────────────────────────────────────────────────────────────────────────
+def _in_block(result: TxnResult, raw: bool, bytecode: dict[Program, bytes]) -> dict:
+    """One evaluated transaction as a block entry (SignedTxnInBlock fields)."""
+    address = (lambda a: encoding.decode_address(a)) if raw else (lambda a: a)
+    blob    = (lambda b: b) if raw else (lambda b: base64.b64encode(b).decode())
+    txn     = result.txn
+    fields: dict = {"type": txn.type, "snd": address(txn.sender)}
+    if isinstance(txn, Payment):
+        fields.update(rcv=address(txn.receiver), amt=txn.amount)
+    elif isinstance(txn, AssetTransfer):
+        fields.update(arcv=address(txn.receiver), aamt=txn.amount, xaid=txn.asset_id)
+    elif isinstance(txn, AppCall):
+        if txn.app_id:
+            fields["apid"] = txn.app_id
+        if txn.on_complete:
+            fields["apan"] = txn.on_complete
+        if txn.args:
+            fields["apaa"] = [blob(arg) for arg in txn.args]
+        if txn.approval_program is not None:
+            fields["apap"] = blob(bytecode[txn.approval_program])
+            fields["apsu"] = blob(bytecode[txn.clear_program])
+    entry: dict = {"txn": fields}
+    if result.application_index is not None:
+        entry["apid"] = result.application_index
+    delta: dict = {}
+    if result.global_delta:
+        # Keys and "bs" are Go strings in algod's encoding: raw bytes, not base64
+        delta["gd"] = {
+            key.decode("utf-8", "surrogateescape"):
+                {"at": 3} if value is None else
+                {"at": 1, "bs": value.decode("utf-8", "surrogateescape") if raw else blob(value)}
+                if isinstance(value, bytes) else
+                {"at": 2, "ui": value}
+            for key, value in result.global_delta.items()
+        }
+    if result.inner_txns:
+        delta["itx"] = [_in_block(inner, raw, bytecode) for inner in result.inner_txns]
+    if delta:
+        entry["dt"] = delta
+    return entry
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# HTTP
+# ─────────────────────────────────────────────────────────────────────────────
+def _handler(node: AlgodStandIn) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            super().setup()
+            # Headers and body go out as two writes; without this, Nagle plus
+            # delayed ACKs add ~40 ms to every keep-alive response
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        def do_GET(self):
+            node.requests += 1
+            path = self.path.split("?")[0]
+            if path == "/v2/transactions/params":
+                return self._json(200, {
+                    "consensus-version": "future", "fee": 0, "min-fee": 1000,
+                    "genesis-id": GENESIS_ID, "genesis-hash": GENESIS_HASH,
+                    "last-round": node.last_round(),
+                })
+            if path.startswith("/v2/transactions/pending/"):
+                info = node.pending(path.rsplit("/", 1)[1])
+                if info is None:
+                    return self._json(404, {"message": "txn does not exist"})
+                return self._json(200, info)
+            if path.startswith("/v2/blocks/") and path.count("/") == 3:
+                packed = "format=msgpack" in self.path
+                block  = node.block(int(path.split("/")[3]), msgpack_format=packed)
+                if block is None:
+                    return self._json(404, {"message": "failed to retrieve information from the ledger"})
+                if packed:
+                    return self._send(200, "application/msgpack", msgpack.packb(block, unicode_errors="surrogateescape"))
+                return self._json(200, block)
+            if path.startswith("/v2/applications/") and path.endswith("/box"):
+                query = urllib.parse.parse_qs(urllib.parse.urlsplit(self.path).query)
+                name  = query.get("name", [""])[0]
+                box   = node.box(int(path.split("/")[3]), base64.b64decode(name.removeprefix("b64:")))
+                if box is None:
+                    return self._json(404, {"message": "box not found"})
+                return self._json(200, box)
+            if path.startswith("/v2/applications/") and path.endswith("/boxes"):
+                query = urllib.parse.parse_qs(urllib.parse.urlsplit(self.path).query)
+                after = query.get("next", [None])[0]
+                boxes = node.boxes(
+                    int(path.split("/")[3]),
+                    prefix=base64.b64decode(query.get("prefix", [""])[0].removeprefix("b64:")),
+                    limit=int(query.get("max", ["0"])[0]),
+                    after=None if after is None else base64.b64decode(after.removeprefix("b64:")),
+                )
+                if boxes is None:
+                    return self._json(404, {"message": "application does not exist"})
+                return self._json(200, boxes)
+            if path.startswith("/v2/applications/"):
+                app = node.application(int(path.rsplit("/", 1)[1]))
+                if app is None:
+                    return self._json(404, {"message": "application does not exist"})
+                return self._json(200, app)
+            if path.startswith("/v2/blocks/") and path.endswith("/txids"):
+                txids = node.block_txids(int(path.split("/")[3]))
+                if txids is None:
+                    return self._json(404, {"message": "failed to retrieve information from the ledger"})
+                return self._json(200, {"blockTxids": txids})
+            if path == "/v2/status":
+                return self._json(200, {"last-round": node.last_round()})
+            if path.startswith("/v2/status/wait-for-block-after/"):
+                rnd = node.wait_for_block_after(int(path.rsplit("/", 1)[1]))
+                return self._json(200, {"last-round": rnd})
+            if path.startswith("/v2/accounts/"):
+                address = path.rsplit("/", 1)[1]
+                return self._json(200, {
+                    "address": address,
+                    "amount": node.ledger.balance(address),
+                    "min-balance": node.ledger.min_balance(address),
+                })
+            return self._json(404, {"message": f"{path} is not served by the stand-in"})
+
+        def do_POST(self):
+            node.requests += 1
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            if self.path.split("?")[0] == "/v2/transactions/simulate":
+                try:
+                    return self._json(200, node.simulate(body))
+                except ValueError as exc:
+                    return self._json(400, {"message": str(exc)})
+            if self.path.split("?")[0] != "/v2/transactions":
+                return self._json(404, {"message": f"{self.path} is not served by the stand-in"})
+            try:
+                txid = node.submit(body)
+            except Exception as exc:              # rejected, as algod's transaction pool would
+                return self._json(400, {"message": f"TransactionPool.Remember: {exc}"})
+            return self._json(200, {"txId": txid})
+
+        def _json(self, status: int, payload: dict) -> None:
+            self._send(status, "application/json", json.dumps(payload).encode())
+
+        def _send(self, status: int, content_type: str, body: bytes) -> None:
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
@@ -0,0 +1,126 @@
+"""
+assembler.py — TEAL source to AVM bytecode, offline
+====================================================
+Encodes a parsed `Program` with the opcode and immediate layouts in
+opcodes.py, producing the same bytes as algod's `/v2/teal/compile` for
+the programs PyTEAL emits, so deploys need no compile endpoint:
+
+    from avm import assemble
+    approval = assemble(spec.approval_program)
+
+Encoding (as go-algorand's assembler):
+    header      varuint program version
+    branches    signed 16-bit offset from the end of the instruction
+    switch      uint8 count, then one 16-bit offset per label, all
+                relative to the end of the whole instruction
+
+PyTEAL emits its own `intcblock` / `bytecblock` and `intc_N` / `bytec_N`
+references.  The `int` / `byte` / `addr` / `method` pseudo-ops are
+rejected: algod lays those out in constant blocks of its own choosing,
+which this assembler does not reproduce.
+"""
+
+from .opcodes import FIELD_TABLES, OPS
+from .program import Program, TealParseError, _tokenize
+
+PSEUDO_OPS = frozenset({"int", "byte", "addr", "method"})
+
+
+class AssemblerError(TealParseError):
+    """Raised when a program cannot be assembled byte-for-byte like algod."""
+
+
+def assemble(source: str | Program) -> bytes:
+    """Bytecode for TEAL `source` (text or an already parsed `Program`)."""
+    program = source if isinstance(source, Program) else Program(source)
+    for ins in program.instructions:
+        head = [t for t in _tokenize(ins.text) if not t.endswith(":")][:1]
+        if head and head[0] in PSEUDO_OPS:
+            raise AssemblerError(
+                f"line {ins.line}: pseudo-op {head[0]!r} is not supported; "
+                "assemble constants into intcblock / bytecblock (PyTEAL does by default)"
+            )
+
+    # Every immediate has a fixed width once parsed, so one pass sizes the program
+    pcs  = [0]
+    for ins in program.instructions:
+        pcs.append(pcs[-1] + _size(ins.op, ins.args))
+
+    out = bytearray(_uvarint(program.version))
+    for index, ins in enumerate(program.instructions):
+        out += _encode(ins.op, ins.args, end=pcs[index + 1], pcs=pcs, line=ins.line)
+    return bytes(out)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Encoding
+# ─────────────────────────────────────────────────────────────────────────────
+def _size(op: str, args: tuple) -> int:
+    size = 1
+    for kind, arg in zip(OPS[op].immediates, args):
+        if kind == "varuint":
+            size += len(_uvarint(arg))
+        elif kind == "bytes":
+            size += len(_uvarint(len(arg))) + len(arg)
+        elif kind == "varuints":
+            size += len(_uvarint(len(arg))) + sum(len(_uvarint(v)) for v in arg)
+        elif kind == "byteses":
+            size += len(_uvarint(len(arg))) + sum(len(_uvarint(len(b))) + len(b) for b in arg)
+        elif kind == "label":
+            size += 2
+        elif kind == "labels":
+            size += 1 + 2 * len(arg)
+        else:  # uint8 / int8 / named field
+            size += 1
+    return size
+
+
+def _encode(op: str, args: tuple, *, end: int, pcs: list[int], line: int) -> bytes:
+    spec = OPS[op]
+    out  = bytearray([spec.code])
+    for kind, arg in zip(spec.immediates, args):
+        if kind == "varuint":
+            out += _uvarint(arg)
+        elif kind == "bytes":
+            out += _uvarint(len(arg)) + arg
+        elif kind == "varuints":
+            out += _uvarint(len(arg))
+            for value in arg:
+                out += _uvarint(value)
+        elif kind == "byteses":
+            out += _uvarint(len(arg))
+            for value in arg:
+                out += _uvarint(len(value)) + value
+        elif kind == "label":
+            out += _offset(pcs[arg] - end, line)
+        elif kind == "labels":
+            if len(arg) > 255:
+                raise AssemblerError(f"line {line}: {op} has more than 255 labels")
+            out.append(len(arg))
+            for target in arg:
+                out += _offset(pcs[target] - end, line)
+        elif kind in FIELD_TABLES:
+            out.append(FIELD_TABLES[kind].index(arg))
+        elif kind == "int8":
+            out.append(arg & 0xFF)
+        else:  # uint8
+            if not 0 <= arg <= 255:
+                raise AssemblerError(f"line {line}: {op} immediate {arg} out of range 0..255")
+            out.append(arg)
+    return bytes(out)
+
+
+def _offset(delta: int, line: int) -> bytes:
+    if not -0x8000 <= delta <= 0x7FFF:
+        raise AssemblerError(f"line {line}: branch offset {delta} does not fit in 16 bits")
+    return (delta & 0xFFFF).to_bytes(2, "big")
+
+
+def _uvarint(value: int) -> bytes:
+    """Unsigned LEB128, as Go's binary.PutUvarint."""
+    out = bytearray()
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
@@ -0,0 +1,252 @@
+"""
+client.py — ARC-4 application client for the in-memory ledger
+==============================================================
+Mirrors the parts of algokit's `ApplicationClient` the test-suite uses:
+`create()`, `call(method, **kwargs)`, `prepare(sender=...)` and
+`get_global_state()`, but submits to an `avm.Ledger` instead of algod.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from algosdk import abi
+
+from .ledger import MIN_TXN_FEE, AppCall, AssetTransfer, Ledger, Payment, TxnResult
+from .program import Program
+
+ABI_RETURN_PREFIX = bytes.fromhex("151f7c75")
+_TXN_ARG_TYPES    = {"txn", "pay", "keyreg", "acfg", "axfer", "afrz", "appl"}
+
+
+@dataclass
+class CallResult:
+    return_value: Any
+    tx_id:        str
+    tx_info:      TxnResult
+    results:      list[TxnResult] = field(default_factory=list)
+
+    @property
+    def cost(self) -> int:
+        return self.tx_info.cost
+
+
+class AppClient:
+    """Calls an ARC-4 application deployed on an in-memory `Ledger`."""
+
+    def __init__(self, ledger: Ledger, app_spec, *, sender: str, app_id: int = 0):
+        if hasattr(app_spec, "build"):           # a beaker Application
+            app_spec = app_spec.build()
+        self.ledger   = ledger
+        self.app_spec = app_spec
+        self.sender   = sender
+        self.app_id   = app_id
+        self.methods  = {m.name: m for m in app_spec.contract.methods}
+        self._approval = _program_cache(app_spec.approval_program)
+        self._clear    = _program_cache(app_spec.clear_program)
+
+    @property
+    def app_address(self) -> str:
+        return self.ledger.app_address(self.app_id)
+
+    def prepare(self, *, sender: str) -> "AppClient":
+        """Return a client for the same app that signs as `sender`."""
+        return AppClient(self.ledger, self.app_spec, sender=sender, app_id=self.app_id)
+
+    # ── Lifecycle ────────────────────────────────────────────────────────────
+    def create(
+        self,
+        method: str | None = None,
+        *,
+        global_schema: tuple[int, int] | None = None,
+        extra_pages: int = 0,
+        fee: int = MIN_TXN_FEE,
+        sender: str | None = None,
+        **kwargs,
+    ) -> CallResult:
+        """Create the app, bare or as an ABI call to `method` (if it allows CREATE)."""
+        txns, call_txn = self.compose_create(
+            method, global_schema=global_schema, extra_pages=extra_pages,
+            fee=fee, sender=sender, **kwargs,
+        )
+        results = self.ledger.send(txns)
+        index   = txns.index(call_txn)
+        self.app_id = results[index].application_index
+        if method is None:
+            return CallResult(return_value=None, tx_id=results[index].txid,
+                              tx_info=results[index], results=results)
+        return self.result(method, results, index)
+
+    def compose_create(
+        self,
+        method: str | None = None,
+        *,
+        global_schema: tuple[int, int] | None = None,
+        extra_pages: int = 0,
+        fee: int = MIN_TXN_FEE,
+        sender: str | None = None,
+        **kwargs,
+    ) -> tuple[list, AppCall]:
+        """Build (without sending) the group that creates this app.
+
+        The schema defaults to the one declared in the app spec.
+        """
+        if method is None:
+            group, call_txn = [], AppCall(sender=sender or self.sender, app_id=0, fee=fee)
+            group.append(call_txn)
+        else:
+            group, call_txn = self.compose(method, fee=fee, sender=sender, **kwargs)
+            call_txn.app_id = 0
+        if global_schema is None:
+            schema = self.app_spec.global_state_schema
+            global_schema = (schema.num_uints or 0, schema.num_byte_slices or 0)
+        local = self.app_spec.local_state_schema
+        call_txn.approval_program = self._approval
+        call_txn.clear_program    = self._clear
+        call_txn.global_schema    = global_schema
+        call_txn.local_schema     = (local.num_uints or 0, local.num_byte_slices or 0)
+        call_txn.extra_pages      = extra_pages
+        return group, call_txn
+
+    # ── ABI calls ────────────────────────────────────────────────────────────
+    def call(
+        self,
+        method: str,
+        *,
+        fee: int = MIN_TXN_FEE,
+        boxes: list[tuple[int, bytes]] | None = None,
+        accounts: list[str] | None = None,
+        foreign_assets: list[int] | None = None,
+        foreign_apps: list[int] | None = None,
+        sender: str | None = None,
+        **kwargs,
+    ) -> CallResult:
+        """Call an ABI method.  Read-only methods are simulated, not committed."""
+        txns, call_txn = self.compose(
+            method, fee=fee, boxes=boxes, accounts=accounts,
+            foreign_assets=foreign_assets, foreign_apps=foreign_apps, sender=sender, **kwargs,
+        )
+        if self._is_read_only(method):
+            results = self.ledger.simulate(txns)
+        else:
+            results = self.ledger.send(txns)
+        return self.result(method, results, txns.index(call_txn))
+
+    def compose(
+        self,
+        method: str,
+        *,
+        fee: int = MIN_TXN_FEE,
+        boxes=None, accounts=None, foreign_assets=None, foreign_apps=None,
+        sender: str | None = None,
+        **kwargs,
+    ) -> tuple[list, AppCall]:
+        """Build (without sending) the transaction group for one ABI call."""
+        abi_method = self.methods.get(method)
+        if abi_method is None:
+            raise KeyError(f"unknown method {method!r}; known: {sorted(self.methods)}")
+        accounts       = list(accounts or [])
+        foreign_assets = list(foreign_assets or [])
+        foreign_apps   = list(foreign_apps or [])
+        group: list     = []
+        encoded: list   = []
+        types: list     = []
+
+        for arg in abi_method.args:
+            if arg.name not in kwargs:
+                raise TypeError(f"{method}: missing argument {arg.name!r}")
+            value = kwargs.pop(arg.name)
+            if str(arg.type) in _TXN_ARG_TYPES:
+                group.append(value)
+            elif arg.type == "account":
+                if value not in accounts:
+                    accounts.append(value)
+                encoded.append(accounts.index(value) + 1)
+                types.append(abi.UintType(8))
+            elif arg.type == "asset":
+                if value not in foreign_assets:
+                    foreign_assets.append(value)
+                encoded.append(foreign_assets.index(value))
+                types.append(abi.UintType(8))
+            elif arg.type == "application":
+                if value not in foreign_apps:
+                    foreign_apps.append(value)
+                encoded.append(foreign_apps.index(value) + 1)
+                types.append(abi.UintType(8))
+            else:
+                encoded.append(value)
+                types.append(arg.type)
+        if kwargs:
+            raise TypeError(f"{method}: unexpected arguments {sorted(kwargs)}")
+
+        app_args = [abi_method.get_selector()]
+        if len(types) > 15:
+            # ARC-4: arguments beyond the 14th are packed into one tuple
+            head, tail = types[:14], types[14:]
+            app_args += [t.encode(v) for t, v in zip(head, encoded[:14])]
+            app_args.append(abi.TupleType(tail).encode(encoded[14:]))
+        else:
+            app_args += [t.encode(v) for t, v in zip(types, encoded)]
+
+        call_txn = AppCall(
+            sender=sender or self.sender, app_id=self.app_id, args=app_args,
+            accounts=accounts, foreign_assets=foreign_assets, foreign_apps=foreign_apps,
+            boxes=[(app_id, _name(name)) for app_id, name in (boxes or [])], fee=fee,
+        )
+        group.append(call_txn)
+        return group, call_txn
+
+    def _is_read_only(self, method: str) -> bool:
+        hints = getattr(self.app_spec, "hints", {}) or {}
+        sig   = self.methods[method].get_signature()
+        return bool(hints.get(sig) and hints[sig].read_only)
+
+    def result(self, method: str, results: list[TxnResult], index: int) -> CallResult:
+        """Decode the ABI return of `method` from `results[index]` (a sent group)."""
+        abi_method = self.methods[method]
+        info  = results[index]
+        value = None
+        if abi_method.returns.type != abi.Returns.VOID:
+            logs = [log for log in info.logs if log.startswith(ABI_RETURN_PREFIX)]
+            if not logs:
+                raise ValueError(f"{abi_method.name}: no ABI return value logged")
+            value = abi_method.returns.type.decode(logs[-1][len(ABI_RETURN_PREFIX):])
+        return CallResult(return_value=value, tx_id=info.txid, tx_info=info, results=results)
+
+    # ── State inspection ─────────────────────────────────────────────────────
+    def get_global_state(self) -> dict[str, int | bytes | str]:
+        """Global state with UTF-8 keys; byte values are decoded to str when printable."""
+        state = {}
+        for key, value in self.ledger.apps[self.app_id].global_state.items():
+            if isinstance(value, bytes):
+                try:
+                    value = value.decode()
+                except UnicodeDecodeError:
+                    pass
+            state[key.decode(errors="replace")] = value
+        return state
+
+    def get_box(self, name: bytes | str) -> bytes | None:
+        return self.ledger.apps[self.app_id].boxes.get(_name(name))
+
+    def pay(self, sender: str, amount: int, *, fee: int = MIN_TXN_FEE) -> Payment:
+        """A payment to this app's account, for `pay` ABI arguments."""
+        return Payment(sender=sender, receiver=self.app_address, amount=amount, fee=fee)
+
+    def asset_transfer(self, sender: str, asset_id: int, amount: int, *, fee: int = MIN_TXN_FEE) -> AssetTransfer:
+        """An asset transfer to this app's account, for `axfer` ABI arguments."""
+        return AssetTransfer(sender=sender, receiver=self.app_address, asset_id=asset_id, amount=amount, fee=fee)
+
+
+def _name(name: bytes | str) -> bytes:
+    return name.encode() if isinstance(name, str) else name
+
+
+_PROGRAMS: dict[str, Program] = {}
+
+
+def _program_cache(source: str) -> Program:
+    """Parse each distinct TEAL source once per process."""
+    program = _PROGRAMS.get(source)
+    if program is None:
+        program = _PROGRAMS[source] = Program(source)
+    return program
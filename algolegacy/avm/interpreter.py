@@ -0,0 +1,1438 @@
+"""
+interpreter.py — TEAL evaluator
+================================
+Executes a parsed approval / clear program for one application call.
+Each opcode is a small function; `_DISPATCH` maps opcode names to them.
+
+Values on the stack are Python `int` (uint64) or `bytes`.  Every opcode
+charges its cost against the group's pooled budget, so cost figures match
+what algod's simulate endpoint reports for the same call.
+"""
+
+import base64
+import hashlib
+from functools import lru_cache
+
+from algosdk import encoding
+
+from . import ledger as L
+from .ledger import LedgerError, LogicError, StackValue
+from .opcodes import OPS, TXN_ARRAY_FIELDS
+from .program import Program
+
+MAX_UINT64     = 2**64 - 1
+MAX_STACK      = 1_000
+MAX_BYTES_LEN  = 4_096
+MAX_LOG_CALLS  = 32
+MAX_LOG_BYTES  = 1_024
+MAX_KEY_LEN    = 64
+MAX_KV_LEN     = 128
+ZERO_ADDR      = bytes(32)
+
+
+@lru_cache(maxsize=4096)
+def addr_bytes(address: str) -> bytes:
+    return encoding.decode_address(address)
+
+
+@lru_cache(maxsize=4096)
+def addr_str(raw: bytes) -> str:
+    return encoding.encode_address(raw)
+
+
+class _Frame:
+    __slots__ = ("ret", "height", "args", "returns", "clear")
+
+    def __init__(self, ret: int, height: int):
+        self.ret, self.height = ret, height
+        self.args = self.returns = 0
+        self.clear = False
+
+
+class EvalContext:
+    """State for evaluating one program run (one outer or inner app call)."""
+
+    def __init__(self, group, txn, index: int, app, program: Program, result, touched: set, caller=None):
+        self.group    = group
+        self.ledger   = group.ledger
+        self.txn      = txn
+        self.index    = index
+        self.app      = app
+        self.program  = program
+        self.result   = result
+        self.touched  = touched
+        self.caller   = caller
+        self.stack:   list[StackValue] = []
+        self.scratch: list[StackValue] = [0] * 256
+        self.frames:  list[_Frame] = []
+        self.logs:    list[bytes] = []
+        self.log_bytes = 0
+        self.cost     = 0
+        self.pc       = 0
+        self.current  = 0
+        self.intc:    tuple = ()
+        self.bytec:   tuple = ()
+        self.building: list[dict] | None = None     # inner group being assembled
+        self.last_inner: list = []                   # results of the last submitted inner group
+        self.trace:   list[int] | None = None        # instruction indices, when tracing
+
+    # ── Main loop ────────────────────────────────────────────────────────────
+    def run(self) -> None:
+        instrs  = self.program.instructions
+        n       = len(instrs)
+        group   = self.group
+        table   = _DISPATCH
+        costs   = _costs(self.program)
+        trace   = self.trace
+        stack   = self.stack
+        self.pc = 0
+        while self.pc < n:
+            pc  = self.current = self.pc
+            ins = instrs[pc]
+            group.budget -= costs[pc]
+            self.cost    += costs[pc]
+            if group.budget < 0:
+                self.fail("dynamic cost budget exceeded")
+            if trace is not None:
+                trace.append(pc)
+            self.pc = pc + 1
+            try:
+                done = table[ins.op](self, *ins.args)
+            except LogicError:
+                raise
+            except (LedgerError, IndexError, ValueError, TypeError, OverflowError, ZeroDivisionError) as exc:
+                self.fail(str(exc) or type(exc).__name__)
+            if done:
+                return
+            if len(stack) > MAX_STACK:
+                self.fail("stack overflow")
+        if len(stack) != 1:
+            self.fail(f"stack len is {len(stack)} instead of 1")
+        self._finish(stack.pop())
+
+    def _finish(self, value: StackValue) -> bool:
+        if not isinstance(value, int):
+            self.fail("approval program returned bytes")
+        if value == 0:
+            self.fail("transaction rejected by ApprovalProgram")
+        return True
+
+    def fail(self, message: str):
+        instrs = self.program.instructions
+        ins    = instrs[min(self.current, len(instrs) - 1)] if instrs else None
+        raise LogicError(
+            message, app_id=self.app.app_id,
+            line=ins.line if ins else 0, source=self.program.context(ins.line) if ins else "",
+        )
+
+    # ── Stack helpers ────────────────────────────────────────────────────────
+    def pop_int(self) -> int:
+        v = self.stack.pop()
+        if not isinstance(v, int):
+            self.fail("expected uint64, got bytes")
+        return v
+
+    def pop_bytes(self) -> bytes:
+        v = self.stack.pop()
+        if not isinstance(v, bytes):
+            self.fail("expected bytes, got uint64")
+        return v
+
+    def push_bytes(self, v: bytes) -> None:
+        if len(v) > MAX_BYTES_LEN:
+            self.fail(f"byte value length {len(v)} exceeds {MAX_BYTES_LEN}")
+        self.stack.append(v)
+
+    # ── Resource availability ────────────────────────────────────────────────
+    def available_account(self, value: StackValue) -> str:
+        """Resolve an account reference (index into Accounts, or a 32-byte address)."""
+        txn = self.txn
+        if isinstance(value, int):
+            if value == 0:
+                return txn.sender
+            if value <= len(txn.accounts):
+                return txn.accounts[value - 1]
+            self.fail(f"invalid Account reference {value}")
+        if len(value) != 32:
+            self.fail("address must be 32 bytes")
+        address = addr_str(value)
+        if address == txn.sender or address in txn.accounts or address == self.app.address:
+            return address
+        for app_id in txn.foreign_apps:
+            if self.ledger.app_address(app_id) == address:
+                return address
+        if self.caller is not None and address == self.caller.app.address:
+            return address
+        self.fail(f"invalid Account reference {address}")
+
+    def available_asset(self, value: int) -> int:
+        assets = self.txn.foreign_assets
+        if value in assets:
+            return value
+        if value < len(assets):
+            return assets[value]
+        self.fail(f"unavailable Asset {value}")
+
+    def available_app(self, value: int) -> int:
+        apps = self.txn.foreign_apps
+        if value == 0 or value == self.app.app_id:
+            return self.app.app_id
+        if value in apps:
+            return value
+        if value <= len(apps):
+            return apps[value - 1]
+        self.fail(f"unavailable App {value}")
+
+    def available_box(self, name: bytes, create_size: int = 0) -> None:
+        key   = (self.app.app_id, name)
+        group = self.group
+        if group.unnamed_resources:
+            return
+        if key not in group.box_refs:
+            self.fail(f"invalid Box reference {name!r}")
+        if key not in group.box_touched:
+            group.box_touched.add(key)
+            existing = self.app.boxes.get(name)
+            group.box_used += len(existing) if existing is not None else create_size
+        elif create_size and name not in self.app.boxes:
+            group.box_used += create_size
+        if group.box_used > group.box_quota:
+            self.fail(f"box read budget ({group.box_quota}) exceeded")
+
+    # ── Transaction field access ─────────────────────────────────────────────
+    def txn_field(self, txn, field: str, index: int | None, group_index: int, result=None) -> StackValue:
+        if field in TXN_ARRAY_FIELDS:
+            if index is None:
+                self.fail(f"{field} requires an array index")
+            return self._txn_array(txn, field, index, result)
+        if field == "GroupIndex":
+            return group_index
+        if field == "TxID":
+            txid = result.txid if result is not None else self.group.txids[group_index]
+            return base64.b32decode(txid + "====")
+        if field in ("NumLogs", "LastLog", "CreatedApplicationID", "CreatedAssetID"):
+            if result is None:
+                result = self._result_for(group_index)
+            if field == "NumLogs":
+                return len(result.logs) if result else 0
+            if field == "LastLog":
+                return result.logs[-1] if result and result.logs else b""
+            if field == "CreatedApplicationID":
+                return (result.application_index or 0) if result else 0
+            return (result.asset_index or 0) if result else 0
+        getter = _TXN_GETTERS.get(field)
+        if getter is None:
+            self.fail(f"unsupported txn field {field}")
+        return getter(txn)
+
+    def _txn_array(self, txn, field: str, index: int, result) -> StackValue:
+        if field == "ApplicationArgs":
+            arr = getattr(txn, "args", [])
+        elif field == "Accounts":
+            arr = [addr_bytes(txn.sender)] + [addr_bytes(a) for a in getattr(txn, "accounts", [])]
+        elif field == "Assets":
+            arr = getattr(txn, "foreign_assets", [])
+        elif field == "Applications":
+            arr = [getattr(txn, "app_id", 0)] + list(getattr(txn, "foreign_apps", []))
+        elif field == "Logs":
+            arr = result.logs if result else []
+        else:
+            self.fail(f"unsupported txn array field {field}")
+        if not 0 <= index < len(arr):
+            self.fail(f"invalid {field} index {index}")
+        return arr[index]
+
+    def _result_for(self, group_index: int):
+        results = self.group.results
+        return results[group_index] if group_index < len(results) else None
+
+    def group_txn(self, gi: int):
+        if not 0 <= gi < len(self.group.txns):
+            self.fail(f"txn index {gi} outside group of {len(self.group.txns)}")
+        return self.group.txns[gi]
+
+    # ── Inner transactions ───────────────────────────────────────────────────
+    def submit_inner(self) -> None:
+        if not self.building:
+            self.fail("itxn_submit without itxn_begin")
+        group   = self.group
+        ledger  = self.ledger
+        results = []
+        for fields in self.building:
+            group.inner_count += 1
+            if group.inner_count > L.MAX_INNER_TRANSACTIONS:
+                self.fail("too many inner transactions")
+            txn = _build_inner(self, fields)
+            if txn.fee < L.MIN_TXN_FEE:
+                group.fee_credit -= L.MIN_TXN_FEE - txn.fee
+                if group.fee_credit < 0:
+                    self.fail("fee too small for inner transaction")
+            else:
+                group.fee_credit += txn.fee - L.MIN_TXN_FEE
+            inner = group.apply(txn, self.index, ledger._next_txid(), self.touched, inner_of=self)
+            results.append(inner)
+        self.result.inner_txns.extend(results)
+        self.last_inner = results
+        self.building   = None
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Transaction field getters for outer and inner transactions
+# ─────────────────────────────────────────────────────────────────────────────
+def _addr_or_zero(address) -> bytes:
+    return addr_bytes(address) if address else ZERO_ADDR
+
+
+def _type(txn) -> bytes:
+    return txn.type.encode()
+
+
+_TXN_GETTERS = {
+    "Sender":           lambda t: addr_bytes(t.sender),
+    "Fee":              lambda t: t.fee,
+    "FirstValid":       lambda t: 0,
+    "FirstValidTime":   lambda t: 0,
+    "LastValid":        lambda t: 0,
+    "Note":             lambda t: t.note,
+    "Lease":            lambda t: bytes(32),
+    "Receiver":         lambda t: _addr_or_zero(getattr(t, "receiver", None)) if t.type == "pay" else ZERO_ADDR,
+    "Amount":           lambda t: t.amount if t.type == "pay" else 0,
+    "CloseRemainderTo": lambda t: _addr_or_zero(getattr(t, "close_remainder_to", None)),
+    "Type":             _type,
+    "TypeEnum":         lambda t: L.TYPE_ENUM[t.type],
+    "XferAsset":        lambda t: getattr(t, "asset_id", 0) if t.type == "axfer" else 0,
+    "AssetAmount":      lambda t: t.amount if t.type == "axfer" else 0,
+    "AssetSender":      lambda t: _addr_or_zero(getattr(t, "asset_sender", None)),
+    "AssetReceiver":    lambda t: _addr_or_zero(t.receiver) if t.type == "axfer" else ZERO_ADDR,
+    "AssetCloseTo":     lambda t: _addr_or_zero(getattr(t, "close_to", None)),
+    "ApplicationID":    lambda t: getattr(t, "app_id", 0),
+    "OnCompletion":     lambda t: getattr(t, "on_complete", 0),
+    "NumAppArgs":       lambda t: len(getattr(t, "args", [])),
+    "NumAccounts":      lambda t: len(getattr(t, "accounts", [])),
+    "NumAssets":        lambda t: len(getattr(t, "foreign_assets", [])),
+    "NumApplications":  lambda t: len(getattr(t, "foreign_apps", [])),
+    "ApprovalProgram":  lambda t: b"",
+    "ClearStateProgram": lambda t: b"",
+    "RekeyTo":          lambda t: ZERO_ADDR,
+    "ConfigAsset":      lambda t: 0,
+    "ConfigAssetTotal": lambda t: getattr(t, "total", 0),
+    "ConfigAssetDecimals": lambda t: getattr(t, "decimals", 0),
+    "ConfigAssetDefaultFrozen": lambda t: int(getattr(t, "default_frozen", False)),
+    "ConfigAssetUnitName": lambda t: getattr(t, "unit_name", "").encode(),
+    "ConfigAssetName":  lambda t: getattr(t, "asset_name", "").encode(),
+    "ConfigAssetURL":   lambda t: getattr(t, "url", "").encode(),
+    "GlobalNumUint":    lambda t: getattr(t, "global_schema", (0, 0))[0],
+    "GlobalNumByteSlice": lambda t: getattr(t, "global_schema", (0, 0))[1],
+    "LocalNumUint":     lambda t: getattr(t, "local_schema", (0, 0))[0],
+    "LocalNumByteSlice": lambda t: getattr(t, "local_schema", (0, 0))[1],
+    "ExtraProgramPages": lambda t: getattr(t, "extra_pages", 0),
+}
+
+
+def _build_inner(ctx: EvalContext, fields: dict):
+    """Turn the fields set by itxn_field into a ledger transaction object."""
+    type_enum = fields.get("TypeEnum")
+    if type_enum is None and "Type" in fields:
+        type_enum = L.TYPE_ENUM.get(fields["Type"].decode(), 0)
+    sender = addr_str(fields.get("Sender", addr_bytes(ctx.app.address)))
+    if sender != ctx.app.address:
+        ctx.fail("inner transaction sender must be the application account")
+    fee  = fields.get("Fee", max(0, L.MIN_TXN_FEE - ctx.group.fee_credit))
+    note = fields.get("Note", b"")
+    if type_enum == 1:
+        close = fields.get("CloseRemainderTo")
+        return L.Payment(
+            sender=sender, receiver=addr_str(fields.get("Receiver", ZERO_ADDR)),
+            amount=fields.get("Amount", 0), fee=fee, note=note,
+            close_remainder_to=addr_str(close) if close else None,
+        )
+    if type_enum == 4:
+        close = fields.get("AssetCloseTo")
+        src   = fields.get("AssetSender")
+        return L.AssetTransfer(
+            sender=sender, receiver=addr_str(fields.get("AssetReceiver", ZERO_ADDR)),
+            asset_id=fields.get("XferAsset", 0), amount=fields.get("AssetAmount", 0), fee=fee, note=note,
+            close_to=addr_str(close) if close else None,
+            asset_sender=addr_str(src) if src else None,
+        )
+    if type_enum == 3 and fields.get("ConfigAsset", 0) == 0:
+        return L.AssetCreate(
+            sender=sender, total=fields.get("ConfigAssetTotal", 0),
+            decimals=fields.get("ConfigAssetDecimals", 0),
+            default_frozen=bool(fields.get("ConfigAssetDefaultFrozen", 0)),
+            unit_name=fields.get("ConfigAssetUnitName", b"").decode(),
+            asset_name=fields.get("ConfigAssetName", b"").decode(),
+            url=fields.get("ConfigAssetURL", b"").decode(), fee=fee, note=note,
+        )
+    ctx.fail(f"unsupported inner transaction type {type_enum}")
+
+
+# Fields whose value names an account or asset that must be available
+_ACCOUNT_FIELDS = {"Receiver", "CloseRemainderTo", "AssetReceiver", "AssetCloseTo", "AssetSender"}
+_ASSET_FIELDS   = {"XferAsset"}
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Opcode implementations
+# ─────────────────────────────────────────────────────────────────────────────
+def _check(ctx: EvalContext, v: int) -> int:
+    if v > MAX_UINT64:
+        ctx.fail("+ overflowed")
+    return v
+
+
+def _bin_int(fn):
+    def op(ctx: EvalContext):
+        b = ctx.pop_int()
+        a = ctx.pop_int()
+        ctx.stack.append(fn(ctx, a, b))
+    return op
+
+
+def _cmp(fn):
+    def op(ctx: EvalContext):
+        b = ctx.stack.pop()
+        a = ctx.stack.pop()
+        if type(a) is not type(b):
+            ctx.fail("cannot compare uint64 to bytes")
+        ctx.stack.append(int(fn(a, b)))
+    return op
+
+
+def _int_cmp(fn):
+    return _bin_int(lambda ctx, a, b: int(fn(a, b)))
+
+
+def _sub(ctx, a, b):
+    if b > a:
+        ctx.fail("- would result negative")
+    return a - b
+
+
+def _div(ctx, a, b):
+    if b == 0:
+        ctx.fail("/ 0")
+    return a // b
+
+
+def _mod(ctx, a, b):
+    if b == 0:
+        ctx.fail("% 0")
+    return a % b
+
+
+def _mul(ctx, a, b):
+    if a * b > MAX_UINT64:
+        ctx.fail("* overflowed")
+    return a * b
+
+
+def _exp(ctx, a, b):
+    if a == 0 and b == 0:
+        ctx.fail("0^0 is undefined")
+    r = a ** b if a < 2 or b < 64 else MAX_UINT64 + 1
+    if r > MAX_UINT64:
+        ctx.fail("exp overflowed")
+    return r
+
+
+def _bytes_math(fn, *, result_bool: bool = False):
+    def op(ctx: EvalContext):
+        b = ctx.pop_bytes()
+        a = ctx.pop_bytes()
+        if len(a) > 64 or len(b) > 64:
+            ctx.fail("byte math input exceeds 64 bytes")
+        r = fn(ctx, int.from_bytes(a, "big"), int.from_bytes(b, "big"))
+        if result_bool:
+            ctx.stack.append(int(r))
+        else:
+            ctx.stack.append(r.to_bytes((r.bit_length() + 7) // 8, "big") if r else b"")
+    return op
+
+
+def _bytes_bitwise(fn):
+    def op(ctx: EvalContext):
+        b = ctx.pop_bytes()
+        a = ctx.pop_bytes()
+        n = max(len(a), len(b))
+        a, b = a.rjust(n, b"\0"), b.rjust(n, b"\0")
+        ctx.stack.append(bytes(fn(x, y) for x, y in zip(a, b)))
+    return op
+
+
+def _hash(fn):
+    def op(ctx: EvalContext):
+        ctx.stack.append(fn(ctx.pop_bytes()))
+    return op
+
+
+def _sha512_256(data: bytes) -> bytes:
+    return hashlib.new("sha512_256", data).digest()
+
+
+def _keccak256(data: bytes) -> bytes:
+    from Cryptodome.Hash import keccak
+    return keccak.new(digest_bits=256, data=data).digest()
+
+
+def _op_err(ctx):
+    ctx.fail("err opcode executed")
+
+
+def _op_return(ctx):
+    v = ctx.stack.pop()
+    ctx.stack.clear()
+    return ctx._finish(v)
+
+
+def _op_assert(ctx):
+    if ctx.pop_int() == 0:
+        ctx.fail("assert failed")
+
+
+def _op_not(ctx):
+    ctx.stack.append(int(ctx.pop_int() == 0))
+
+
+def _op_len(ctx):
+    ctx.stack.append(len(ctx.pop_bytes()))
+
+
+def _op_itob(ctx):
+    ctx.stack.append(ctx.pop_int().to_bytes(8, "big"))
+
+
+def _op_btoi(ctx):
+    v = ctx.pop_bytes()
+    if len(v) > 8:
+        ctx.fail(f"btoi arg too long, got [{len(v)}]bytes")
+    ctx.stack.append(int.from_bytes(v, "big"))
+
+
+def _op_bnot(ctx):
+    ctx.stack.append(MAX_UINT64 ^ ctx.pop_int())
+
+
+def _op_mulw(ctx):
+    b, a = ctx.pop_int(), ctx.pop_int()
+    r = a * b
+    ctx.stack.extend((r >> 64, r & MAX_UINT64))
+
+
+def _op_addw(ctx):
+    b, a = ctx.pop_int(), ctx.pop_int()
+    r = a + b
+    ctx.stack.extend((r >> 64, r & MAX_UINT64))
+
+
+def _op_divmodw(ctx):
+    d_lo, d_hi, n_lo, n_hi = ctx.pop_int(), ctx.pop_int(), ctx.pop_int(), ctx.pop_int()
+    d = (d_hi << 64) | d_lo
+    if d == 0:
+        ctx.fail("/ 0")
+    q, r = divmod((n_hi << 64) | n_lo, d)
+    ctx.stack.extend((q >> 64, q & MAX_UINT64, r >> 64, r & MAX_UINT64))
+
+
+def _op_divw(ctx):
+    c, b, a = ctx.pop_int(), ctx.pop_int(), ctx.pop_int()
+    if c == 0:
+        ctx.fail("/ 0")
+    q = ((a << 64) | b) // c
+    if q > MAX_UINT64:
+        ctx.fail("divw overflow")
+    ctx.stack.append(q)
+
+
+def _op_intcblock(ctx, ints):
+    ctx.intc = ints
+
+
+def _op_intc(ctx, i):
+    if i >= len(ctx.intc):
+        ctx.fail(f"intc {i} beyond {len(ctx.intc)} constants")
+    ctx.stack.append(ctx.intc[i])
+
+
+def _op_bytecblock(ctx, byteses):
+    ctx.bytec = byteses
+
+
+def _op_bytec(ctx, i):
+    if i >= len(ctx.bytec):
+        ctx.fail(f"bytec {i} beyond {len(ctx.bytec)} constants")
+    ctx.stack.append(ctx.bytec[i])
+
+
+def _op_arg(ctx, *_):
+    ctx.fail("arg is only available to logic signatures")
+
+
+def _op_txn(ctx, field, index=None):
+    ctx.stack.append(ctx.txn_field(ctx.txn, field, index, ctx.index))
+
+
+def _op_txnas(ctx, field):
+    ctx.stack.append(ctx.txn_field(ctx.txn, field, ctx.pop_int(), ctx.index))
+
+
+def _op_gtxn(ctx, gi, field, index=None):
+    ctx.stack.append(ctx.txn_field(ctx.group_txn(gi), field, index, gi))
+
+
+def _op_gtxnas(ctx, gi, field):
+    ctx.stack.append(ctx.txn_field(ctx.group_txn(gi), field, ctx.pop_int(), gi))
+
+
+def _op_gtxns(ctx, field, index=None):
+    gi = ctx.pop_int()
+    ctx.stack.append(ctx.txn_field(ctx.group_txn(gi), field, index, gi))
+
+
+def _op_gtxnsas(ctx, field):
+    index = ctx.pop_int()
+    gi    = ctx.pop_int()
+    ctx.stack.append(ctx.txn_field(ctx.group_txn(gi), field, index, gi))
+
+
+_GLOBALS = {
+    "MinTxnFee":                 lambda ctx: L.MIN_TXN_FEE,
+    "MinBalance":                lambda ctx: L.MIN_BALANCE,
+    "MaxTxnLife":                lambda ctx: 1000,
+    "ZeroAddress":               lambda ctx: ZERO_ADDR,
+    "GroupSize":                 lambda ctx: len(ctx.group.txns),
+    "LogicSigVersion":           lambda ctx: 8,
+    "Round":                     lambda ctx: ctx.ledger.round,
+    "LatestTimestamp":           lambda ctx: ctx.ledger.timestamp,
+    "CurrentApplicationID":      lambda ctx: ctx.app.app_id,
+    "CreatorAddress":            lambda ctx: addr_bytes(ctx.app.creator),
+    "CurrentApplicationAddress": lambda ctx: addr_bytes(ctx.app.address),
+    "GroupID":                   lambda ctx: ctx.group.group_id,
+    "OpcodeBudget":              lambda ctx: ctx.group.budget,
+    "CallerApplicationID":       lambda ctx: ctx.caller.app.app_id if ctx.caller else 0,
+    "CallerApplicationAddress":  lambda ctx: addr_bytes(ctx.caller.app.address) if ctx.caller else ZERO_ADDR,
+    "AssetCreateMinBalance":     lambda ctx: L.ASSET_MIN_BALANCE,
+    "AssetOptInMinBalance":      lambda ctx: L.ASSET_MIN_BALANCE,
+    "GenesisHash":               lambda ctx: bytes(32),
+}
+
+
+def _op_global(ctx, field):
+    getter = _GLOBALS.get(field)
+    if getter is None:
+        ctx.fail(f"unsupported global field {field}")
+    ctx.stack.append(getter(ctx))
+
+
+def _op_load(ctx, i):
+    ctx.stack.append(ctx.scratch[i])
+
+
+def _op_store(ctx, i):
+    ctx.scratch[i] = ctx.stack.pop()
+
+
+def _op_loads(ctx):
+    i = ctx.pop_int()
+    if i > 255:
+        ctx.fail(f"invalid scratch slot {i}")
+    ctx.stack.append(ctx.scratch[i])
+
+
+def _op_stores(ctx):
+    v = ctx.stack.pop()
+    i = ctx.pop_int()
+    if i > 255:
+        ctx.fail(f"invalid scratch slot {i}")
+    ctx.scratch[i] = v
+
+
+def _op_gload(ctx, gi, i):
+    _gload(ctx, gi, i)
+
+
+def _op_gloads(ctx, i):
+    _gload(ctx, ctx.pop_int(), i)
+
+
+def _op_gloadss(ctx):
+    i  = ctx.pop_int()
+    gi = ctx.pop_int()
+    _gload(ctx, gi, i)
+
+
+def _gload(ctx, gi, i):
+    if gi >= ctx.index or gi not in ctx.group.scratch:
+        ctx.fail(f"gload can't get future scratch space from txn {gi}")
+    ctx.stack.append(ctx.group.scratch[gi][i])
+
+
+def _op_gaid(ctx, gi):
+    _gaid(ctx, gi)
+
+
+def _op_gaids(ctx):
+    _gaid(ctx, ctx.pop_int())
+
+
+def _gaid(ctx, gi):
+    ctx.fail("gaid is not supported by the in-memory ledger")
+
+
+def _op_bnz(ctx, target):
+    if ctx.pop_int() != 0:
+        ctx.pc = target
+
+
+def _op_bz(ctx, target):
+    if ctx.pop_int() == 0:
+        ctx.pc = target
+
+
+def _op_b(ctx, target):
+    ctx.pc = target
+
+
+def _op_bury(ctx, n):
+    if n == 0 or n >= len(ctx.stack):
+        ctx.fail(f"bury {n} outside stack")
+    ctx.stack[-1 - n] = ctx.stack[-1]
+    ctx.stack.pop()
+
+
+def _op_popn(ctx, n):
+    if n > len(ctx.stack):
+        ctx.fail(f"popn {n} below stack")
+    del ctx.stack[len(ctx.stack) - n:]
+
+
+def _op_dupn(ctx, n):
+    ctx.stack.extend([ctx.stack[-1]] * n)
+
+
+def _op_pop(ctx):
+    ctx.stack.pop()
+
+
+def _op_dup(ctx):
+    ctx.stack.append(ctx.stack[-1])
+
+
+def _op_dup2(ctx):
+    ctx.stack.extend(ctx.stack[-2:])
+
+
+def _op_dig(ctx, n):
+    if n >= len(ctx.stack):
+        ctx.fail(f"dig {n} with stack size {len(ctx.stack)}")
+    ctx.stack.append(ctx.stack[-1 - n])
+
+
+def _op_swap(ctx):
+    ctx.stack[-1], ctx.stack[-2] = ctx.stack[-2], ctx.stack[-1]
+
+
+def _op_select(ctx):
+    c = ctx.pop_int()
+    b = ctx.stack.pop()
+    a = ctx.stack.pop()
+    ctx.stack.append(b if c else a)
+
+
+def _op_cover(ctx, n):
+    if n >= len(ctx.stack):
+        ctx.fail(f"cover {n} with stack size {len(ctx.stack)}")
+    v = ctx.stack.pop()
+    ctx.stack.insert(len(ctx.stack) - n, v)
+
+
+def _op_uncover(ctx, n):
+    if n >= len(ctx.stack):
+        ctx.fail(f"uncover {n} with stack size {len(ctx.stack)}")
+    ctx.stack.append(ctx.stack.pop(-1 - n))
+
+
+def _op_concat(ctx):
+    b = ctx.pop_bytes()
+    a = ctx.pop_bytes()
+    ctx.push_bytes(a + b)
+
+
+def _slice(ctx, a: bytes, start: int, end: int) -> bytes:
+    if start > end or end > len(a):
+        ctx.fail(f"extraction end {end} is beyond length: {len(a)}" if end > len(a) else "extraction start > end")
+    return a[start:end]
+
+
+def _op_substring(ctx, s, e):
+    ctx.stack.append(_slice(ctx, ctx.pop_bytes(), s, e))
+
+
+def _op_substring3(ctx):
+    e, s = ctx.pop_int(), ctx.pop_int()
+    ctx.stack.append(_slice(ctx, ctx.pop_bytes(), s, e))
+
+
+def _op_extract(ctx, s, length):
+    a = ctx.pop_bytes()
+    if length == 0:
+        if s > len(a):
+            ctx.fail(f"extraction start {s} is beyond length: {len(a)}")
+        ctx.stack.append(a[s:])
+    else:
+        ctx.stack.append(_slice(ctx, a, s, s + length))
+
+
+def _op_extract3(ctx):
+    length, s = ctx.pop_int(), ctx.pop_int()
+    ctx.stack.append(_slice(ctx, ctx.pop_bytes(), s, s + length))
+
+
+def _extract_uint(width):
+    def op(ctx):
+        s = ctx.pop_int()
+        a = ctx.pop_bytes()
+        ctx.stack.append(int.from_bytes(_slice(ctx, a, s, s + width), "big"))
+    return op
+
+
+def _op_replace2(ctx, s):
+    b = ctx.pop_bytes()
+    a = ctx.pop_bytes()
+    _replace(ctx, a, s, b)
+
+
+def _op_replace3(ctx):
+    b = ctx.pop_bytes()
+    s = ctx.pop_int()
+    a = ctx.pop_bytes()
+    _replace(ctx, a, s, b)
+
+
+def _replace(ctx, a, s, b):
+    if s + len(b) > len(a):
+        ctx.fail(f"replacement end {s + len(b)} beyond original length: {len(a)}")
+    ctx.stack.append(a[:s] + b + a[s + len(b):])
+
+
+def _op_getbit(ctx):
+    i = ctx.pop_int()
+    a = ctx.stack.pop()
+    if isinstance(a, int):
+        if i > 63:
+            ctx.fail(f"getbit index {i} beyond 64 bits")
+        ctx.stack.append((a >> i) & 1)
+    else:
+        if i >= len(a) * 8:
+            ctx.fail(f"getbit index {i} beyond byteslice")
+        ctx.stack.append((a[i // 8] >> (7 - i % 8)) & 1)
+
+
+def _op_setbit(ctx):
+    bit = ctx.pop_int()
+    i   = ctx.pop_int()
+    a   = ctx.stack.pop()
+    if bit > 1:
+        ctx.fail("setbit value > 1")
+    if isinstance(a, int):
+        if i > 63:
+            ctx.fail(f"setbit index {i} beyond 64 bits")
+        ctx.stack.append(a | (1 << i) if bit else a & ~(1 << i))
+    else:
+        if i >= len(a) * 8:
+            ctx.fail(f"setbit index {i} beyond byteslice")
+        buf  = bytearray(a)
+        mask = 1 << (7 - i % 8)
+        buf[i // 8] = buf[i // 8] | mask if bit else buf[i // 8] & ~mask
+        ctx.stack.append(bytes(buf))
+
+
+def _op_getbyte(ctx):
+    i = ctx.pop_int()
+    a = ctx.pop_bytes()
+    if i >= len(a):
+        ctx.fail(f"getbyte index {i} beyond length {len(a)}")
+    ctx.stack.append(a[i])
+
+
+def _op_setbyte(ctx):
+    v = ctx.pop_int()
+    i = ctx.pop_int()
+    a = ctx.pop_bytes()
+    if i >= len(a) or v > 255:
+        ctx.fail("setbyte index or value out of range")
+    ctx.stack.append(a[:i] + bytes([v]) + a[i + 1:])
+
+
+def _op_base64_decode(ctx, encoding_name):
+    data = ctx.pop_bytes()
+    fn = base64.urlsafe_b64decode if encoding_name == "URLEncoding" else base64.b64decode
+    ctx.stack.append(fn(data + b"=" * (-len(data) % 4)))
+
+
+def _op_balance(ctx):
+    address = ctx.available_account(ctx.stack.pop())
+    ctx.stack.append(ctx.ledger.balance(address))
+
+
+def _op_min_balance(ctx):
+    address = ctx.available_account(ctx.stack.pop())
+    ctx.stack.append(ctx.ledger.min_balance(address))
+
+
+def _op_app_global_get(ctx):
+    key = ctx.pop_bytes()
+    ctx.stack.append(ctx.app.global_state.get(key, 0))
+
+
+def _op_app_global_get_ex(ctx):
+    key    = ctx.pop_bytes()
+    app_id = ctx.available_app(ctx.pop_int())
+    app    = ctx.ledger.apps.get(app_id)
+    value  = app.global_state.get(key) if app else None
+    ctx.stack.extend((0, 0) if value is None else (value, 1))
+
+
+def _op_app_global_put(ctx):
+    value = ctx.stack.pop()
+    key   = ctx.pop_bytes()
+    if len(key) > MAX_KEY_LEN:
+        ctx.fail(f"key too long: length was {len(key)}, maximum is {MAX_KEY_LEN}")
+    if isinstance(value, bytes) and len(key) + len(value) > MAX_KV_LEN:
+        ctx.fail(f"key/value total too long for key {key!r}")
+    ctx.app.global_state[key] = value
+
+
+def _op_app_global_del(ctx):
+    ctx.app.global_state.pop(ctx.pop_bytes(), None)
+
+
+def _op_local(ctx, *_):
+    ctx.fail("local state is not supported by the in-memory ledger")
+
+
+def _op_asset_holding_get(ctx, field):
+    asset_id = ctx.available_asset(ctx.pop_int())
+    address  = ctx.available_account(ctx.stack.pop())
+    holding  = ctx.ledger.asset_balance(address, asset_id)
+    if holding is None:
+        ctx.stack.extend((0, 0))
+    elif field == "AssetBalance":
+        ctx.stack.extend((holding, 1))
+    else:
+        ctx.stack.extend((0, 1))
+
+
+def _op_asset_params_get(ctx, field):
+    asset_id = ctx.available_asset(ctx.pop_int())
+    asset    = ctx.ledger.assets.get(asset_id)
+    if asset is None:
+        ctx.stack.extend((0, 0))
+        return
+    values = {
+        "AssetTotal": asset.total, "AssetDecimals": asset.decimals,
+        "AssetDefaultFrozen": int(asset.default_frozen), "AssetUnitName": asset.unit_name.encode(),
+        "AssetName": asset.asset_name.encode(), "AssetURL": asset.url.encode(),
+        "AssetMetadataHash": asset.metadata_hash, "AssetManager": addr_bytes(asset.manager),
+        "AssetReserve": addr_bytes(asset.reserve), "AssetFreeze": addr_bytes(asset.freeze),
+        "AssetClawback": addr_bytes(asset.clawback), "AssetCreator": addr_bytes(asset.creator),
+    }
+    ctx.stack.extend((values[field], 1))
+
+
+def _op_app_params_get(ctx, field):
+    app_id = ctx.available_app(ctx.pop_int())
+    app    = ctx.ledger.apps.get(app_id)
+    if app is None:
+        ctx.stack.extend((0, 0))
+        return
+    values = {
+        "AppApprovalProgram": b"", "AppClearStateProgram": b"",
+        "AppGlobalNumUint": app.global_schema[0], "AppGlobalNumByteSlice": app.global_schema[1],
+        "AppLocalNumUint": app.local_schema[0], "AppLocalNumByteSlice": app.local_schema[1],
+        "AppExtraProgramPages": app.extra_pages, "AppCreator": addr_bytes(app.creator),
+        "AppAddress": addr_bytes(app.address),
+    }
+    ctx.stack.extend((values[field], 1))
+
+
+def _op_acct_params_get(ctx, field):
+    address = ctx.available_account(ctx.stack.pop())
+    ledger  = ctx.ledger
+    acct    = ledger.accounts.get(address)
+    if acct is None or acct.balance == 0:
+        ctx.stack.extend((0 if field != "AcctAuthAddr" else ZERO_ADDR, 0))
+        return
+    app = ledger._app_by_address(address)
+    values = {
+        "AcctBalance": acct.balance, "AcctMinBalance": ledger.min_balance(address),
+        "AcctAuthAddr": ZERO_ADDR, "AcctTotalAssets": len(acct.assets),
+        "AcctTotalAppsCreated": len(acct.created_apps),
+        "AcctTotalBoxes": len(app.boxes) if app else 0,
+        "AcctTotalBoxBytes": sum(len(k) + len(v) for k, v in app.boxes.items()) if app else 0,
+    }
+    ctx.stack.extend((values.get(field, 0), 1))
+
+
+def _op_push(ctx, value):
+    ctx.stack.append(value)
+
+
+def _op_pushes(ctx, values):
+    ctx.stack.extend(values)
+
+
+def _op_callsub(ctx, target):
+    if len(ctx.frames) >= 1024:
+        ctx.fail("callsub stack too deep")
+    ctx.frames.append(_Frame(ctx.pc, len(ctx.stack)))
+    ctx.pc = target
+
+
+def _op_retsub(ctx):
+    if not ctx.frames:
+        ctx.fail("retsub with empty callstack")
+    frame = ctx.frames.pop()
+    if frame.clear:
+        stack = ctx.stack
+        if len(stack) < frame.height + frame.returns:
+            ctx.fail("retsub executed with stack below frame")
+        # Return values are the first R slots above the frame; locals above them are dropped
+        start = frame.height - frame.args
+        rets  = stack[frame.height:frame.height + frame.returns]
+        del stack[start:]
+        stack.extend(rets)
+    ctx.pc = frame.ret
+
+
+def _op_proto(ctx, args, returns):
+    if not ctx.frames:
+        ctx.fail("proto with empty callstack")
+    frame = ctx.frames[-1]
+    if frame.height < args:
+        ctx.fail(f"callsub to proto that requires {args} args with stack height {frame.height}")
+    frame.args, frame.returns, frame.clear = args, returns, True
+
+
+def _frame_index(ctx, i) -> int:
+    if not ctx.frames or not ctx.frames[-1].clear:
+        ctx.fail("frame_dig/bury with no proto")
+    frame = ctx.frames[-1]
+    idx   = frame.height + i
+    if idx < frame.height - frame.args or idx >= len(ctx.stack):
+        ctx.fail(f"frame index {i} outside frame")
+    return idx
+
+
+def _op_frame_dig(ctx, i):
+    ctx.stack.append(ctx.stack[_frame_index(ctx, i)])
+
+
+def _op_frame_bury(ctx, i):
+    idx = _frame_index(ctx, i)
+    v   = ctx.stack.pop()
+    if idx >= len(ctx.stack):
+        ctx.fail(f"frame_bury {i} outside frame")
+    ctx.stack[idx] = v
+
+
+def _op_switch(ctx, targets):
+    i = ctx.pop_int()
+    if i < len(targets):
+        ctx.pc = targets[i]
+
+
+def _op_match(ctx, targets):
+    n = len(targets)
+    if len(ctx.stack) < n + 1:
+        ctx.fail("match with insufficient stack")
+    x = ctx.stack.pop()
+    cands = ctx.stack[len(ctx.stack) - n:]
+    del ctx.stack[len(ctx.stack) - n:]
+    for i, c in enumerate(cands):
+        if type(c) is type(x) and c == x:
+            ctx.pc = targets[i]
+            return
+
+
+def _op_shl(ctx):
+    b, a = ctx.pop_int(), ctx.pop_int()
+    if b > 63:
+        ctx.fail(f"shl arg too big, ({b})")
+    ctx.stack.append((a << b) & MAX_UINT64)
+
+
+def _op_shr(ctx):
+    b, a = ctx.pop_int(), ctx.pop_int()
+    if b > 63:
+        ctx.fail(f"shr arg too big, ({b})")
+    ctx.stack.append(a >> b)
+
+
+def _op_sqrt(ctx):
+    import math
+    ctx.stack.append(math.isqrt(ctx.pop_int()))
+
+
+def _op_bitlen(ctx):
+    a = ctx.stack.pop()
+    ctx.stack.append(a.bit_length() if isinstance(a, int) else int.from_bytes(a, "big").bit_length())
+
+
+def _op_expw(ctx):
+    b, a = ctx.pop_int(), ctx.pop_int()
+    if a == 0 and b == 0:
+        ctx.fail("0^0 is undefined")
+    r = a ** b if a < 2 or b < 128 else 2**128
+    if r >= 2**128:
+        ctx.fail("expw overflowed")
+    ctx.stack.extend((r >> 64, r & MAX_UINT64))
+
+
+def _op_bsqrt(ctx):
+    import math
+    a = ctx.pop_bytes()
+    r = math.isqrt(int.from_bytes(a, "big"))
+    ctx.stack.append(r.to_bytes((r.bit_length() + 7) // 8, "big") if r else b"")
+
+
+def _op_bbnot(ctx):
+    ctx.stack.append(bytes(255 - x for x in ctx.pop_bytes()))
+
+
+def _op_bzero(ctx):
+    n = ctx.pop_int()
+    if n > MAX_BYTES_LEN:
+        ctx.fail("bzero attempted to create a too large string")
+    ctx.stack.append(bytes(n))
+
+
+def _op_log(ctx):
+    msg = ctx.pop_bytes()
+    ctx.log_bytes += len(msg)
+    if len(ctx.logs) >= MAX_LOG_CALLS:
+        ctx.fail(f"too many log calls in program. up to {MAX_LOG_CALLS} is allowed")
+    if ctx.log_bytes > MAX_LOG_BYTES:
+        ctx.fail(f"program logs too large. {ctx.log_bytes} bytes > {MAX_LOG_BYTES} bytes limit")
+    ctx.logs.append(msg)
+
+
+def _op_itxn_begin(ctx):
+    if ctx.building is not None:
+        ctx.fail("itxn_begin without itxn_submit")
+    ctx.building = [{}]
+
+
+def _op_itxn_next(ctx):
+    if ctx.building is None:
+        ctx.fail("itxn_next without itxn_begin")
+    ctx.building.append({})
+
+
+def _op_itxn_field(ctx, field):
+    if ctx.building is None:
+        ctx.fail("itxn_field without itxn_begin")
+    value = ctx.stack.pop()
+    if field in _ACCOUNT_FIELDS or field == "Sender":
+        if not isinstance(value, bytes) or len(value) != 32:
+            ctx.fail(f"{field} must be a 32-byte address")
+        if field != "Sender":
+            ctx.available_account(value)
+    elif field in _ASSET_FIELDS:
+        ctx.available_asset(value)
+    ctx.building[-1][field] = value
+
+
+def _op_itxn_submit(ctx):
+    ctx.submit_inner()
+
+
+def _op_itxn(ctx, field, index=None):
+    if not ctx.last_inner:
+        ctx.fail("no inner transaction available")
+    res = ctx.last_inner[-1]
+    ctx.stack.append(ctx.txn_field(res.txn, field, index, len(ctx.last_inner) - 1, result=res))
+
+
+def _op_itxnas(ctx, field):
+    _op_itxn(ctx, field, ctx.pop_int())
+
+
+def _op_gitxn(ctx, gi, field, index=None):
+    if gi >= len(ctx.last_inner):
+        ctx.fail(f"gitxn {gi} beyond last inner group")
+    res = ctx.last_inner[gi]
+    ctx.stack.append(ctx.txn_field(res.txn, field, index, gi, result=res))
+
+
+def _op_gitxnas(ctx, gi, field):
+    _op_gitxn(ctx, gi, field, ctx.pop_int())
+
+
+# ── Boxes ─────────────────────────────────────────────────────────────────────
+def _box_name(ctx) -> bytes:
+    name = ctx.pop_bytes()
+    if not 1 <= len(name) <= MAX_KEY_LEN:
+        ctx.fail(f"box names must be 1-{MAX_KEY_LEN} bytes")
+    return name
+
+
+def _op_box_create(ctx):
+    size = ctx.pop_int()
+    name = _box_name(ctx)
+    if size > L.MAX_BOX_SIZE:
+        ctx.fail(f"box size {size} exceeds {L.MAX_BOX_SIZE}")
+    ctx.available_box(name, size)
+    boxes = ctx.app.boxes
+    if name in boxes:
+        if len(boxes[name]) != size:
+            ctx.fail(f"box size mismatch {len(boxes[name])} {size}")
+        ctx.stack.append(0)
+    else:
+        boxes[name] = bytes(size)
+        ctx.touched.add(ctx.app.address)
+        ctx.stack.append(1)
+
+
+def _existing_box(ctx, name: bytes) -> bytes:
+    ctx.available_box(name)
+    box = ctx.app.boxes.get(name)
+    if box is None:
+        ctx.fail(f"no such box {name!r}")
+    return box
+
+
+def _op_box_extract(ctx):
+    length = ctx.pop_int()
+    start  = ctx.pop_int()
+    box    = _existing_box(ctx, _box_name(ctx))
+    ctx.push_bytes(_slice(ctx, box, start, start + length))
+
+
+def _op_box_replace(ctx):
+    value = ctx.pop_bytes()
+    start = ctx.pop_int()
+    name  = _box_name(ctx)
+    box   = _existing_box(ctx, name)
+    if start + len(value) > len(box):
+        ctx.fail(f"replacement end {start + len(value)} beyond box length {len(box)}")
+    ctx.app.boxes[name] = box[:start] + value + box[start + len(value):]
+
+
+def _op_box_del(ctx):
+    name = _box_name(ctx)
+    ctx.available_box(name)
+    existed = ctx.app.boxes.pop(name, None) is not None
+    ctx.stack.append(int(existed))
+
+
+def _op_box_len(ctx):
+    name = _box_name(ctx)
+    ctx.available_box(name)
+    box = ctx.app.boxes.get(name)
+    ctx.stack.extend((0, 0) if box is None else (len(box), 1))
+
+
+def _op_box_get(ctx):
+    name = _box_name(ctx)
+    ctx.available_box(name)
+    box = ctx.app.boxes.get(name)
+    if box is not None and len(box) > MAX_BYTES_LEN:
+        ctx.fail(f"box_get produced a too big ({len(box)}) byte-array")
+    ctx.stack.extend((b"", 0) if box is None else (box, 1))
+
+
+def _op_box_put(ctx):
+    value = ctx.pop_bytes()
+    name  = _box_name(ctx)
+    ctx.available_box(name, len(value))
+    boxes = ctx.app.boxes
+    if name in boxes and len(boxes[name]) != len(value):
+        ctx.fail(f"attempt to box_put wrong size {len(boxes[name])} != {len(value)}")
+    boxes[name] = value
+    ctx.touched.add(ctx.app.address)
+
+
+def _op_unsupported(ctx, *_):
+    ctx.fail(f"{ctx.program.instructions[ctx.pc - 1].op} is not supported by the in-memory ledger")
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Dispatch table
+# ─────────────────────────────────────────────────────────────────────────────
+_DISPATCH = {
+    "err":        _op_err,
+    "sha256":     _hash(lambda d: hashlib.sha256(d).digest()),
+    "keccak256":  _hash(_keccak256),
+    "sha512_256": _hash(_sha512_256),
+    "sha3_256":   _hash(lambda d: hashlib.sha3_256(d).digest()),
+    "+":          _bin_int(lambda ctx, a, b: _check(ctx, a + b)),
+    "-":          _bin_int(_sub),
+    "/":          _bin_int(_div),
+    "*":          _bin_int(_mul),
+    "%":          _bin_int(_mod),
+    "<":          _int_cmp(lambda a, b: a < b),
+    ">":          _int_cmp(lambda a, b: a > b),
+    "<=":         _int_cmp(lambda a, b: a <= b),
+    ">=":         _int_cmp(lambda a, b: a >= b),
+    "&&":         _int_cmp(lambda a, b: a != 0 and b != 0),
+    "||":         _int_cmp(lambda a, b: a != 0 or b != 0),
+    "==":         _cmp(lambda a, b: a == b),
+    "!=":         _cmp(lambda a, b: a != b),
+    "!":          _op_not,
+    "len":        _op_len,
+    "itob":       _op_itob,
+    "btoi":       _op_btoi,
+    "|":          _bin_int(lambda ctx, a, b: a | b),
+    "&":          _bin_int(lambda ctx, a, b: a & b),
+    "^":          _bin_int(lambda ctx, a, b: a ^ b),
+    "~":          _op_bnot,
+    "mulw":       _op_mulw,
+    "addw":       _op_addw,
+    "divmodw":    _op_divmodw,
+    "divw":       _op_divw,
+    "exp":        _bin_int(_exp),
+    "expw":       _op_expw,
+    "shl":        _op_shl,
+    "shr":        _op_shr,
+    "sqrt":       _op_sqrt,
+    "bitlen":     _op_bitlen,
+    "intcblock":  _op_intcblock,
+    "intc":       _op_intc,
+    "intc_0":     lambda ctx: _op_intc(ctx, 0),
+    "intc_1":     lambda ctx: _op_intc(ctx, 1),
+    "intc_2":     lambda ctx: _op_intc(ctx, 2),
+    "intc_3":     lambda ctx: _op_intc(ctx, 3),
+    "bytecblock": _op_bytecblock,
+    "bytec":      _op_bytec,
+    "bytec_0":    lambda ctx: _op_bytec(ctx, 0),
+    "bytec_1":    lambda ctx: _op_bytec(ctx, 1),
+    "bytec_2":    lambda ctx: _op_bytec(ctx, 2),
+    "bytec_3":    lambda ctx: _op_bytec(ctx, 3),
+    "arg":        _op_arg,
+    "arg_0":      _op_arg,
+    "arg_1":      _op_arg,
+    "arg_2":      _op_arg,
+    "arg_3":      _op_arg,
+    "args":       _op_arg,
+    "txn":        _op_txn,
+    "txna":       _op_txn,
+    "txnas":      _op_txnas,
+    "gtxn":       _op_gtxn,
+    "gtxna":      _op_gtxn,
+    "gtxnas":     _op_gtxnas,
+    "gtxns":      _op_gtxns,
+    "gtxnsa":     _op_gtxns,
+    "gtxnsas":    _op_gtxnsas,
+    "global":     _op_global,
+    "load":       _op_load,
+    "store":      _op_store,
+    "loads":      _op_loads,
+    "stores":     _op_stores,
+    "gload":      _op_gload,
+    "gloads":     _op_gloads,
+    "gloadss":    _op_gloadss,
+    "gaid":       _op_gaid,
+    "gaids":      _op_gaids,
+    "bnz":        _op_bnz,
+    "bz":         _op_bz,
+    "b":          _op_b,
+    "return":     _op_return,
+    "assert":     _op_assert,
+    "bury":       _op_bury,
+    "popn":       _op_popn,
+    "dupn":       _op_dupn,
+    "pop":        _op_pop,
+    "dup":        _op_dup,
+    "dup2":       _op_dup2,
+    "dig":        _op_dig,
+    "swap":       _op_swap,
+    "select":     _op_select,
+    "cover":      _op_cover,
+    "uncover":    _op_uncover,
+    "concat":     _op_concat,
+    "substring":  _op_substring,
+    "substring3": _op_substring3,
+    "getbit":     _op_getbit,
+    "setbit":     _op_setbit,
+    "getbyte":    _op_getbyte,
+    "setbyte":    _op_setbyte,
+    "extract":    _op_extract,
+    "extract3":   _op_extract3,
+    "extract_uint16": _extract_uint(2),
+    "extract_uint32": _extract_uint(4),
+    "extract_uint64": _extract_uint(8),
+    "replace2":   _op_replace2,
+    "replace3":   _op_replace3,
+    "base64_decode": _op_base64_decode,
+    "balance":    _op_balance,
+    "min_balance": _op_min_balance,
+    "app_opted_in": _op_local,
+    "app_local_get": _op_local,
+    "app_local_get_ex": _op_local,
+    "app_local_put": _op_local,
+    "app_local_del": _op_local,
+    "app_global_get": _op_app_global_get,
+    "app_global_get_ex": _op_app_global_get_ex,
+    "app_global_put": _op_app_global_put,
+    "app_global_del": _op_app_global_del,
+    "asset_holding_get": _op_asset_holding_get,
+    "asset_params_get": _op_asset_params_get,
+    "app_params_get": _op_app_params_get,
+    "acct_params_get": _op_acct_params_get,
+    "pushbytes":  _op_push,
+    "pushint":    _op_push,
+    "pushbytess": _op_pushes,
+    "pushints":   _op_pushes,
+    "callsub":    _op_callsub,
+    "retsub":     _op_retsub,
+    "proto":      _op_proto,
+    "frame_dig":  _op_frame_dig,
+    "frame_bury": _op_frame_bury,
+    "switch":     _op_switch,
+    "match":      _op_match,
+    "b+":         _bytes_math(lambda ctx, a, b: a + b),
+    "b-":         _bytes_math(lambda ctx, a, b: a - b if a >= b else ctx.fail("byte math would have negative result")),
+    "b/":         _bytes_math(lambda ctx, a, b: a // b if b else ctx.fail("division by zero")),
+    "b*":         _bytes_math(lambda ctx, a, b: a * b),
+    "b%":         _bytes_math(lambda ctx, a, b: a % b if b else ctx.fail("modulo by zero")),
+    "b<":         _bytes_math(lambda ctx, a, b: a < b, result_bool=True),
+    "b>":         _bytes_math(lambda ctx, a, b: a > b, result_bool=True),
+    "b<=":        _bytes_math(lambda ctx, a, b: a <= b, result_bool=True),
+    "b>=":        _bytes_math(lambda ctx, a, b: a >= b, result_bool=True),
+    "b==":        _bytes_math(lambda ctx, a, b: a == b, result_bool=True),
+    "b!=":        _bytes_math(lambda ctx, a, b: a != b, result_bool=True),
+    "b|":         _bytes_bitwise(lambda x, y: x | y),
+    "b&":         _bytes_bitwise(lambda x, y: x & y),
+    "b^":         _bytes_bitwise(lambda x, y: x ^ y),
+    "b~":         _op_bbnot,
+    "bsqrt":      _op_bsqrt,
+    "bzero":      _op_bzero,
+    "log":        _op_log,
+    "itxn_begin": _op_itxn_begin,
+    "itxn_next":  _op_itxn_next,
+    "itxn_field": _op_itxn_field,
+    "itxn_submit": _op_itxn_submit,
+    "itxn":       _op_itxn,
+    "itxna":      _op_itxn,
+    "itxnas":     _op_itxnas,
+    "gitxn":      _op_gitxn,
+    "gitxna":     _op_gitxn,
+    "gitxnas":    _op_gitxnas,
+    "box_create": _op_box_create,
+    "box_extract": _op_box_extract,
+    "box_replace": _op_box_replace,
+    "box_del":    _op_box_del,
+    "box_len":    _op_box_len,
+    "box_get":    _op_box_get,
+    "box_put":    _op_box_put,
+}
+for _name in OPS:
+    _DISPATCH.setdefault(_name, _op_unsupported)
+
+
+def _costs(program: Program) -> list[int]:
+    costs = program.__dict__.get("_costs")
+    if costs is None:
+        costs = program.__dict__["_costs"] = [OPS[i.op].cost for i in program.instructions]
+    return costs
@@ -0,0 +1,581 @@
+"""
+ledger.py — In-memory Algorand ledger
+======================================
+Holds accounts, applications, assets and boxes in plain Python dicts and
+applies transaction groups atomically: a group either commits in full or
+leaves the ledger untouched.
+
+Modelled:
+  - Payments, asset transfers / opt-ins, asset creation, application calls
+    (create, NoOp, OptIn, CloseOut, ClearState, Update, Delete)
+  - Fee pooling across the group (inner transactions may set Fee = 0)
+  - Pooled opcode budget (700 per app call in the group)
+  - Minimum-balance requirements, including schema and box MBR
+  - Box references and the per-reference box I/O budget
+  - `latest_timestamp` / `round`, both under test control
+
+Not modelled: signatures, logic signatures, local state, inner app calls.
+"""
+
+import base64
+import dataclasses
+import hashlib
+import os
+import time
+from dataclasses import dataclass, field
+from typing import ClassVar, Union
+
+from algosdk import encoding, logic
+
+from .program import Program
+
+# ── Consensus constants ───────────────────────────────────────────────────────
+MIN_TXN_FEE              = 1_000
+MIN_BALANCE              = 100_000
+ASSET_MIN_BALANCE        = 100_000
+APP_PAGE_MIN_BALANCE     = 100_000
+SCHEMA_UINT_MIN_BALANCE  = 28_500
+SCHEMA_BYTES_MIN_BALANCE = 50_000
+BOX_FLAT_MIN_BALANCE     = 2_500
+BOX_BYTE_MIN_BALANCE     = 400
+BYTES_PER_BOX_REFERENCE  = 1_024
+MAX_BOX_SIZE             = 32_768
+MAX_APP_PROGRAM_COST     = 700
+MAX_GROUP_SIZE           = 16
+MAX_INNER_TRANSACTIONS   = 256
+MAX_TXN_REFERENCES       = 8
+MAX_TXN_ACCOUNTS         = 4
+MAX_APP_ARGS             = 16
+MAX_APP_ARGS_BYTES       = 2_048
+
+ZERO_ADDRESS = encoding.encode_address(bytes(32))
+
+StackValue = Union[int, bytes]
+
+
+class LedgerError(Exception):
+    """A transaction group was rejected by a ledger rule (fees, balances, schema...)."""
+
+
+class LogicError(LedgerError):
+    """An approval program failed or rejected the transaction."""
+
+    def __init__(self, message: str, *, app_id: int = 0, line: int = 0, source: str = ""):
+        self.message = message
+        self.app_id  = app_id
+        self.line    = line
+        self.source  = source.strip()
+        detail = f" (app={app_id}, line {line}: {self.source})" if line else f" (app={app_id})"
+        super().__init__(f"logic eval error: {message}{detail}")
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Transactions
+# ─────────────────────────────────────────────────────────────────────────────
+@dataclass
+class Payment:
+    sender:             str
+    receiver:           str
+    amount:             int = 0
+    fee:                int = MIN_TXN_FEE
+    close_remainder_to: str | None = None
+    note:               bytes = b""
+    type:               ClassVar[str] = "pay"
+
+
+@dataclass
+class AssetTransfer:
+    sender:       str
+    receiver:     str
+    asset_id:     int
+    amount:       int = 0
+    fee:          int = MIN_TXN_FEE
+    close_to:     str | None = None
+    asset_sender: str | None = None     # clawback source
+    note:         bytes = b""
+    type:         ClassVar[str] = "axfer"
+
+
+@dataclass
+class AssetCreate:
+    sender:         str
+    total:          int
+    decimals:       int = 0
+    default_frozen: bool = False
+    unit_name:      str = ""
+    asset_name:     str = ""
+    url:            str = ""
+    metadata_hash:  bytes = b""
+    manager:        str | None = None
+    reserve:        str | None = None
+    freeze:         str | None = None
+    clawback:       str | None = None
+    fee:            int = MIN_TXN_FEE
+    note:           bytes = b""
+    type:           ClassVar[str] = "acfg"
+
+
+@dataclass
+class AppCall:
+    sender:           str
+    app_id:           int = 0
+    on_complete:      int = 0
+    args:             list[bytes] = field(default_factory=list)
+    accounts:         list[str]   = field(default_factory=list)
+    foreign_apps:     list[int]   = field(default_factory=list)
+    foreign_assets:   list[int]   = field(default_factory=list)
+    boxes:            list[tuple[int, bytes]] = field(default_factory=list)   # (app_id or 0, name)
+    approval_program: str | Program | None = None
+    clear_program:    str | Program | None = None
+    global_schema:    tuple[int, int] = (0, 0)    # (num_uints, num_byte_slices)
+    local_schema:     tuple[int, int] = (0, 0)
+    extra_pages:      int = 0
+    fee:              int = MIN_TXN_FEE
+    note:             bytes = b""
+    type:             ClassVar[str] = "appl"
+
+
+Transaction = Union[Payment, AssetTransfer, AssetCreate, AppCall]
+
+TYPE_ENUM = {"pay": 1, "keyreg": 2, "acfg": 3, "axfer": 4, "afrz": 5, "appl": 6}
+
+
+@dataclass
+class TxnResult:
+    """What algod's pending-transaction endpoint would report for one transaction."""
+    txid:              str
+    txn:               Transaction
+    confirmed_round:   int
+    logs:              list[bytes] = field(default_factory=list)
+    inner_txns:        list["TxnResult"] = field(default_factory=list)
+    cost:              int = 0
+    application_index: int | None = None
+    asset_index:       int | None = None
+    global_delta:      dict[bytes, StackValue | None] = field(default_factory=dict)   # None: deleted
+    trace:             list[int] | None = None       # instruction indices run, when the ledger is tracing
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Ledger state
+# ─────────────────────────────────────────────────────────────────────────────
+@dataclass
+class Account:
+    balance:      int = 0
+    assets:       dict[int, int] = field(default_factory=dict)   # asset id -> units held
+    created_apps: set[int]       = field(default_factory=set)
+
+    def copy(self) -> "Account":
+        return Account(self.balance, dict(self.assets), set(self.created_apps))
+
+
+@dataclass
+class Application:
+    app_id:        int
+    creator:       str
+    approval:      Program
+    clear:         Program
+    global_schema: tuple[int, int]
+    local_schema:  tuple[int, int]
+    extra_pages:   int = 0
+    global_state:  dict[bytes, StackValue] = field(default_factory=dict)
+    boxes:         dict[bytes, bytes]      = field(default_factory=dict)
+
+    @property
+    def address(self) -> str:
+        return logic.get_application_address(self.app_id)
+
+    def copy(self) -> "Application":
+        return dataclasses.replace(self, global_state=dict(self.global_state), boxes=dict(self.boxes))
+
+
+@dataclass(frozen=True)
+class Asset:
+    asset_id:       int
+    creator:        str
+    total:          int
+    decimals:       int = 0
+    default_frozen: bool = False
+    unit_name:      str = ""
+    asset_name:     str = ""
+    url:            str = ""
+    metadata_hash:  bytes = b""
+    manager:        str = ZERO_ADDRESS
+    reserve:        str = ZERO_ADDRESS
+    freeze:         str = ZERO_ADDRESS
+    clawback:       str = ZERO_ADDRESS
+
+
+@dataclass
+class _State:
+    accounts:      dict[str, Account]
+    apps:          dict[int, Application]
+    assets:        dict[int, Asset]
+    app_addresses: dict[str, int]
+    next_id:       int
+    round:         int
+    timestamp:     int
+
+    def copy(self) -> "_State":
+        return _State(
+            {a: acct.copy() for a, acct in self.accounts.items()},
+            {i: app.copy() for i, app in self.apps.items()},
+            dict(self.assets),
+            dict(self.app_addresses),
+            self.next_id, self.round, self.timestamp,
+        )
+
+
+class Ledger:
+    """An in-memory ledger that executes TEAL approval programs in-process."""
+
+    def __init__(self, *, timestamp: int | None = None, round: int = 1):
+        self._state = _State({}, {}, {}, {}, 1001, round, int(time.time()) if timestamp is None else timestamp)
+        self._txn_counter = 0
+        self.tracing = False          # record each app call's executed instructions in TxnResult.trace
+
+    # ── Clock ────────────────────────────────────────────────────────────────
+    @property
+    def timestamp(self) -> int:
+        """`Global.latest_timestamp()` as seen by the next transaction group."""
+        return self._state.timestamp
+
+    @timestamp.setter
+    def timestamp(self, value: int) -> None:
+        self._state.timestamp = value
+
+    @property
+    def round(self) -> int:
+        return self._state.round
+
+    def advance(self, seconds: int, rounds: int = 1) -> None:
+        """Move chain time forward without waiting."""
+        self._state.timestamp += seconds
+        self._state.round     += rounds
+
+    # ── Accounts ─────────────────────────────────────────────────────────────
+    @property
+    def accounts(self) -> dict[str, Account]:
+        return self._state.accounts
+
+    @property
+    def apps(self) -> dict[int, Application]:
+        return self._state.apps
+
+    @property
+    def assets(self) -> dict[int, Asset]:
+        return self._state.assets
+
+    def new_account(self, balance: int = 0) -> str:
+        """Create a random address, optionally minting `balance` microALGO into it."""
+        address = encoding.encode_address(os.urandom(32))
+        if balance:
+            self.fund(address, balance)
+        return address
+
+    def fund(self, address: str, amount: int) -> None:
+        """Mint `amount` microALGO into `address` (the in-memory dispenser)."""
+        self._account(address).balance += amount
+
+    def balance(self, address: str) -> int:
+        acct = self.accounts.get(address)
+        return acct.balance if acct else 0
+
+    def asset_balance(self, address: str, asset_id: int) -> int | None:
+        """Units of `asset_id` held, or None when the account is not opted in."""
+        acct = self.accounts.get(address)
+        return acct.assets.get(asset_id) if acct else None
+
+    def min_balance(self, address: str) -> int:
+        acct = self.accounts.get(address)
+        if acct is None:
+            return 0
+        total = MIN_BALANCE + ASSET_MIN_BALANCE * len(acct.assets)
+        for app_id in acct.created_apps:
+            app = self.apps[app_id]
+            total += APP_PAGE_MIN_BALANCE * (1 + app.extra_pages)
+            total += SCHEMA_UINT_MIN_BALANCE * app.global_schema[0]
+            total += SCHEMA_BYTES_MIN_BALANCE * app.global_schema[1]
+        app = self._app_by_address(address)
+        if app is not None:
+            for name, value in app.boxes.items():
+                total += BOX_FLAT_MIN_BALANCE + BOX_BYTE_MIN_BALANCE * (len(name) + len(value))
+        return total
+
+    def app_address(self, app_id: int) -> str:
+        return logic.get_application_address(app_id)
+
+    # ── Snapshots ────────────────────────────────────────────────────────────
+    def snapshot(self) -> _State:
+        """Capture the full ledger state; pass the result to `restore`."""
+        return self._state.copy()
+
+    def restore(self, snapshot: _State) -> None:
+        self._state = snapshot.copy()
+
+    # ── Submission ───────────────────────────────────────────────────────────
+    def send(self, txns: Transaction | list[Transaction]) -> list[TxnResult]:
+        """Apply a transaction group atomically and confirm it in a new round."""
+        group = txns if isinstance(txns, list) else [txns]
+        saved = self._state.copy()
+        try:
+            results = _GroupEval(self, group).run()
+        except Exception:
+            self._state = saved
+            raise
+        self._state.round += 1
+        return results
+
+    def simulate(
+        self, txns: Transaction | list[Transaction], *, allow_unnamed_resources: bool = False,
+    ) -> list[TxnResult]:
+        """
+        Evaluate a group and return its results without committing anything.
+        `allow_unnamed_resources` lets app calls read boxes they did not
+        reference, as algod's simulate option of that name does.
+        """
+        group = txns if isinstance(txns, list) else [txns]
+        saved = self._state.copy()
+        try:
+            return _GroupEval(self, group, unnamed_resources=allow_unnamed_resources).run()
+        finally:
+            self._state = saved
+
+    # ── Internal helpers (used by the evaluator) ─────────────────────────────
+    def _account(self, address: str) -> Account:
+        acct = self.accounts.get(address)
+        if acct is None:
+            acct = self.accounts[address] = Account()
+        return acct
+
+    def _app_by_address(self, address: str) -> Application | None:
+        app_id = self._state.app_addresses.get(address)
+        return self.apps.get(app_id) if app_id is not None else None
+
+    def _next_txid(self) -> str:
+        self._txn_counter += 1
+        digest = hashlib.sha512(b"TX" + self._txn_counter.to_bytes(8, "big")).digest()[:32]
+        return base64.b32encode(digest).decode().rstrip("=")
+
+    def _allocate_id(self) -> int:
+        new_id = self._state.next_id
+        self._state.next_id += 1
+        return new_id
+
+
+def as_program(source: str | Program) -> Program:
+    return source if isinstance(source, Program) else Program(source)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Group evaluation
+# ─────────────────────────────────────────────────────────────────────────────
+class _GroupEval:
+    """Evaluates one top-level transaction group against a ledger."""
+
+    def __init__(self, ledger: Ledger, txns: list[Transaction], *, unnamed_resources: bool = False):
+        if not 1 <= len(txns) <= MAX_GROUP_SIZE:
+            raise LedgerError(f"group size {len(txns)} outside 1..{MAX_GROUP_SIZE}")
+        self.ledger   = ledger
+        self.txns     = txns
+        self.txids    = [ledger._next_txid() for _ in txns]
+        self.group_id = hashlib.sha512(b"TG" + "".join(self.txids).encode()).digest()[:32] if len(txns) > 1 else bytes(32)
+        self.scratch: dict[int, list[StackValue]] = {}
+        self.results: list[TxnResult] = []
+
+        # Fees are pooled: any surplus pays for inner transactions.
+        self.fee_credit = sum(t.fee for t in txns) - MIN_TXN_FEE * len(txns)
+        if self.fee_credit < 0:
+            raise LedgerError(f"fee too small: group paid {sum(t.fee for t in txns)}, needs {MIN_TXN_FEE * len(txns)}")
+
+        app_calls = [t for t in txns if isinstance(t, AppCall)]
+        self.budget        = MAX_APP_PROGRAM_COST * len(app_calls)
+        self.inner_count   = 0
+        self.box_quota     = BYTES_PER_BOX_REFERENCE * sum(len(t.boxes) for t in app_calls)
+        self.box_used      = 0
+        self.box_touched: set[tuple[int, bytes]] = set()
+        self.box_refs:    set[tuple[int, bytes]] = set()
+        self.unnamed_resources = unnamed_resources           # simulate only: any box, no I/O budget
+        for t in app_calls:
+            _check_references(t)
+            for app_id, name in t.boxes:
+                self.box_refs.add((app_id or t.app_id, name))
+
+    def run(self) -> list[TxnResult]:
+        for index, txn in enumerate(self.txns):
+            touched: set[str] = set()
+            result = self.apply(txn, index, self.txids[index], touched, inner_of=None)
+            self.check_min_balances(touched)
+            self.results.append(result)
+        return self.results
+
+    # ── Per-transaction dispatch ─────────────────────────────────────────────
+    def apply(self, txn: Transaction, index: int, txid: str, touched: set[str], inner_of) -> TxnResult:
+        ledger = self.ledger
+        result = TxnResult(txid=txid, txn=txn, confirmed_round=ledger.round)
+        sender = ledger._account(txn.sender)
+        touched.add(txn.sender)
+        if sender.balance < txn.fee:
+            raise LedgerError(f"overspend: {txn.sender} cannot pay fee {txn.fee} (balance {sender.balance})")
+        sender.balance -= txn.fee
+
+        if isinstance(txn, Payment):
+            self._pay(txn, touched)
+        elif isinstance(txn, AssetTransfer):
+            self._asset_transfer(txn, touched)
+        elif isinstance(txn, AssetCreate):
+            result.asset_index = self._asset_create(txn)
+        elif isinstance(txn, AppCall):
+            self._app_call(txn, index, result, touched, inner_of)
+        else:
+            raise LedgerError(f"unsupported transaction type {type(txn).__name__}")
+        return result
+
+    def _pay(self, txn: Payment, touched: set[str]) -> None:
+        ledger = self.ledger
+        sender = ledger._account(txn.sender)
+        if sender.balance < txn.amount:
+            raise LedgerError(f"overspend: {txn.sender} has {sender.balance}, tried to send {txn.amount}")
+        sender.balance -= txn.amount
+        ledger._account(txn.receiver).balance += txn.amount
+        touched.add(txn.receiver)
+        if txn.close_remainder_to:
+            if sender.assets or sender.created_apps:
+                raise LedgerError(f"cannot close {txn.sender}: it still holds assets or apps")
+            ledger._account(txn.close_remainder_to).balance += sender.balance
+            touched.add(txn.close_remainder_to)
+            del ledger.accounts[txn.sender]
+
+    def _asset_transfer(self, txn: AssetTransfer, touched: set[str]) -> None:
+        ledger = self.ledger
+        if txn.asset_id not in ledger.assets:
+            raise LedgerError(f"asset {txn.asset_id} does not exist")
+        source   = txn.asset_sender or txn.sender
+        sender   = ledger._account(source)
+        receiver = ledger._account(txn.receiver)
+        touched.update((source, txn.receiver))
+
+        # Opt-in: zero-amount transfer to self
+        if txn.receiver == source and txn.asset_id not in sender.assets:
+            if txn.amount:
+                raise LedgerError(f"{source} is not opted in to asset {txn.asset_id}")
+            sender.assets[txn.asset_id] = 0
+            return
+
+        if txn.asset_id not in sender.assets:
+            raise LedgerError(f"{source} is not opted in to asset {txn.asset_id}")
+        if txn.asset_id not in receiver.assets:
+            raise LedgerError(f"receiver {txn.receiver} is not opted in to asset {txn.asset_id}")
+        if sender.assets[txn.asset_id] < txn.amount:
+            raise LedgerError(f"underflow on asset {txn.asset_id}: {source} holds {sender.assets[txn.asset_id]}")
+        sender.assets[txn.asset_id]   -= txn.amount
+        receiver.assets[txn.asset_id] += txn.amount
+        if txn.close_to:
+            closer = ledger._account(txn.close_to)
+            if txn.asset_id not in closer.assets:
+                raise LedgerError(f"close-to {txn.close_to} is not opted in to asset {txn.asset_id}")
+            closer.assets[txn.asset_id] += sender.assets.pop(txn.asset_id)
+            touched.add(txn.close_to)
+
+    def _asset_create(self, txn: AssetCreate) -> int:
+        ledger   = self.ledger
+        asset_id = ledger._allocate_id()
+        ledger.assets[asset_id] = Asset(
+            asset_id=asset_id, creator=txn.sender, total=txn.total, decimals=txn.decimals,
+            default_frozen=txn.default_frozen, unit_name=txn.unit_name, asset_name=txn.asset_name,
+            url=txn.url, metadata_hash=txn.metadata_hash,
+            manager=txn.manager or ZERO_ADDRESS, reserve=txn.reserve or ZERO_ADDRESS,
+            freeze=txn.freeze or ZERO_ADDRESS, clawback=txn.clawback or ZERO_ADDRESS,
+        )
+        ledger._account(txn.sender).assets[asset_id] = txn.total
+        return asset_id
+
+    def _app_call(self, txn: AppCall, index: int, result: TxnResult, touched: set[str], inner_of) -> None:
+        from .interpreter import EvalContext
+
+        ledger = self.ledger
+        if txn.app_id == 0:
+            if txn.approval_program is None or txn.clear_program is None:
+                raise LedgerError("app create requires approval and clear programs")
+            app_id = ledger._allocate_id()
+            app = Application(
+                app_id=app_id, creator=txn.sender,
+                approval=as_program(txn.approval_program), clear=as_program(txn.clear_program),
+                global_schema=tuple(txn.global_schema), local_schema=tuple(txn.local_schema),
+                extra_pages=txn.extra_pages,
+            )
+            ledger.apps[app_id] = app
+            ledger._state.app_addresses[app.address] = app_id
+            ledger._account(txn.sender).created_apps.add(app_id)
+            result.application_index = app_id
+        else:
+            app = ledger.apps.get(txn.app_id)
+            if app is None:
+                raise LedgerError(f"application {txn.app_id} does not exist")
+        touched.add(app.address)
+        before = dict(app.global_state)
+
+        program = app.clear if txn.on_complete == 3 else app.approval
+        ctx = EvalContext(self, txn, index, app, program, result, touched, caller=inner_of)
+        if ledger.tracing:
+            ctx.trace = result.trace = []
+        if txn.on_complete == 3:
+            saved = ledger.snapshot()
+            try:
+                ctx.run()
+            except LogicError:
+                ledger.restore(saved)       # ClearState always succeeds
+        else:
+            ctx.run()
+        self.scratch[index] = ctx.scratch
+        result.cost = ctx.cost
+        result.logs = ctx.logs
+        result.global_delta = {
+            key: app.global_state.get(key)
+            for key in before.keys() | app.global_state.keys()
+            if before.get(key) != app.global_state.get(key)
+        }
+
+        _check_schema(app)
+        if txn.on_complete == 4:
+            app.approval = as_program(txn.approval_program)
+            app.clear    = as_program(txn.clear_program)
+        elif txn.on_complete == 5:
+            if app.boxes:
+                raise LedgerError(f"cannot delete app {app.app_id}: it still owns boxes")
+            ledger._account(app.creator).created_apps.discard(app.app_id)
+            del ledger.apps[app.app_id]
+            del ledger._state.app_addresses[app.address]
+            touched.add(app.creator)
+
+    # ── Balance checks ───────────────────────────────────────────────────────
+    def check_min_balances(self, touched: set[str]) -> None:
+        ledger = self.ledger
+        for address in touched:
+            acct = ledger.accounts.get(address)
+            if acct is None:
+                continue
+            required = ledger.min_balance(address)
+            empty    = acct.balance == 0 and not acct.assets and not acct.created_apps and required == MIN_BALANCE
+            if acct.balance < required and not empty:
+                raise LedgerError(
+                    f"balance {acct.balance} below min {required} for account {address}"
+                )
+
+
+def _check_references(txn: AppCall) -> None:
+    if len(txn.args) > MAX_APP_ARGS or sum(len(a) for a in txn.args) > MAX_APP_ARGS_BYTES:
+        raise LedgerError("application args exceed 16 entries / 2048 bytes")
+    if len(txn.accounts) > MAX_TXN_ACCOUNTS:
+        raise LedgerError(f"too many accounts: {len(txn.accounts)} > {MAX_TXN_ACCOUNTS}")
+    refs = len(txn.accounts) + len(txn.foreign_apps) + len(txn.foreign_assets) + len(txn.boxes)
+    if refs > MAX_TXN_REFERENCES:
+        raise LedgerError(f"too many references: {refs} > {MAX_TXN_REFERENCES}")
+
+
+def _check_schema(app: Application) -> None:
+    uints = sum(1 for v in app.global_state.values() if isinstance(v, int))
+    byts  = len(app.global_state) - uints
+    if uints > app.global_schema[0]:
+        raise LedgerError(f"store integer count {uints} exceeds schema integer count {app.global_schema[0]}")
+    if byts > app.global_schema[1]:
+        raise LedgerError(f"store bytes count {byts} exceeds schema bytes count {app.global_schema[1]}")
@@ -0,0 +1,281 @@
+"""
+opcodes.py — TEAL opcode and field tables
+==========================================
+Single source of truth for opcode bytes, immediate layouts, opcode costs
+and named-field enumerations, shared by the program parser and the
+in-process interpreter.
+
+Immediate kinds:
+    uint8 / int8     one byte (frame_dig / frame_bury are signed)
+    varuint          unsigned LEB128
+    bytes            varuint length + raw bytes
+    label            signed 16-bit branch offset
+    labels           uint8 count + signed 16-bit offsets   (switch / match)
+    varuints         varuint count + varuints              (intcblock / pushints)
+    byteses          varuint count + length-prefixed bytes (bytecblock / pushbytess)
+    <name>_field     one byte index into the matching field table below
+"""
+
+from typing import NamedTuple
+
+
+class OpSpec(NamedTuple):
+    code:       int
+    immediates: tuple = ()
+    cost:       int   = 1
+    version:    int   = 1
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Opcodes
+# ─────────────────────────────────────────────────────────────────────────────
+OPS: dict[str, OpSpec] = {
+    "err":                 OpSpec(0x00),
+    "sha256":              OpSpec(0x01, cost=35),
+    "keccak256":           OpSpec(0x02, cost=130),
+    "sha512_256":          OpSpec(0x03, cost=45),
+    "ed25519verify":       OpSpec(0x04, cost=1900),
+    "ecdsa_verify":        OpSpec(0x05, ("ecdsa_curve",), cost=1700, version=5),
+    "ecdsa_pk_decompress": OpSpec(0x06, ("ecdsa_curve",), cost=650,  version=5),
+    "ecdsa_pk_recover":    OpSpec(0x07, ("ecdsa_curve",), cost=2000, version=5),
+    "+":                   OpSpec(0x08),
+    "-":                   OpSpec(0x09),
+    "/":                   OpSpec(0x0a),
+    "*":                   OpSpec(0x0b),
+    "<":                   OpSpec(0x0c),
+    ">":                   OpSpec(0x0d),
+    "<=":                  OpSpec(0x0e),
+    ">=":                  OpSpec(0x0f),
+    "&&":                  OpSpec(0x10),
+    "||":                  OpSpec(0x11),
+    "==":                  OpSpec(0x12),
+    "!=":                  OpSpec(0x13),
+    "!":                   OpSpec(0x14),
+    "len":                 OpSpec(0x15),
+    "itob":                OpSpec(0x16),
+    "btoi":                OpSpec(0x17),
+    "%":                   OpSpec(0x18),
+    "|":                   OpSpec(0x19),
+    "&":                   OpSpec(0x1a),
+    "^":                   OpSpec(0x1b),
+    "~":                   OpSpec(0x1c),
+    "mulw":                OpSpec(0x1d),
+    "addw":                OpSpec(0x1e, version=2),
+    "divmodw":             OpSpec(0x1f, cost=20, version=4),
+    "intcblock":           OpSpec(0x20, ("varuints",)),
+    "intc":                OpSpec(0x21, ("uint8",)),
+    "intc_0":              OpSpec(0x22),
+    "intc_1":              OpSpec(0x23),
+    "intc_2":              OpSpec(0x24),
+    "intc_3":              OpSpec(0x25),
+    "bytecblock":          OpSpec(0x26, ("byteses",)),
+    "bytec":               OpSpec(0x27, ("uint8",)),
+    "bytec_0":             OpSpec(0x28),
+    "bytec_1":             OpSpec(0x29),
+    "bytec_2":             OpSpec(0x2a),
+    "bytec_3":             OpSpec(0x2b),
+    "arg":                 OpSpec(0x2c, ("uint8",)),
+    "arg_0":               OpSpec(0x2d),
+    "arg_1":               OpSpec(0x2e),
+    "arg_2":               OpSpec(0x2f),
+    "arg_3":               OpSpec(0x30),
+    "txn":                 OpSpec(0x31, ("txn_field",)),
+    "global":              OpSpec(0x32, ("global_field",)),
+    "gtxn":                OpSpec(0x33, ("uint8", "txn_field")),
+    "load":                OpSpec(0x34, ("uint8",)),
+    "store":               OpSpec(0x35, ("uint8",)),
+    "txna":                OpSpec(0x36, ("txn_field", "uint8"), version=2),
+    "gtxna":               OpSpec(0x37, ("uint8", "txn_field", "uint8"), version=2),
+    "gtxns":               OpSpec(0x38, ("txn_field",), version=3),
+    "gtxnsa":              OpSpec(0x39, ("txn_field", "uint8"), version=3),
+    "gload":               OpSpec(0x3a, ("uint8", "uint8"), version=4),
+    "gloads":              OpSpec(0x3b, ("uint8",), version=4),
+    "gaid":                OpSpec(0x3c, ("uint8",), version=4),
+    "gaids":               OpSpec(0x3d, version=4),
+    "loads":               OpSpec(0x3e, version=5),
+    "stores":              OpSpec(0x3f, version=5),
+    "bnz":                 OpSpec(0x40, ("label",)),
+    "bz":                  OpSpec(0x41, ("label",), version=2),
+    "b":                   OpSpec(0x42, ("label",), version=2),
+    "return":              OpSpec(0x43, version=2),
+    "assert":              OpSpec(0x44, version=3),
+    "bury":                OpSpec(0x45, ("uint8",), version=8),
+    "popn":                OpSpec(0x46, ("uint8",), version=8),
+    "dupn":                OpSpec(0x47, ("uint8",), version=8),
+    "pop":                 OpSpec(0x48),
+    "dup":                 OpSpec(0x49),
+    "dup2":                OpSpec(0x4a, version=2),
+    "dig":                 OpSpec(0x4b, ("uint8",), version=3),
+    "swap":                OpSpec(0x4c, version=3),
+    "select":              OpSpec(0x4d, version=3),
+    "cover":               OpSpec(0x4e, ("uint8",), version=5),
+    "uncover":             OpSpec(0x4f, ("uint8",), version=5),
+    "concat":              OpSpec(0x50, version=2),
+    "substring":           OpSpec(0x51, ("uint8", "uint8"), version=2),
+    "substring3":          OpSpec(0x52, version=2),
+    "getbit":              OpSpec(0x53, version=3),
+    "setbit":              OpSpec(0x54, version=3),
+    "getbyte":             OpSpec(0x55, version=3),
+    "setbyte":             OpSpec(0x56, version=3),
+    "extract":             OpSpec(0x57, ("uint8", "uint8"), version=5),
+    "extract3":            OpSpec(0x58, version=5),
+    "extract_uint16":      OpSpec(0x59, version=5),
+    "extract_uint32":      OpSpec(0x5a, version=5),
+    "extract_uint64":      OpSpec(0x5b, version=5),
+    "replace2":            OpSpec(0x5c, ("uint8",), version=7),
+    "replace3":            OpSpec(0x5d, version=7),
+    "base64_decode":       OpSpec(0x5e, ("base64_encoding",), cost=1, version=7),
+    "json_ref":            OpSpec(0x5f, ("json_ref_type",), cost=25, version=7),
+    "balance":             OpSpec(0x60, version=2),
+    "app_opted_in":        OpSpec(0x61, version=2),
+    "app_local_get":       OpSpec(0x62, version=2),
+    "app_local_get_ex":    OpSpec(0x63, version=2),
+    "app_global_get":      OpSpec(0x64, version=2),
+    "app_global_get_ex":   OpSpec(0x65, version=2),
+    "app_local_put":       OpSpec(0x66, version=2),
+    "app_global_put":      OpSpec(0x67, version=2),
+    "app_local_del":       OpSpec(0x68, version=2),
+    "app_global_del":      OpSpec(0x69, version=2),
+    "asset_holding_get":   OpSpec(0x70, ("asset_holding_field",), version=2),
+    "asset_params_get":    OpSpec(0x71, ("asset_params_field",), version=2),
+    "app_params_get":      OpSpec(0x72, ("app_params_field",), version=5),
+    "acct_params_get":     OpSpec(0x73, ("acct_params_field",), version=6),
+    "min_balance":         OpSpec(0x78, version=3),
+    "pushbytes":           OpSpec(0x80, ("bytes",), version=3),
+    "pushint":             OpSpec(0x81, ("varuint",), version=3),
+    "pushbytess":          OpSpec(0x82, ("byteses",), version=8),
+    "pushints":            OpSpec(0x83, ("varuints",), version=8),
+    "ed25519verify_bare":  OpSpec(0x84, cost=1900, version=7),
+    "callsub":             OpSpec(0x88, ("label",), version=4),
+    "retsub":              OpSpec(0x89, version=4),
+    "proto":               OpSpec(0x8a, ("uint8", "uint8"), version=8),
+    "frame_dig":           OpSpec(0x8b, ("int8",), version=8),
+    "frame_bury":          OpSpec(0x8c, ("int8",), version=8),
+    "switch":              OpSpec(0x8d, ("labels",), version=8),
+    "match":               OpSpec(0x8e, ("labels",), version=8),
+    "shl":                 OpSpec(0x90, version=4),
+    "shr":                 OpSpec(0x91, version=4),
+    "sqrt":                OpSpec(0x92, cost=4, version=4),
+    "bitlen":              OpSpec(0x93, version=4),
+    "exp":                 OpSpec(0x94, version=4),
+    "expw":                OpSpec(0x95, cost=10, version=4),
+    "bsqrt":               OpSpec(0x96, cost=40, version=6),
+    "divw":                OpSpec(0x97, version=6),
+    "sha3_256":            OpSpec(0x98, cost=130, version=7),
+    "b+":                  OpSpec(0xa0, cost=10, version=4),
+    "b-":                  OpSpec(0xa1, cost=10, version=4),
+    "b/":                  OpSpec(0xa2, cost=20, version=4),
+    "b*":                  OpSpec(0xa3, cost=20, version=4),
+    "b<":                  OpSpec(0xa4, version=4),
+    "b>":                  OpSpec(0xa5, version=4),
+    "b<=":                 OpSpec(0xa6, version=4),
+    "b>=":                 OpSpec(0xa7, version=4),
+    "b==":                 OpSpec(0xa8, version=4),
+    "b!=":                 OpSpec(0xa9, version=4),
+    "b%":                  OpSpec(0xaa, cost=20, version=4),
+    "b|":                  OpSpec(0xab, cost=6, version=4),
+    "b&":                  OpSpec(0xac, cost=6, version=4),
+    "b^":                  OpSpec(0xad, cost=6, version=4),
+    "b~":                  OpSpec(0xae, cost=4, version=4),
+    "bzero":               OpSpec(0xaf, version=4),
+    "log":                 OpSpec(0xb0, version=5),
+    "itxn_begin":          OpSpec(0xb1, version=5),
+    "itxn_field":          OpSpec(0xb2, ("txn_field",), version=5),
+    "itxn_submit":         OpSpec(0xb3, version=5),
+    "itxn":                OpSpec(0xb4, ("txn_field",), version=5),
+    "itxna":               OpSpec(0xb5, ("txn_field", "uint8"), version=5),
+    "itxn_next":           OpSpec(0xb6, version=6),
+    "gitxn":               OpSpec(0xb7, ("uint8", "txn_field"), version=6),
+    "gitxna":              OpSpec(0xb8, ("uint8", "txn_field", "uint8"), version=6),
+    "box_create":          OpSpec(0xb9, version=8),
+    "box_extract":         OpSpec(0xba, version=8),
+    "box_replace":         OpSpec(0xbb, version=8),
+    "box_del":             OpSpec(0xbc, version=8),
+    "box_len":             OpSpec(0xbd, version=8),
+    "box_get":             OpSpec(0xbe, version=8),
+    "box_put":             OpSpec(0xbf, version=8),
+    "txnas":               OpSpec(0xc0, ("txn_field",), version=5),
+    "gtxnas":              OpSpec(0xc1, ("uint8", "txn_field"), version=5),
+    "gtxnsas":             OpSpec(0xc2, ("txn_field",), version=5),
+    "args":                OpSpec(0xc3, version=5),
+    "gloadss":             OpSpec(0xc4, version=6),
+    "itxnas":              OpSpec(0xc5, ("txn_field",), version=6),
+    "gitxnas":             OpSpec(0xc6, ("uint8", "txn_field"), version=6),
+    "vrf_verify":          OpSpec(0xd0, ("vrf_standard",), cost=5700, version=7),
+    "block":               OpSpec(0xd1, ("block_field",), version=7),
+}
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Named fields  (position in the tuple == encoded immediate byte)
+# ─────────────────────────────────────────────────────────────────────────────
+TXN_FIELDS = (
+    "Sender", "Fee", "FirstValid", "FirstValidTime", "LastValid", "Note", "Lease",
+    "Receiver", "Amount", "CloseRemainderTo", "VotePK", "SelectionPK", "VoteFirst",
+    "VoteLast", "VoteKeyDilution", "Type", "TypeEnum", "XferAsset", "AssetAmount",
+    "AssetSender", "AssetReceiver", "AssetCloseTo", "GroupIndex", "TxID",
+    "ApplicationID", "OnCompletion", "ApplicationArgs", "NumAppArgs", "Accounts",
+    "NumAccounts", "ApprovalProgram", "ClearStateProgram", "RekeyTo", "ConfigAsset",
+    "ConfigAssetTotal", "ConfigAssetDecimals", "ConfigAssetDefaultFrozen",
+    "ConfigAssetUnitName", "ConfigAssetName", "ConfigAssetURL",
+    "ConfigAssetMetadataHash", "ConfigAssetManager", "ConfigAssetReserve",
+    "ConfigAssetFreeze", "ConfigAssetClawback", "FreezeAsset", "FreezeAssetAccount",
+    "FreezeAssetFrozen", "Assets", "NumAssets", "Applications", "NumApplications",
+    "GlobalNumUint", "GlobalNumByteSlice", "LocalNumUint", "LocalNumByteSlice",
+    "ExtraProgramPages", "Nonparticipation", "Logs", "NumLogs", "CreatedAssetID",
+    "CreatedApplicationID", "LastLog", "StateProofPK", "ApprovalProgramPages",
+    "NumApprovalProgramPages", "ClearStateProgramPages", "NumClearStateProgramPages",
+)
+
+# Fields that take an array index (txna / txnas / gtxnsa / itxna ...)
+TXN_ARRAY_FIELDS = frozenset({
+    "ApplicationArgs", "Accounts", "Assets", "Applications", "Logs",
+    "ApprovalProgramPages", "ClearStateProgramPages",
+})
+
+GLOBAL_FIELDS = (
+    "MinTxnFee", "MinBalance", "MaxTxnLife", "ZeroAddress", "GroupSize",
+    "LogicSigVersion", "Round", "LatestTimestamp", "CurrentApplicationID",
+    "CreatorAddress", "CurrentApplicationAddress", "GroupID", "OpcodeBudget",
+    "CallerApplicationID", "CallerApplicationAddress", "AssetCreateMinBalance",
+    "AssetOptInMinBalance", "GenesisHash",
+)
+
+ASSET_HOLDING_FIELDS = ("AssetBalance", "AssetFrozen")
+
+ASSET_PARAMS_FIELDS = (
+    "AssetTotal", "AssetDecimals", "AssetDefaultFrozen", "AssetUnitName",
+    "AssetName", "AssetURL", "AssetMetadataHash", "AssetManager", "AssetReserve",
+    "AssetFreeze", "AssetClawback", "AssetCreator",
+)
+
+APP_PARAMS_FIELDS = (
+    "AppApprovalProgram", "AppClearStateProgram", "AppGlobalNumUint",
+    "AppGlobalNumByteSlice", "AppLocalNumUint", "AppLocalNumByteSlice",
+    "AppExtraProgramPages", "AppCreator", "AppAddress",
+)
+
+ACCT_PARAMS_FIELDS = (
+    "AcctBalance", "AcctMinBalance", "AcctAuthAddr", "AcctTotalNumUint",
+    "AcctTotalNumByteSlice", "AcctTotalExtraAppPages", "AcctTotalAppsCreated",
+    "AcctTotalAppsOptedIn", "AcctTotalAssetsCreated", "AcctTotalAssets",
+    "AcctTotalBoxes", "AcctTotalBoxBytes",
+)
+
+FIELD_TABLES: dict[str, tuple] = {
+    "txn_field":           TXN_FIELDS,
+    "global_field":        GLOBAL_FIELDS,
+    "asset_holding_field": ASSET_HOLDING_FIELDS,
+    "asset_params_field":  ASSET_PARAMS_FIELDS,
+    "app_params_field":    APP_PARAMS_FIELDS,
+    "acct_params_field":   ACCT_PARAMS_FIELDS,
+    "base64_encoding":     ("URLEncoding", "StdEncoding"),
+    "json_ref_type":       ("JSONString", "JSONUint64", "JSONObject"),
+    "ecdsa_curve":         ("Secp256k1", "Secp256r1"),
+    "vrf_standard":        ("VrfAlgorand",),
+    "block_field":         ("BlkSeed", "BlkTimestamp"),
+}
+
+# OnCompletion and TypeEnum named constants accepted in place of integers
+ON_COMPLETION = ("NoOp", "OptIn", "CloseOut", "ClearState", "UpdateApplication", "DeleteApplication")
+TYPE_ENUMS    = ("unknown", "pay", "keyreg", "acfg", "axfer", "afrz", "appl")
@@ -0,0 +1,96 @@
+"""
+profiler.py — opcode cost by source line and call stack
+========================================================
+Turns the instruction traces a tracing `Ledger` records
+(`ledger.tracing = True`, then `TxnResult.trace`) into where the budget
+went:
+
+    profile = Profile(program, source_map)      # source_map: TEAL line -> (path, line, expr)
+    profile.add(result.trace, "claim")
+    profile.by_source()                         # {(path, line): cost}
+    print(profile.listing("contracts/algolegacy.py", source_text))
+    open("claim.folded", "w").write(profile.folded())
+
+Every executed instruction is charged its opcode cost to its TEAL line,
+and, through the source map, to the contract line that emitted it.
+Stacks are the run's `callsub` frames (PyTEAL subroutine labels) under
+the name given to `add`, ending in that source line ("algolegacy.py:362");
+`folded()` writes them in the folded-stack format flamegraph.pl and
+speedscope read.
+"""
+
+from collections import Counter
+
+from .interpreter import _costs
+from .program import Program
+
+UNMAPPED = ("<router>", 0, "")   # dispatch and ABI glue the compiler generated
+
+
+class Profile:
+    """Accumulated opcode cost of traced runs of one program."""
+
+    def __init__(self, program: Program, source_map: dict[int, tuple[str, int, str]] | None = None):
+        self.program    = program
+        self.source_map = source_map or {}
+        self.total      = 0
+        self.teal:   Counter[int]             = Counter()   # TEAL line -> cost
+        self.stacks: Counter[tuple[str, ...]] = Counter()   # (name, subroutines..., file:line) -> cost
+        self._costs  = _costs(program)                      # what the interpreter charged
+        self._labels: dict[int, str] = {}
+        for label, index in program.labels.items():
+            self._labels.setdefault(index, label)
+
+    def add(self, trace: list[int], name: str) -> int:
+        """Charge one traced run to `name`; returns its cost."""
+        instructions, costs = self.program.instructions, self._costs
+        stack, spent = [name], 0
+        for pc in trace:
+            ins, cost = instructions[pc], costs[pc]
+            spent += cost
+            self.teal[ins.line] += cost
+            self.stacks[(*stack, self._frame(ins.line))] += cost
+            if ins.op == "callsub":
+                stack.append(self._labels.get(ins.args[0], f"pc{ins.args[0]}"))
+            elif ins.op == "retsub" and len(stack) > 1:
+                stack.pop()
+        self.total += spent
+        return spent
+
+    def source(self, teal_line: int) -> tuple[str, int, str]:
+        return self.source_map.get(teal_line, UNMAPPED)
+
+    def _frame(self, teal_line: int) -> str:
+        path, line, _ = self.source(teal_line)
+        return f"{path.rsplit('/', 1)[-1]}:{line}" if line else path
+
+    # ── Reports ──────────────────────────────────────────────────────────────
+    def by_source(self) -> Counter[tuple[str, int]]:
+        """Cost per (source path, line); compiler-generated code is ("<router>", 0)."""
+        out: Counter[tuple[str, int]] = Counter()
+        for teal_line, cost in self.teal.items():
+            path, line, _ = self.source(teal_line)
+            out[path, line] += cost
+        return out
+
+    def folded(self) -> str:
+        """One `frame;frame;frame cost` line per stack."""
+        return "".join(f"{';'.join(stack)} {cost}\n" for stack, cost in sorted(self.stacks.items()))
+
+    def listing(self, path: str, text: str, *, context: int = 1) -> str:
+        """`text` (the source at `path`) with each costed line's opcodes and share of the total."""
+        costs = {line: cost for (p, line), cost in self.by_source().items() if p == path}
+        lines = text.splitlines()
+        shown = sorted({n for line in costs for n in range(line - context, line + context + 1) if 1 <= n <= len(lines)})
+        out, previous = [], 0
+        for n in shown:
+            if previous and n > previous + 1:
+                out.append(f"{'':>7} {'':>6}   ⋮")
+            cost = costs.get(n)
+            share = f"{cost:>7} {cost / self.total:>6.1%}" if cost else f"{'':>7} {'':>6}"
+            out.append(f"{share} {n:>5}  {lines[n - 1]}")
+            previous = n
+        generated = self.by_source().get(UNMAPPED[:2])
+        if generated:
+            out.append(f"{generated:>7} {generated / self.total:>6.1%}        (router: dispatch, ABI decoding and encoding)")
+        return "\n".join(out)
@@ -0,0 +1,207 @@
+"""
+program.py — TEAL source parser
+================================
+Turns TEAL text (as produced by `app.build()`) into a flat list of
+instructions with resolved immediates and branch targets, ready for the
+interpreter.  Source lines are kept so failures can point back at the
+exact TEAL line (and its PyTEAL `// comment`).
+"""
+
+import base64
+from typing import NamedTuple
+
+from algosdk import abi, encoding
+
+from .opcodes import FIELD_TABLES, ON_COMPLETION, OPS, TYPE_ENUMS
+
+
+class TealParseError(ValueError):
+    """Raised when TEAL source cannot be parsed."""
+
+
+class Instruction(NamedTuple):
+    op:   str
+    args: tuple
+    line: int     # 1-based line number in the TEAL source
+    text: str     # raw source line, including any trailing comment
+
+
+class Program:
+    """A parsed TEAL program."""
+
+    def __init__(self, source: str):
+        self.source       = source
+        self.version      = 1
+        self.instructions: list[Instruction] = []
+        self.labels:       dict[str, int]    = {}
+        self._parse()
+
+    def __len__(self) -> int:
+        return len(self.instructions)
+
+    def __repr__(self) -> str:
+        return f"<Program v{self.version} ({len(self.instructions)} instructions)>"
+
+    def context(self, lineno: int) -> str:
+        """Source line `lineno` prefixed by the comment-only lines directly above it.
+
+        PyTEAL emits `Assert(..., comment=...)` as a `// comment` line before
+        the `assert`, so this is what makes failures readable.
+        """
+        lines = self.source.splitlines()
+        start = lineno - 1
+        while start > 0 and lines[start - 1].lstrip().startswith("//"):
+            start -= 1
+        return " ".join(line.strip() for line in lines[start:lineno])
+
+    # ── Parsing ──────────────────────────────────────────────────────────────
+    def _parse(self) -> None:
+        pending: list[tuple[str, list[str], int, str]] = []
+        for lineno, raw in enumerate(self.source.splitlines(), start=1):
+            tokens = _tokenize(raw)
+            if not tokens:
+                continue
+            if tokens[0] == "#pragma":
+                if len(tokens) == 3 and tokens[1] == "version":
+                    self.version = int(tokens[2])
+                continue
+            while tokens and tokens[0].endswith(":") and not tokens[0].startswith('"'):
+                self.labels[tokens[0][:-1]] = len(pending)
+                tokens = tokens[1:]
+            if tokens:
+                pending.append((tokens[0], tokens[1:], lineno, raw))
+
+        for op, toks, lineno, raw in pending:
+            op, args = self._resolve(op, toks, lineno)
+            self.instructions.append(Instruction(op, args, lineno, raw))
+
+    def _resolve(self, op: str, toks: list[str], lineno: int) -> tuple[str, tuple]:
+        # Pseudo-ops are lowered to their push equivalents
+        if op == "int":
+            return "pushint", (_parse_int(toks[0], lineno),)
+        if op == "byte":
+            return "pushbytes", (_parse_bytes(toks, lineno),)
+        if op == "addr":
+            return "pushbytes", (encoding.decode_address(toks[0]),)
+        if op == "method":
+            return "pushbytes", (abi.Method.from_signature(_parse_bytes(toks, lineno).decode()).get_selector(),)
+
+        spec = OPS.get(op)
+        if spec is None:
+            raise TealParseError(f"line {lineno}: unknown opcode {op!r}")
+        if spec.version > self.version:
+            raise TealParseError(f"line {lineno}: {op} requires version {spec.version}")
+
+        args: list = []
+        i = 0
+        for kind in spec.immediates:
+            if kind == "varuints":
+                args.append(tuple(_parse_int(t, lineno) for t in toks[i:]))
+                i = len(toks)
+            elif kind == "byteses":
+                args.append(tuple(_parse_bytes([t], lineno) for t in _group_bytes(toks[i:])))
+                i = len(toks)
+            elif kind == "bytes":
+                args.append(_parse_bytes(toks[i:], lineno))
+                i = len(toks)
+            elif kind == "label":
+                args.append(self._target(toks[i], lineno))
+                i += 1
+            elif kind == "labels":
+                args.append(tuple(self._target(t, lineno) for t in toks[i:]))
+                i = len(toks)
+            elif kind in FIELD_TABLES:
+                table = FIELD_TABLES[kind]
+                name  = toks[i]
+                if name not in table:
+                    name = table[_parse_int(name, lineno)]
+                args.append(name)
+                i += 1
+            else:  # uint8 / int8 / varuint
+                args.append(_parse_int(toks[i], lineno))
+                i += 1
+        if i != len(toks):
+            raise TealParseError(f"line {lineno}: unexpected immediates for {op}: {toks[i:]}")
+        return op, tuple(args)
+
+    def _target(self, label: str, lineno: int) -> int:
+        if label not in self.labels:
+            raise TealParseError(f"line {lineno}: unknown label {label!r}")
+        return self.labels[label]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Token helpers
+# ─────────────────────────────────────────────────────────────────────────────
+def _tokenize(line: str) -> list[str]:
+    """Split a TEAL line on whitespace, keeping quoted strings whole and dropping comments."""
+    tokens: list[str] = []
+    i, n = 0, len(line)
+    while i < n:
+        ch = line[i]
+        if ch in " \t":
+            i += 1
+        elif line.startswith("//", i):
+            break
+        elif ch == '"':
+            j = i + 1
+            while j < n and line[j] != '"':
+                j += 2 if line[j] == "\\" else 1
+            tokens.append(line[i:j + 1])
+            i = j + 1
+        else:
+            j = i
+            while j < n and line[j] not in " \t":
+                j += 1
+            tokens.append(line[i:j])
+            i = j
+    return tokens
+
+
+def _group_bytes(toks: list[str]) -> list[str]:
+    """Re-join `base64 XXX` style two-token constants inside a block."""
+    out, i = [], 0
+    while i < len(toks):
+        if toks[i] in ("base64", "b64", "base32", "b32"):
+            out.append(f"{toks[i]}({toks[i + 1]})")
+            i += 2
+        else:
+            out.append(toks[i])
+            i += 1
+    return out
+
+
+def _parse_int(tok: str, lineno: int) -> int:
+    if tok in ON_COMPLETION:
+        return ON_COMPLETION.index(tok)
+    if tok in TYPE_ENUMS:
+        return TYPE_ENUMS.index(tok)
+    try:
+        if tok.startswith(("0x", "0X")):
+            return int(tok, 16)
+        if len(tok) > 1 and tok.startswith("0"):
+            return int(tok, 8)
+        return int(tok)
+    except ValueError:
+        raise TealParseError(f"line {lineno}: invalid integer {tok!r}") from None
+
+
+def _parse_bytes(toks: list[str], lineno: int) -> bytes:
+    if len(toks) == 2:
+        toks = [f"{toks[0]}({toks[1]})"]
+    if len(toks) != 1:
+        raise TealParseError(f"line {lineno}: expected one byte constant, got {toks}")
+    tok = toks[0]
+    if tok.startswith(("0x", "0X")):
+        return bytes.fromhex(tok[2:])
+    if tok.startswith('"'):
+        return tok[1:-1].encode().decode("unicode_escape").encode("latin-1")
+    for prefix, decode in (("base64(", base64.b64decode), ("b64(", base64.b64decode),
+                           ("base32(", _b32decode), ("b32(", _b32decode)):
+        if tok.startswith(prefix) and tok.endswith(")"):
+            return decode(tok[len(prefix):-1])
+    raise TealParseError(f"line {lineno}: invalid byte constant {tok!r}")
+
+
+def _b32decode(text: str) -> bytes:
+    return base64.b32decode(text + "=" * (-len(text) % 8))
@@ -0,0 +1,83 @@
+"""
+bench_bulk_deploy.py — one deploy per will vs. bulk deployment
+===============================================================
+Usage:
+    python benchmarks/bench_bulk_deploy.py [WILLS] [BLOCK_SECONDS]   # default: 48 0.25
+
+Deploys WILLS wills (3 beneficiaries and a deposit each) through
+client/bulk.py against `avm.algod.AlgodStandIn`, a local algod that
+closes a block every BLOCK_SECONDS, so confirmation waits cost what they
+cost on a network (scaled down from ~2.8 s):
+
+  per will   `deploy([order])` for each will in turn: a creation, then
+             its setup group, each waited for, as repeated deploy.py runs do
+  bulk       `deploy(orders)`: creations 16 to a group, setup groups
+             packed, all signed on a thread pool and confirmed in parallel
+
+Columns:
+    groups     atomic groups submitted
+    wall s     elapsed wall-clock
+    wills/s    throughput
+"""
+
+import pathlib
+import sys
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+from algosdk import account
+from algosdk.transaction import StateSchema
+
+from avm import AlgodStandIn, Ledger
+from client.bulk import BulkDeployer, WillOrder
+from client.transport import PooledAlgodClient
+from contracts.algolegacy import GLOBAL_NUM_BYTE_SLICES, GLOBAL_NUM_UINTS
+from contracts.build_cache import build, compiled
+
+DEPOSIT = 2_000_000
+
+
+def run(n_wills: int, block_seconds: float, bulk: bool) -> tuple[int, float]:
+    spec   = build("AlgoLegacy")[0]
+    ledger = Ledger()
+    deployer_key, deployer = account.generate_account()
+    ledger.fund(deployer, 10**12)
+    heirs  = [account.generate_account()[1] for _ in range(3)]
+    orders = []
+    for _ in range(n_wills):
+        key, addr = account.generate_account()
+        ledger.fund(addr, 10_000_000)
+        orders.append(WillOrder(key, period=3600, heirs=list(zip(heirs, (50, 30, 20))), deposit=DEPOSIT))
+
+    programs = [spec.approval_program, spec.clear_program]
+    with AlgodStandIn(ledger, programs, block_time=block_seconds) as node:
+        deployer_ = BulkDeployer(
+            PooledAlgodClient("", node.url), deployer_key, spec,
+            compiled("AlgoLegacy", "approval", spec.approval_program),
+            compiled("AlgoLegacy", "clear", spec.clear_program),
+            global_schema=StateSchema(GLOBAL_NUM_UINTS, GLOBAL_NUM_BYTE_SLICES),
+            extra_pages=1,
+        )
+        start = time.perf_counter()
+        if bulk:
+            results = deployer_.deploy(orders)
+        else:
+            results = [r for order in orders for r in deployer_.deploy([order])]
+        elapsed = time.perf_counter() - start
+    assert all(r["status"] == "ok" for r in results), results
+    return deployer_.groups, elapsed
+
+
+def main():
+    n_wills       = int(sys.argv[1]) if len(sys.argv) > 1 else 48
+    block_seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 0.25
+
+    print(f"{n_wills} wills, 3 beneficiaries + deposit each, {block_seconds} s blocks\n")
+    print(f"{'mode':<10}{'groups':>8}{'wall s':>9}{'wills/s':>10}")
+    for label, bulk in (("per will", False), ("bulk", True)):
+        groups, elapsed = run(n_wills, block_seconds, bulk)
+        print(f"{label:<10}{groups:>8}{elapsed:>9.2f}{n_wills / elapsed:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+bench_claim_all.py — settling a will: per-slot claims vs. claim_all
+====================================================================
+Usage:
+    python benchmarks/bench_claim_all.py [HEIRS ...]     # default: 3
+
+Builds an activated will with an ALGO deposit and an ASA allocation for
+every heir, on the in-process AVM, and settles it two ways:
+
+  per-slot   each heir sends claim(slot) then claim_asa(slot)
+  claim_all  one call, by anyone, paying everything in grouped inner txns
+
+Columns:
+    txns       outer transactions submitted
+    fees       total fees paid, µALGO
+    rounds     confirmations waited for, one per outer transaction when the
+               heirs settle independently
+    avm ms     wall-clock on the in-process AVM (execution cost only)
+    est. s     rounds × ROUND_SECONDS, the wall-clock on a live network
+
+claim_all needs every heir's account and box in one call, so AVM 8's
+reference limits (4 accounts, 8 references) cap it at 3 heirs with an ASA.
+"""
+
+import pathlib
+import sys
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+from avm import AppClient, AssetCreate, AssetTransfer, Ledger
+from contracts.algolegacy import (
+    GLOBAL_NUM_BYTE_SLICES,
+    GLOBAL_NUM_UINTS,
+    HEIR_BOX_MBR,
+    app,
+    heir_box_name,
+)
+
+DEPOSIT       = 3_000_000
+ASA_UNITS     = 100          # per heir
+ROUND_SECONDS = 2.8          # Algorand block time
+
+
+def build_will(ledger: Ledger, spec, n_heirs: int):
+    """An activated will: equal-ish ALGO shares plus ASA_UNITS of one ASA per heir."""
+    owner = ledger.new_account(20_000_000)
+    heirs = [ledger.new_account(1_000_000) for _ in range(n_heirs)]
+    pcts  = [100 // n_heirs + (1 if i < 100 % n_heirs else 0) for i in range(n_heirs)]
+    boxes = [(0, heir_box_name(slot)) for slot in range(1, n_heirs + 1)]
+
+    client = AppClient(ledger, spec, sender=owner)
+    client.create(global_schema=(GLOBAL_NUM_UINTS, GLOBAL_NUM_BYTE_SLICES), extra_pages=1)
+    ledger.fund(client.app_address, 1_000_000 + HEIR_BOX_MBR * n_heirs)
+    client.call("create_will", period=60, heirs=list(zip(heirs, pcts)), boxes=boxes)
+    client.call("deposit", payment=client.pay(owner, DEPOSIT))
+
+    asset_id = ledger.send(AssetCreate(sender=owner, total=10**6, unit_name="HEIR"))[0].asset_index
+    for heir in heirs:
+        ledger.send(AssetTransfer(sender=heir, receiver=heir, asset_id=asset_id, amount=0))
+    client.call("opt_in_asa", asset=asset_id, fee=2000)
+    client.call(
+        "lock_asa", transfer=client.asset_transfer(owner, asset_id, ASA_UNITS * n_heirs),
+        allocations=[(slot, ASA_UNITS) for slot in range(1, n_heirs + 1)], boxes=boxes,
+    )
+    client.call("force_activate")
+    return client, heirs, asset_id, boxes
+
+
+def settle_per_slot(ledger, client, heirs, asset_id, boxes) -> tuple[int, int]:
+    txns = fees = 0
+    for slot, heir in enumerate(heirs, start=1):
+        as_heir = client.prepare(sender=heir)
+        as_heir.call("claim", beneficiary_slot=slot, boxes=[boxes[slot - 1]], fee=2000)
+        as_heir.call("claim_asa", beneficiary_slot=slot, boxes=[boxes[slot - 1]],
+                     foreign_assets=[asset_id], fee=2000)
+        txns += 2
+        fees += 4000
+    return txns, fees
+
+
+def settle_claim_all(ledger, client, heirs, asset_id, boxes) -> tuple[int, int]:
+    fee    = 1000 * (1 + 2 * len(heirs))
+    caller = client.prepare(sender=heirs[0])
+    caller.call("claim_all", accounts=heirs, foreign_assets=[asset_id], boxes=boxes, fee=fee)
+    return 1, fee
+
+
+def main(sizes: list[int]) -> None:
+    spec = app.build()
+    print(f"{'heirs':>5} {'path':<10} {'txns':>5} {'fees':>7} {'rounds':>7} {'avm ms':>7} {'est. s':>7}")
+    for n in sizes:
+        for name, settle in (("per-slot", settle_per_slot), ("claim_all", settle_claim_all)):
+            ledger = Ledger()
+            will   = build_will(ledger, spec, n)
+            start  = time.perf_counter()
+            txns, fees = settle(ledger, *will)
+            elapsed = (time.perf_counter() - start) * 1000
+            _, heirs, asset_id, _ = will
+            assert all(ledger.asset_balance(h, asset_id) == ASA_UNITS for h in heirs)
+            print(f"{n:>5} {name:<10} {txns:>5} {fees:>7} {txns:>7} {elapsed:>7.1f} "
+                  f"{txns * ROUND_SECONDS:>7.1f}")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [3])
@@ -0,0 +1,79 @@
+"""
+bench_claim_cost.py — claim cost vs. number of beneficiaries
+=============================================================
+Usage:
+    python benchmarks/bench_claim_cost.py [HEIRS ...]     # default: 3 10 25 50 100
+
+Builds one will per size on the in-process AVM (no network), activates it,
+and claims the first, middle and last slot.  Each claim reads and rewrites
+one beneficiary box, so its opcode cost and fee should not grow with the
+number of heirs.
+
+Columns:
+    opcodes   approval-program cost of the claim call (budget: 700)
+    fee       outer fee paid, µALGO (base + one zero-fee inner payment)
+    box MBR   µALGO the app account locks up for beneficiary boxes
+"""
+
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+from avm import AppClient, Ledger
+from contracts.algolegacy import (
+    GLOBAL_NUM_BYTE_SLICES,
+    GLOBAL_NUM_UINTS,
+    HEIR_BOX_MBR,
+    app,
+    heir_box_name,
+)
+
+DEFAULT_SIZES  = (3, 10, 25, 50, 100)
+HEIRS_PER_CALL = 8            # one box reference per heir, 8 references per txn
+DEPOSIT        = 100_000_000
+CLAIM_FEE      = 2000
+
+
+def build_will(ledger: Ledger, spec, n_heirs: int) -> tuple[AppClient, list[str]]:
+    """A funded, activated will with `n_heirs` equal-ish shares summing to 100."""
+    owner  = ledger.new_account(DEPOSIT + 10_000_000)
+    heirs  = [ledger.new_account(1_000_000) for _ in range(n_heirs)]
+    pcts   = [100 // n_heirs + (1 if i < 100 % n_heirs else 0) for i in range(n_heirs)]
+    shares = list(zip(heirs, pcts))
+
+    client = AppClient(ledger, spec, sender=owner)
+    client.create(global_schema=(GLOBAL_NUM_UINTS, GLOBAL_NUM_BYTE_SLICES), extra_pages=1)
+    ledger.fund(client.app_address, 100_000 + HEIR_BOX_MBR * n_heirs)
+
+    for start in range(0, n_heirs, HEIRS_PER_CALL):
+        chunk = shares[start:start + HEIRS_PER_CALL]
+        boxes = [(0, heir_box_name(slot)) for slot in range(start + 1, start + len(chunk) + 1)]
+        if start == 0:
+            client.call("create_will", period=60, heirs=chunk, boxes=boxes)
+        else:
+            client.call("add_heirs", heirs=chunk, boxes=boxes)
+
+    client.call("deposit", payment=client.pay(owner, DEPOSIT))
+    client.call("force_activate")
+    return client, heirs
+
+
+def claim_cost(ledger: Ledger, client: AppClient, heirs: list[str], slot: int) -> int:
+    heir   = client.prepare(sender=heirs[slot - 1])
+    result = heir.call("claim", beneficiary_slot=slot, fee=CLAIM_FEE, boxes=[(0, heir_box_name(slot))])
+    return result.cost
+
+
+def main(sizes: list[int]) -> None:
+    spec = app.build()
+    print(f"{'heirs':>6} {'slot':>5} {'opcodes':>8} {'fee':>6} {'box MBR':>10}")
+    for n in sizes:
+        ledger = Ledger()
+        client, heirs = build_will(ledger, spec, n)
+        for slot in sorted({1, (n + 1) // 2, n}):
+            cost = claim_cost(ledger, client, heirs, slot)
+            print(f"{n:>6} {slot:>5} {cost:>8} {CLAIM_FEE:>6} {HEIR_BOX_MBR * n:>10}")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or list(DEFAULT_SIZES))
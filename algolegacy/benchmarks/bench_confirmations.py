@@ -0,0 +1,72 @@
+"""
+bench_confirmations.py — one polling loop per txid vs. ConfirmationTracker
+===========================================================================
+Usage:
+    python benchmarks/bench_confirmations.py [TXNS] [BLOCK_SECONDS]   # default: 300 0.25
+
+Submits TXNS independent payments to `avm.AlgodStandIn` (blocks every
+BLOCK_SECONDS), then waits for all of them:
+
+  per txid   `wait_for_confirmation` for each txid, on a thread each, as
+             N in-flight transactions are waited for today
+  tracker    one `ConfirmationTracker`: status_after_block + block txids
+             once per round, whatever the number of txids
+
+Columns:
+    requests   HTTP requests made while waiting
+    wall s     from the first submission to the last confirmation
+"""
+
+import pathlib
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+from algosdk import account, transaction
+from algosdk.atomic_transaction_composer import AccountTransactionSigner
+
+from avm import AlgodStandIn, Ledger
+from client.confirm import ConfirmationTracker
+from client.transport import PooledAlgodClient
+
+
+def run(n_txns: int, block_seconds: float, tracked: bool) -> tuple[int, float]:
+    ledger = Ledger()
+    key, sender = account.generate_account()
+    ledger.fund(sender, 10**12)
+    receiver = account.generate_account()[1]
+
+    with AlgodStandIn(ledger, block_time=block_seconds) as node:
+        algod = PooledAlgodClient("", node.url, pool_size=64)
+        sp    = algod.suggested_params()
+        txns  = [transaction.PaymentTxn(sender, sp, receiver, 100_000 + i) for i in range(n_txns)]
+        signed = AccountTransactionSigner(key).sign_transactions(txns, list(range(n_txns)))
+
+        start = time.perf_counter()
+        if tracked:
+            with ConfirmationTracker(algod) as tracker:
+                txids = [algod.send_transaction(stxn) for stxn in signed]
+                before = node.requests
+                tracker.wait(txids)
+        else:
+            txids  = [algod.send_transaction(stxn) for stxn in signed]
+            before = node.requests
+            with ThreadPoolExecutor(n_txns) as pool:
+                list(pool.map(lambda txid: transaction.wait_for_confirmation(algod, txid, 8), txids))
+        return node.requests - before, time.perf_counter() - start
+
+
+def main():
+    n_txns        = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    block_seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 0.25
+
+    print(f"{n_txns} payments in flight, {block_seconds} s blocks\n")
+    print(f"{'mode':<10}{'requests':>10}{'wall s':>9}")
+    for label, tracked in (("per txid", False), ("tracker", True)):
+        requests, elapsed = run(n_txns, block_seconds, tracked)
+        print(f"{label:<10}{requests:>10}{elapsed:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+bench_indexer.py — will queries from the local SQLite index
+============================================================
+Usage:
+    python benchmarks/bench_indexer.py [WILLS]   # default: 100000
+
+Builds a `WillIndex` of WILLS wills from synthetic blocks (one
+`create_will` per will with its global-state delta, 2 beneficiaries each
+drawn from 10 000 addresses, 256 wills per block), then times the queries
+that used to take an algod read per app or an indexer history walk:
+
+  will          one will by app id
+  wills_for     every will an address owns or inherits from (~30)
+  due_between   live wills whose deadline falls in the next hour
+
+Columns:
+    ms         mean of 200 runs
+    rows       rows returned by the last run
+"""
+
+import pathlib
+import random
+import sys
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+from algosdk import abi, account, encoding
+
+from client.indexer import WillIndex
+from contracts.algolegacy import STATUS_HEIR_COUNT_SHIFT, STATUS_PERCENT_TOTAL_SHIFT
+from contracts.build_cache import build
+
+DAY       = 86_400
+NOW       = 1_700_000_000
+PER_BLOCK = 256
+SHARES    = abi.ABIType.from_string("(address,uint64)[]")
+STATUS    = 1 | 100 << STATUS_PERCENT_TOTAL_SHIFT | 2 << STATUS_HEIR_COUNT_SHIFT
+
+
+def create_entry(app_id: int, owner: str, heirs: list[str], period: int, last_checkin: int, selector: bytes) -> dict:
+    return {
+        "txn": {"type": "appl", "snd": encoding.decode_address(owner),
+                "apaa": [selector, period.to_bytes(8, "big"), SHARES.encode([[heirs[0], 50], [heirs[1], 50]])]},
+        "apid": app_id,
+        "dt": {"gd": {
+            "owner":             {"at": 1, "bs": encoding.decode_address(owner)},
+            "inactivity_period": {"at": 2, "ui": period},
+            "last_checkin":      {"at": 2, "ui": last_checkin},
+            "status":            {"at": 2, "ui": STATUS},
+        }},
+    }
+
+
+def build_index(n_wills: int, rng: random.Random) -> tuple[WillIndex, list[str], float]:
+    """The index, the address pool, and seconds spent applying blocks."""
+    contract = build("AlgoLegacy")[0].contract
+    selector = contract.get_method_by_name("create_will").get_selector()
+    index    = WillIndex(":memory:", contract, app_ids=range(1000, 1000 + n_wills))
+    people   = [account.generate_account()[1] for _ in range(10_000)]
+    entries  = []
+    for app_id in range(1000, 1000 + n_wills):
+        period = rng.randint(1, 30) * DAY
+        entries.append(create_entry(app_id, rng.choice(people), rng.sample(people, 2),
+                                    period, NOW - rng.randint(0, period), selector))
+    start = time.perf_counter()
+    for rnd, first in enumerate(range(0, n_wills, PER_BLOCK), 1):
+        index.apply_block({"rnd": rnd, "ts": NOW, "txns": entries[first:first + PER_BLOCK]})
+    return index, people, time.perf_counter() - start
+
+
+def timed(query, runs: int = 200) -> tuple[float, int]:
+    start = time.perf_counter()
+    for _ in range(runs):
+        rows = query()
+    return (time.perf_counter() - start) / runs * 1000, len(rows)
+
+
+def main():
+    n_wills = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rng     = random.Random(1)
+
+    index, people, applied = build_index(n_wills, rng)
+    print(f"{n_wills} wills indexed from {-(-n_wills // PER_BLOCK)} blocks in {applied:.1f} s "
+          f"({n_wills / applied:.0f} creations/s)\n")
+
+    print(f"{'query':<14}{'ms':>8}{'rows':>7}")
+    for label, query in (
+        ("will",        lambda: [index.will(1000 + rng.randrange(n_wills))]),
+        ("wills_for",   lambda: index.wills_for(rng.choice(people))),
+        ("due_between", lambda: index.due_between(NOW, NOW + 3600)),
+    ):
+        ms, rows = timed(query)
+        print(f"{label:<14}{ms:>8.3f}{rows:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+bench_keeper.py — deadline heap vs. rescanning every will each round
+=====================================================================
+Usage:
+    python benchmarks/bench_keeper.py [WILLS] [ROUNDS] [CHECKINS]   # default: 100000 500 50
+
+Simulates a ledger of WILLS wills (periods of 1 to 30 days, last check-ins
+spread over the past period) and ROUNDS blocks ~9 minutes of chain time apart, each carrying
+CHECKINS `check_in` calls on random wills.  Each round finds the wills that
+became due:
+
+  rescan   every will's last_checkin + period against the block timestamp,
+           as a loop over all tracked wills does each tick
+  heap     `Keeper.observe_block` + `Keeper.due`: the block's calls update
+           the deadline heap, and only due wills are popped
+
+Both report the same wills in the same rounds.  Loading state once
+(`Keeper.track`, through a stub algod over the simulated ledger) is
+timed separately.
+
+Columns:
+    ms/round   bookkeeping per round (activation calls are not sent)
+    due        wills found due over all rounds
+"""
+
+import base64
+import pathlib
+import random
+import sys
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+from algosdk import account
+
+from client.keeper import Keeper
+from contracts.build_cache import build
+
+DAY        = 86_400
+BLOCK_TIME = 2.8
+CREATED    = 1                       # status word: will_created, not active
+
+
+class SimulatedAlgod:
+    """The `application_info` a Keeper needs, over {app_id: [last_checkin, period]}."""
+
+    def __init__(self, wills: dict[int, list[int]]):
+        self.wills = wills
+
+    def application_info(self, app_id: int) -> dict:
+        last_checkin, period = self.wills[app_id]
+        return {"params": {"global-state": [
+            _uint(b"last_checkin", last_checkin), _uint(b"inactivity_period", period), _uint(b"status", CREATED),
+        ]}}
+
+
+def _uint(key: bytes, value: int) -> dict:
+    return {"key": base64.b64encode(key).decode(), "value": {"type": 2, "bytes": "", "uint": value}}
+
+
+def simulate(n_wills: int, n_rounds: int, checkins: int, seed: int = 1):
+    rng   = random.Random(seed)
+    now   = 1_700_000_000
+    wills = {}
+    for app_id in range(1, n_wills + 1):
+        period = rng.randint(1, 30) * DAY
+        wills[app_id] = [now - rng.randint(0, period), period]
+    selector = base64.b64encode(build("AlgoLegacy")[0].contract.get_method_by_name("check_in").get_selector()).decode()
+    state  = {app_id: list(v) for app_id, v in wills.items()}
+    blocks = []
+    prev   = now
+    for r in range(1, n_rounds + 1):
+        ts   = now + int(r * BLOCK_TIME * 200)               # ~9 minutes of chain time per round
+        txns = []
+        while len(txns) < checkins:
+            app_id = rng.randint(1, n_wills)
+            last, period = state[app_id]
+            if last + period < prev:                         # activated already: check_in would fail
+                continue
+            state[app_id][0] = ts
+            txns.append({"txn": {"type": "appl", "apid": app_id, "apaa": [selector]}})
+        blocks.append({"rnd": r, "ts": ts, "txns": txns})
+        prev = ts
+    return wills, blocks
+
+
+def run_rescan(wills: dict[int, list[int]], blocks: list[dict]) -> tuple[float, list[list[int]]]:
+    state  = {app_id: list(v) for app_id, v in wills.items()}
+    active = set()
+    out    = []
+    start  = time.perf_counter()
+    for block in blocks:
+        for entry in block["txns"]:
+            state[entry["txn"]["apid"]][0] = block["ts"]
+        due = [app_id for app_id, (last, period) in state.items()
+               if app_id not in active and last + period < block["ts"]]
+        active.update(due)
+        out.append(sorted(due))
+    return time.perf_counter() - start, out
+
+
+def run_heap(keeper: Keeper, blocks: list[dict]) -> tuple[float, list[list[int]]]:
+    out   = []
+    start = time.perf_counter()
+    for block in blocks:
+        keeper.observe_block(block)
+        out.append(sorted(keeper.due(block["ts"])))
+    return time.perf_counter() - start, out
+
+
+def main():
+    n_wills  = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    n_rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    checkins = int(sys.argv[3]) if len(sys.argv) > 3 else 50
+
+    wills, blocks = simulate(n_wills, n_rounds, checkins)
+    keeper = Keeper(SimulatedAlgod(wills), account.generate_account()[0], build("AlgoLegacy")[0].contract)
+    start  = time.perf_counter()
+    keeper.track(wills)
+    loaded = time.perf_counter() - start
+
+    print(f"{n_wills} wills, {n_rounds} rounds, {checkins} check-ins per round")
+    print(f"initial load (Keeper.track): {loaded:.2f} s\n")
+    print(f"{'mode':<8}{'ms/round':>10}{'due':>8}")
+    rescan_s, rescan_due = run_rescan(wills, blocks)
+    heap_s,   heap_due   = run_heap(keeper, blocks)
+    assert rescan_due == heap_due, "heap and rescan disagree"
+    for label, elapsed, due in (("rescan", rescan_s, rescan_due), ("heap", heap_s, heap_due)):
+        print(f"{label:<8}{elapsed / n_rounds * 1000:>10.3f}{sum(map(len, due)):>8}")
+
+
+if __name__ == "__main__":
+    main()
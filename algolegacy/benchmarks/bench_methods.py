@@ -0,0 +1,214 @@
+"""
+bench_methods.py — per-method opcode cost and program size, gated on a baseline
+================================================================================
+Usage:
+    python benchmarks/bench_methods.py            # report, and compare with the baseline
+    python benchmarks/bench_methods.py --check    # ... exit 1 if anything regressed
+    python benchmarks/bench_methods.py --update   # write the current numbers as the baseline
+    python benchmarks/bench_methods.py --profile optimised
+                                                  # another build profile against the same baseline
+
+Builds AlgoLegacy and measures, on the in-process AVM:
+
+  program   approval / clear bytecode bytes, the extra pages they need
+            (both programs count against 2048 bytes per page) and the
+            creator's minimum balance for pages + global schema
+  methods   approval-program opcode cost of every ABI method in each
+            lifecycle state it runs in, keyed "method@STATE"
+
+The lifecycle is one will with 3 heirs and a locked ASA, driven from
+NO_WILL to claimed; calls that change state are made in order on it, and
+the others (read-only helpers in every state, revoke / force_activate /
+claim_all as alternatives) are run and rolled back.
+
+The baseline is benchmarks/baselines/methods.json.  A number regresses
+when it grows by more than TOLERANCE over its baseline; extra pages may
+not grow at all, and no call may exceed the 700-opcode budget of one app
+call.  tests/test_method_costs.py runs the same check in the test suite.
+"""
+
+import json
+import math
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+from avm import AppClient, AssetCreate, AssetTransfer, Ledger, TxnResult
+from avm.ledger import APP_PAGE_MIN_BALANCE, SCHEMA_BYTES_MIN_BALANCE, SCHEMA_UINT_MIN_BALANCE
+from contracts.algolegacy import GLOBAL_NUM_BYTE_SLICES, GLOBAL_NUM_UINTS, HEIR_BOX_MBR, heir_box_name
+from contracts.build_cache import artifact_name, build, compiled
+
+BASELINE      = pathlib.Path(__file__).parent / "baselines" / "methods.json"
+TOLERANCE     = 0.02              # relative growth allowed before a number counts as regressed
+OPCODE_BUDGET = 700               # per app call, without pooling
+PAGE_BYTES    = 2048
+PERIOD        = 60
+READ_ONLY     = ("get_will_status", "get_time_remaining", "get_locked_balance", "get_will_snapshot")
+BOXES         = [(0, heir_box_name(slot)) for slot in (1, 2, 3)]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Measurement
+# ─────────────────────────────────────────────────────────────────────────────
+def program_metrics(spec, name: str = "AlgoLegacy") -> dict[str, int]:
+    approval = len(compiled(name, "approval", spec.approval_program))
+    clear    = len(compiled(name, "clear", spec.clear_program))
+    extra    = max(0, math.ceil((approval + clear) / PAGE_BYTES) - 1)
+    return {
+        "approval_bytes": approval,
+        "clear_bytes":    clear,
+        "extra_pages":    extra,
+        "global_mbr":     APP_PAGE_MIN_BALANCE * (1 + extra)
+                          + SCHEMA_UINT_MIN_BALANCE * GLOBAL_NUM_UINTS
+                          + SCHEMA_BYTES_MIN_BALANCE * GLOBAL_NUM_BYTE_SLICES,
+    }
+
+
+class Lifecycle:
+    """One will driven through its states, recording each call's cost and result."""
+
+    def __init__(self, spec, extra_pages: int, *, trace: bool = False):
+        self.ledger = Ledger()
+        self.ledger.tracing = trace
+        self.owner  = self.ledger.new_account(50_000_000)
+        self.heirs  = [self.ledger.new_account(1_000_000) for _ in range(3)]
+        self.client = AppClient(self.ledger, spec, sender=self.owner)
+        self.client.create(global_schema=(GLOBAL_NUM_UINTS, GLOBAL_NUM_BYTE_SLICES), extra_pages=extra_pages)
+        self.ledger.fund(self.client.app_address, 1_000_000 + HEIR_BOX_MBR * len(BOXES))
+        self.costs:   dict[str, int]      = {}
+        self.results: dict[str, TxnResult] = {}          # the app call of each, with .trace when tracing
+        self.state = "NO_WILL"
+
+    def step(self, method: str, sender: str | None = None, **kwargs) -> None:
+        """Make the call on the will and keep its effects."""
+        client = self.client.prepare(sender=sender) if sender else self.client
+        result = client.call(method, **kwargs)
+        key    = f"{method}@{self.state}"
+        self.costs[key], self.results[key] = result.cost, result.tx_info
+
+    def branch(self, method: str, sender: str | None = None, **kwargs) -> None:
+        """Make the call, record its cost, and roll the will back."""
+        saved = self.ledger.snapshot()
+        try:
+            self.step(method, sender, **kwargs)
+        finally:
+            self.ledger.restore(saved)
+
+    def read_only(self) -> None:
+        for method in READ_ONLY:
+            self.branch(method, boxes=BOXES)
+
+
+def method_costs(spec, extra_pages: int) -> dict[str, int]:
+    """Opcode cost of every method in each lifecycle state it runs in."""
+    return run_lifecycle(spec, extra_pages).costs
+
+
+def run_lifecycle(spec, extra_pages: int, *, trace: bool = False) -> Lifecycle:
+    """Every method called in each lifecycle state it runs in; `trace` keeps instruction traces."""
+    will = Lifecycle(spec, extra_pages, trace=trace)
+    ledger, owner, heirs = will.ledger, will.owner, will.heirs
+    asset_id = ledger.send(AssetCreate(sender=owner, total=1000, unit_name="NFT"))[0].asset_index
+    for heir in heirs:
+        ledger.send(AssetTransfer(sender=heir, receiver=heir, asset_id=asset_id, amount=0))
+
+    will.read_only()
+    will.step("create_will", period=PERIOD, heirs=[(heirs[0], 50), (heirs[1], 30)], boxes=BOXES[:2])
+
+    will.state = "ALIVE"
+    will.step("add_heirs", heirs=[(heirs[2], 20)], boxes=BOXES[2:])
+    will.step("deposit", payment=will.client.pay(owner, 3_000_000))
+    will.step("check_in")
+    will.step("opt_in_asa", asset=asset_id, fee=2000)
+    will.step("lock_asa", transfer=will.client.asset_transfer(owner, asset_id, 300),
+              allocations=[(1, 100), (2, 100), (3, 100)], boxes=BOXES)
+    will.read_only()
+    will.branch("revoke_will", fee=5000, foreign_assets=[asset_id])
+    will.branch("force_activate")
+
+    ledger.advance(PERIOD + 1)
+    will.state = "READY_TO_ACTIVATE"
+    will.read_only()
+    will.step("activate_inheritance")
+
+    will.state = "INHERITANCE_ACTIVE"
+    will.read_only()
+    will.branch("claim_all", accounts=heirs, foreign_assets=[asset_id], boxes=BOXES, fee=7000)
+    will.branch("claim_everything", heirs[0], beneficiary_slot=1, boxes=BOXES[:1], foreign_assets=[asset_id], fee=3000)
+    will.branch("claim_asa", heirs[0], beneficiary_slot=1, boxes=BOXES[:1], foreign_assets=[asset_id], fee=2000)
+    will.step("claim", heirs[0], beneficiary_slot=1, boxes=BOXES[:1], fee=2000)
+
+    will.state = "PARTLY_CLAIMED"
+    will.read_only()
+    will.step("claim_asa", heirs[0], beneficiary_slot=1, boxes=BOXES[:1], foreign_assets=[asset_id], fee=2000)
+    will.step("claim_everything", heirs[1], beneficiary_slot=2, boxes=BOXES[1:2], foreign_assets=[asset_id], fee=3000)
+    will.step("claim_all", accounts=heirs, foreign_assets=[asset_id], boxes=BOXES, fee=3000)
+    return will
+
+
+def measure(spec=None, options: dict | None = None) -> dict:
+    """Program metrics and method costs of `spec` (default: AlgoLegacy built with `options`)."""
+    spec    = spec or build("AlgoLegacy", options)[0]
+    program = program_metrics(spec, artifact_name("AlgoLegacy", options))
+    return {"program": program, "methods": method_costs(spec, program["extra_pages"])}
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Gate
+# ─────────────────────────────────────────────────────────────────────────────
+def compare(current: dict, baseline: dict, tolerance: float = TOLERANCE) -> list[str]:
+    """Regressions of `current` against `baseline`, one message each (empty: none)."""
+    problems = []
+    for section in ("program", "methods"):
+        for key, base in baseline.get(section, {}).items():
+            now = current[section].get(key)
+            if now is None:
+                problems.append(f"{section}.{key}: no longer measured (was {base})")
+            elif key == "extra_pages" and now > base:
+                problems.append(f"{section}.{key}: {base} → {now}")
+            elif now > base * (1 + tolerance):
+                problems.append(f"{section}.{key}: {base} → {now} (+{(now - base) / base:.1%})")
+    for key, cost in current["methods"].items():
+        if cost > OPCODE_BUDGET:
+            problems.append(f"methods.{key}: {cost} opcodes is over the {OPCODE_BUDGET} budget of one app call")
+    return problems
+
+
+def load_baseline(path: pathlib.Path = BASELINE) -> dict:
+    return json.loads(path.read_text())
+
+
+def write_baseline(current: dict, path: pathlib.Path = BASELINE) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(current, indent=2, sort_keys=True) + "\n")
+
+
+def main() -> None:
+    options  = {"profile": sys.argv[sys.argv.index("--profile") + 1]} if "--profile" in sys.argv else None
+    if options and "--update" in sys.argv:
+        sys.exit("The baseline is of the default build; --update takes no --profile")
+    current  = measure(options=options)
+    baseline = load_baseline() if BASELINE.exists() else {"program": {}, "methods": {}}
+
+    print(f"{'program':<38}{'now':>8}{'baseline':>10}")
+    for key, value in current["program"].items():
+        print(f"{key:<38}{value:>8}{baseline['program'].get(key, '-'):>10}")
+    print(f"\n{'method@state':<38}{'opcodes':>8}{'baseline':>10}")
+    for key, value in current["methods"].items():
+        print(f"{key:<38}{value:>8}{baseline['methods'].get(key, '-'):>10}")
+
+    if "--update" in sys.argv:
+        write_baseline(current)
+        print(f"\nBaseline written to {BASELINE}")
+        return
+    problems = compare(current, baseline)
+    for problem in problems:
+        print(f"REGRESSION  {problem}")
+    if not problems:
+        print(f"\nNo regressions beyond {TOLERANCE:.0%} of the baseline")
+    if problems and "--check" in sys.argv:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
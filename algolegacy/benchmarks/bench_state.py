@@ -0,0 +1,100 @@
+"""
+bench_state.py — decoding a fleet's global state into WillState records
+========================================================================
+Usage:
+    python benchmarks/bench_state.py [WILLS]   # default: 100000
+
+Builds WILLS `global-state` lists shaped as algod returns them (base64
+keys, type-tagged values, a 32-byte owner; unset uints absent) and
+decodes them three ways:
+
+  dict        `decode_global_state` + `decode_status` per app, the way
+              client code decoded before client/state.py
+  WillState   `decode_states`: `__slots__` records with derived fields
+  + owner     the same, then reading each `owner` address: the rate
+              a caller that shows owners gets.  Every owner is distinct,
+              so the per-owner address cache never helps the timed pass
+
+Memory is the tracemalloc peak while the WILLS decoded results are held
+(for `+ owner`, including the cached addresses).
+
+Columns:
+    states/s   decode throughput
+    MB         peak memory of the decoded results
+"""
+
+import base64
+import os
+import pathlib
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+from client.state import decode_global_state, decode_states
+from contracts.algolegacy import STATUS_HEIR_COUNT_SHIFT, STATUS_PERCENT_TOTAL_SHIFT, decode_status
+
+DAY = 86_400
+NOW = 1_700_000_000
+
+
+def global_state(rng: random.Random) -> list[dict]:
+    def uint(key: bytes, value: int) -> dict:
+        return {"key": base64.b64encode(key).decode(), "value": {"type": 2, "bytes": "", "uint": value}}
+
+    period = rng.randint(1, 30) * DAY
+    items  = [
+        {"key": base64.b64encode(b"owner").decode(),
+         "value": {"type": 1, "bytes": base64.b64encode(os.urandom(32)).decode(), "uint": 0}},
+        uint(b"inactivity_period", period),
+        uint(b"last_checkin", NOW - rng.randint(0, period)),
+        uint(b"status", 1 | 100 << STATUS_PERCENT_TOTAL_SHIFT | rng.randint(1, 3) << STATUS_HEIR_COUNT_SHIFT),
+    ]
+    if rng.random() < 0.3:
+        items.append(uint(b"total_locked", rng.randint(1, 10**9)))
+    rng.shuffle(items)
+    return items
+
+
+def as_dicts(apps: list[tuple[int, list[dict]]]) -> list[dict]:
+    out = []
+    for app_id, items in apps:
+        state = decode_global_state(items)
+        out.append({"app_id": app_id, **state, **decode_status(state.get(b"status", 0))})
+    return out
+
+
+def with_owners(apps: list[tuple[int, list[dict]]]) -> list:
+    states = decode_states(apps)
+    for state in states:
+        state.owner
+    return states
+
+
+def measure(decode, apps) -> tuple[float, float]:
+    start  = time.perf_counter()
+    decode(apps)
+    rate   = len(apps) / (time.perf_counter() - start)
+    tracemalloc.start()
+    held   = decode(apps)
+    peak   = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del held
+    return rate, peak / 1e6
+
+
+def main():
+    n_wills = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rng     = random.Random(1)
+    apps    = [(1000 + i, global_state(rng)) for i in range(n_wills)]
+
+    print(f"{n_wills} global-state lists\n")
+    print(f"{'decoder':<12}{'states/s':>12}{'MB':>8}")
+    for label, decode in (("dict", as_dicts), ("WillState", decode_states), ("+ owner", with_owners)):
+        rate, mb = measure(decode, apps)
+        print(f"{label:<12}{rate:>12,.0f}{mb:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
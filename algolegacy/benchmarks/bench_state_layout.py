@@ -0,0 +1,113 @@
+"""
+bench_state_layout.py — global-state footprint and per-method opcode cost
+==========================================================================
+Usage:
+    python benchmarks/bench_state_layout.py
+
+Reports, for the AlgoLegacy approval program as currently built:
+
+  schema        global uints / byte-slices the app is created with, and the
+                minimum balance they lock on the creator (28_500 per uint +
+                50_000 per byte-slice, on top of 100_000 per program page)
+  program       TEAL instructions, and how many of them are app_global_get /
+                app_global_put
+  methods       approval-program opcode cost of each method, measured on the
+                in-process AVM over one full will lifecycle (3 heirs, ASA)
+
+Run it before and after a layout change to compare.
+"""
+
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+from avm import AppClient, AssetCreate, AssetTransfer, Ledger, Program
+from avm.ledger import SCHEMA_BYTES_MIN_BALANCE, SCHEMA_UINT_MIN_BALANCE
+from contracts.algolegacy import (
+    GLOBAL_NUM_BYTE_SLICES,
+    GLOBAL_NUM_UINTS,
+    HEIR_BOX_MBR,
+    app,
+    heir_box_name,
+)
+
+PERIOD = 60
+BOXES  = [(0, heir_box_name(slot)) for slot in (1, 2, 3)]
+
+
+def schema_mbr(uints: int, byte_slices: int) -> int:
+    return SCHEMA_UINT_MIN_BALANCE * uints + SCHEMA_BYTES_MIN_BALANCE * byte_slices
+
+
+def program_stats(teal: str) -> tuple[int, int, int]:
+    program = Program(teal)
+    ops     = [ins.op for ins in program.instructions]
+    return len(ops), ops.count("app_global_get"), ops.count("app_global_put")
+
+
+def deploy(ledger: Ledger, spec, owner: str) -> AppClient:
+    client = AppClient(ledger, spec, sender=owner)
+    client.create(global_schema=(GLOBAL_NUM_UINTS, GLOBAL_NUM_BYTE_SLICES), extra_pages=1)
+    ledger.fund(client.app_address, 1_000_000 + HEIR_BOX_MBR * len(BOXES))
+    return client
+
+
+def method_costs(spec) -> dict[str, int]:
+    """Opcode cost of every state-touching method over one will lifecycle."""
+    ledger = Ledger()
+    owner  = ledger.new_account(50_000_000)
+    heirs  = [ledger.new_account(1_000_000) for _ in range(3)]
+    costs: dict[str, int] = {}
+
+    def run(client: AppClient, method: str, **kwargs) -> None:
+        costs[method] = client.call(method, **kwargs).cost
+
+    client = deploy(ledger, spec, owner)
+    run(client, "create_will", period=PERIOD, heirs=[(heirs[0], 50), (heirs[1], 30)], boxes=BOXES[:2])
+    run(client, "add_heirs", heirs=[(heirs[2], 20)], boxes=BOXES[2:])
+    run(client, "deposit", payment=client.pay(owner, 3_000_000))
+    run(client, "check_in")
+    run(client, "get_will_status")
+    run(client, "get_time_remaining")
+
+    asset_id = ledger.send(AssetCreate(sender=owner, total=1000, unit_name="NFT"))[0].asset_index
+    for heir in heirs:
+        ledger.send(AssetTransfer(sender=heir, receiver=heir, asset_id=asset_id, amount=0))
+    run(client, "opt_in_asa", asset=asset_id, fee=2000)
+    run(client, "lock_asa", transfer=client.asset_transfer(owner, asset_id, 300),
+        allocations=[(1, 100), (2, 100), (3, 100)], boxes=BOXES)
+
+    ledger.advance(PERIOD + 1)
+    run(client, "activate_inheritance")
+    run(client.prepare(sender=heirs[0]), "claim", beneficiary_slot=1, boxes=BOXES[:1], fee=2000)
+    run(client.prepare(sender=heirs[0]), "claim_asa", beneficiary_slot=1, boxes=BOXES[:1],
+        foreign_assets=[asset_id], fee=2000)
+    run(client.prepare(sender=heirs[1]), "claim_everything", beneficiary_slot=2, boxes=BOXES[1:2],
+        foreign_assets=[asset_id], fee=3000)
+    run(client, "claim_all", accounts=heirs, foreign_assets=[asset_id], boxes=BOXES, fee=3000)
+
+    forced = deploy(ledger, spec, owner)
+    forced.call("create_will", period=PERIOD, heirs=[(heirs[0], 100)], boxes=BOXES[:1])
+    run(forced, "force_activate")
+    revoked = deploy(ledger, spec, owner)
+    revoked.call("create_will", period=PERIOD, heirs=[(heirs[0], 100)], boxes=BOXES[:1])
+    revoked.call("deposit", payment=revoked.pay(owner, 1_000_000))
+    run(revoked, "revoke_will", fee=2000)
+    return costs
+
+
+def main() -> None:
+    spec = app.build()
+    instructions, gets, puts = program_stats(spec.approval_program)
+    print(f"schema    {GLOBAL_NUM_UINTS} uints + {GLOBAL_NUM_BYTE_SLICES} byte-slices "
+          f"→ {schema_mbr(GLOBAL_NUM_UINTS, GLOBAL_NUM_BYTE_SLICES):,} µALGO schema min balance")
+    print(f"program   {instructions} instructions "
+          f"({gets} app_global_get, {puts} app_global_put)")
+    print()
+    print(f"{'method':<22} {'opcodes':>8}")
+    for method, cost in method_costs(spec).items():
+        print(f"{method:<22} {cost:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+profile_methods.py — where each method's opcode budget goes, by contract line
+==============================================================================
+Usage:
+    python benchmarks/profile_methods.py                          # costliest lines over all calls
+    python benchmarks/profile_methods.py claim_all                # annotated source, every state
+    python benchmarks/profile_methods.py claim_all@INHERITANCE_ACTIVE --folded claim_all.folded
+
+Runs the bench_methods.py lifecycle on a tracing ledger and charges every
+executed instruction's cost, through PyTEAL's source map
+(contracts/sourcemap.py), to the line of contracts/algolegacy.py that
+emitted it.  The numbers add up to the "opcodes" bench_methods.py
+reports for the same call.
+
+With METHOD[@STATE] arguments, prints each matching call's source with
+its costed lines annotated; otherwise, the TOP costliest lines summed
+over every call.  `--folded FILE` writes the selected calls' stacks
+(call;subroutine...;line cost) for flamegraph.pl or speedscope.
+
+Columns:
+    opcodes   cost charged to the line
+    %         share of the call's (or all calls') total
+"""
+
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+from avm import Program
+from avm.profiler import UNMAPPED, Profile
+from benchmarks.bench_methods import program_metrics, run_lifecycle
+from contracts.build_cache import build
+from contracts.sourcemap import source_map
+
+ROOT = pathlib.Path(__file__).parent.parent
+TOP  = 20
+
+
+def profile_calls(selected: list[str] | None = None) -> tuple[dict[str, Profile], Profile]:
+    """({"method@STATE": its profile}, all calls together); `selected` filters by METHOD or METHOD@STATE."""
+    spec, _ = build("AlgoLegacy")
+    program = Program(spec.approval_program)
+    lines   = source_map("AlgoLegacy")
+    will    = run_lifecycle(spec, program_metrics(spec)["extra_pages"], trace=True)
+    calls, overall = {}, Profile(program, lines)
+    for key, result in will.results.items():
+        if selected and key not in selected and key.split("@")[0] not in selected:
+            continue
+        calls[key] = Profile(program, lines)
+        calls[key].add(result.trace, key)
+        overall.add(result.trace, key)
+    return calls, overall
+
+
+def main() -> None:
+    args   = sys.argv[1:]
+    folded = None
+    if "--folded" in args:
+        at = args.index("--folded")
+        folded, args = pathlib.Path(args[at + 1]), args[:at] + args[at + 2:]
+    calls, overall = profile_calls(args)
+    if not calls:
+        sys.exit(f"no call matches {' '.join(args)}")
+
+    if args:
+        for key, profile in calls.items():
+            print(f"\n── {key}: {profile.total} opcodes ──")
+            for path in sorted({path for path, line in profile.by_source() if line}):
+                print(profile.listing(path, (ROOT / path).read_text()))
+    else:
+        print(f"{'opcodes':>8}{'%':>7}  line")
+        for (path, line), cost in overall.by_source().most_common(TOP):
+            if line:
+                where, source = f"{path}:{line}", (ROOT / path).read_text().splitlines()[line - 1].strip()
+            else:
+                where, source = UNMAPPED[0], "dispatch, ABI decoding and encoding"
+            print(f"{cost:>8}{cost / overall.total:>7.1%}  {where:<30} {source}")
+        print(f"{overall.total:>8}         over {len(calls)} calls")
+
+    if folded:
+        folded.write_text(overall.folded())
+        print(f"\nFolded stacks written to {folded}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Python client helpers for AlgoLegacy contracts
+===============================================
+    from client import RegistryClient
+    from client import PooledAlgodClient, RateLimiter   # rate-limited, keep-alive algod
+    from client import ConfirmationTracker              # one poll loop for many txids
+    from client import Keeper                           # activates wills as deadlines pass
+    from client import CheckInScheduler                 # keeps one owner's wills checked in
+    from client import WillIndex, BlockIndexer          # local SQLite will database
+    from client import WillState, read_states           # many wills' global state, decoded
+    from client import ReadAPI, WillReader              # cached will state over HTTP
+    from client import SnapshotReader, WillSnapshot     # get_will_snapshot, 16 wills per simulate
+"""
+
+from .calls import call_apps
+from .checkin import CheckInScheduler
+from .confirm import ConfirmationTracker
+from .indexer import BlockIndexer, WillIndex
+from .keeper import Keeper
+from .read_api import ReadAPI, WillReader
+from .registry import RegistryClient, decode_will_ids, index_storage_cost
+from .snapshot import SnapshotReader, WillSnapshot
+from .state import WillState, decode_global_state, decode_states, read_states
+from .transport import ConnectionPool, PooledAlgodClient, RateLimiter
+
+__all__ = [
+    "BlockIndexer",
+    "CheckInScheduler",
+    "ConfirmationTracker",
+    "ConnectionPool",
+    "Keeper",
+    "PooledAlgodClient",
+    "RateLimiter",
+    "ReadAPI",
+    "RegistryClient",
+    "SnapshotReader",
+    "WillIndex",
+    "WillReader",
+    "WillSnapshot",
+    "WillState",
+    "call_apps",
+    "decode_global_state",
+    "decode_states",
+    "decode_will_ids",
+    "index_storage_cost",
+    "read_states",
+]
@@ -0,0 +1,328 @@
+"""
+bulk — deploying many AlgoLegacy wills in one run
+==================================================
+`BulkDeployer` turns a manifest of wills into as few atomic groups and
+round trips as the protocol allows:
+
+    create   one `create_will(period, [])` app creation per will, signed by
+             its owner, up to 16 wills per group
+    setup    per will: fund the app account (deployer), `add_heirs` (owner,
+             8 heir boxes per call), then the `deposit` payment + call;
+             as many wills per group as fit in 16 transactions
+
+A new app's id is only known once its creation is confirmed, so a will
+cannot be created and set up in the same group: two phases, each signed
+on a thread pool and submitted group-parallel over one pooled client.
+Groups are atomic, so when algod rejects one, its wills are resubmitted
+one group each and only the faulty will fails.  A will whose setup does
+not fit one group (over 104 beneficiaries with a deposit, 120 without) is
+reported failed before anything is sent, and the others are deployed.
+
+Manifest (JSON list, or CSV with these columns):
+
+    owner          env var holding the owner's mnemonic ("" → the deployer)
+    period         inactivity period, seconds
+    beneficiaries  [{"address": ..., "percent": ...}] — CSV: "ADDR:60;ADDR:40"
+    deposit        µALGO to lock (0 → no deposit)
+"""
+
+import csv
+import json
+import math
+import pathlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable
+
+from algosdk import account, constants, encoding, logic, transaction
+from algosdk.abi import Method
+from algosdk.atomic_transaction_composer import AccountTransactionSigner
+from algosdk.error import AlgodHTTPError, ConfirmationTimeoutError, TransactionRejectedError
+
+from .confirm import ConfirmationTracker
+from contracts.algolegacy import (
+    HEIR_BOX_MBR,
+    MIN_DEPOSIT_MICROALGOS,
+    MIN_INACTIVITY_SECONDS,
+    heir_box_name,
+)
+
+MAX_GROUP_SIZE   = constants.tx_group_limit
+MAX_BOX_REFS     = 8          # per app call
+APP_MIN_BALANCE  = 100_000    # the app account's own minimum balance
+
+
+@dataclass
+class WillOrder:
+    """One manifest row: a will to create, fund and set up."""
+    owner_key: str                                          # private key
+    period:    int
+    heirs:     list[tuple[str, int]] = field(default_factory=list)   # (address, percent)
+    deposit:   int = 0
+    owner:     str = ""                                     # manifest label, for the results
+
+    @property
+    def owner_address(self) -> str:
+        return account.address_from_private_key(self.owner_key)
+
+    @property
+    def funding(self) -> int:
+        """µALGO the app account needs before its heir boxes can be written."""
+        return APP_MIN_BALANCE + HEIR_BOX_MBR * len(self.heirs)
+
+    @property
+    def setup_size(self) -> int:
+        """Transactions in the will's setup unit: funding, add_heirs calls, deposit payment + call."""
+        return 1 + math.ceil(len(self.heirs) / MAX_BOX_REFS) + (2 if self.deposit else 0)
+
+
+def pack_groups(units: list, size=len, limit: int = MAX_GROUP_SIZE) -> list[list]:
+    """Greedily pack units, in order, into groups of at most `limit` transactions."""
+    groups: list[list] = [[]]
+    used = 0
+    for unit in units:
+        n = size(unit)
+        if n > limit:
+            raise ValueError(f"unit of {n} transactions exceeds the group limit of {limit}")
+        if used + n > limit:
+            groups.append([])
+            used = 0
+        groups[-1].append(unit)
+        used += n
+    return [g for g in groups if g]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Manifest
+# ─────────────────────────────────────────────────────────────────────────────
+def load_manifest(path: str | pathlib.Path, owner_key: Callable[[str], str]) -> list[WillOrder]:
+    """
+    Parse a .json or .csv manifest.  `owner_key(label)` returns the private
+    key for a row's `owner` column ("" for the deployer).
+    """
+    path = pathlib.Path(path)
+    if path.suffix.lower() == ".csv":
+        with path.open(newline="") as f:
+            rows = [dict(row) for row in csv.DictReader(f)]
+        for row in rows:
+            row["beneficiaries"] = [
+                {"address": addr.strip(), "percent": pct}
+                for addr, _, pct in (item.partition(":") for item in (row.get("beneficiaries") or "").split(";"))
+                if addr.strip()
+            ]
+    else:
+        rows = json.loads(path.read_text())
+
+    orders = []
+    for line, row in enumerate(rows, start=1):
+        label = (row.get("owner") or "").strip()
+        order = WillOrder(
+            owner_key=owner_key(label),
+            owner=label,
+            period=int(row["period"]),
+            heirs=[(b["address"], int(b["percent"])) for b in row.get("beneficiaries") or []],
+            deposit=int(row.get("deposit") or 0),
+        )
+        _validate(order, f"{path.name} entry {line}")
+        orders.append(order)
+    return orders
+
+
+def _validate(order: WillOrder, where: str) -> None:
+    if order.period < MIN_INACTIVITY_SECONDS:
+        raise ValueError(f"{where}: inactivity period below {MIN_INACTIVITY_SECONDS} s")
+    total = sum(pct for _, pct in order.heirs)
+    if total > 100:
+        raise ValueError(f"{where}: beneficiary percentages add up to {total} (> 100)")
+    if order.deposit:
+        if total != 100:
+            raise ValueError(f"{where}: a deposit needs percentages adding up to 100, not {total}")
+        if order.deposit < MIN_DEPOSIT_MICROALGOS:
+            raise ValueError(f"{where}: deposit below the {MIN_DEPOSIT_MICROALGOS} µALGO minimum")
+    for address, _ in order.heirs:
+        if not encoding.is_valid_address(address):
+            raise ValueError(f"{where}: {address!r} is not an Algorand address")
+    if order.setup_size > MAX_GROUP_SIZE:
+        raise ValueError(
+            f"{where}: {len(order.heirs)} beneficiaries need {order.setup_size} setup transactions, "
+            f"more than one group of {MAX_GROUP_SIZE}"
+        )
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Deployment
+# ─────────────────────────────────────────────────────────────────────────────
+class BulkDeployer:
+    """Creates and sets up the wills of a manifest against one algod."""
+
+    def __init__(
+        self,
+        algod,
+        deployer_key: str,
+        spec,
+        approval: bytes,
+        clear: bytes,
+        *,
+        global_schema: transaction.StateSchema,
+        extra_pages: int = 0,
+        workers: int = 8,
+    ):
+        self.algod         = algod
+        self.deployer_key  = deployer_key
+        self.deployer      = account.address_from_private_key(deployer_key)
+        self.approval      = approval
+        self.clear         = clear
+        self.global_schema = global_schema
+        self.extra_pages   = extra_pages
+        self.workers       = workers
+        self.methods: dict[str, Method] = {
+            name: spec.contract.get_method_by_name(name) for name in ("create_will", "add_heirs", "deposit")
+        }
+        self.groups = 0                                   # groups submitted, for reporting
+
+    def deploy(self, orders: list[WillOrder]) -> list[dict]:
+        """
+        Deploy every order; returns one result per order, in manifest order.
+        An order failing validation (see `_validate`) is reported failed and
+        not created; the rest go ahead.
+        """
+        results = [
+            {"index": i, "owner": o.owner or "deployer", "owner_address": o.owner_address,
+             "app_id": None, "app_address": None, "status": "pending"}
+            for i, o in enumerate(orders)
+        ]
+        valid = []
+        for i, order in enumerate(orders):
+            try:
+                _validate(order, f"will {i}")
+            except ValueError as exc:
+                _fail(results[i], "invalid", exc)
+            else:
+                valid.append(i)
+        with ThreadPoolExecutor(self.workers) as pool, ConfirmationTracker(self.algod) as tracker:
+            self._tracker = tracker
+            sp = self.algod.suggested_params()
+            units = [[(self._create_txn(i, orders[i], sp), orders[i].owner_key)] for i in valid]
+            for group, outcome in self._run(pool, units, create=True, indices=valid):
+                for (index, _), app_id in zip(group, outcome):
+                    if isinstance(app_id, Exception):
+                        _fail(results[index], "create", app_id)
+                    else:
+                        results[index]["app_id"]      = app_id
+                        results[index]["app_address"] = logic.get_application_address(app_id)
+
+            created = [i for i, r in enumerate(results) if r["app_id"]]
+            sp = self.algod.suggested_params()
+            units = [self._setup_txns(orders[i], results[i]["app_id"], sp) for i in created]
+            for group, outcome in self._run(pool, units, indices=created):
+                for (index, _), ok in zip(group, outcome):
+                    if isinstance(ok, Exception):
+                        _fail(results[index], "setup", ok)
+                    else:
+                        results[index]["status"] = "ok"
+        return results
+
+    # ── Transactions ─────────────────────────────────────────────────────────
+    def _create_txn(self, index: int, order: WillOrder, sp) -> transaction.Transaction:
+        method = self.methods["create_will"]
+        # Wills of one owner with the same period would otherwise be the same
+        # transaction (one txid, rejected as a duplicate): the note tells them apart
+        return transaction.ApplicationCreateTxn(
+            order.owner_address, sp, transaction.OnComplete.NoOpOC,
+            self.approval, self.clear,
+            self.global_schema, transaction.StateSchema(0, 0),
+            app_args=[method.get_selector(), *_encode(method, [order.period, []])],
+            extra_pages=self.extra_pages,
+            note=f"algolegacy:{index}".encode(),
+        )
+
+    def _setup_txns(self, order: WillOrder, app_id: int, sp) -> list[tuple]:
+        owner, key = order.owner_address, order.owner_key
+        app_addr   = logic.get_application_address(app_id)
+        txns = [(transaction.PaymentTxn(self.deployer, sp, app_addr, order.funding), self.deployer_key)]
+        add_heirs = self.methods["add_heirs"]
+        for start in range(0, len(order.heirs), MAX_BOX_REFS):
+            chunk = order.heirs[start:start + MAX_BOX_REFS]
+            txns.append((transaction.ApplicationNoOpTxn(
+                owner, sp, app_id,
+                app_args=[add_heirs.get_selector(), *_encode(add_heirs, [[list(h) for h in chunk]])],
+                boxes=[(0, heir_box_name(start + slot)) for slot in range(1, len(chunk) + 1)],
+            ), key))
+        if order.deposit:
+            txns.append((transaction.PaymentTxn(owner, sp, app_addr, order.deposit), key))
+            txns.append((transaction.ApplicationNoOpTxn(
+                owner, sp, app_id, app_args=[self.methods["deposit"].get_selector()],
+            ), key))
+        return txns
+
+    # ── Submission ───────────────────────────────────────────────────────────
+    def _run(self, pool: ThreadPoolExecutor, units: list[list], *, create: bool = False,
+             indices: list[int] | None = None):
+        """Sign and send `units` (one per will) in packed groups; yields (group, outcomes)."""
+        indices = indices if indices is not None else list(range(len(units)))
+        groups  = pack_groups(list(zip(indices, units)), size=lambda unit: len(unit[1]))
+        for group in groups:
+            _group([txn for _, unit in group for txn, _ in unit])
+        # Signing is libsodium, which releases the GIL: sign the whole phase in parallel
+        flat   = [pair for group in groups for _, unit in group for pair in unit]
+        signed = iter(pool.map(_sign, flat))
+        batches = [[next(signed) for _, unit in group for _ in unit] for group in groups]
+        self.groups += len(groups)
+        futures = [pool.submit(self._send, batch, group, create) for batch, group in zip(batches, groups)]
+        for group, future in zip(groups, futures):
+            yield group, future.result()
+
+    def _send(self, signed: list, group: list, create: bool) -> list:
+        """
+        One group: send and confirm; per will an app id / True, or the
+        exception.  A group algod rejects is atomic, so one bad will would
+        sink the rest: its wills are retried one group each.  A group lost
+        to a network error (timeout, reset connection) may still have
+        reached the pool, so it is not resent: its wills fail.
+        """
+        try:
+            self.algod.send_transactions(signed)
+        except OSError as exc:
+            return [exc] * len(group)
+        except AlgodHTTPError as exc:
+            if len(group) == 1:
+                return [exc]
+            outcome = []
+            for _, unit in group:
+                _group([txn for txn, _ in unit])
+                outcome += self._send([_sign(pair) for pair in unit], [unit], create)
+            return outcome
+        try:
+            if not create:
+                self._tracker.wait([signed[-1].get_txid()])
+                return [True] * len(group)
+            infos = self._tracker.wait([stxn.get_txid() for stxn in signed], info=True)
+            return [info["application-index"] for info in infos]
+        except (AlgodHTTPError, ConfirmationTimeoutError, TransactionRejectedError, OSError) as exc:
+            return [exc] * len(group)
+
+
+def _group(txns: list[transaction.Transaction]) -> None:
+    """Make `txns` one atomic group (replacing any earlier group id)."""
+    for txn in txns:
+        txn.group = None
+    if len(txns) > 1:
+        transaction.assign_group_id(txns)
+
+
+def _sign(pair: tuple) -> transaction.SignedTransaction:
+    txn, key = pair
+    return AccountTransactionSigner(key).sign_transactions([txn], [0])[0]
+
+
+def _encode(method: Method, values: list) -> list[bytes]:
+    return [arg.type.encode(value) for arg, value in zip(method.args, values)]
+
+
+def _fail(result: dict, phase: str, exc: Exception) -> None:
+    result["status"] = "failed"
+    result["error"]  = f"{phase}: {exc}"
+
+
+def write_results(path: str | pathlib.Path, results: list[dict]) -> None:
+    pathlib.Path(path).write_text(json.dumps(results, indent=2))
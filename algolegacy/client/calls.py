@@ -0,0 +1,88 @@
+"""
+calls — one ABI method on many apps, in as few atomic groups as possible
+=========================================================================
+The keeper's `activate_inheritance` and the owner's `check_in` are both
+the same argument-less call made on many wills.  `call_apps` packs them
+into atomic groups of up to 16, signs each group with one
+`sign_transactions` call and submits every group before waiting on any:
+
+    confirmed, failed = call_apps(algod, private_key, selector, app_ids)
+    # confirmed: {app_id: round}    failed: {app_id: error}
+
+Groups are atomic, so one will that no longer accepts the call (checked
+in, activated or revoked since it was read) sinks its group.  The wills
+of a rejected group are then retried one call at a time.  A group that
+cannot reach algod fails the same way, with the connection error.
+"""
+
+from algosdk import account, constants, transaction
+from algosdk.atomic_transaction_composer import AccountTransactionSigner
+from algosdk.error import AlgodHTTPError, ConfirmationTimeoutError, TransactionRejectedError
+
+from .confirm import ConfirmationTracker
+
+MAX_GROUP_SIZE = constants.tx_group_limit
+
+
+def call_apps(
+    algod, private_key: str, selector: bytes, app_ids: list[int], *,
+    tracker: ConfirmationTracker | None = None,
+) -> tuple[dict[int, int], dict[int, str]]:
+    """NoOp-call `selector` on each app; ({app_id: confirmed round}, {app_id: error})."""
+    confirmed: dict[int, int] = {}
+    failed:    dict[int, str] = {}
+    if not app_ids:
+        return confirmed, failed
+    caller = _Caller(algod, private_key, selector, tracker)
+    groups = [app_ids[i:i + MAX_GROUP_SIZE] for i in range(0, len(app_ids), MAX_GROUP_SIZE)]
+    pending = [(group, caller.send(group)) for group in groups]
+    for group, sent in pending:
+        rnd = caller.confirmed(sent)
+        if isinstance(rnd, int):
+            confirmed.update(dict.fromkeys(group, rnd))
+            continue
+        if len(group) == 1:
+            failed[group[0]] = rnd
+            continue
+        for app_id in group:
+            single = caller.confirmed(caller.send([app_id]))
+            if isinstance(single, int):
+                confirmed[app_id] = single
+            else:
+                failed[app_id] = single
+    return confirmed, failed
+
+
+class _Caller:
+    def __init__(self, algod, private_key: str, selector: bytes, tracker: ConfirmationTracker | None):
+        self.algod    = algod
+        self.signer   = AccountTransactionSigner(private_key)
+        self.sender   = account.address_from_private_key(private_key)
+        self.selector = selector
+        self.tracker  = tracker
+        self.sp       = algod.suggested_params()
+
+    def send(self, group: list[int]) -> str | Exception:
+        txns = [
+            transaction.ApplicationNoOpTxn(self.sender, self.sp, app_id, app_args=[self.selector])
+            for app_id in group
+        ]
+        if len(txns) > 1:
+            transaction.assign_group_id(txns)
+        signed = self.signer.sign_transactions(txns, list(range(len(txns))))
+        try:
+            self.algod.send_transactions(signed)
+        except (AlgodHTTPError, OSError) as exc:
+            return exc
+        return signed[-1].get_txid()
+
+    def confirmed(self, sent: str | Exception) -> int | str:
+        """The round `sent` confirmed in, or why it did not."""
+        if isinstance(sent, Exception):
+            return str(sent)
+        try:
+            if self.tracker is not None:
+                return self.tracker.wait([sent])[0]["confirmed-round"]
+            return transaction.wait_for_confirmation(self.algod, sent, 8)["confirmed-round"]
+        except (AlgodHTTPError, ConfirmationTimeoutError, TransactionRejectedError, OSError) as exc:
+            return str(exc)
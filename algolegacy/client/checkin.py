@@ -0,0 +1,207 @@
+"""
+checkin — keeping every will of one owner checked in
+=====================================================
+An owner with many wills has to call `check_in` on each before its
+`last_checkin + inactivity_period` passes.  A `CheckInScheduler` reads
+each will once and works out its latest safe check-in:
+
+    safe = last_checkin + inactivity_period - margin
+
+where the margin is `margin` seconds, or half the period for short ones.
+When the earliest safe time comes, every will whose safe time falls within
+`window` of now is checked in with it, so calls go out together rather
+than a will at a time: up to 16 per atomic group, one signing call per
+group (client/calls.py).
+
+    scheduler = CheckInScheduler(algod, owner_key, contract, margin=DAY)
+    scheduler.load(app_ids)         # skips wills the key does not own
+    scheduler.run()                 # sleep until the next safe time, check in, repeat
+
+A will whose check-in fails is left out of the next `retry` seconds of
+check-ins, doubling after each further failure up to its safe window
+(`min(margin, period // 2)`, the time between its safe time and its
+deadline), and is back on its normal schedule once a check-in succeeds.
+It leaves the schedule only when a re-read shows it is no longer live, or
+algod answers 404 for it; a re-read failing with a 429, 5xx or timeout
+keeps it scheduled, backing off.
+
+`run` survives algod outages: an iteration that fails (algod
+unreachable, a request timing out) is retried, waiting 0.5 s after the
+first failure and doubling up to 30 s, so the wills are checked in as soon
+as algod is back.
+
+Times are chain time: the timestamp of the latest block, which is what
+the contract compares against.
+"""
+
+import logging
+import threading
+from typing import Iterable
+
+from algosdk import account
+from algosdk.abi import Contract
+from algosdk.error import AlgodHTTPError
+
+from .calls import call_apps
+from .confirm import ConfirmationTracker
+from .state import WillState, read_states
+
+DAY    = 86_400
+MARGIN = DAY              # default: check in a day before the deadline
+RETRY  = 60               # seconds a failed check-in waits, doubling per failure
+RETRY_DELAY = 0.5         # after a failed run iteration, doubling ...
+RETRY_MAX   = 30.0        # ... up to this
+
+log = logging.getLogger(__name__)
+
+
+class CheckInScheduler:
+    """Plans and submits `check_in` for all of one owner's wills."""
+
+    def __init__(
+        self, algod, private_key: str, contract: Contract, *,
+        margin: int = MARGIN, window: int | None = None, tracker: ConfirmationTracker | None = None,
+    ):
+        self.algod   = algod
+        self.key     = private_key
+        self.owner   = account.address_from_private_key(private_key)
+        self.margin  = margin
+        self.window  = margin if window is None else window
+        self.tracker = tracker
+        self.last_checkin: dict[int, int] = {}
+        self.periods:      dict[int, int] = {}
+        self.skipped: dict[int, str] = {}                  # app id -> why it is not scheduled
+        self.failed:  dict[int, str] = {}                  # app id -> last check-in error
+        self.retry_at: dict[int, int] = {}                 # app id -> chain time it may be retried from
+        self.errors  = 0                                   # failed run iterations, retried
+        self._backoff: dict[int, int] = {}                 # app id -> seconds of its last backoff
+        self.on_checked_in = None                          # callback(app_ids) from run()
+        self._check_in = contract.get_method_by_name("check_in").get_selector()
+        self._stop     = threading.Event()
+
+    # ── State ────────────────────────────────────────────────────────────────
+    def load(self, app_ids: Iterable[int]) -> None:
+        """
+        Read the wills' state (concurrently); schedule the live ones this key
+        owns.  A read that fails other than with a 404 is raised once the
+        rest are scheduled; load those wills again.
+        """
+        app_ids = list(app_ids)
+        states, _, failed = read_states(self.algod, app_ids)
+        for app_id in app_ids:
+            if app_id not in failed:
+                self._apply(app_id, states.get(app_id))
+        if failed:
+            raise next(iter(failed.values()))
+
+    def refresh(self, app_id: int) -> None:
+        """Re-read `app_id`; raises if the read fails other than with a 404, leaving its schedule."""
+        states, _, failed = read_states(self.algod, [app_id], workers=1)
+        if app_id in failed:
+            raise failed[app_id]
+        self._apply(app_id, states.get(app_id))
+
+    def _apply(self, app_id: int, state: WillState | None) -> None:
+        self.last_checkin.pop(app_id, None)
+        self.periods.pop(app_id, None)
+        if state is None:
+            self.skipped[app_id] = "application not found"
+        elif state.owner != self.owner:
+            self.skipped[app_id] = "not owned by this account"
+        elif not state.will_created:
+            self.skipped[app_id] = "no will created"
+        elif state.inheritance_active:
+            self.skipped[app_id] = "inheritance already active"
+        else:
+            self.skipped.pop(app_id, None)
+            self.last_checkin[app_id] = state.last_checkin
+            self.periods[app_id]      = state.inactivity_period
+        if app_id not in self.periods:
+            self.retry_at.pop(app_id, None)
+            self._backoff.pop(app_id, None)
+
+    # ── Plan ─────────────────────────────────────────────────────────────────
+    def safe_time(self, app_id: int) -> int:
+        """The latest chain time `app_id` should be checked in by."""
+        period = self.periods[app_id]
+        return self.last_checkin[app_id] + period - min(self.margin, period // 2)
+
+    def ready_time(self, app_id: int) -> int:
+        """When `app_id` is next checked in: its safe time, or later while backing off a failure."""
+        return max(self.safe_time(app_id), self.retry_at.get(app_id, 0))
+
+    def next_check_in(self) -> int | None:
+        """The earliest ready time over all scheduled wills."""
+        return min(map(self.ready_time, self.periods), default=None)
+
+    def due(self, now: int) -> list[int]:
+        """Wills to check in at `now`: none until one is due, then all within `window` not backing off."""
+        first = self.next_check_in()
+        if first is None or first > now:
+            return []
+        return sorted(
+            (a for a in self.periods if self.safe_time(a) <= now + self.window and self.retry_at.get(a, 0) <= now),
+            key=self.safe_time,
+        )
+
+    # ── Check-in ─────────────────────────────────────────────────────────────
+    def check_in(self, app_ids: list[int]) -> list[int]:
+        """Call `check_in` in groups of ≤ 16; returns the app ids checked in."""
+        confirmed, failed = call_apps(self.algod, self.key, self._check_in, app_ids, tracker=self.tracker)
+        # The contract stores the timestamp of the block before the one it ran in
+        stored = {rnd: self._block_ts(rnd - 1) for rnd in set(confirmed.values())}
+        for app_id, rnd in confirmed.items():
+            self.last_checkin[app_id] = stored[rnd]
+            self.failed.pop(app_id, None)
+            self.retry_at.pop(app_id, None)
+            self._backoff.pop(app_id, None)
+        now = self.chain_time() if failed else 0
+        for app_id, error in failed.items():
+            try:
+                self.refresh(app_id)                         # activated or revoked meanwhile?
+            except (AlgodHTTPError, OSError) as exc:         # unknown: keep it scheduled
+                error = f"{error}; re-read failed: {exc}"
+            self.failed[app_id] = error
+            if app_id in self.periods:
+                self._back_off(app_id, now, error)
+        return list(confirmed)
+
+    def _back_off(self, app_id: int, now: int, error: str) -> None:
+        period = self.periods[app_id]
+        delay  = self._backoff[app_id] * 2 if app_id in self._backoff else RETRY
+        delay  = min(delay, max(1, min(self.margin, period // 2)))      # capped at its safe window
+        self._backoff[app_id] = delay
+        self.retry_at[app_id] = now + delay
+        log.warning("check-in of app %d failed (retrying in %d s): %s", app_id, delay, error)
+
+    def chain_time(self) -> int:
+        """The latest block's timestamp."""
+        return self._block_ts(self.algod.status()["last-round"])
+
+    def _block_ts(self, rnd: int) -> int:
+        return self.algod.block_info(rnd)["block"]["ts"]
+
+    # ── Daemon ───────────────────────────────────────────────────────────────
+    def run(self) -> None:
+        """Check in whatever is due, sleep until the next safe time; until `stop()`; failures are retried."""
+        delay = RETRY_DELAY
+        while not self._stop.is_set():
+            try:
+                now = self.chain_time()
+                due = self.due(now)
+                if due:
+                    done = self.check_in(due)
+                    if done and self.on_checked_in is not None:
+                        self.on_checked_in(done)
+            except (AlgodHTTPError, OSError) as exc:
+                self.errors += 1
+                log.warning("check-in round failed (retrying in %.1f s): %r", delay, exc)
+                self._stop.wait(delay)
+                delay = min(RETRY_MAX, delay * 2)
+                continue
+            delay = RETRY_DELAY
+            first = self.next_check_in()
+            self._stop.wait(None if first is None else max(1, first - now))
+
+    def stop(self) -> None:
+        self._stop.set()
@@ -0,0 +1,216 @@
+"""
+confirm — one polling loop for any number of pending transactions
+==================================================================
+`transaction.wait_for_confirmation` runs a status / pending-info loop per
+transaction, so N transactions in flight cost N polling loops.  A
+`ConfirmationTracker` follows the chain once:
+
+    status_after_block(r)   wait for the next round
+    get_block_txids(r)      every txid that round confirmed
+
+and resolves the future of each tracked txid found there:
+
+    with ConfirmationTracker(algod) as tracker:
+        futures = [tracker.track(algod.send_transaction(stxn)) for stxn in signed]
+        infos   = [f.result() for f in futures]
+
+A future resolves to `{"confirmed-round": r}`, or to the full pending
+transaction info with `track(txid, info=True)` (app ids, logs).  A txid
+not seen within `wait_rounds` is looked up once: rejected by the pool, it
+fails with TransactionRejectedError, otherwise ConfirmationTimeoutError.
+Blocks are scanned from the round the tracker was created in, so create
+it before submitting.  Recent rounds are remembered, so a txid tracked
+after its block closed still resolves.
+
+A failed poll (HTTP error, timeout, reset connection) is logged and
+retried with backoff; pending txids may still confirm, so none fails
+for it.  Only while algod stays unreachable does a txid time out, once
+`wait_rounds` rounds' worth of wall-clock time has passed.  A failed
+pending-info lookup for one txid fails that txid's future only; the loop
+keeps running.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future
+
+from algosdk.error import ConfirmationTimeoutError, TransactionRejectedError
+
+WAIT_ROUNDS    = 8
+HISTORY        = 32       # rounds of txids kept for late `track` calls
+ROUND_SECONDS  = 4.0      # a generous round, for deadlines while algod is unreachable
+STATUS_TIMEOUT = 75       # seconds; algod holds wait-for-block-after for up to 60
+RETRY_DELAY    = 0.5      # after a failed poll, doubling ...
+RETRY_MAX      = 30.0     # ... up to this
+
+log = logging.getLogger(__name__)
+
+
+class _Pending:
+    __slots__ = ("future", "info", "wait_rounds", "deadline", "expires")
+
+    def __init__(self, info: bool, wait_rounds: int):
+        self.future      = Future()
+        self.info        = info
+        self.wait_rounds = wait_rounds
+        self.deadline: int | None = None     # set by the first scan after tracking
+        self.expires     = time.monotonic() + wait_rounds * ROUND_SECONDS   # used while polls fail
+
+
+class ConfirmationTracker:
+    """Confirms tracked txids from a single background block-following loop."""
+
+    def __init__(self, algod, *, history: int = HISTORY):
+        self.algod    = algod
+        self.history  = history
+        self.polls    = 0                                  # status_after_block calls
+        self.errors   = 0                                  # failed polls, retried
+        self._cond    = threading.Condition()
+        self._pending: dict[str, _Pending] = {}
+        self._seen: dict[str, int] = {}                    # txid -> round, recent rounds only
+        self._rounds: list[tuple[int, list[str]]] = []     # (round, txids), oldest first
+        self._round   = algod.status()["last-round"]       # last round scanned
+        self._thread: threading.Thread | None = None
+        self._closed  = False
+
+    def __enter__(self) -> "ConfirmationTracker":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def track(self, txid: str, *, info: bool = False, wait_rounds: int = WAIT_ROUNDS) -> Future:
+        """A future for `txid`'s confirmation (see the module docstring)."""
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("ConfirmationTracker is closed")
+            entry = self._pending.get(txid)
+            if entry is not None:
+                entry.info = entry.info or info
+                return entry.future
+            entry = _Pending(info, wait_rounds)
+            confirmed = self._seen.get(txid)
+            if confirmed is None:
+                self._pending[txid] = entry
+                self._start()
+                self._cond.notify()
+                return entry.future
+        self._resolve(txid, entry, confirmed)
+        return entry.future
+
+    def wait(self, txids: list[str], *, info: bool = False, wait_rounds: int = WAIT_ROUNDS) -> list[dict]:
+        """Block until every txid confirms; results in order (raises the first failure)."""
+        futures = [self.track(txid, info=info, wait_rounds=wait_rounds) for txid in txids]
+        return [future.result() for future in futures]
+
+    def close(self) -> None:
+        """Stop following the chain; futures still pending are cancelled."""
+        with self._cond:
+            self._closed = True
+            pending, self._pending = self._pending, {}
+            self._cond.notify()
+        for entry in pending.values():
+            entry.future.cancel()
+
+    # ── Loop ─────────────────────────────────────────────────────────────────
+    def _start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._follow, name="confirmations", daemon=True)
+            self._thread.start()
+
+    def _follow(self) -> None:
+        delay = RETRY_DELAY
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                after = self._round
+            try:
+                self.polls += 1
+                last = self.algod.status_after_block(after, timeout=STATUS_TIMEOUT)["last-round"]
+                # After a long idle spell only the last `history` rounds are read;
+                # txids from before then resolve through the deadline lookup
+                first  = max(after + 1, last - self.history + 1)
+                blocks = [(r, self.algod.get_block_txids(r).get("blockTxids") or [])
+                          for r in range(first, last + 1)]
+            except Exception as exc:       # the loop must outlive any one failed poll
+                self.errors += 1
+                log.warning("confirmation poll after round %d failed (retrying in %.1f s): %r", after, delay, exc)
+                self._time_out(exc)
+                with self._cond:
+                    self._cond.wait_for(lambda: self._closed, delay)
+                delay = min(RETRY_MAX, delay * 2)
+                continue
+            delay = RETRY_DELAY
+            try:
+                self._scan(blocks, last)
+            except Exception:              # nor may one failed scan stop it
+                self.errors += 1
+                log.exception("confirmation scan up to round %d failed", last)
+
+    def _scan(self, blocks: list[tuple[int, list[str]]], last: int) -> None:
+        found: list[tuple[str, _Pending, int]] = []
+        with self._cond:
+            for rnd, txids in blocks:
+                self._rounds.append((rnd, txids))
+                for txid in txids:
+                    self._seen[txid] = rnd
+                    entry = self._pending.pop(txid, None)
+                    if entry is not None:
+                        found.append((txid, entry, rnd))
+            while len(self._rounds) > self.history:
+                for txid in self._rounds.pop(0)[1]:
+                    self._seen.pop(txid, None)
+            self._round = max(self._round, last)
+            for entry in self._pending.values():
+                if entry.deadline is None:
+                    entry.deadline = self._round + entry.wait_rounds
+            expired = [(t, e) for t, e in self._pending.items() if e.deadline < self._round]
+            for txid, _ in expired:
+                del self._pending[txid]
+        for txid, entry, rnd in found:
+            self._resolve(txid, entry, rnd)
+        for txid, entry in expired:
+            self._expire(txid, entry)
+
+    def _resolve(self, txid: str, entry: _Pending, rnd: int) -> None:
+        if entry.future.cancelled():
+            return
+        if not entry.info:
+            entry.future.set_result({"confirmed-round": rnd})
+            return
+        try:
+            entry.future.set_result(self.algod.pending_transaction_info(txid))
+        except Exception as exc:           # HTTP error, timeout, reset connection
+            entry.future.set_exception(exc)
+
+    def _expire(self, txid: str, entry: _Pending) -> None:
+        """Not in any block before its deadline: rejected, late, or lost."""
+        if entry.future.cancelled():
+            return
+        try:
+            info = self.algod.pending_transaction_info(txid)
+        except Exception:                  # unknown either way: a timeout, below
+            info = {}
+        if info.get("pool-error"):
+            entry.future.set_exception(TransactionRejectedError("Transaction rejected: " + info["pool-error"]))
+        elif info.get("confirmed-round"):
+            entry.future.set_result(info if entry.info else {"confirmed-round": info["confirmed-round"]})
+        else:
+            entry.future.set_exception(ConfirmationTimeoutError(f"Wait for transaction id {txid} timed out"))
+
+    def _time_out(self, cause: Exception) -> None:
+        """While polls fail: time out the txids whose wall-clock deadline has passed."""
+        now = time.monotonic()
+        with self._cond:
+            expired = [(t, e) for t, e in self._pending.items() if e.expires < now]
+            for txid, _ in expired:
+                del self._pending[txid]
+        for txid, entry in expired:
+            if not entry.future.cancelled():
+                error = ConfirmationTimeoutError(f"Wait for transaction id {txid} timed out: algod unreachable")
+                error.__cause__ = cause
+                entry.future.set_exception(error)
@@ -0,0 +1,361 @@
+"""
+indexer — every AlgoLegacy will in a local SQLite database
+===========================================================
+Rebuilding will state from algod costs a `getAppGlobalState` per app, and
+finding a beneficiary's wills means paging through indexer history.  A
+`WillIndex` keeps that state in SQLite instead, and a `BlockIndexer`
+keeps the database current by reading each block once:
+
+    index   = WillIndex("wills.db", contract, will_programs())
+    indexer = BlockIndexer(algod, index, start_round=deploy_round)
+    indexer.run()                                   # until stop()
+
+    index.wills_for(address)                        # as owner or beneficiary
+    index.due_between(now, now + 3600)              # deadlines in the next hour
+
+Only AlgoLegacy apps are indexed: those created, in an indexed block, with
+one of the accepted approval programs (by default every build variant,
+`will_programs()`), plus any app ids passed as `app_ids`.  Anyone can
+deploy an app answering to the same selectors; its calls are ignored.
+
+Blocks are fetched as msgpack.  An app call (outer or inner) whose first
+argument is an AlgoLegacy selector is applied to the will it targets:
+its global-state delta (`dt.gd`) updates the `wills` row, and its decoded
+ABI arguments update the `heirs` rows, since box writes do not appear in
+blocks.  `create_will` on an accepted app starts a row; other methods
+only touch apps already indexed.  Each block is applied in one SQL transaction together
+with the checkpoint round, so a restarted indexer resumes after the last
+block it committed.  `run` outlives algod outages: a failed sync or wait
+is retried, waiting 0.5 s after the first failure and doubling up to
+30 s, from the last committed block.
+
+Tables:
+    wills   app_id, owner, inactivity_period, last_checkin, deadline,
+            total_locked, locked_asa_id, status (+ decoded fields), rounds
+    heirs   app_id, slot, address, percent, asa_amount, claimed, asa_claimed
+    apps    app_id of every app created with an accepted approval program
+"""
+
+import logging
+import sqlite3
+import threading
+from typing import Iterable
+
+import msgpack
+from algosdk import abi, encoding
+from algosdk.abi import Contract
+
+from contracts.algolegacy import decode_status
+from contracts.build_cache import OPTIONS, artifact_name, build, compiled
+
+RETRY_DELAY = 0.5         # after a failed sync, doubling ...
+RETRY_MAX   = 30.0        # ... up to this
+
+log = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS wills (
+    app_id             INTEGER PRIMARY KEY,
+    owner              TEXT,
+    inactivity_period  INTEGER NOT NULL DEFAULT 0,
+    last_checkin       INTEGER NOT NULL DEFAULT 0,
+    deadline           INTEGER NOT NULL DEFAULT 0,
+    total_locked       INTEGER NOT NULL DEFAULT 0,
+    locked_asa_id      INTEGER NOT NULL DEFAULT 0,
+    status             INTEGER NOT NULL DEFAULT 0,
+    will_created       INTEGER NOT NULL DEFAULT 0,
+    inheritance_active INTEGER NOT NULL DEFAULT 0,
+    heir_count         INTEGER NOT NULL DEFAULT 0,
+    percent_total      INTEGER NOT NULL DEFAULT 0,
+    created_round      INTEGER NOT NULL,
+    updated_round      INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS wills_owner    ON wills (owner);
+CREATE INDEX IF NOT EXISTS wills_deadline ON wills (deadline) WHERE will_created AND NOT inheritance_active;
+CREATE INDEX IF NOT EXISTS wills_updated  ON wills (updated_round);
+CREATE TABLE IF NOT EXISTS heirs (
+    app_id      INTEGER NOT NULL,
+    slot        INTEGER NOT NULL,
+    address     TEXT    NOT NULL,
+    percent     INTEGER NOT NULL,
+    asa_amount  INTEGER NOT NULL DEFAULT 0,
+    claimed     INTEGER NOT NULL DEFAULT 0,
+    asa_claimed INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (app_id, slot)
+);
+CREATE INDEX IF NOT EXISTS heirs_address ON heirs (address);
+CREATE TABLE IF NOT EXISTS apps (
+    app_id INTEGER PRIMARY KEY
+);
+CREATE TABLE IF NOT EXISTS checkpoint (
+    id    INTEGER PRIMARY KEY CHECK (id = 1),
+    round INTEGER NOT NULL
+);
+"""
+
+GLOBALS = {                       # global-state key -> wills column
+    b"owner":             "owner",
+    b"inactivity_period": "inactivity_period",
+    b"last_checkin":      "last_checkin",
+    b"total_locked":      "total_locked",
+    b"locked_asa_id":     "locked_asa_id",
+    b"status":            "status",
+}
+DELTA_BYTES, DELTA_UINT, DELTA_DELETE = 1, 2, 3      # EvalDelta "at" actions
+
+
+def will_programs() -> list[bytes]:
+    """Approval bytecode of every AlgoLegacy build variant (each profile and beneficiary bound)."""
+    programs = []
+    for profile in OPTIONS["profile"]:
+        for bound in OPTIONS["max_beneficiaries"]:
+            options = {"profile": profile, **({"max_beneficiaries": bound} if bound else {})}
+            spec, _ = build("AlgoLegacy", options)
+            programs.append(compiled(artifact_name("AlgoLegacy", options), "approval", spec.approval_program))
+    return programs
+
+
+def decode_block(raw: bytes) -> dict:
+    """A msgpack block from algod; global-state keys stay exact as surrogate-escaped str."""
+    return msgpack.unpackb(raw, raw=False, unicode_errors="surrogateescape", strict_map_key=False)["block"]
+
+
+def _bytes(value: bytes | str) -> bytes:
+    # algod encodes Go strings (state keys, delta "bs") as msgpack str
+    return value if isinstance(value, bytes) else value.encode("utf-8", "surrogateescape")
+
+
+class WillIndex:
+    """SQLite store of will state, updated block by block (see the module docstring)."""
+
+    def __init__(
+        self, path: str, contract: Contract, programs: Iterable[bytes] = (), *, app_ids: Iterable[int] = (),
+    ):
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.row_factory = sqlite3.Row
+        self.db.executescript(SCHEMA)
+        self._methods: dict[bytes, abi.Method] = {
+            method.get_selector(): method for method in contract.methods
+        }
+        self.programs = frozenset(programs)              # accepted approval bytecode
+        self.app_ids  = frozenset(app_ids)               # accepted whatever their program
+        self.lock = threading.RLock()                    # held while a block or a seed is written
+
+    def close(self) -> None:
+        self.db.close()
+
+    @property
+    def round(self) -> int | None:
+        """The last block applied, or None for an empty index."""
+        row = self.db.execute("SELECT round FROM checkpoint").fetchone()
+        return row[0] if row else None
+
+    # ── Queries ──────────────────────────────────────────────────────────────
+    def will(self, app_id: int) -> dict | None:
+        row = self.db.execute("SELECT * FROM wills WHERE app_id = ?", (app_id,)).fetchone()
+        return dict(row) if row else None
+
+    def heirs(self, app_id: int) -> list[dict]:
+        rows = self.db.execute("SELECT * FROM heirs WHERE app_id = ? ORDER BY slot", (app_id,))
+        return [dict(row) for row in rows]
+
+    def wills_for(self, address: str) -> list[dict]:
+        """Wills `address` owns or is a beneficiary of, by app id."""
+        rows = self.db.execute(
+            "SELECT * FROM wills WHERE owner = ?"
+            " UNION SELECT wills.* FROM heirs JOIN wills USING (app_id) WHERE heirs.address = ?"
+            " ORDER BY app_id",
+            (address, address),
+        )
+        return [dict(row) for row in rows]
+
+    def accepts(self, app_id: int, approval: bytes | None = None) -> bool:
+        """Whether `app_id` is allowlisted, was seen created with an accepted program, or runs `approval`."""
+        if app_id in self.app_ids or approval in self.programs:
+            return True
+        return self.db.execute("SELECT 1 FROM apps WHERE app_id = ?", (app_id,)).fetchone() is not None
+
+    def changed_since(self, rnd: int) -> list[int]:
+        """App ids of wills written after round `rnd`."""
+        return [row[0] for row in self.db.execute("SELECT app_id FROM wills WHERE updated_round > ?", (rnd,))]
+
+    def due_between(self, start: int, end: int) -> list[dict]:
+        """Live wills (created, not active) whose deadline is in [start, end), soonest first."""
+        rows = self.db.execute(
+            "SELECT * FROM wills WHERE will_created AND NOT inheritance_active"
+            " AND deadline >= ? AND deadline < ? ORDER BY deadline",
+            (start, end),
+        )
+        return [dict(row) for row in rows]
+
+    # ── Updates ──────────────────────────────────────────────────────────────
+    def apply_block(self, block: dict) -> None:
+        """Apply one decoded block and advance the checkpoint (one transaction)."""
+        rnd = block["rnd"]
+        with self.lock, self.db:
+            current = self.round
+            if current is not None and rnd <= current:
+                return                                     # already applied before a restart
+            for entry in block.get("txns") or []:
+                self._apply_entry(entry, rnd)
+            self.db.execute("INSERT OR REPLACE INTO checkpoint (id, round) VALUES (1, ?)", (rnd,))
+
+    def _apply_entry(self, entry: dict, rnd: int) -> None:
+        txn   = entry.get("txn", {})
+        delta = entry.get("dt") or {}
+        if txn.get("type") == "appl":
+            app_id = txn.get("apid") or entry.get("apid")
+            if not txn.get("apid") and app_id and txn.get("apap") in self.programs:
+                self.db.execute("INSERT OR IGNORE INTO apps (app_id) VALUES (?)", (app_id,))
+            method = self._methods.get(_bytes(txn["apaa"][0])) if txn.get("apaa") else None
+            if method is not None and app_id:
+                self._apply_call(app_id, method, txn, delta, rnd)
+        for inner in delta.get("itx") or []:
+            self._apply_entry(inner, rnd)
+
+    def _apply_call(self, app_id: int, method: abi.Method, txn: dict, delta: dict, rnd: int) -> None:
+        row = self.will(app_id)
+        if row is None:
+            if method.name != "create_will" or not self.accepts(app_id):
+                return                                     # not a will we index
+            self.db.execute(
+                "INSERT INTO wills (app_id, created_round, updated_round) VALUES (?, ?, ?)", (app_id, rnd, rnd),
+            )
+            row = self.will(app_id)
+        before = dict(row)
+        for key, change in (delta.get("gd") or {}).items():
+            action = change.get("at")
+            value  = None if action == DELTA_DELETE else _bytes(change.get("bs", b"")) if action == DELTA_BYTES else change.get("ui", 0)
+            _set_global(row, _bytes(key), value)
+        self._write(row, rnd)
+        self._apply_heirs(app_id, method, _decode_args(method, txn["apaa"][1:]), before, row, delta)
+
+    def _write(self, row: dict, rnd: int) -> None:
+        row.update(decode_status(row["status"]))
+        row["deadline"]      = row["last_checkin"] + row["inactivity_period"]
+        row["updated_round"] = rnd
+        columns = [c for c in row if c != "app_id"]
+        self.db.execute(
+            f"UPDATE wills SET {', '.join(c + ' = ?' for c in columns)} WHERE app_id = ?",
+            [row[c] for c in columns] + [row["app_id"]],
+        )
+
+    def seed(self, app_id: int, state: dict[bytes, int | bytes], heirs: list[dict]) -> None:
+        """
+        Add a will read from algod (global state, decoded heir records), for
+        apps created before the indexer's start round.  The caller holds
+        `lock` with the index caught up to the state it read, and has
+        checked the app's program with `accepts`.
+        """
+        with self.lock, self.db:
+            if self.will(app_id) is not None:
+                return
+            rnd = self.round or 0
+            self.db.execute("INSERT OR IGNORE INTO apps (app_id) VALUES (?)", (app_id,))
+            self.db.execute(
+                "INSERT INTO wills (app_id, created_round, updated_round) VALUES (?, ?, ?)", (app_id, rnd, rnd),
+            )
+            row = self.will(app_id)
+            for key, value in state.items():
+                _set_global(row, key, value)
+            self._write(row, rnd)
+            self.db.executemany(
+                "INSERT INTO heirs (app_id, slot, address, percent, asa_amount, claimed, asa_claimed)"
+                " VALUES (:app_id, :slot, :address, :percent, :asa_amount, :claimed, :asa_claimed)",
+                [{"app_id": app_id, **heir} for heir in heirs],
+            )
+
+    def _apply_heirs(self, app_id: int, method: abi.Method, args: list, before: dict, after: dict, delta: dict) -> None:
+        """Box writes, replayed from the call's arguments."""
+        name, db = method.name, self.db
+        if name in ("create_will", "add_heirs"):
+            shares = args[-1]
+            if name == "create_will":
+                db.execute("DELETE FROM heirs WHERE app_id = ?", (app_id,))
+            first = after["heir_count"] - len(shares) + 1
+            db.executemany(
+                "INSERT OR REPLACE INTO heirs (app_id, slot, address, percent) VALUES (?, ?, ?, ?)",
+                [(app_id, first + i, address, percent) for i, (address, percent) in enumerate(shares)],
+            )
+        elif name == "revoke_will":
+            db.execute("DELETE FROM heirs WHERE app_id = ?", (app_id,))
+        elif name == "lock_asa":
+            db.executemany(
+                "UPDATE heirs SET asa_amount = asa_amount + ? WHERE app_id = ? AND slot = ?",
+                [(units, app_id, slot) for slot, units in args[0]],
+            )
+        elif name == "claim":
+            db.execute("UPDATE heirs SET claimed = 1 WHERE app_id = ? AND slot = ?", (app_id, args[0]))
+        elif name == "claim_asa":
+            db.execute("UPDATE heirs SET asa_claimed = 1 WHERE app_id = ? AND slot = ?", (app_id, args[0]))
+        elif name in ("claim_all", "claim_everything"):
+            where, slot = ("AND slot = ?", [args[0]]) if args else ("", [])
+            if before["total_locked"]:
+                db.execute(f"UPDATE heirs SET claimed = 1 WHERE app_id = ? {where}", [app_id, *slot])
+            # ASA allocations are paid only to opted-in heirs: follow the inner transfers
+            paid = [encoding.encode_address(inner["txn"]["arcv"])
+                    for inner in delta.get("itx") or [] if inner.get("txn", {}).get("type") == "axfer"]
+            db.executemany(
+                f"UPDATE heirs SET asa_claimed = 1 WHERE app_id = ? AND address = ? AND asa_amount > 0 {where}",
+                [[app_id, address, *slot] for address in paid],
+            )
+
+
+def _set_global(row: dict, key: bytes, value: int | bytes | None) -> None:
+    """One global-state value (None: deleted) into its `wills` column."""
+    column = GLOBALS.get(key)
+    if column is None:
+        return
+    if column == "owner":
+        row[column] = encoding.encode_address(value) if isinstance(value, bytes) and len(value) == 32 else None
+    else:
+        row[column] = value if isinstance(value, int) else 0
+
+
+def _decode_args(method: abi.Method, raw: list) -> list:
+    """ABI-decode the non-transaction arguments of one call."""
+    types = [arg.type for arg in method.args if isinstance(arg.type, abi.ABIType)]
+    return [t.decode(_bytes(value)) for t, value in zip(types, raw)]
+
+
+class BlockIndexer:
+    """Follows algod from the index's checkpoint and applies every block."""
+
+    def __init__(self, algod, index: WillIndex, *, start_round: int = 1):
+        self.algod       = algod
+        self.index       = index
+        self.start_round = start_round
+        self.blocks      = 0                               # blocks fetched and applied
+        self.errors      = 0                               # failed syncs, retried
+        self._stop       = threading.Event()
+
+    @property
+    def next_round(self) -> int:
+        current = self.index.round
+        return self.start_round if current is None else current + 1
+
+    def sync(self, until: int | None = None) -> int:
+        """Apply every block up to `until` (default: algod's last round); returns the index round."""
+        last = self.algod.status()["last-round"] if until is None else until
+        for rnd in range(self.next_round, last + 1):
+            self.index.apply_block(decode_block(self.algod.block_info(rnd, response_format="msgpack")))
+            self.blocks += 1
+        return self.next_round - 1
+
+    def run(self) -> None:
+        """Catch up, then apply each new block as it closes, until `stop()`; failures are retried."""
+        delay = RETRY_DELAY
+        while not self._stop.is_set():
+            try:
+                self.sync()
+                self.algod.status_after_block(self.next_round - 1)
+            except Exception as exc:       # algod down, a timeout, a locked database
+                self.errors += 1
+                log.warning("indexing from round %d failed (retrying in %.1f s): %r", self.next_round, delay, exc)
+                self._stop.wait(delay)
+                delay = min(RETRY_MAX, delay * 2)
+                continue
+            delay = RETRY_DELAY
+
+    def stop(self) -> None:
+        self._stop.set()
@@ -0,0 +1,228 @@
+"""
+keeper — activating inheritances as their deadlines pass
+=========================================================
+`activate_inheritance` only runs when somebody calls it after
+`last_checkin + inactivity_period`.  A `Keeper` makes that on time for
+every will it tracks:
+
+    heap        min-heap of (deadline, app_id); the top is the next will due
+    deadlines   app_id -> current deadline, the source of truth
+
+Each round it reads one block and applies only that block's calls to
+tracked wills: `check_in` moves a deadline to `ts + period` (a new heap
+entry; the old one goes stale and is skipped when it surfaces), and
+`activate_inheritance` / `force_activate` / `revoke_will` unschedule.
+Wills whose deadline is below the block timestamp are popped and
+activated in atomic groups of up to 16 calls.  Per round, the work is
+O(calls in the block + wills due · log n), not O(wills tracked).
+
+    keeper = Keeper(algod, private_key, contract)
+    keeper.track(app_ids)           # reads each will's state once
+    keeper.run()                    # follow the chain until stop()
+
+`run` blocks in `status_after_block` between rounds and calls
+`on_activated(round, app_ids)`, if set, after each round that activated.
+A round that fails (algod unreachable) is retried, waiting 0.5 s after
+the first failure and doubling up to 30 s.  Due wills whose activation
+could not be submitted, or whose state could not be re-read after a
+rejection, go back in the heap, due again at the next round.  A will
+leaves the schedule only when a read shows it can no longer activate, or
+algod answers 404 for it; a 429, 5xx or timeout never drops it.
+
+`activate_inheritance` compares against the previous block's timestamp,
+so a will is due once a block is seen with `ts > deadline`.
+"""
+
+import base64
+import heapq
+import logging
+import threading
+from typing import Iterable
+
+from algosdk.abi import Contract
+from algosdk.error import AlgodHTTPError
+
+from .calls import call_apps
+from .confirm import ConfirmationTracker
+from .state import WillState, read_states
+
+UNSCHEDULE  = ("activate_inheritance", "force_activate", "revoke_will")
+RETRY_DELAY = 0.5         # after a failed round, doubling ...
+RETRY_MAX   = 30.0        # ... up to this
+
+log = logging.getLogger(__name__)
+
+
+class Keeper:
+    """Tracks will deadlines and submits `activate_inheritance` when they pass."""
+
+    def __init__(self, algod, private_key: str, contract: Contract, *, tracker: ConfirmationTracker | None = None):
+        self.algod     = algod
+        self.key       = private_key
+        self.tracker   = tracker
+        self.heap: list[tuple[int, int]] = []
+        self.deadlines: dict[int, int] = {}
+        self.periods:   dict[int, int] = {}
+        self.tracked:   set[int] = set()
+        self.activated: list[int] = []                 # app ids, in activation order
+        self.failed:    dict[int, str] = {}            # app id -> last error
+        self.errors     = 0                            # failed rounds, retried by run()
+        self.on_activated = None                       # callback(round, app_ids) from run()
+        self._selectors = {
+            contract.get_method_by_name(name).get_selector(): name
+            for name in ("check_in", "create_will", *UNSCHEDULE)
+        }
+        self._activate = contract.get_method_by_name("activate_inheritance").get_selector()
+        self._stop     = threading.Event()
+
+    # ── Schedule ─────────────────────────────────────────────────────────────
+    def schedule(self, app_id: int, last_checkin: int, period: int) -> None:
+        """(Re)schedule `app_id` to be due at last_checkin + period."""
+        deadline = last_checkin + period
+        self.periods[app_id] = period
+        if self.deadlines.get(app_id) == deadline:
+            return
+        self.deadlines[app_id] = deadline
+        heapq.heappush(self.heap, (deadline, app_id))
+        if len(self.heap) > 2 * len(self.deadlines) + 1024:
+            self._compact()
+
+    def unschedule(self, app_id: int) -> None:
+        """Stop watching `app_id`; its heap entries go stale."""
+        self.deadlines.pop(app_id, None)
+
+    def next_deadline(self) -> int | None:
+        """The earliest live deadline, discarding stale heap entries on the way."""
+        while self.heap:
+            deadline, app_id = self.heap[0]
+            if self.deadlines.get(app_id) == deadline:
+                return deadline
+            heapq.heappop(self.heap)
+        return None
+
+    def due(self, now: int) -> list[int]:
+        """Pop and return every will whose deadline is before `now`."""
+        out = []
+        while (deadline := self.next_deadline()) is not None and deadline < now:
+            _, app_id = heapq.heappop(self.heap)
+            del self.deadlines[app_id]
+            out.append(app_id)
+        return out
+
+    def retry(self, app_ids: Iterable[int], now: int) -> None:
+        """Put popped wills back in the heap, due in the first block after chain time `now`."""
+        for app_id in app_ids:
+            self.deadlines[app_id] = now
+            heapq.heappush(self.heap, (now, app_id))
+
+    def _compact(self) -> None:
+        self.heap = [(deadline, app_id) for app_id, deadline in self.deadlines.items()]
+        heapq.heapify(self.heap)
+
+    # ── State ────────────────────────────────────────────────────────────────
+    def track(self, app_ids: Iterable[int]) -> None:
+        """
+        Read the wills' global state (concurrently) and schedule those that
+        can still activate.  A will whose read failed (not a 404) is due at
+        once, so the next round tries it and re-reads it.
+        """
+        app_ids = list(app_ids)
+        states, _, failed = read_states(self.algod, app_ids)
+        for app_id in app_ids:
+            if app_id in failed:
+                self.tracked.add(app_id)
+                self.retry([app_id], 0)
+            else:
+                self._apply(app_id, states.get(app_id))
+
+    def refresh(self, app_id: int) -> None:
+        """Re-read `app_id` from algod and (un)schedule it accordingly; raises if the read fails (not a 404)."""
+        states, _, failed = read_states(self.algod, [app_id], workers=1)
+        if app_id in failed:
+            raise failed[app_id]
+        self._apply(app_id, states.get(app_id))
+
+    def _apply(self, app_id: int, state: WillState | None) -> None:
+        self.tracked.add(app_id)
+        if state is not None and state.is_live:
+            self.schedule(app_id, state.last_checkin, state.inactivity_period)
+        else:
+            self.unschedule(app_id)                    # deleted, activated, revoked or never created
+
+    def observe_block(self, block: dict) -> None:
+        """Apply one block's calls to tracked wills (algod's JSON block shape)."""
+        ts = block["ts"]
+        for entry in block.get("txns") or []:
+            txn = entry.get("txn", entry)
+            app_id = txn.get("apid")
+            if txn.get("type") != "appl" or app_id not in self.tracked:
+                continue
+            args   = txn.get("apaa") or []
+            method = self._selectors.get(base64.b64decode(args[0])) if args else None
+            if method == "check_in" and app_id in self.periods:
+                # The contract stores the previous block's timestamp, which is
+                # ≤ ts: scheduling from ts can only be late by a round, never early
+                self.schedule(app_id, ts, self.periods[app_id])
+            elif method == "check_in":
+                self.refresh(app_id)
+            elif method == "create_will":
+                self.refresh(app_id)                     # re-created after a revoke
+            elif method in UNSCHEDULE:
+                self.unschedule(app_id)
+
+    # ── Activation ───────────────────────────────────────────────────────────
+    def activate(self, app_ids: list[int], now: int = 0) -> list[int]:
+        """
+        Submit activations in groups of ≤ 16; returns the app ids that
+        activated.  A will whose group failed is re-read from algod and
+        rescheduled; if that read fails too, it is retried after `now`.
+        """
+        try:
+            confirmed, failed = call_apps(self.algod, self.key, self._activate, app_ids, tracker=self.tracker)
+        except (AlgodHTTPError, OSError) as exc:           # no suggested params: nothing was sent
+            confirmed, failed = {}, dict.fromkeys(app_ids, str(exc))
+        retry = []
+        for app_id, error in failed.items():
+            # Rejected even alone (checked in since it was read): reschedule from chain state
+            self.failed[app_id] = error
+            try:
+                self.refresh(app_id)
+            except (AlgodHTTPError, OSError):
+                retry.append(app_id)
+        if retry:
+            log.warning("activation of %d wills failed (retrying next round): %s", len(retry), failed[retry[0]])
+            self.retry(retry, now)
+        done = list(confirmed)
+        self.activated += done
+        return done
+
+    # ── Daemon ───────────────────────────────────────────────────────────────
+    def run(self, start_round: int | None = None) -> None:
+        """Follow the chain from `start_round` (default: now) until `stop()`; failed rounds are retried."""
+        rnd   = start_round
+        delay = RETRY_DELAY
+        while not self._stop.is_set():
+            try:
+                if rnd is None:
+                    rnd = self.algod.status()["last-round"]
+                last = self.algod.status_after_block(rnd)["last-round"]
+                for r in range(rnd + 1, last + 1):
+                    done = self.step(self.algod.block_info(r)["block"])
+                    rnd  = r
+                    if done and self.on_activated is not None:
+                        self.on_activated(r, done)
+            except (AlgodHTTPError, OSError) as exc:
+                self.errors += 1
+                log.warning("keeper round after %s failed (retrying in %.1f s): %r", rnd, delay, exc)
+                self._stop.wait(delay)
+                delay = min(RETRY_MAX, delay * 2)
+                continue
+            delay = RETRY_DELAY
+
+    def step(self, block: dict) -> list[int]:
+        """One round: apply the block, then activate what it made due."""
+        self.observe_block(block)
+        return self.activate(self.due(block["ts"]), block["ts"])
+
+    def stop(self) -> None:
+        self._stop.set()
@@ -0,0 +1,386 @@
+"""
+read_api — decoded will state over HTTP, one upstream read per change
+======================================================================
+Every open dashboard polls `getAppGlobalState` (a global-state read plus a
+box read per beneficiary) every 10 seconds, and the claims view does the
+same for every will it finds; each of those is a request to algod.  A
+`ReadAPI` answers them from a `WillIndex` kept current by a
+`BlockIndexer`, so algod sees one block fetch per round however many
+dashboards are open:
+
+    reader = WillReader(algod, index, BlockIndexer(algod, index, start_round=r))
+    with ReadAPI(reader, port=8980):                # serves until stop()
+        ...
+
+Endpoints:
+    GET /wills/{app-id}                  one will, with its beneficiaries
+    GET /wills/{app-id}?after=N&timeout=S
+                                         long-poll: answer once the will is
+                                         written after round N (≤ 60 s)
+    GET /wills?address=X                 wills X owns or inherits from
+    GET /status                          index round, cache, upstream, limited and error counts
+
+Will bodies are cached per app and dropped when a block writes the will;
+lists are dropped when any will changes.  Responses carry an ETag (a will's
+is `"{app-id}-{updated round}"`), and a request whose If-None-Match still
+matches gets 304 with no body.  A will the index has not seen (created
+before the indexer's start round) is read from algod once, global state and
+heir boxes, and seeded into the index; from then on blocks keep it current.
+Seeding drops the cached lists, which did not include the will.
+
+Seeding is the one path on which a request reaches algod, so it is
+bounded: at most `seed_rate` seeds per second (burst `seed_burst`), and a
+request over the limit gets 503 with Retry-After, and one whose reads fail
+(algod unreachable or erroring, or a box gone mid-read) gets 502.  An app id found not to
+be a will (no such app, or not an AlgoLegacy build) is remembered and
+answered 404 from then on: an app created later is indexed from its
+block.  Only an AlgoLegacy app with no will yet is looked up again, once
+per round.
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import socket
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from algosdk import abi
+from algosdk.error import AlgodHTTPError
+
+from .indexer import BlockIndexer, WillIndex
+from .state import decode_global_state
+from .transport import RateLimiter
+from contracts.algolegacy import HEIR_RECORD_TYPE, decode_status, heir_box_name
+
+MAX_WAIT     = 60                 # seconds a long-poll may hold a request
+RETRY_DELAY  = 0.5                # after a failed refresh, doubling ...
+RETRY_MAX    = 30.0               # ... up to this
+SEED_RATE    = 2.0                # unknown wills read from algod per second ...
+SEED_BURST   = 10                 # ... and at once
+MAX_MISSING  = 100_000            # app ids remembered as not wills
+HEIR_RECORD  = abi.ABIType.from_string(HEIR_RECORD_TYPE)
+WILL_FIELDS  = (
+    "will_created", "inheritance_active", "percent_total", "heir_count", "total_locked",
+    "last_checkin", "inactivity_period", "deadline", "owner", "locked_asa_id", "updated_round",
+)
+HEIR_FIELDS  = ("slot", "address", "percent", "asa_amount", "claimed", "asa_claimed")
+
+log = logging.getLogger(__name__)
+
+
+class SeedLimited(Exception):
+    """An unknown will was asked for while seeding is over its rate limit."""
+
+
+class SeedFailed(Exception):
+    """An unknown will could not be read from algod; nothing was remembered."""
+
+
+class WillReader:
+    """Cached JSON bodies and ETags of indexed wills; seeds unknown ones from algod."""
+
+    def __init__(
+        self, algod, index: WillIndex, indexer: BlockIndexer, *,
+        seed_rate: float | None = SEED_RATE, seed_burst: int = SEED_BURST,
+    ):
+        self.algod    = algod
+        self.index    = index
+        self.indexer  = indexer
+        self.upstream = 0                                  # algod reads made to seed wills
+        self.errors   = 0                                  # failed refreshes (retried) and seeds
+        self.limited  = 0                                  # seeds refused over the rate limit
+        self._seeds   = RateLimiter(seed_rate, seed_burst)
+        self._wills: dict[int, tuple[str, bytes, int]] = {}  # app id -> (etag, body, updated round)
+        self._lists: dict[str, tuple[str, bytes]]     = {}  # address -> (etag, body)
+        self._missing: set[int] = set()                    # never a will: no such app, or not AlgoLegacy
+        self._no_will: set[int] = set()                    # AlgoLegacy, no will as of the current round
+        self._round   = index.round or 0                   # last round the caches were checked against
+        self._changed = threading.Condition()              # notified after every refresh
+        self._stop    = threading.Event()
+
+    @property
+    def round(self) -> int:
+        return self._round
+
+    @property
+    def cached(self) -> int:
+        return len(self._wills)
+
+    # ── Reads ────────────────────────────────────────────────────────────────
+    def will(self, app_id: int) -> tuple[str, bytes, int] | None:
+        """
+        (etag, JSON body, updated round) of one will, or None if it is not
+        one.  Raises SeedLimited if it would have to be seeded over the limit,
+        SeedFailed if seeding it failed.
+        """
+        cached = self._wills.get(app_id)
+        if cached is not None:
+            return cached
+        with self.index.lock:
+            known = self.index.will(app_id) is not None
+        if not known:
+            if app_id in self._missing or app_id in self._no_will:
+                return None
+            if not self._seeds.try_acquire():
+                self.limited += 1
+                raise SeedLimited(f"application {app_id} is not indexed yet; retry later")
+            try:
+                seeded = self._seed(app_id)
+            except (AlgodHTTPError, OSError) as exc:       # a box 404 too: changed mid-read
+                self.errors += 1
+                raise SeedFailed(f"application {app_id} could not be read from algod: {exc}") from exc
+            if seeded is not True:
+                if len(self._missing) >= MAX_MISSING:
+                    self._missing.clear()
+                (self._missing if seeded is False else self._no_will).add(app_id)
+                return None
+        with self.index.lock:
+            if not known:
+                self._lists.clear()                        # listed before it was seeded
+            row  = self.index.will(app_id)
+            body = {field: row[field] for field in WILL_FIELDS}
+            body["app_id"] = app_id
+            body["heirs"]  = [{field: heir[field] for field in HEIR_FIELDS} for heir in self.index.heirs(app_id)]
+            entry = (f'"{app_id}-{row["updated_round"]}"', json.dumps(body).encode(), row["updated_round"])
+            self._wills[app_id] = entry
+        return entry
+
+    def wills_for(self, address: str) -> tuple[str, bytes]:
+        """(etag, JSON body) of the wills `address` owns or is a beneficiary of."""
+        cached = self._lists.get(address)
+        if cached is not None:
+            return cached
+        with self.index.lock:
+            rows = self.index.wills_for(address)
+            body = json.dumps({
+                "address": address,
+                "wills":   [{"app_id": row["app_id"], **{f: row[f] for f in WILL_FIELDS}} for row in rows],
+            }).encode()
+            entry = (f'"{hashlib.sha1(body).hexdigest()}"', body)
+            self._lists[address] = entry
+        return entry
+
+    def wait(self, app_id: int, after: int, timeout: float) -> tuple[str, bytes, int] | None:
+        """The will once it is written after round `after`; None if not by `timeout` seconds."""
+        deadline = time.monotonic() + timeout
+        while True:
+            entry = self.will(app_id)
+            if entry is None or entry[2] > after:
+                return entry
+            with self._changed:
+                # refresh() drops a changed will before notifying: checked under the
+                # condition, so a change between will() and wait() is not missed
+                if self._wills.get(app_id) is entry and not self._changed.wait(deadline - time.monotonic()):
+                    return None
+
+    # ── Seeding ──────────────────────────────────────────────────────────────
+    def _seed(self, app_id: int) -> bool | None:
+        """
+        Read a will the index has not seen from algod and add it; False if
+        the app never will be one, None if it has no will yet.  The reads run
+        without `index.lock`, which is taken only to check that no block was
+        applied since and to seed.  A failed read other than "no such app"
+        raises AlgodHTTPError or OSError.
+        """
+        for attempt in range(3):                           # retry if a block lands mid-read
+            rnd = self.indexer.sync()
+            try:
+                self.upstream += 1
+                info = self.algod.application_info(app_id)
+            except AlgodHTTPError as exc:                  # only "no such app" is final
+                if getattr(exc, "code", None) == 404:
+                    return False
+                raise
+            with self.index.lock:
+                accepted = self.index.accepts(app_id, base64.b64decode(info["params"].get("approval-program", "")))
+            if not accepted:
+                return False                               # not an AlgoLegacy build, whatever its state
+            state = decode_global_state(info["params"].get("global-state", []))
+            if b"owner" not in state or b"status" not in state:
+                return None                                # unset uints are absent, these two never are
+            heirs = [self._heir(app_id, slot) for slot in range(1, decode_status(state[b"status"])["heir_count"] + 1)]
+            self.upstream += 1
+            settled = self.algod.status()["last-round"] == rnd
+            with self.index.lock:
+                if (settled and self.indexer.next_round - 1 == rnd) or attempt == 2:
+                    self.index.seed(app_id, state, heirs)
+                    break
+        return True
+
+    def _heir(self, app_id: int, slot: int) -> dict:
+        self.upstream += 1
+        box = self.algod.application_box_by_name(app_id, heir_box_name(slot))
+        address, percent, asa_amount, claimed, asa_claimed = HEIR_RECORD.decode(base64.b64decode(box["value"]))
+        return {"slot": slot, "address": address, "percent": percent, "asa_amount": asa_amount,
+                "claimed": int(claimed), "asa_claimed": int(asa_claimed)}
+
+    # ── Following ────────────────────────────────────────────────────────────
+    def refresh(self) -> int:
+        """Apply new blocks, drop what they changed from the caches, wake long-polls."""
+        self.indexer.sync()
+        with self.index.lock:
+            changed     = self.index.changed_since(self._round)
+            self._round = self.indexer.next_round - 1        # not 0 before the start round's block
+            for app_id in changed:
+                self._wills.pop(app_id, None)
+            if changed:
+                self._lists.clear()
+            self._no_will.clear()
+        with self._changed:
+            self._changed.notify_all()
+        return self._round
+
+    def run(self) -> None:
+        """Refresh after every block, until `stop()`; a failed refresh is retried with backoff."""
+        delay = RETRY_DELAY
+        while not self._stop.is_set():
+            try:
+                self.algod.status_after_block(self.refresh())
+            except Exception as exc:
+                self.errors += 1
+                log.warning("refresh after round %d failed (retrying in %.1f s): %r", self._round, delay, exc)
+                self._stop.wait(delay)
+                delay = min(RETRY_MAX, delay * 2)
+                continue
+            delay = RETRY_DELAY
+
+    def stop(self) -> None:
+        self._stop.set()
+
+
+class ReadAPI:
+    """An HTTP server answering will reads from a `WillReader` (see the module docstring)."""
+
+    def __init__(self, reader: WillReader, *, host: str = "127.0.0.1", port: int = 0):
+        self.reader       = reader
+        self.requests     = 0                              # HTTP requests served
+        self.not_modified = 0                              # of which answered 304
+        self._server      = ThreadingHTTPServer((host, port), _handler(self))
+        self._server.daemon_threads = True
+        self._serving: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "ReadAPI":
+        """Catch up, then serve and follow blocks in background threads."""
+        self._serve()
+        threading.Thread(target=self.reader.run, daemon=True).start()
+        return self
+
+    def run(self) -> None:
+        """Serve from background threads, following blocks in this one, until `stop()`."""
+        self._serve()
+        self.reader.run()
+
+    def stop(self) -> None:
+        self.reader.stop()
+        if self._serving is not None:                      # shutdown() waits for serve_forever to run
+            self._server.shutdown()
+            self._serving.join()
+            self._serving = None
+        self._server.server_close()
+
+    def _serve(self) -> None:
+        self.reader.refresh()
+        self._serving = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._serving.start()
+
+    def __enter__(self) -> "ReadAPI":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def status(self) -> dict:
+        return {"round": self.reader.round, "cached": self.reader.cached, "upstream": self.reader.upstream,
+                "limited": self.reader.limited, "errors": self.reader.errors,
+                "requests": self.requests, "not_modified": self.not_modified}
+
+
+def _handler(api: ReadAPI) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            super().setup()
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        def do_GET(self):
+            api.requests += 1
+            url   = urllib.parse.urlsplit(self.path)
+            query = {key: values[0] for key, values in urllib.parse.parse_qs(url.query).items()}
+            parts = url.path.strip("/").split("/")
+            if parts == ["status"]:
+                return self._send(200, json.dumps(api.status()).encode())
+            if parts == ["wills"]:
+                if "address" not in query:
+                    return self._error(400, "address is required")
+                etag, body = api.reader.wills_for(query["address"])
+                return self._send(200, body, etag)
+            if len(parts) == 2 and parts[0] == "wills" and parts[1].isdigit():
+                app_id = int(parts[1])
+                if "after" in query:
+                    try:
+                        after   = int(query["after"])
+                        timeout = min(float(query.get("timeout", MAX_WAIT)), MAX_WAIT)
+                    except ValueError:
+                        after, timeout = -1, -1.0
+                    if not (after >= 0 and timeout >= 0):           # also rejects a NaN timeout
+                        return self._error(400, "after must be a round ≥ 0 and timeout seconds ≥ 0")
+                try:
+                    entry = api.reader.will(app_id)
+                except SeedLimited as exc:
+                    return self._error(503, str(exc), retry_after=1)
+                except SeedFailed as exc:
+                    return self._error(502, str(exc))
+                if entry is None:
+                    return self._error(404, f"application {app_id} is not an AlgoLegacy will")
+                if "after" in query:
+                    entry = api.reader.wait(app_id, after, timeout)
+                    if entry is None:                      # nothing new: the caller's copy stands
+                        return self._send(304, b"")
+                etag, body, _ = entry
+                return self._send(200, body, etag)
+            return self._error(404, f"{url.path} is not served")
+
+        def _error(self, status: int, message: str, *, retry_after: int | None = None) -> None:
+            self._send(status, json.dumps({"message": message}).encode(), retry_after=retry_after)
+
+        def _send(self, status: int, body: bytes, etag: str | None = None, *, retry_after: int | None = None) -> None:
+            if etag is not None and etag == self.headers.get("If-None-Match"):
+                status, body = 304, b""
+            if status == 304:
+                api.not_modified += 1
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Cache-Control", "no-cache")              # revalidate with the ETag
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.send_header("Access-Control-Expose-Headers", "ETag, X-Index-Round")
+            self.send_header("X-Index-Round", str(api.reader.round))
+            if etag is not None:
+                self.send_header("ETag", etag)
+            if retry_after is not None:
+                self.send_header("Retry-After", str(retry_after))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_OPTIONS(self):
+            # CORS preflight for If-None-Match from dashboards on another origin
+            self.send_response(204)
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.send_header("Access-Control-Allow-Headers", "If-None-Match")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
@@ -0,0 +1,119 @@
+"""
+registry — client for the AlgoLegacy will registry
+===================================================
+Discovery: `RegistryClient.wills_for(address)` asks algod for the
+registry's box names under the prefix "b" + address, a page at a time
+(`GET /v2/applications/{id}/boxes?prefix=...&max=...&next=...`), and reads
+the will ids off the index entries ("b" + address + itob(will_id)).  It
+costs one request per `page_size` wills naming the address, however many
+wills the registry holds or how much transaction history the address has,
+and replaces paging through the indexer for every `appl` transaction
+touching the wallet.
+
+Creation: `storage_cost` and `create_will_boxes` work out the storage
+payment and box references `create_will` / `add_heirs` need, including one
+index entry per distinct heir.
+"""
+
+import base64
+from typing import Callable, Iterable, Iterator
+
+from algosdk import encoding
+from algosdk.error import AlgodHTTPError
+
+from contracts.registry import (
+    INDEX_BOX_MBR,
+    INDEX_BOX_PREFIX,
+    heir_box_name,
+    index_box_name,
+    will_box_name,
+    will_storage_cost,
+)
+
+MAX_BOX_REFS = 8        # per app call
+BOX_PAGE     = 1000     # box names per listing request
+
+
+def decode_will_ids(names: Iterable[bytes], beneficiary: str) -> list[int]:
+    """Ids of the wills naming `beneficiary`, from the registry's box names, ascending."""
+    prefix = INDEX_BOX_PREFIX + encoding.decode_address(beneficiary)
+    return sorted(
+        int.from_bytes(name[len(prefix):], "big")
+        for name in names if len(name) == len(prefix) + 8 and name.startswith(prefix)
+    )
+
+
+def index_storage_cost(heirs: list[str], will_id: int, indexed: Callable[[str, int], bool]) -> int:
+    """µALGO of the index entries writing `heirs` into `will_id` creates.
+
+    `indexed(address, will_id)` says whether the entry already exists.  An
+    address named twice, or already indexed for this will by an earlier
+    call, is not charged again, as the contract does.
+    """
+    return INDEX_BOX_MBR * sum(1 for heir in dict.fromkeys(heirs) if not indexed(heir, will_id))
+
+
+def create_will_boxes(will_id: int, heirs: list[str], first_slot: int = 1) -> list[tuple[int, bytes]]:
+    """Box references for writing `heirs` into slots first_slot.. of `will_id`."""
+    boxes = [(0, will_box_name(will_id))]
+    boxes += [(0, heir_box_name(will_id, first_slot + i)) for i in range(len(heirs))]
+    boxes += [(0, index_box_name(h, will_id)) for h in dict.fromkeys(heirs)]
+    if len(boxes) > MAX_BOX_REFS:
+        raise ValueError(
+            f"{len(heirs)} heirs need {len(boxes)} box references (max {MAX_BOX_REFS}); "
+            "split them across add_heirs calls"
+        )
+    return boxes
+
+
+class RegistryClient:
+    """Read-side helpers for one deployed registry."""
+
+    def __init__(self, algod_client, app_id: int, *, page_size: int = BOX_PAGE):
+        self.algod     = algod_client
+        self.app_id    = app_id
+        self.page_size = page_size
+
+    # ── Discovery ────────────────────────────────────────────────────────────
+    def wills_for(self, address: str) -> list[int]:
+        """Ids of every will naming `address` as a beneficiary, ascending.
+
+        Lists only the address's index entries, `page_size` per request.
+        """
+        return decode_will_ids(self.box_names(INDEX_BOX_PREFIX + encoding.decode_address(address)), address)
+
+    def box_names(self, prefix: bytes) -> Iterator[bytes]:
+        """Names of the registry's boxes starting with `prefix`, following algod's next-token."""
+        params = {"prefix": "b64:" + base64.b64encode(prefix).decode(), "max": self.page_size}
+        while True:
+            page = self.algod.algod_request("GET", f"/applications/{self.app_id}/boxes", params=params)
+            for box in page.get("boxes", []):
+                yield base64.b64decode(box["name"])
+            token = page.get("next-token")
+            if not token:
+                return
+            params["next"] = token
+
+    # ── Creation ─────────────────────────────────────────────────────────────
+    def indexed(self, address: str, will_id: int) -> bool:
+        """Whether will `will_id` already has an index entry for `address`."""
+        try:
+            self.algod.application_box_by_name(self.app_id, index_box_name(address, will_id))
+        except AlgodHTTPError as exc:
+            if getattr(exc, "code", None) == 404:
+                return False
+            raise
+        return True
+
+    def storage_cost(self, heirs: list[str], will_id: int, *, new_will: bool = True) -> int:
+        """The exact `storage` payment for writing `heirs` into will `will_id`."""
+        return (
+            will_storage_cost(len(heirs), new_will=new_will)
+            + index_storage_cost(heirs, will_id, self.indexed)
+        )
+
+    def next_will_id(self) -> int:
+        """The id the next `create_will` will be given."""
+        state = self.algod.application_info(self.app_id)["params"].get("global-state", [])
+        key   = base64.b64encode(b"will_count").decode()
+        return next((kv["value"]["uint"] for kv in state if kv["key"] == key), 0) + 1
@@ -0,0 +1,134 @@
+"""
+snapshot — many wills' dashboard state, a simulate request per 16 wills
+========================================================================
+`get_will_snapshot` returns in one call what `get_will_status`,
+`get_time_remaining` and `get_locked_balance` return in three, plus the
+locked ASA and every slot's claimed flag.  `SnapshotReader` puts one such
+call per will into each group of up to 16 and simulates the groups, all
+in flight together over the client's connection pool:
+
+    reader = SnapshotReader(algod, sender)     # any funded account; nothing is signed
+    snapshots, failed = reader.read(app_ids)
+    # snapshots: {app_id: WillSnapshot}    failed: {app_id: error}
+
+A refresh of N wills is ceil(N / 16) simulate requests instead of 3 × N
+calls (algod simulates one group per request).  The calls list no box
+references: the request allows unnamed resources, so a will's heir boxes
+are read however many it has.  A group with a will that cannot be read
+(deleted, or an app rejecting the call) fails as a whole, and its wills
+are then simulated one at a time so only that will is reported.  An app
+that accepts the call but returns no snapshot (not an AlgoLegacy app) is
+reported on its own, beside the rest of its group.
+"""
+
+import base64
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from algosdk import abi, constants, transaction
+from algosdk.error import AlgodHTTPError
+from algosdk.v2client.models import SimulateRequest, SimulateRequestTransactionGroup
+
+GET_WILL_SNAPSHOT = abi.Method.from_signature("get_will_snapshot()(string,uint64,uint64,uint64,bool[])")
+RETURN_PREFIX     = bytes.fromhex("151f7c75")   # ARC-4 return log
+MAX_GROUP_SIZE    = constants.tx_group_limit
+PARAMS_TTL        = 600      # seconds a cached suggested-params is reused for simulate
+WORKERS           = 8        # simulate requests in flight
+
+
+@dataclass(frozen=True)
+class WillSnapshot:
+    """One will as `get_will_snapshot` returned it, at `round`."""
+    app_id:         int
+    round:          int
+    status:         str                  # NO_WILL | ALIVE | READY_TO_ACTIVATE | INHERITANCE_ACTIVE
+    time_remaining: int                  # seconds to the inactivity deadline, 0 once past
+    locked_balance: int                  # µALGO
+    asa_id:         int                  # 0 if no ASA is locked
+    claimed:        tuple[bool, ...]     # per slot 1..heir count: ALGO share claimed
+
+    @property
+    def unclaimed_slots(self) -> list[int]:
+        return [slot for slot, done in enumerate(self.claimed, start=1) if not done]
+
+
+class SnapshotReader:
+    """Batched `get_will_snapshot` reads, simulated as `sender`."""
+
+    def __init__(self, algod_client, sender: str, *, workers: int = WORKERS):
+        self.algod   = algod_client
+        self.sender  = sender
+        self.workers = workers
+        self._params: tuple[float, object] | None = None
+
+    def read(self, app_ids) -> tuple[dict[int, WillSnapshot], dict[int, str]]:
+        """Snapshot every app in `app_ids`; returns ({app_id: snapshot}, {app_id: error})."""
+        ids    = list(dict.fromkeys(app_ids))
+        groups = [ids[i:i + MAX_GROUP_SIZE] for i in range(0, len(ids), MAX_GROUP_SIZE)]
+        snapshots: dict[int, WillSnapshot] = {}
+        failed:    dict[int, str] = {}
+        if not groups:
+            return snapshots, failed
+        params = self._suggested_params()
+        with ThreadPoolExecutor(self.workers) as pool:
+            outcomes = list(pool.map(lambda group: self._simulate(group, params), groups))
+            retry    = [app_id for group, outcome in zip(groups, outcomes) if isinstance(outcome, str) for app_id in group]
+            for app_id, outcome in zip(retry, pool.map(lambda app_id: self._simulate([app_id], params), retry)):
+                if isinstance(outcome, str):
+                    failed[app_id] = outcome
+                else:
+                    outcomes.append(outcome)
+            for outcome in outcomes:
+                if not isinstance(outcome, str):
+                    snapshots.update(outcome[0])
+                    failed.update(outcome[1])
+        return snapshots, failed
+
+    def _simulate(self, group: list[int], params) -> tuple[dict[int, WillSnapshot], dict[int, str]] | str:
+        """One simulate request for `group`; ({app_id: snapshot}, {app_id: error}), or why the group failed."""
+        txns = [
+            transaction.ApplicationNoOpTxn(self.sender, params, app_id, app_args=[GET_WILL_SNAPSHOT.get_selector()])
+            for app_id in group
+        ]
+        if len(txns) > 1:
+            transaction.assign_group_id(txns)
+        request = SimulateRequest(
+            txn_groups=[SimulateRequestTransactionGroup(txns=[transaction.SignedTransaction(t, None) for t in txns])],
+            allow_empty_signatures=True, allow_unnamed_resources=True,
+        )
+        try:
+            response = self.algod.simulate_transactions(request)
+        except (AlgodHTTPError, OSError) as exc:          # a timeout or reset connection fails the group
+            return str(exc)
+        result = response["txn-groups"][0]
+        if result.get("failure-message"):
+            return result["failure-message"]
+        rnd = response["last-round"]
+        snapshots: dict[int, WillSnapshot] = {}
+        failed:    dict[int, str] = {}
+        for app_id, entry in zip(group, result["txn-results"]):
+            try:
+                snapshots[app_id] = _decode(app_id, rnd, entry["txn-result"].get("logs", []))
+            except ValueError as exc:
+                failed[app_id] = str(exc)
+        return snapshots, failed
+
+    def _suggested_params(self):
+        now = time.monotonic()
+        if self._params is None or now - self._params[0] > PARAMS_TTL:
+            params = self.algod.suggested_params()
+            params.flat_fee, params.fee = True, params.min_fee
+            self._params = (now, params)
+        return self._params[1]
+
+
+def _decode(app_id: int, rnd: int, logs: list[str]) -> WillSnapshot:
+    raw = base64.b64decode(logs[-1]) if logs else b""
+    if not raw.startswith(RETURN_PREFIX):
+        raise ValueError(f"app {app_id}: get_will_snapshot returned no value")
+    try:
+        status, remaining, locked, asa_id, claimed = GET_WILL_SNAPSHOT.returns.type.decode(raw[len(RETURN_PREFIX):])
+    except Exception as exc:
+        raise ValueError(f"app {app_id}: get_will_snapshot returned a malformed value") from exc
+    return WillSnapshot(app_id, rnd, status, remaining, locked, asa_id, tuple(claimed))
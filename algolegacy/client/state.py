@@ -0,0 +1,173 @@
+"""
+state — reading and decoding the global state of many wills
+============================================================
+algod returns an app's global state as a list of base64 keys with
+type-tagged values.  `read_states` fetches it for many app ids at once
+(`workers` requests in flight over the client's connection pool) and
+`decode_states` turns each list into a `WillState`:
+
+    states, missing, failed = read_states(algod, app_ids)
+    live = [s for s in states.values() if s.is_live]
+    soonest = min(live, key=lambda s: s.deadline)
+
+`missing` holds the app ids algod answered 404 for (deleted, or never
+created); `failed` holds those whose read failed otherwise (429, 5xx, a
+timeout), with the exception, so callers can retry them rather than take
+them for gone.
+
+A `WillState` is a `__slots__` record of the six globals plus what is
+derived from them: the status word's fields and `deadline`
+(`last_checkin + inactivity_period`).  Keys are matched in their base64
+form, without decoding, and the owner is kept as its 32 raw bytes and
+encoded to an address only when `owner` is read.  That encoding hashes
+with hashlib's SHA-512/256 rather than algosdk's pure-Python-wrapped one,
+base32-encodes through a pair table instead of `base64.b32encode`, and is
+cached per owner (benchmarks/bench_state.py).
+"""
+
+import base64
+import functools
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
+
+from algosdk import encoding
+from algosdk.error import AlgodHTTPError
+
+from contracts.algolegacy import (
+    STATUS_HEIR_COUNT_SHIFT,
+    STATUS_INHERITANCE_ACTIVE,
+    STATUS_PERCENT_TOTAL_SHIFT,
+    STATUS_WILL_CREATED,
+)
+
+WORKERS = 8                       # application reads in flight
+OWNERS  = 65_536                  # owner addresses kept encoded
+
+
+def decode_global_state(items: list[dict]) -> dict[bytes, int | bytes]:
+    """algod's `global-state` list as {key: uint or bytes}."""
+    state: dict[bytes, int | bytes] = {}
+    for item in items:
+        value = item["value"]
+        state[base64.b64decode(item["key"])] = (
+            base64.b64decode(value["bytes"]) if value["type"] == 1 else value["uint"]
+        )
+    return state
+
+
+try:
+    _SHA512_256 = hashlib.new("sha512_256")             # copied per key: no lookup by name
+except ValueError:                                      # OpenSSL built without it
+    _SHA512_256 = None
+_B32_PAIRS  = [a + b for a in "ABCDEFGHIJKLMNOPQRSTUVWXYZ234567" for b in "ABCDEFGHIJKLMNOPQRSTUVWXYZ234567"]
+_B32_SHIFTS = tuple(range(280, -1, -10))                # 36 bytes + 2 pad bits = 29 pairs = 58 chars
+
+
+@functools.lru_cache(maxsize=OWNERS)
+def _address(public_key: bytes) -> str:
+    """`encoding.encode_address`, with hashlib's SHA-512/256 and a table-driven base32."""
+    if _SHA512_256 is None:
+        return encoding.encode_address(public_key)
+    digest = _SHA512_256.copy()
+    digest.update(public_key)
+    # base64.b32encode is pure Python before 3.13: one big int, 10 bits per table lookup
+    bits = int.from_bytes(public_key + digest.digest()[-4:], "big") << 2
+    return "".join([_B32_PAIRS[bits >> shift & 0x3FF] for shift in _B32_SHIFTS])
+
+
+# base64 global-state key -> WillState slot; owner is the only bytes value
+_UINTS = {
+    base64.b64encode(key).decode(): key.decode()
+    for key in (b"inactivity_period", b"last_checkin", b"total_locked", b"locked_asa_id", b"status")
+}
+_OWNER = base64.b64encode(b"owner").decode()
+
+
+class WillState:
+    """One will's global state, decoded, with its status fields and deadline."""
+
+    __slots__ = (
+        "app_id", "owner_bytes", "inactivity_period", "last_checkin", "total_locked", "locked_asa_id",
+        "status", "will_created", "inheritance_active", "percent_total", "heir_count", "deadline",
+    )
+
+    def __init__(
+        self, app_id: int, owner_bytes: bytes | None = None, *, inactivity_period: int = 0, last_checkin: int = 0,
+        total_locked: int = 0, locked_asa_id: int = 0, status: int = 0,
+    ):
+        self.app_id             = app_id
+        self.owner_bytes        = owner_bytes            # 32-byte public key, None if unset
+        self.inactivity_period  = inactivity_period
+        self.last_checkin       = last_checkin
+        self.total_locked       = total_locked
+        self.locked_asa_id      = locked_asa_id
+        self.status             = status
+        self.will_created       = status >> STATUS_WILL_CREATED & 1
+        self.inheritance_active = status >> STATUS_INHERITANCE_ACTIVE & 1
+        self.percent_total      = status >> STATUS_PERCENT_TOTAL_SHIFT & 0xFF
+        self.heir_count         = status >> STATUS_HEIR_COUNT_SHIFT
+        self.deadline           = last_checkin + inactivity_period
+
+    @classmethod
+    def decode(cls, app_id: int, items: list[dict]) -> "WillState":
+        """From algod's `global-state` list (absent keys are zero, as on chain)."""
+        fields, owner = {}, None
+        for item in items:
+            key = item["key"]
+            if key == _OWNER:
+                owner = base64.b64decode(item["value"]["bytes"]) or None
+            elif key in _UINTS:
+                fields[_UINTS[key]] = item["value"]["uint"]
+        return cls(app_id, owner, **fields)
+
+    @property
+    def owner(self) -> str | None:
+        """The owner's address."""
+        return _address(self.owner_bytes) if self.owner_bytes else None
+
+    @property
+    def is_live(self) -> bool:
+        """Created and not yet activated: it can still be checked in or activated."""
+        return bool(self.will_created and not self.inheritance_active)
+
+    def time_remaining(self, now: int) -> int:
+        """Seconds from chain time `now` until the will can be activated."""
+        return max(0, self.deadline - now)
+
+    def is_due(self, now: int) -> bool:
+        """Whether `activate_inheritance` succeeds in a block after one at time `now`."""
+        return self.is_live and now > self.deadline
+
+    def __repr__(self) -> str:
+        return (f"WillState(app_id={self.app_id}, owner={self.owner}, status={self.status}, "
+                f"last_checkin={self.last_checkin}, deadline={self.deadline})")
+
+
+def decode_states(apps: Iterable[tuple[int, list[dict]]]) -> list[WillState]:
+    """`WillState.decode` over (app_id, global-state list) pairs."""
+    decode = WillState.decode
+    return [decode(app_id, items) for app_id, items in apps]
+
+
+def read_states(
+    algod, app_ids: Iterable[int], *, workers: int = WORKERS,
+) -> tuple[dict[int, WillState], dict[int, str], dict[int, Exception]]:
+    """
+    Fetch and decode many apps' global state; returns ({app_id: state},
+    {app_id: error} for apps algod does not have, {app_id: exception} for
+    reads that failed otherwise).
+    """
+    def fetch(app_id: int) -> tuple[int, list[dict] | Exception]:
+        try:
+            return app_id, algod.application_info(app_id)["params"].get("global-state", [])
+        except (AlgodHTTPError, OSError) as exc:
+            return app_id, exc
+
+    with ThreadPoolExecutor(workers) as pool:
+        fetched = list(pool.map(fetch, dict.fromkeys(app_ids)))
+    errors  = {app_id: items for app_id, items in fetched if isinstance(items, Exception)}
+    missing = {app_id: str(exc) for app_id, exc in errors.items() if getattr(exc, "code", None) == 404}
+    failed  = {app_id: exc for app_id, exc in errors.items() if app_id not in missing}
+    states  = decode_states((app_id, items) for app_id, items in fetched if app_id not in errors)
+    return {state.app_id: state for state in states}, missing, failed
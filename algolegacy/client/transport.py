@@ -0,0 +1,285 @@
+"""
+transport — rate-limited, pooled HTTP for algod
+================================================
+`PooledAlgodClient` is a drop-in `AlgodClient` whose requests share
+
+    RateLimiter     a token bucket: `rate` requests/s sustained, `burst` at once,
+                    shared by every thread and asyncio task using the client
+    ConnectionPool  keep-alive HTTP/1.1 connections (one TLS handshake per
+                    connection, not per request)
+
+and retry HTTP 429 after the server's `Retry-After` (or an exponential
+backoff when it sends none).  A 429 also pauses the limiter, so the other
+threads back off too instead of walking into the same limit:
+
+    algod = PooledAlgodClient(token, "https://testnet-api.algonode.network",
+                              rate=20, burst=20)
+
+It replaces fixed sleeps after every call: requests run as fast as the
+provider allows and only wait when the bucket is empty.
+"""
+
+import asyncio
+import email.utils
+import http.client
+import json
+import queue
+import random
+import threading
+import time
+from typing import Callable
+from urllib import parse
+
+from algosdk import constants, error
+from algosdk.v2client.algod import AlgodClient, api_version_path_prefix
+
+MAX_RETRIES  = 5
+BACKOFF_BASE = 0.5       # seconds; doubled per attempt when there is no Retry-After
+BACKOFF_MAX  = 30.0
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Rate limiting
+# ─────────────────────────────────────────────────────────────────────────────
+class RateLimiter:
+    """
+    Token bucket holding up to `burst` tokens, refilled at `rate` per second.
+
+    Each request reserves a token under a lock and then sleeps outside it
+    until that token exists, so waiters are served in arrival order and
+    never hold the lock while sleeping.  `rate=None` disables limiting.
+    """
+
+    def __init__(
+        self,
+        rate: float | None,
+        burst: int = 1,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive (or None for no limit)")
+        self.rate   = rate
+        self.burst  = max(1, burst)
+        self._clock = clock
+        self._sleep = sleep
+        self._lock  = threading.Lock()
+        self._tokens  = float(self.burst)
+        self._updated = clock()
+        self._paused  = 0.0      # clock time before which no token is handed out
+
+    def reserve(self) -> float:
+        """Take one token and return how many seconds to wait before using it."""
+        with self._lock:
+            now = self._clock()
+            if self.rate is None:
+                return max(0.0, self._paused - now)
+            start = max(now, self._paused)
+            self._tokens = min(self.burst, self._tokens + (start - self._updated) * self.rate)
+            self._updated = start
+            self._tokens -= 1
+            ready = start if self._tokens >= 0 else start - self._tokens / self.rate
+            return ready - now
+
+    def acquire(self) -> None:
+        """Block the calling thread until a request may be sent."""
+        wait = self.reserve()
+        if wait > 0:
+            self._sleep(wait)
+
+    def try_acquire(self) -> bool:
+        """Take one token if it exists now; never waits (for callers that refuse instead)."""
+        with self._lock:
+            now = self._clock()
+            if now < self._paused:
+                return False
+            if self.rate is None:
+                return True
+            start = max(now, self._updated)                 # tokens reserved ahead accrue nothing
+            self._tokens  = min(self.burst, self._tokens + (start - self._updated) * self.rate)
+            self._updated = start
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    async def acquire_async(self) -> None:
+        """`acquire` for asyncio tasks: waits without blocking the event loop."""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for `seconds` (the server said to back off)."""
+        with self._lock:
+            now = self._clock()
+            self._paused = max(self._paused, now + seconds)
+            if self.rate is not None:
+                # Nothing accrues during the pause, and the burst starts over empty
+                self._tokens  = min(self._tokens, 0.0)
+                self._updated = max(self._updated, self._paused)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Connection pooling
+# ─────────────────────────────────────────────────────────────────────────────
+class ConnectionPool:
+    """Up to `size` idle keep-alive connections to one `scheme://host:port`."""
+
+    def __init__(self, base_url: str, size: int = 8, timeout: float = 30):
+        url = parse.urlsplit(base_url)
+        if url.scheme not in ("http", "https"):
+            raise ValueError(f"unsupported URL scheme: {base_url!r}")
+        self._factory = http.client.HTTPSConnection if url.scheme == "https" else http.client.HTTPConnection
+        self.host     = url.hostname
+        self.port     = url.port
+        self.prefix   = url.path.rstrip("/")
+        self.timeout  = timeout
+        self._idle: queue.LifoQueue = queue.LifoQueue(maxsize=size)
+        self.opened   = 0        # connections created so far (for diagnostics and tests)
+        self._lock    = threading.Lock()
+
+    def get(self) -> tuple[http.client.HTTPConnection, bool]:
+        """An idle connection (reused=True) or a new one."""
+        try:
+            return self._idle.get_nowait(), True
+        except queue.Empty:
+            with self._lock:
+                self.opened += 1
+            return self._factory(self.host, self.port, timeout=self.timeout), False
+
+    def put(self, conn: http.client.HTTPConnection) -> None:
+        """Return `conn` for reuse, closing it if the pool is full."""
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def request(
+        self, method: str, path: str, body: bytes | None, headers: dict[str, str], timeout: float | None = None,
+    ) -> tuple[int, dict[str, str], bytes]:
+        """Send one request; returns (status, headers, body).  `timeout` overrides the pool's for it."""
+        while True:
+            conn, reused = self.get()
+            if timeout is not None:
+                _set_timeout(conn, timeout)
+            try:
+                conn.request(method, self.prefix + path, body=body, headers=headers)
+                resp = conn.getresponse()
+                data = resp.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if reused:       # the server closed an idle connection: retry on a new one
+                    continue
+                raise
+            except BaseException:
+                conn.close()
+                raise
+            if resp.will_close:
+                conn.close()
+            else:
+                if timeout is not None:
+                    _set_timeout(conn, self.timeout)
+                self.put(conn)
+            return resp.status, {k.lower(): v for k, v in resp.getheaders()}, data
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+def _set_timeout(conn: http.client.HTTPConnection, timeout: float) -> None:
+    conn.timeout = timeout
+    if conn.sock is not None:
+        conn.sock.settimeout(timeout)
+
+
+def retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a `Retry-After` header (delta-seconds or HTTP-date)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# algod
+# ─────────────────────────────────────────────────────────────────────────────
+class PooledAlgodClient(AlgodClient):
+    """`AlgodClient` sending every request through a `RateLimiter` and a `ConnectionPool`."""
+
+    def __init__(
+        self,
+        algod_token: str,
+        algod_address: str,
+        headers: dict[str, str] | None = None,
+        *,
+        rate: float | None = None,
+        burst: int = 1,
+        limiter: RateLimiter | None = None,
+        pool_size: int = 8,
+        max_retries: int = MAX_RETRIES,
+    ):
+        super().__init__(algod_token, algod_address, headers)
+        self.limiter     = limiter or RateLimiter(rate, burst)
+        self.pool        = ConnectionPool(algod_address, pool_size)
+        self.max_retries = max_retries
+        self.on_rate_limited: Callable[[float, int], None] | None = None   # (wait, attempt)
+
+    def algod_request(
+        self,
+        method: str,
+        requrl: str,
+        params=None,
+        data: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        response_format: str | None = "json",
+        timeout: int | None = None,          # None: the pool's
+    ):
+        header = {"User-Agent": "py-algorand-sdk", **(self.headers or {}), **(headers or {})}
+        if requrl not in constants.no_auth:
+            header[constants.algod_auth_header] = self.algod_token
+        if requrl not in constants.unversioned_paths:
+            requrl = api_version_path_prefix + requrl
+        if params:
+            requrl = requrl + "?" + parse.urlencode(params)
+
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire()
+            status, resp_headers, body = self.pool.request(method, requrl, data, header, timeout)
+            if status != 429 or attempt == self.max_retries:
+                break
+            wait = retry_after(resp_headers.get("retry-after"))
+            if wait is None:
+                wait = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt) * random.uniform(0.5, 1.0)
+            self.limiter.pause(wait)
+            if self.on_rate_limited:
+                self.on_rate_limited(wait, attempt + 1)
+
+        if status >= 400:
+            message, payload = body.decode("utf-8", "replace"), {}
+            try:
+                payload = json.loads(message)
+                message = payload["message"]
+            except (ValueError, KeyError, TypeError):
+                pass
+            raise error.AlgodHTTPError(message, status, payload.get("data") if isinstance(payload, dict) else None)
+        if response_format != "json":
+            return body
+        if not body:
+            return {}
+        try:
+            return json.loads(body)
+        except ValueError as exc:
+            raise error.AlgodResponseError("Failed to parse JSON response from algod") from exc
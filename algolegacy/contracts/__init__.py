@@ -1,3 +1,13 @@
-from .algolegacy import app
+# The apps are imported on first access, so `contracts.build_cache` can serve
+# cached builds without importing beaker/PyTEAL.
+__all__ = ["app", "registry_app"]
 
-__all__ = ["app", "AlgoLegacy"]
+
+def __getattr__(name: str):
+    if name == "app":
+        from .algolegacy import app
+        return app
+    if name == "registry_app":
+        from .registry import app as registry_app
+        return registry_app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
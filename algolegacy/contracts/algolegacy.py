@@ -9,25 +9,47 @@ Architecture:
   - If owner misses check-in, any address can activate inheritance
   - Each beneficiary claims their % share of locked funds
 
+Storage:
+  - Global state holds the will itself (owner, clock, totals); the flags and
+    beneficiary counters share one packed `status` word
+  - Beneficiaries live in one box each, keyed by slot: "h" + itob(slot),
+    so a claim reads exactly one box however many heirs the will has
+
 Security:
   - Only owner can create will / check-in / revoke
   - Activation blocked until inactivity period elapses
-  - Percentages must sum to exactly 100
+  - Percentages must sum to exactly 100 before funds can be deposited
   - Double-claim protection via claimed flags
   - Revoke only possible before inheritance is activated
 """
 
 from beaker import Application, GlobalStateValue
 from pyteal import (
+    And,
+    Approve,
+    AssetHolding,
     Assert,
+    BoxExtract,
+    BoxGet,
+    BoxPut,
     Bytes,
+    BytesZero,
+    CallConfig,
+    Concat,
     Cond,
     Expr,
+    For,
+    GetBit,
     Global,
     If,
     InnerTxnBuilder,
     Int,
+    Itob,
+    Not,
+    ScratchVar,
     Seq,
+    SetBit,
+    Suffix,
     TealType,
     Txn,
     TxnField,
@@ -35,12 +57,18 @@ from pyteal import (
     abi,
 )
 
+from contracts.build_cache import build_options
+from contracts.constants import GLOBAL_NUM_BYTE_SLICES, GLOBAL_NUM_UINTS, HEIR_BOX_MBR
+
 
 MIN_INACTIVITY_SECONDS = 60
 MIN_DEPOSIT_MICROALGOS = 1_000_000
 ERR_NO_WILL              = "No will exists"
 ERR_INHERITANCE_ACTIVE   = "Inheritance already active"
 ERR_ALREADY_CLAIMED      = "Already claimed"
+ERR_PERCENT_TOTAL        = "Percentages must sum to 100"
+ERR_BAD_SLOT             = "Invalid beneficiary slot"
+MAX_INNER_GROUP_SIZE     = 16
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Application + module-level global state
@@ -51,97 +79,303 @@ ERR_ALREADY_CLAIMED      = "Already claimed"
 owner              = GlobalStateValue(TealType.bytes,  key="owner",              default=Bytes(""))
 inactivity_period  = GlobalStateValue(TealType.uint64, key="inactivity_period",  default=Int(0))
 last_checkin       = GlobalStateValue(TealType.uint64, key="last_checkin",       default=Int(0))
-inheritance_active = GlobalStateValue(TealType.uint64, key="inheritance_active", default=Int(0))
 total_locked       = GlobalStateValue(TealType.uint64, key="total_locked",       default=Int(0))
-will_created       = GlobalStateValue(TealType.uint64, key="will_created",       default=Int(0))
-
-# ── Beneficiary 1 ─────────────────────────────────────────────────────────────
-b1_address = GlobalStateValue(TealType.bytes,  key="b1_address", default=Bytes(""))
-b1_percent = GlobalStateValue(TealType.uint64, key="b1_percent", default=Int(0))
-b1_claimed = GlobalStateValue(TealType.uint64, key="b1_claimed", default=Int(0))
 
-# ── Beneficiary 2 ─────────────────────────────────────────────────────────────
-b2_address = GlobalStateValue(TealType.bytes,  key="b2_address", default=Bytes(""))
-b2_percent = GlobalStateValue(TealType.uint64, key="b2_percent", default=Int(0))
-b2_claimed = GlobalStateValue(TealType.uint64, key="b2_claimed", default=Int(0))
-
-# ── Beneficiary 3 ─────────────────────────────────────────────────────────────
-b3_address = GlobalStateValue(TealType.bytes,  key="b3_address", default=Bytes(""))
-b3_percent = GlobalStateValue(TealType.uint64, key="b3_percent", default=Int(0))
-b3_claimed = GlobalStateValue(TealType.uint64, key="b3_claimed", default=Int(0))
+# ── Flags + beneficiary table counters (packed, see layout below) ─────────────
+status             = GlobalStateValue(TealType.uint64, key="status",             default=Int(0))
 
 # ── Digital Assets (ASA) ──────────────────────────────────────────────────────
-locked_asa_id  = GlobalStateValue(TealType.uint64, key="locked_asa_id",  default=Int(0))
-b1_asa_amount  = GlobalStateValue(TealType.uint64, key="b1_asa_amount",  default=Int(0))
-b1_asa_claimed = GlobalStateValue(TealType.uint64, key="b1_asa_claimed", default=Int(0))
-b2_asa_amount  = GlobalStateValue(TealType.uint64, key="b2_asa_amount",  default=Int(0))
-b2_asa_claimed = GlobalStateValue(TealType.uint64, key="b2_asa_claimed", default=Int(0))
-b3_asa_amount  = GlobalStateValue(TealType.uint64, key="b3_asa_amount",  default=Int(0))
-b3_asa_claimed = GlobalStateValue(TealType.uint64, key="b3_asa_claimed", default=Int(0))
+locked_asa_id      = GlobalStateValue(TealType.uint64, key="locked_asa_id",      default=Int(0))
 
 # ─────────────────────────────────────────────────────────────────────────────
-# Create application  (22 global state keys: 15 original + 7 ASA)
-# Schema: 4 byte-slices, 18 ints
+# Create application  (6 global state keys; beneficiaries are in boxes)
+# Schema: 1 byte-slice, 5 ints
 # ─────────────────────────────────────────────────────────────────────────────
+# The state list is not reflected in app.build()'s declared schema, so
+# deployers pass GLOBAL_NUM_UINTS / GLOBAL_NUM_BYTE_SLICES (contracts/constants.py)
+# explicitly when creating the app.
 app = Application(
     "AlgoLegacy",
     state=[
-        owner, inactivity_period, last_checkin, inheritance_active,
-        total_locked, will_created,
-        b1_address, b1_percent, b1_claimed,
-        b2_address, b2_percent, b2_claimed,
-        b3_address, b3_percent, b3_claimed,
+        owner, inactivity_period, last_checkin, total_locked,
+        status,
         # ASA state
         locked_asa_id,
-        b1_asa_amount, b1_asa_claimed,
-        b2_asa_amount, b2_asa_claimed,
-        b3_asa_amount, b3_asa_claimed,
     ],
 )
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Packed status word  (global uint64 "status")
+#   bit  0        will_created
+#   bit  1        inheritance_active
+#   bits 8..15    percent_total   (0..100)
+#   bits 16..63   heir_count
+#
+# Each method reads the word once into scratch (`will.load()`), decodes the
+# fields from there and writes it back once (`will.save()`) if it changed.
+# Off-chain readers unpack it with decode_status().
+# ─────────────────────────────────────────────────────────────────────────────
+STATUS_WILL_CREATED        = 0      # bit index
+STATUS_INHERITANCE_ACTIVE  = 1      # bit index
+STATUS_PERCENT_TOTAL_SHIFT = 8
+STATUS_HEIR_COUNT_SHIFT    = 16
+
+
+def decode_status(word: int) -> dict[str, int]:
+    """Unpack a `status` global-state value into its named fields."""
+    return {
+        "will_created":       word >> STATUS_WILL_CREATED & 1,
+        "inheritance_active": word >> STATUS_INHERITANCE_ACTIVE & 1,
+        "percent_total":      word >> STATUS_PERCENT_TOTAL_SHIFT & 0xFF,
+        "heir_count":         word >> STATUS_HEIR_COUNT_SHIFT,
+    }
+
+
+class _WillStatus:
+    """The status word in scratch: read once per call, decoded, written back by save()."""
+
+    def __init__(self):
+        self.word = ScratchVar(TealType.uint64)
+
+    def load(self) -> Expr:
+        return self.word.store(status.get())
+
+    def save(self) -> Expr:
+        return status.set(self.word.load())
+
+    def will_created(self) -> Expr:
+        return GetBit(self.word.load(), Int(STATUS_WILL_CREATED))
+
+    def inheritance_active(self) -> Expr:
+        return GetBit(self.word.load(), Int(STATUS_INHERITANCE_ACTIVE))
+
+    def percent_total(self) -> Expr:
+        return (self.word.load() >> Int(STATUS_PERCENT_TOTAL_SHIFT)) & Int(0xFF)
+
+    def heir_count(self) -> Expr:
+        return self.word.load() >> Int(STATUS_HEIR_COUNT_SHIFT)
+
+    def clear(self) -> Expr:
+        return self.word.store(Int(0))
+
+    def mark_created(self) -> Expr:
+        return self.word.store(SetBit(self.word.load(), Int(STATUS_WILL_CREATED), Int(1)))
+
+    def mark_active(self) -> Expr:
+        return self.word.store(SetBit(self.word.load(), Int(STATUS_INHERITANCE_ACTIVE), Int(1)))
+
+    def set_counters(self, heir_count: Expr, percent_total: Expr) -> Expr:
+        # percent_total must already be checked ≤ 100 so it fits its 8 bits
+        return self.word.store(
+            (self.word.load() & Int(0xFF))
+            | (percent_total << Int(STATUS_PERCENT_TOTAL_SHIFT))
+            | (heir_count << Int(STATUS_HEIR_COUNT_SHIFT))
+        )
+
+
+will = _WillStatus()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Build profile  (build("AlgoLegacy", {"profile": ...}), see build_cache.py)
+#   default     every read of state is made where it is used
+#   optimised   values a method reads repeatedly (per heir in claim_all, or
+#               the share claim pays and returns) are computed once into scratch.
+#               A single re-read is cheaper than a scratch store and load, so
+#               only these are cached
+# Both profiles behave identically; tests/test_build_profiles.py runs them
+# side by side on random call sequences.
+# ─────────────────────────────────────────────────────────────────────────────
+OPTIMISED = build_options().get("profile") == "optimised"
+
+# Beneficiary-count variant  (build("AlgoLegacy", {"max_beneficiaries": n}))
+#   None        any number of heirs (add_heirs as often as needed)
+#   n           at most n heirs: _append_heirs rejects more, and claim_all,
+#               paying at most 2n inner transactions, drops its mid-loop
+#               group flush when they fit in one group
+# The ABI, schema and status layout are the same in every variant.
+MAX_BENEFICIARIES = build_options().get("max_beneficiaries")
+ERR_TOO_MANY_HEIRS = "Too many beneficiaries"
+
+
+class _Once:
+    """A value a method uses repeatedly: recomputed at each use, or (optimised) kept in scratch."""
+
+    def __init__(self, value: Expr, type: TealType, *, cached: bool = True):
+        self.value = value
+        self.slot  = ScratchVar(type) if OPTIMISED and cached else None
+
+    def load(self) -> Expr:
+        """Evaluate the value; must precede every get() and follow any write it depends on."""
+        return self.slot.store(self.value) if self.slot else Seq()
+
+    def get(self) -> Expr:
+        return self.slot.load() if self.slot else self.value
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Beneficiary boxes
+#   name  : "h" + itob(slot)                               (9 bytes, slot 1..n)
+#   value : Heir = (address,uint64,uint64,bool,bool)       (49 bytes)
+#   MBR   : 2500 + 400 * (9 + 49) = 25_700 µALGO per heir, paid by the app account
+#
+# Every call touching slot N must list box "h"+itob(N) in its box references.
+# A revoked will leaves its boxes in place; the next create_will overwrites
+# them, and slots beyond the heir count are never read.
+# ─────────────────────────────────────────────────────────────────────────────
+HEIR_BOX_PREFIX  = b"h"
+HEIR_RECORD_TYPE = "(address,uint64,uint64,bool,bool)"
+HEIR_FLAGS_BYTE  = 32 + 8 + 8                          # claimed (high bit), then asa_claimed
+
+
+class Heir(abi.NamedTuple):
+    address:     abi.Field[abi.Address]
+    percent:     abi.Field[abi.Uint64]
+    asa_amount:  abi.Field[abi.Uint64]
+    claimed:     abi.Field[abi.Bool]
+    asa_claimed: abi.Field[abi.Bool]
+
+
+class WillSnapshot(abi.NamedTuple):
+    status:         abi.Field[abi.String]                # as get_will_status
+    time_remaining: abi.Field[abi.Uint64]                # as get_time_remaining
+    locked_balance: abi.Field[abi.Uint64]                # as get_locked_balance
+    asa_id:         abi.Field[abi.Uint64]                # locked_asa_id, 0 if none
+    claimed:        abi.Field[abi.DynamicArray[abi.Bool]]   # per slot 1..heir_count: ALGO share claimed
+
+
+HeirShare      = abi.Tuple2[abi.Address, abi.Uint64]   # create_will input: (address, percent)
+AsaAllocation  = abi.Tuple2[abi.Uint64, abi.Uint64]    # lock_asa input:    (slot, units)
+ClaimedAmounts = abi.Tuple2[abi.Uint64, abi.Uint64]    # claim_everything:  (microALGO, units)
+
+
+def heir_box_name(slot: int) -> bytes:
+    """Box name of beneficiary `slot` (1-based), for transaction box references."""
+    return HEIR_BOX_PREFIX + slot.to_bytes(8, "big")
+
+
+def _heir_key(slot: Expr) -> Expr:
+    return Concat(Bytes(HEIR_BOX_PREFIX), Itob(slot))
+
+
+class _HeirFields:
+    """Scratch ABI values for reading, updating and re-writing one Heir record."""
+
+    def __init__(self):
+        self.record      = Heir()
+        self.address     = abi.Address()
+        self.percent     = abi.Uint64()
+        self.asa_amount  = abi.Uint64()
+        self.claimed     = abi.Bool()
+        self.asa_claimed = abi.Bool()
+
+    def load(self, slot: Expr) -> Expr:
+        return Seq(
+            Assert(And(slot >= Int(1), slot <= will.heir_count()), comment=ERR_BAD_SLOT),
+            box := BoxGet(_heir_key(slot)),
+            Assert(box.hasValue(), comment=ERR_BAD_SLOT),
+            self.record.decode(box.value()),
+            self.record.address.store_into(self.address),
+            self.record.percent.store_into(self.percent),
+            self.record.asa_amount.store_into(self.asa_amount),
+            self.record.claimed.store_into(self.claimed),
+            self.record.asa_claimed.store_into(self.asa_claimed),
+        )
+
+    def save(self, slot: Expr) -> Expr:
+        # Records are fixed-size, so box_put overwrites in place
+        return Seq(
+            self.record.set(self.address, self.percent, self.asa_amount, self.claimed, self.asa_claimed),
+            BoxPut(_heir_key(slot), self.record.encode()),
+        )
+
+
+def _append_heirs(shares: abi.DynamicArray[HeirShare]) -> Expr:
+    """
+    Write one box per (address, percent) share, in slots heir_count+1 ...
+    Updates the counters in `will`; the caller saves it.
+    """
+    i     = ScratchVar(TealType.uint64)
+    count = ScratchVar(TealType.uint64)
+    pct   = ScratchVar(TealType.uint64)
+    share = abi.make(HeirShare)
+    heir  = _HeirFields()
+    return Seq(
+        heir.asa_amount.set(Int(0)),
+        heir.claimed.set(False),
+        heir.asa_claimed.set(False),
+        count.store(will.heir_count()),
+        pct.store(will.percent_total()),
+        For(i.store(Int(0)), i.load() < shares.length(), i.store(i.load() + Int(1))).Do(
+            shares[i.load()].store_into(share),
+            share[0].store_into(heir.address),
+            share[1].store_into(heir.percent),
+            count.store(count.load() + Int(1)),
+            pct.store(pct.load() + heir.percent.get()),
+            heir.save(count.load()),
+        ),
+        Assert(pct.load() <= Int(100), comment=ERR_PERCENT_TOTAL),
+        Assert(count.load() <= Int(MAX_BENEFICIARIES), comment=ERR_TOO_MANY_HEIRS) if MAX_BENEFICIARIES else Seq(),
+        will.set_counters(count.load(), pct.load()),
+    )
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 0. BARE CREATE (deploy an empty will; create_will is called afterwards)
+# ─────────────────────────────────────────────────────────────────────────────
+@app.create(bare=True)
+def create() -> Expr:
+    """Plain app creation, as used by deploy.py and the frontend."""
+    return Approve()
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # 1. CREATE WILL
 # ─────────────────────────────────────────────────────────────────────────────
-@app.external
+@app.external(method_config={"no_op": CallConfig.ALL})
 def create_will(
     period:     abi.Uint64,
-    addr1:      abi.Address,
-    pct1:       abi.Uint64,
-    addr2:      abi.Address,
-    pct2:       abi.Uint64,
-    addr3:      abi.Address,
-    pct3:       abi.Uint64,
+    heirs:      abi.DynamicArray[HeirShare],
     *,
     output:     abi.String,
 ) -> Expr:
     """
     Initialize the will. Can only be called once per app instance.
-    Caller becomes the owner. Percentages must sum to 100.
+    Caller becomes the owner; `heirs` fill slots 1..len(heirs).
+    May also be the app-create call itself (deploy + create in one txn) with
+    an empty list, as box storage needs a funded app account.
+    Each heir needs its box reference, so large estates continue with add_heirs.
     """
-    total_pct = pct1.get() + pct2.get() + pct3.get()
     return Seq(
-        Assert(will_created.get() == Int(0),                   comment="Will already created"),
+        will.load(),
+        Assert(Not(will.will_created()),                       comment="Will already created"),
         Assert(period.get() >= Int(MIN_INACTIVITY_SECONDS),    comment="Inactivity period too short"),
-        Assert(total_pct == Int(100),                          comment="Percentages must sum to 100"),
         owner.set(Txn.sender()),
         inactivity_period.set(period.get()),
         last_checkin.set(Global.latest_timestamp()),
-        inheritance_active.set(Int(0)),
-        will_created.set(Int(1)),
-        b1_address.set(addr1.get()),
-        b1_percent.set(pct1.get()),
-        b1_claimed.set(Int(0)),
-        b2_address.set(addr2.get()),
-        b2_percent.set(pct2.get()),
-        b2_claimed.set(Int(0)),
-        b3_address.set(addr3.get()),
-        b3_percent.set(pct3.get()),
-        b3_claimed.set(Int(0)),
+        will.clear(),
+        will.mark_created(),
+        _append_heirs(heirs),
+        will.save(),
         output.set("Will created successfully"),
     )
 
 
+@app.external
+def add_heirs(heirs: abi.DynamicArray[HeirShare], *, output: abi.Uint64) -> Expr:
+    """Owner appends more beneficiaries (before activation). Returns the new heir count."""
+    return Seq(
+        will.load(),
+        Assert(will.will_created(),                 comment=ERR_NO_WILL),
+        Assert(Txn.sender() == owner.get(),          comment="Only owner can add heirs"),
+        Assert(Not(will.inheritance_active()),      comment=ERR_INHERITANCE_ACTIVE),
+        _append_heirs(heirs),
+        will.save(),
+        output.set(will.heir_count()),
+    )
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # 2. DEPOSIT FUNDS
 # ─────────────────────────────────────────────────────────────────────────────
@@ -153,9 +387,11 @@ def deposit(
 ) -> Expr:
     """Lock ALGO into the will. Full payment amount is locked with no fees."""
     return Seq(
-        Assert(will_created.get() == Int(1),                         comment="Create will first"),
-        Assert(inheritance_active.get() == Int(0),                   comment=ERR_INHERITANCE_ACTIVE),
+        will.load(),
+        Assert(will.will_created(),                                  comment="Create will first"),
+        Assert(Not(will.inheritance_active()),                       comment=ERR_INHERITANCE_ACTIVE),
         Assert(Txn.sender() == owner.get(),                          comment="Only owner can deposit"),
+        Assert(will.percent_total() == Int(100),                     comment=ERR_PERCENT_TOTAL),
         Assert(payment.get().receiver() == Global.current_application_address(),
                comment="Payment must go to contract"),
         Assert(payment.get().amount() >= Int(MIN_DEPOSIT_MICROALGOS), comment="Minimum deposit is 1 ALGO"),
@@ -171,9 +407,10 @@ def deposit(
 def check_in(*, output: abi.Uint64) -> Expr:
     """Owner resets the inactivity clock. Blocked after activation."""
     return Seq(
-        Assert(will_created.get() == Int(1),                         comment=ERR_NO_WILL),
+        will.load(),
+        Assert(will.will_created(),                                  comment=ERR_NO_WILL),
         Assert(Txn.sender() == owner.get(),                          comment="Only owner can check in"),
-        Assert(inheritance_active.get() == Int(0),                   comment=ERR_INHERITANCE_ACTIVE),
+        Assert(Not(will.inheritance_active()),                       comment=ERR_INHERITANCE_ACTIVE),
         last_checkin.set(Global.latest_timestamp()),
         output.set(Global.latest_timestamp()),
     )
@@ -187,10 +424,12 @@ def activate_inheritance(*, output: abi.String) -> Expr:
     """Anyone can trigger activation once the inactivity deadline passes."""
     deadline = last_checkin.get() + inactivity_period.get()
     return Seq(
-        Assert(will_created.get() == Int(1),                           comment=ERR_NO_WILL),
-        Assert(inheritance_active.get() == Int(0),                     comment="Already activated"),
+        will.load(),
+        Assert(will.will_created(),                                    comment=ERR_NO_WILL),
+        Assert(Not(will.inheritance_active()),                         comment="Already activated"),
         Assert(Global.latest_timestamp() > deadline,                   comment="Inactivity period not yet elapsed"),
-        inheritance_active.set(Int(1)),
+        will.mark_active(),
+        will.save(),
         output.set("Inheritance activated"),
     )
 
@@ -202,10 +441,12 @@ def activate_inheritance(*, output: abi.String) -> Expr:
 def force_activate(*, output: abi.String) -> Expr:
     """Owner can force-activate inheritance immediately, bypassing the inactivity timer."""
     return Seq(
-        Assert(will_created.get() == Int(1),        comment=ERR_NO_WILL),
+        will.load(),
+        Assert(will.will_created(),                 comment=ERR_NO_WILL),
         Assert(Txn.sender() == owner.get(),          comment="Only owner can force activate"),
-        Assert(inheritance_active.get() == Int(0),   comment="Already activated"),
-        inheritance_active.set(Int(1)),
+        Assert(Not(will.inheritance_active()),       comment="Already activated"),
+        will.mark_active(),
+        will.save(),
         output.set("Inheritance force-activated by owner"),
     )
 
@@ -215,45 +456,186 @@ def force_activate(*, output: abi.String) -> Expr:
 # ─────────────────────────────────────────────────────────────────────────────
 @app.external
 def claim(beneficiary_slot: abi.Uint64, *, output: abi.Uint64) -> Expr:
-    """Beneficiary claims their full share (slot 1, 2, or 3). No fees deducted."""
-    slot    = beneficiary_slot.get()
-    locked  = total_locked.get()
+    """Beneficiary claims their full share (any slot 1..heir_count). No fees deducted."""
+    slot  = beneficiary_slot.get()
+    heir  = _HeirFields()
+    share = _Once((total_locked.get() * heir.percent.get()) / Int(100), TealType.uint64)
+    return Seq(
+        will.load(),
+        Assert(will.inheritance_active(),          comment="Inheritance not active"),
+        Assert(total_locked.get() > Int(0),        comment="No funds to claim"),
+        heir.load(slot),
+        Assert(Txn.sender() == heir.address.get(), comment="Not the beneficiary for this slot"),
+        Assert(Not(heir.claimed.get()),            comment="Slot already claimed"),
+        share.load(),
+        InnerTxnBuilder.Execute({
+            TxnField.type_enum: TxnType.Payment,
+            TxnField.receiver:  heir.address.get(),
+            TxnField.amount:    share.get(),
+            TxnField.fee:       Int(0),
+        }),
+        heir.claimed.set(True),
+        heir.save(slot),
+        output.set(share.get()),
+    )
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 5b. CLAIM ALL (settle every beneficiary in one call)
+# ─────────────────────────────────────────────────────────────────────────────
+class _InnerGroup:
+    """
+    Inner transactions submitted as atomic groups of ≤ 16, opened on demand.
+    With `most` (an upper bound on the transactions added) ≤ 16, everything
+    goes in one group and add() skips the full-group check.
+    """
 
-    def share(pct: Expr) -> Expr:
-        return (locked * pct) / Int(100)
+    def __init__(self, most: int | None = None):
+        self.size = ScratchVar(TealType.uint64)
+        self.one  = most is not None and most <= MAX_INNER_GROUP_SIZE
 
-    def pay_out(addr: Expr, pct: Expr, claimed_flag: GlobalStateValue) -> Expr:
+    def init(self) -> Expr:
+        return self.size.store(Int(0))
+
+    def add(self, fields: dict) -> Expr:
         return Seq(
-            InnerTxnBuilder.Execute({
+            If(self.size.load() == Int(0), InnerTxnBuilder.Begin(), InnerTxnBuilder.Next()),
+            InnerTxnBuilder.SetFields(fields),
+            self.size.store(self.size.load() + Int(1)),
+            Seq() if self.one else If(self.size.load() == Int(MAX_INNER_GROUP_SIZE), self.flush()),
+        )
+
+    def flush(self) -> Expr:
+        return If(self.size.load() > Int(0), Seq(InnerTxnBuilder.Submit(), self.size.store(Int(0))))
+
+
+class _Locked:
+    """
+    total_locked and locked_asa_id, for settling heirs; load() once per call,
+    before the first.  Worth caching only when several heirs are settled.
+    """
+
+    def __init__(self, *, cached: bool):
+        self.algo   = _Once(total_locked.get(), TealType.uint64, cached=cached)
+        self.asa_id = _Once(locked_asa_id.get(), TealType.uint64, cached=cached)
+
+    def load(self) -> Expr:
+        return Seq(self.algo.load(), self.asa_id.load())
+
+
+def _settle_heir(
+    heir: _HeirFields, locked: _Locked, inner: _InnerGroup, algo: ScratchVar, units: ScratchVar,
+) -> Expr:
+    """
+    Queue a loaded heir's unclaimed ALGO share and ASA allocation on `inner`
+    and set their claimed flags; `algo` / `units` receive the amounts queued.
+    An ASA allocation is skipped (left for claim_asa) while the heir is not
+    opted in to the asset.
+    """
+    share    = (locked.algo.get() * heir.percent.get()) / Int(100)
+    opted_in = AssetHolding.balance(heir.address.get(), locked.asa_id.get())
+    return Seq(
+        algo.store(Int(0)),
+        units.store(Int(0)),
+        If(And(Not(heir.claimed.get()), locked.algo.get() > Int(0)), Seq(
+            algo.store(share),
+            inner.add({
                 TxnField.type_enum: TxnType.Payment,
-                TxnField.receiver:  addr,
-                TxnField.amount:    share(pct),
+                TxnField.receiver:  heir.address.get(),
+                TxnField.amount:    algo.load(),
                 TxnField.fee:       Int(0),
             }),
-            claimed_flag.set(Int(1)),
-            output.set(share(pct)),
-        )
+            heir.claimed.set(True),
+        )),
+        If(And(locked.asa_id.get() > Int(0),
+               heir.asa_amount.get() > Int(0),
+               Not(heir.asa_claimed.get())),
+           Seq(
+               opted_in,
+               If(opted_in.hasValue(), Seq(
+                   units.store(heir.asa_amount.get()),
+                   inner.add({
+                       TxnField.type_enum:      TxnType.AssetTransfer,
+                       TxnField.xfer_asset:     locked.asa_id.get(),
+                       TxnField.asset_receiver: heir.address.get(),
+                       TxnField.asset_amount:   units.load(),
+                       TxnField.fee:            Int(0),
+                   }),
+                   heir.asa_claimed.set(True),
+               )),
+           )),
+    )
 
+
+@app.external
+def claim_all(*, output: abi.Uint64) -> Expr:
+    """
+    Anyone may settle an active will: every unclaimed ALGO share and ASA
+    allocation is paid out in grouped inner transactions, and the claimed
+    flags are set.  Returns the microALGO paid.
+
+    The call must reference every heir's box and account (plus the locked
+    ASA), and its fee must cover one inner transaction per payout.  ASA
+    allocations of heirs not opted in to the asset are left for claim_asa.
+    """
+    slot  = ScratchVar(TealType.uint64)
+    paid  = ScratchVar(TealType.uint64)
+    algo  = ScratchVar(TealType.uint64)
+    units = ScratchVar(TealType.uint64)
+    heir  = _HeirFields()
+    funds = _Locked(cached=True)
+    inner = _InnerGroup(most=2 * MAX_BENEFICIARIES if MAX_BENEFICIARIES else None)
     return Seq(
-        Assert(inheritance_active.get() == Int(1), comment="Inheritance not active"),
-        Assert(total_locked.get() > Int(0),        comment="No funds to claim"),
-        Cond(
-            [slot == Int(1), Seq(
-                Assert(Txn.sender() == b1_address.get(), comment="Not beneficiary 1"),
-                Assert(b1_claimed.get() == Int(0),       comment="Slot 1 already claimed"),
-                pay_out(b1_address.get(), b1_percent.get(), b1_claimed),
-            )],
-            [slot == Int(2), Seq(
-                Assert(Txn.sender() == b2_address.get(), comment="Not beneficiary 2"),
-                Assert(b2_claimed.get() == Int(0),       comment="Slot 2 already claimed"),
-                pay_out(b2_address.get(), b2_percent.get(), b2_claimed),
-            )],
-            [slot == Int(3), Seq(
-                Assert(Txn.sender() == b3_address.get(), comment="Not beneficiary 3"),
-                Assert(b3_claimed.get() == Int(0),       comment="Slot 3 already claimed"),
-                pay_out(b3_address.get(), b3_percent.get(), b3_claimed),
-            )],
+        will.load(),
+        Assert(will.inheritance_active(),          comment="Inheritance not active"),
+        paid.store(Int(0)),
+        funds.load(),
+        inner.init(),
+        For(slot.store(Int(1)), slot.load() <= will.heir_count(), slot.store(slot.load() + Int(1))).Do(
+            heir.load(slot.load()),
+            _settle_heir(heir, funds, inner, algo, units),
+            paid.store(paid.load() + algo.load()),
+            heir.save(slot.load()),
         ),
+        inner.flush(),
+        output.set(paid.load()),
+    )
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 5c. CLAIM EVERYTHING (one beneficiary's ALGO + ASA in one call)
+# ─────────────────────────────────────────────────────────────────────────────
+@app.external
+def claim_everything(beneficiary_slot: abi.Uint64, *, output: ClaimedAmounts) -> Expr:
+    """
+    Beneficiary claims their ALGO share and ASA allocation together, paid as
+    one group of inner transactions.  Returns (microALGO, ASA units) paid;
+    either may be 0 if already claimed.  Fee budget ≥ 3000 with an ASA, and
+    the locked ASA must be in foreign assets.  An ASA allocation is left for
+    claim_asa while the beneficiary is not opted in.
+    """
+    slot  = beneficiary_slot.get()
+    algo  = ScratchVar(TealType.uint64)
+    units = ScratchVar(TealType.uint64)
+    heir  = _HeirFields()
+    funds = _Locked(cached=False)
+    inner = _InnerGroup()
+    algo_paid  = abi.Uint64()
+    units_paid = abi.Uint64()
+    return Seq(
+        will.load(),
+        Assert(will.inheritance_active(),          comment="Inheritance not active"),
+        heir.load(slot),
+        Assert(Txn.sender() == heir.address.get(), comment="Not the beneficiary for this slot"),
+        funds.load(),
+        inner.init(),
+        _settle_heir(heir, funds, inner, algo, units),
+        Assert(algo.load() + units.load() > Int(0), comment="Nothing left to claim"),
+        inner.flush(),
+        heir.save(slot),
+        algo_paid.set(algo.load()),
+        units_paid.set(units.load()),
+        output.set(algo_paid, units_paid),
     )
 
 
@@ -264,9 +646,10 @@ def claim(beneficiary_slot: abi.Uint64, *, output: abi.Uint64) -> Expr:
 def revoke_will(*, output: abi.String) -> Expr:
     """Owner cancels the will and reclaims all funds. Blocked after activation."""
     return Seq(
-        Assert(will_created.get() == Int(1),       comment=ERR_NO_WILL),
+        will.load(),
+        Assert(will.will_created(),                comment=ERR_NO_WILL),
         Assert(Txn.sender() == owner.get(),         comment="Only owner can revoke"),
-        Assert(inheritance_active.get() == Int(0), comment="Cannot revoke after activation"),
+        Assert(Not(will.inheritance_active()),     comment="Cannot revoke after activation"),
         If(
             total_locked.get() > Int(0),
             Seq(
@@ -279,13 +662,11 @@ def revoke_will(*, output: abi.String) -> Expr:
                 total_locked.set(Int(0)),
             ),
         ),
-        will_created.set(Int(0)),
+        will.clear(),
+        will.save(),
         owner.set(Bytes("")),
         inactivity_period.set(Int(0)),
         last_checkin.set(Int(0)),
-        b1_address.set(Bytes("")), b1_percent.set(Int(0)), b1_claimed.set(Int(0)),
-        b2_address.set(Bytes("")), b2_percent.set(Int(0)), b2_claimed.set(Int(0)),
-        b3_address.set(Bytes("")), b3_percent.set(Int(0)), b3_claimed.set(Int(0)),
         output.set("Will revoked - funds returned to owner"),
     )
 
@@ -302,9 +683,10 @@ def opt_in_asa(asset: abi.Asset, *, output: abi.String) -> Expr:
     Fee must cover the inner opt-in transaction (fee budget ≥ 2000).
     """
     return Seq(
-        Assert(will_created.get() == Int(1),        comment=ERR_NO_WILL),
+        will.load(),
+        Assert(will.will_created(),                 comment=ERR_NO_WILL),
         Assert(Txn.sender() == owner.get(),          comment="Only owner can opt contract in"),
-        Assert(inheritance_active.get() == Int(0),  comment=ERR_INHERITANCE_ACTIVE),
+        Assert(Not(will.inheritance_active()),      comment=ERR_INHERITANCE_ACTIVE),
         InnerTxnBuilder.Execute({
             TxnField.type_enum:     TxnType.AssetTransfer,
             TxnField.xfer_asset:    asset.asset_id(),
@@ -319,21 +701,25 @@ def opt_in_asa(asset: abi.Asset, *, output: abi.String) -> Expr:
 
 @app.external
 def lock_asa(
-    transfer:  abi.AssetTransferTransaction,
-    b1_amount: abi.Uint64,
-    b2_amount: abi.Uint64,
-    b3_amount: abi.Uint64,
+    transfer:    abi.AssetTransferTransaction,
+    allocations: abi.DynamicArray[AsaAllocation],
     *,
     output: abi.String,
 ) -> Expr:
     """
     Owner transfers ASA tokens into the will, specifying how many units
-    each beneficiary slot should receive.
+    each beneficiary slot should receive as (slot, units) pairs.
     """
-    total_asa = b1_amount.get() + b2_amount.get() + b3_amount.get()
+    i      = ScratchVar(TealType.uint64)
+    total  = ScratchVar(TealType.uint64)
+    alloc  = abi.make(AsaAllocation)
+    slot   = abi.Uint64()
+    units  = abi.Uint64()
+    heir   = _HeirFields()
     return Seq(
-        Assert(will_created.get() == Int(1),        comment=ERR_NO_WILL),
-        Assert(inheritance_active.get() == Int(0),  comment=ERR_INHERITANCE_ACTIVE),
+        will.load(),
+        Assert(will.will_created(),                 comment=ERR_NO_WILL),
+        Assert(Not(will.inheritance_active()),      comment=ERR_INHERITANCE_ACTIVE),
         Assert(Txn.sender() == owner.get(),          comment="Only owner can lock ASA"),
         Assert(locked_asa_id.get() > Int(0),        comment="Opt contract in to an ASA first"),
         Assert(
@@ -344,81 +730,65 @@ def lock_asa(
             transfer.get().asset_receiver() == Global.current_application_address(),
             comment="Transfer must go to contract",
         ),
+        total.store(Int(0)),
+        For(i.store(Int(0)), i.load() < allocations.length(), i.store(i.load() + Int(1))).Do(
+            allocations[i.load()].store_into(alloc),
+            alloc[0].store_into(slot),
+            alloc[1].store_into(units),
+            heir.load(slot.get()),
+            heir.asa_amount.set(heir.asa_amount.get() + units.get()),
+            heir.save(slot.get()),
+            total.store(total.load() + units.get()),
+        ),
         Assert(
-            transfer.get().asset_amount() == total_asa,
+            transfer.get().asset_amount() == total.load(),
             comment="Transfer amount must equal sum of beneficiary allocations",
         ),
-        b1_asa_amount.set(b1_asa_amount.get() + b1_amount.get()),
-        b2_asa_amount.set(b2_asa_amount.get() + b2_amount.get()),
-        b3_asa_amount.set(b3_asa_amount.get() + b3_amount.get()),
         output.set("ASA locked into will"),
     )
 
 
 @app.external
 def claim_asa(beneficiary_slot: abi.Uint64, *, output: abi.Uint64) -> Expr:
-    """Beneficiary claims their ASA allocation (slot 1, 2, or 3)."""
+    """Beneficiary claims their ASA allocation (any slot 1..heir_count)."""
     slot = beneficiary_slot.get()
-
-    def pay_asa(addr: Expr, amount: GlobalStateValue, claimed_flag: GlobalStateValue) -> Expr:
-        return Seq(
-            InnerTxnBuilder.Execute({
-                TxnField.type_enum:     TxnType.AssetTransfer,
-                TxnField.xfer_asset:    locked_asa_id.get(),
-                TxnField.asset_receiver: addr,
-                TxnField.asset_amount:  amount.get(),
-                TxnField.fee:           Int(0),
-            }),
-            claimed_flag.set(Int(1)),
-            output.set(amount.get()),
-        )
-
+    heir = _HeirFields()
     return Seq(
-        Assert(inheritance_active.get() == Int(1), comment="Inheritance not active"),
+        will.load(),
+        Assert(will.inheritance_active(),          comment="Inheritance not active"),
         Assert(locked_asa_id.get() > Int(0),       comment="No ASA locked in this will"),
-        Cond(
-            [slot == Int(1), Seq(
-                Assert(Txn.sender() == b1_address.get(),  comment="Not beneficiary 1"),
-                Assert(b1_asa_claimed.get() == Int(0),    comment=ERR_ALREADY_CLAIMED),
-                Assert(b1_asa_amount.get()  > Int(0),     comment="No ASA allocated to slot 1"),
-                pay_asa(b1_address.get(), b1_asa_amount, b1_asa_claimed),
-            )],
-            [slot == Int(2), Seq(
-                Assert(Txn.sender() == b2_address.get(),  comment="Not beneficiary 2"),
-                Assert(b2_asa_claimed.get() == Int(0),    comment=ERR_ALREADY_CLAIMED),
-                Assert(b2_asa_amount.get()  > Int(0),     comment="No ASA allocated to slot 2"),
-                pay_asa(b2_address.get(), b2_asa_amount, b2_asa_claimed),
-            )],
-            [slot == Int(3), Seq(
-                Assert(Txn.sender() == b3_address.get(),  comment="Not beneficiary 3"),
-                Assert(b3_asa_claimed.get() == Int(0),    comment=ERR_ALREADY_CLAIMED),
-                Assert(b3_asa_amount.get()  > Int(0),     comment="No ASA allocated to slot 3"),
-                pay_asa(b3_address.get(), b3_asa_amount, b3_asa_claimed),
-            )],
-        ),
+        heir.load(slot),
+        Assert(Txn.sender() == heir.address.get(), comment="Not the beneficiary for this slot"),
+        Assert(Not(heir.asa_claimed.get()),        comment=ERR_ALREADY_CLAIMED),
+        Assert(heir.asa_amount.get() > Int(0),     comment="No ASA allocated to this slot"),
+        InnerTxnBuilder.Execute({
+            TxnField.type_enum:     TxnType.AssetTransfer,
+            TxnField.xfer_asset:    locked_asa_id.get(),
+            TxnField.asset_receiver: heir.address.get(),
+            TxnField.asset_amount:  heir.asa_amount.get(),
+            TxnField.fee:           Int(0),
+        }),
+        heir.asa_claimed.set(True),
+        heir.save(slot),
+        output.set(heir.asa_amount.get()),
     )
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 8. READ-ONLY HELPERS
 # ─────────────────────────────────────────────────────────────────────────────
-@app.external(read_only=True)
-def get_will_status(*, output: abi.String) -> Expr:
-    """Returns: NO_WILL | ALIVE | READY_TO_ACTIVATE | INHERITANCE_ACTIVE"""
-    return output.set(
-        Cond(
-            [will_created.get() == Int(0),      Bytes("NO_WILL")],
-            [inheritance_active.get() == Int(1), Bytes("INHERITANCE_ACTIVE")],
-            [Global.latest_timestamp() > last_checkin.get() + inactivity_period.get(),
-             Bytes("READY_TO_ACTIVATE")],
-            [Int(1),                             Bytes("ALIVE")],
-        )
+def _status_name() -> Expr:
+    """NO_WILL | ALIVE | READY_TO_ACTIVATE | INHERITANCE_ACTIVE (after will.load())."""
+    return Cond(
+        [Not(will.will_created()),        Bytes("NO_WILL")],
+        [will.inheritance_active(),       Bytes("INHERITANCE_ACTIVE")],
+        [Global.latest_timestamp() > last_checkin.get() + inactivity_period.get(),
+         Bytes("READY_TO_ACTIVATE")],
+        [Int(1),                          Bytes("ALIVE")],
     )
 
 
-@app.external(read_only=True)
-def get_time_remaining(*, output: abi.Uint64) -> Expr:
-    """Seconds until the inactivity deadline. Returns 0 if past deadline."""
+def _set_time_remaining(output: abi.Uint64) -> Expr:
     deadline = last_checkin.get() + inactivity_period.get()
     now      = Global.latest_timestamp()
     return If(
@@ -428,12 +798,60 @@ def get_time_remaining(*, output: abi.Uint64) -> Expr:
     )
 
 
+@app.external(read_only=True)
+def get_will_status(*, output: abi.String) -> Expr:
+    """Returns: NO_WILL | ALIVE | READY_TO_ACTIVATE | INHERITANCE_ACTIVE"""
+    return Seq(
+        will.load(),
+        output.set(_status_name()),
+    )
+
+
+@app.external(read_only=True)
+def get_time_remaining(*, output: abi.Uint64) -> Expr:
+    """Seconds until the inactivity deadline. Returns 0 if past deadline."""
+    return _set_time_remaining(output)
+
+
 @app.external(read_only=True)
 def get_locked_balance(*, output: abi.Uint64) -> Expr:
     """Total microALGO locked in the will."""
     return output.set(total_locked.get())
 
 
+@app.external(read_only=True)
+def get_will_snapshot(*, output: WillSnapshot) -> Expr:
+    """
+    Everything a dashboard shows, in one call: status, seconds remaining,
+    locked microALGO, locked ASA id and each slot's claimed flag.  Reads
+    one byte of every heir box, so callers list boxes 1..heir_count (or
+    simulate with unnamed resources allowed, as client/snapshot.py does).
+    """
+    status    = abi.String()
+    remaining = abi.Uint64()
+    locked    = abi.Uint64()
+    asa_id    = abi.Uint64()
+    claimed   = abi.make(abi.DynamicArray[abi.Bool])
+    slot      = ScratchVar(TealType.uint64)
+    bits      = ScratchVar(TealType.bytes)
+    return Seq(
+        will.load(),
+        status.set(_status_name()),
+        _set_time_remaining(remaining),
+        locked.set(total_locked.get()),
+        asa_id.set(locked_asa_id.get()),
+        bits.store(BytesZero((will.heir_count() + Int(7)) / Int(8))),
+        For(slot.store(Int(1)), slot.load() <= will.heir_count(), slot.store(slot.load() + Int(1))).Do(
+            bits.store(SetBit(
+                bits.load(), slot.load() - Int(1),
+                GetBit(BoxExtract(_heir_key(slot.load()), Int(HEIR_FLAGS_BYTE), Int(1)), Int(0)),
+            )),
+        ),
+        claimed.decode(Concat(Suffix(Itob(will.heir_count()), Int(6)), bits.load())),
+        output.set(status, remaining, locked, asa_id, claimed),
+    )
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Entry point — compile to TEAL artifacts
 # ─────────────────────────────────────────────────────────────────────────────
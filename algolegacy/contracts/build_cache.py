@@ -0,0 +1,197 @@
+"""
+build_cache — content-addressed cache of contract build outputs
+================================================================
+`app.build()` imports beaker/PyTEAL and recompiles the whole router, about
+0.3 s per app.  The outputs only change when the contract source, the
+toolchain or the build options do, so they are cached in
+contracts/artifacts/ under a key hashed from exactly those:
+
+    key = sha256(contracts/*.py sources, pyteal + beaker-pyteal versions,
+                 app name, build options)
+
+Per app, next to the usual artifacts:
+
+    <Name>.approval.teal / .clear.teal / .abi.json   as written by compile.py
+    <Name>.arc32.json                                full app spec (ARC-32)
+    <Name>.approval.bin / .clear.bin                 bytecode, assembled offline
+    <Name>.build.json                                {"key": ...}, written last
+
+    spec, hit = build("AlgoLegacy")       # warm: no beaker/PyTEAL import at all
+
+Bytecode is also keyed by the sha256 of the TEAL it was assembled from
+(see `compiled`), so TEAL from anywhere can be looked up.  It is produced
+by avm's offline assembler, which matches algod's compile endpoint
+byte-for-byte.
+
+Build options select a variant of the contract (see OPTIONS).  A contract
+module reads them with `build_options()` when it is imported, so a
+variant other than the one this process imported is built in a fresh
+interpreter, and its artifacts are named apart from the default build's:
+
+    spec, hit = build("AlgoLegacy", {"profile": "optimised"})
+    # contracts/artifacts/AlgoLegacy-profile-optimised.approval.teal, ...
+
+`smallest_variant` picks the `max_beneficiaries` bound whose program is
+smallest for a given number of heirs.
+"""
+
+import hashlib
+import importlib
+import importlib.metadata
+import json
+import os
+import pathlib
+import subprocess
+import sys
+import tempfile
+from typing import Callable
+
+CONTRACTS = pathlib.Path(__file__).parent
+ARTIFACTS = CONTRACTS / "artifacts"
+
+# Artifact name → the beaker Application it is built from
+APPS = {
+    "AlgoLegacy":         "contracts.algolegacy:app",
+    "AlgoLegacyRegistry": "contracts.registry:app",
+}
+TOOLCHAIN = ("pyteal", "beaker-pyteal")
+
+# Build option → the values it takes; absent means the first
+OPTIONS = {
+    "profile":           ("default", "optimised"),  # optimised: repeated state reads from scratch
+    "max_beneficiaries": (None, 1, 2, 4, 8),        # a program bounded to that many heirs
+}
+OPTIONS_ENV = "ALGOLEGACY_BUILD_OPTIONS"     # how a build subprocess receives them
+
+
+def build_options() -> dict:
+    """The options contract modules are being imported with in this process (empty: the default build)."""
+    return json.loads(os.environ.get(OPTIONS_ENV) or "{}")
+
+
+def artifact_name(name: str, options: dict | None = None) -> str:
+    """File-name stem of `name`'s artifacts when built with `options`."""
+    return "-".join([name, *(f"{key}-{value}" for key, value in sorted(_variant(options).items()))])
+
+
+def _variant(options: dict | None) -> dict:
+    # Options left at their default name the same build as no options
+    return {key: value for key, value in (options or {}).items() if value != OPTIONS.get(key, (None,))[0]}
+
+
+def build_key(name: str, options: dict | None = None) -> str:
+    """Cache key for `name` built with `options` from the current sources."""
+    digest = hashlib.sha256()
+    for path in sorted(CONTRACTS.glob("*.py")):
+        digest.update(path.name.encode() + b"\0" + path.read_bytes() + b"\0")
+    for dist in TOOLCHAIN:
+        digest.update(f"{dist}=={importlib.metadata.version(dist)}\0".encode())
+    digest.update(json.dumps({"app": name, "options": _variant(options)}, sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+def is_current(name: str, options: dict | None = None) -> bool:
+    """Whether the cached artifacts of `name` match the current sources and toolchain."""
+    try:
+        manifest = json.loads((ARTIFACTS / f"{artifact_name(name, options)}.build.json").read_text())
+    except (OSError, ValueError):
+        return False
+    return manifest.get("key") == build_key(name, options)
+
+
+def cached_spec(name: str, options: dict | None = None):
+    """The cached ApplicationSpecification for `name`, or None if stale or missing."""
+    if not is_current(name, options):
+        return None
+    try:
+        spec_json = (ARTIFACTS / f"{artifact_name(name, options)}.arc32.json").read_text()
+    except OSError:
+        return None
+    from algokit_utils import ApplicationSpecification
+
+    return ApplicationSpecification.from_json(spec_json)
+
+
+def build(name: str, options: dict | None = None, *, force: bool = False):
+    """Return (spec, cache_hit) for `name`, building and caching it on a miss."""
+    for key, value in (options or {}).items():
+        if value not in OPTIONS.get(key, ()):
+            raise ValueError(f"build option {key}={value!r}; known: {OPTIONS}")
+    options = _variant(options)
+    spec    = None if force else cached_spec(name, options)
+    if spec is not None:
+        return spec, True
+
+    if options != build_options():
+        # The contract module binds its options at import: build in an interpreter that has not imported it
+        subprocess.run(
+            [sys.executable, "-m", "contracts.build_cache", name, json.dumps(options)],
+            cwd=CONTRACTS.parent, env={**os.environ, OPTIONS_ENV: json.dumps(options)}, check=True,
+        )
+        return cached_spec(name, options), False
+
+    module, attr = APPS[name].split(":")
+    spec = getattr(importlib.import_module(module), attr).build()
+    stem = artifact_name(name, options)
+    ARTIFACTS.mkdir(exist_ok=True)
+    _write(f"{stem}.approval.teal", spec.approval_program)
+    _write(f"{stem}.clear.teal",    spec.clear_program)
+    _write(f"{stem}.abi.json",      json.dumps(spec.contract.dictify(), indent=2))
+    _write(f"{stem}.arc32.json",    spec.to_json())
+    compiled(stem, "approval", spec.approval_program)
+    compiled(stem, "clear",    spec.clear_program)
+    _write(f"{stem}.build.json",    json.dumps({"key": build_key(name, options)}))  # last: commits the entry
+    return spec, False
+
+
+def smallest_variant(name: str, heirs: int, options: dict | None = None) -> dict:
+    """
+    `options` plus the `max_beneficiaries` that gives `name` its smallest
+    program for a will of `heirs` heirs (ties: the tighter bound).  Every
+    variant has the same schema, so the program size is what differs.
+    """
+    def size(bound: int | None) -> tuple[int, int]:
+        variant = {**(options or {}), "max_beneficiaries": bound}
+        spec, _ = build(name, variant)
+        stem    = artifact_name(name, variant)
+        return (len(compiled(stem, "approval", spec.approval_program))
+                + len(compiled(stem, "clear", spec.clear_program)), bound or sys.maxsize)
+
+    fits = [bound for bound in OPTIONS["max_beneficiaries"] if bound is None or bound >= heirs]
+    return {**(options or {}), "max_beneficiaries": min(fits, key=size)}
+
+
+def compiled(
+    name: str, program: str, teal: str, compile_teal: Callable[[str], bytes] | None = None,
+) -> bytes:
+    """
+    Bytecode of `program` ("approval" or "clear") for `name`, compiling the
+    TEAL only if the cached bytecode came from other TEAL.  `compile_teal`
+    defaults to the offline assembler (`avm.assemble`).
+    """
+    path = ARTIFACTS / f"{name}.{program}.bin"
+    tag  = hashlib.sha256(teal.encode()).digest()       # first 32 bytes of the file
+    try:
+        data = path.read_bytes()
+        if data[:32] == tag:
+            return data[32:]
+    except OSError:
+        pass
+    if compile_teal is None:
+        from avm import assemble as compile_teal
+    bytecode = compile_teal(teal)
+    ARTIFACTS.mkdir(exist_ok=True)
+    _write(path.name, tag + bytecode)
+    return bytecode
+
+
+def _write(filename: str, data: str | bytes) -> None:
+    # Write-then-rename, so parallel test workers never read a partial file
+    fd, tmp = tempfile.mkstemp(dir=ARTIFACTS, prefix=f".{filename}.")
+    with os.fdopen(fd, "wb") as f:
+        f.write(data.encode() if isinstance(data, str) else data)
+    os.replace(tmp, ARTIFACTS / filename)
+
+
+if __name__ == "__main__":
+    build(sys.argv[1], json.loads(sys.argv[2]) if len(sys.argv) > 2 else None, force=True)
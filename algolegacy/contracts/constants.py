@@ -0,0 +1,17 @@
+"""
+constants — AlgoLegacy sizes deployers need without building the contract
+==========================================================================
+Plain numbers only: this module imports neither beaker nor PyTEAL, so
+scripts/compile.py can report minimum balances on a warm build cache
+without paying for those imports.  contracts/algolegacy.py builds on
+the same values.
+"""
+
+# Global schema: the state list is not reflected in app.build()'s declared
+# schema, so deployers pass these explicitly when creating the app.
+GLOBAL_NUM_UINTS       = 5
+GLOBAL_NUM_BYTE_SLICES = 1
+
+# One beneficiary box: 2500 + 400 * (9-byte name + 49-byte Heir) µALGO,
+# paid by the app account
+HEIR_BOX_MBR = 2_500 + 400 * (9 + 49)
@@ -0,0 +1,487 @@
+"""
+AlgoLegacy Registry — many wills in one application
+====================================================
+Built with Beaker 1.x + PyTEAL for Algorand Testnet
+
+The single-will contract (algolegacy.py) costs an app deployment, extra
+program pages and a funded app account per will.  The registry is deployed
+once and holds every will as box records, keyed by a will id:
+
+  - Creating a will is one app call (plus the payment for its boxes)
+  - All methods take the will id; the owner / beneficiary rules are the same
+  - The app account pools every will's ALGO; `total_locked` keeps each
+    will's funds separate
+
+Storage:
+  "w" + itob(will_id)               WillRecord  (73 bytes)
+  "h" + itob(will_id) + itob(slot)  HeirRecord  (41 bytes, slot 1..heir_count)
+  "b" + address + itob(will_id)     empty: will_id names that beneficiary
+
+The beneficiary index answers "which wills name me?" from the registry's
+box names (client/registry.py lists them by prefix), instead of an
+indexer scan of the address's history.  One box per (beneficiary, will)
+pair keeps adding and removing an entry O(1), and each will pays for, and
+gets back, exactly its own entries: no will can grow or block another's.
+
+The creator pays the box MBR in the same group (`will_storage_cost` plus
+one index entry per distinct heir, see client/registry.py), and gets it
+back with the deposit when the will is revoked.  The app account itself only needs
+its 0.1 ALGO base balance, funded once after deploy.
+"""
+
+from algosdk import encoding
+from beaker import Application, GlobalStateValue
+from pyteal import (
+    And,
+    Approve,
+    Assert,
+    BoxCreate,
+    BoxDelete,
+    BoxGet,
+    BoxPut,
+    Bytes,
+    Concat,
+    Cond,
+    Expr,
+    For,
+    Global,
+    If,
+    InnerTxnBuilder,
+    Int,
+    Itob,
+    Not,
+    Pop,
+    ScratchVar,
+    Seq,
+    TealType,
+    Txn,
+    TxnField,
+    TxnType,
+    abi,
+)
+
+from contracts.algolegacy import (
+    ERR_BAD_SLOT,
+    ERR_INHERITANCE_ACTIVE,
+    ERR_NO_WILL,
+    ERR_PERCENT_TOTAL,
+    MIN_DEPOSIT_MICROALGOS,
+    MIN_INACTIVITY_SECONDS,
+    HeirShare,
+)
+
+ERR_STORAGE_PAYMENT = "Payment must equal box storage cost"
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Application + global state
+# ─────────────────────────────────────────────────────────────────────────────
+will_count = GlobalStateValue(TealType.uint64, key="will_count", default=Int(0))
+
+GLOBAL_NUM_UINTS       = 1
+GLOBAL_NUM_BYTE_SLICES = 0
+
+app = Application("AlgoLegacyRegistry", state=[will_count])
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Box records
+#   MBR = 2500 + 400 * (len(name) + len(value)) µALGO per box
+# ─────────────────────────────────────────────────────────────────────────────
+WILL_BOX_PREFIX  = b"w"
+HEIR_BOX_PREFIX  = b"h"
+INDEX_BOX_PREFIX = b"b"
+WILL_BOX_MBR     = 2_500 + 400 * (9 + 73)     # 35_300
+HEIR_BOX_MBR     = 2_500 + 400 * (17 + 41)    # 25_700
+INDEX_BOX_MBR    = 2_500 + 400 * (41 + 0)     # 18_900  one (beneficiary, will) entry
+
+
+class WillRecord(abi.NamedTuple):
+    owner:         abi.Field[abi.Address]
+    period:        abi.Field[abi.Uint64]
+    last_checkin:  abi.Field[abi.Uint64]
+    total_locked:  abi.Field[abi.Uint64]
+    heir_count:    abi.Field[abi.Uint64]
+    percent_total: abi.Field[abi.Uint64]
+    active:        abi.Field[abi.Bool]
+
+
+class HeirRecord(abi.NamedTuple):
+    address: abi.Field[abi.Address]
+    percent: abi.Field[abi.Uint64]
+    claimed: abi.Field[abi.Bool]
+
+
+def will_box_name(will_id: int) -> bytes:
+    """Box name of will `will_id`, for transaction box references."""
+    return WILL_BOX_PREFIX + will_id.to_bytes(8, "big")
+
+
+def heir_box_name(will_id: int, slot: int) -> bytes:
+    """Box name of beneficiary `slot` (1-based) of will `will_id`."""
+    return HEIR_BOX_PREFIX + will_id.to_bytes(8, "big") + slot.to_bytes(8, "big")
+
+
+def index_box_name(beneficiary: str, will_id: int) -> bytes:
+    """Box name of the index entry saying will `will_id` names `beneficiary` (an address)."""
+    return INDEX_BOX_PREFIX + encoding.decode_address(beneficiary) + will_id.to_bytes(8, "big")
+
+
+def will_storage_cost(heir_count: int, *, new_will: bool = True) -> int:
+    """µALGO for the will and `heir_count` heir boxes, before index entries."""
+    return (WILL_BOX_MBR if new_will else 0) + HEIR_BOX_MBR * heir_count
+
+
+def _will_key(will_id: Expr) -> Expr:
+    return Concat(Bytes(WILL_BOX_PREFIX), Itob(will_id))
+
+
+def _heir_key(will_id: Expr, slot: Expr) -> Expr:
+    return Concat(Bytes(HEIR_BOX_PREFIX), Itob(will_id), Itob(slot))
+
+
+def _index_key(beneficiary: Expr, will_id: Expr) -> Expr:
+    return Concat(Bytes(INDEX_BOX_PREFIX), beneficiary, Itob(will_id))
+
+
+def _index_add(beneficiary: Expr, will_id: Expr, cost: ScratchVar) -> Expr:
+    """Index `will_id` under the beneficiary; add the entry's MBR to `cost` if it is new.
+
+    A will naming the same address in several slots is indexed once.
+    """
+    return If(BoxCreate(_index_key(beneficiary, will_id), Int(0)),
+              cost.store(cost.load() + Int(INDEX_BOX_MBR)))
+
+
+def _index_remove(beneficiary: Expr, will_id: Expr, refund: ScratchVar) -> Expr:
+    """Drop the beneficiary's entry for `will_id`, if still there; add its MBR to `refund`."""
+    return If(BoxDelete(_index_key(beneficiary, will_id)),
+              refund.store(refund.load() + Int(INDEX_BOX_MBR)))
+
+
+class _WillFields:
+    """Scratch ABI values for reading, updating and re-writing one WillRecord."""
+
+    def __init__(self):
+        self.record        = WillRecord()
+        self.owner         = abi.Address()
+        self.period        = abi.Uint64()
+        self.last_checkin  = abi.Uint64()
+        self.total_locked  = abi.Uint64()
+        self.heir_count    = abi.Uint64()
+        self.percent_total = abi.Uint64()
+        self.active        = abi.Bool()
+
+    def load(self, will_id: Expr) -> Expr:
+        return Seq(
+            box := BoxGet(_will_key(will_id)),
+            Assert(box.hasValue(), comment=ERR_NO_WILL),
+            self.record.decode(box.value()),
+            self.record.owner.store_into(self.owner),
+            self.record.period.store_into(self.period),
+            self.record.last_checkin.store_into(self.last_checkin),
+            self.record.total_locked.store_into(self.total_locked),
+            self.record.heir_count.store_into(self.heir_count),
+            self.record.percent_total.store_into(self.percent_total),
+            self.record.active.store_into(self.active),
+        )
+
+    def save(self, will_id: Expr) -> Expr:
+        return Seq(
+            self.record.set(
+                self.owner, self.period, self.last_checkin, self.total_locked,
+                self.heir_count, self.percent_total, self.active,
+            ),
+            BoxPut(_will_key(will_id), self.record.encode()),
+        )
+
+    def deadline(self) -> Expr:
+        return self.last_checkin.get() + self.period.get()
+
+
+class _HeirFields:
+    """Scratch ABI values for one HeirRecord."""
+
+    def __init__(self):
+        self.record  = HeirRecord()
+        self.address = abi.Address()
+        self.percent = abi.Uint64()
+        self.claimed = abi.Bool()
+
+    def load(self, will: _WillFields, will_id: Expr, slot: Expr) -> Expr:
+        return Seq(
+            Assert(And(slot >= Int(1), slot <= will.heir_count.get()), comment=ERR_BAD_SLOT),
+            box := BoxGet(_heir_key(will_id, slot)),
+            Assert(box.hasValue(), comment=ERR_BAD_SLOT),
+            self.record.decode(box.value()),
+            self.record.address.store_into(self.address),
+            self.record.percent.store_into(self.percent),
+            self.record.claimed.store_into(self.claimed),
+        )
+
+    def save(self, will_id: Expr, slot: Expr) -> Expr:
+        return Seq(
+            self.record.set(self.address, self.percent, self.claimed),
+            BoxPut(_heir_key(will_id, slot), self.record.encode()),
+        )
+
+
+def _pay_storage(storage: abi.PaymentTransaction, amount: Expr) -> Expr:
+    return Seq(
+        Assert(storage.get().receiver() == Global.current_application_address(),
+               comment="Payment must go to contract"),
+        Assert(storage.get().amount() == amount, comment=ERR_STORAGE_PAYMENT),
+    )
+
+
+def _append_heirs(
+    will: _WillFields, will_id: Expr, shares: abi.DynamicArray[HeirShare], index_cost: ScratchVar,
+) -> Expr:
+    """Write one heir box per share after the will's current last slot, and index it."""
+    i     = ScratchVar(TealType.uint64)
+    share = abi.make(HeirShare)
+    heir  = _HeirFields()
+    return Seq(
+        heir.claimed.set(False),
+        For(i.store(Int(0)), i.load() < shares.length(), i.store(i.load() + Int(1))).Do(
+            shares[i.load()].store_into(share),
+            share[0].store_into(heir.address),
+            share[1].store_into(heir.percent),
+            will.heir_count.set(will.heir_count.get() + Int(1)),
+            will.percent_total.set(will.percent_total.get() + heir.percent.get()),
+            heir.save(will_id, will.heir_count.get()),
+            _index_add(heir.address.get(), will_id, index_cost),
+        ),
+        Assert(will.percent_total.get() <= Int(100), comment=ERR_PERCENT_TOTAL),
+    )
+
+
+def _send_algo(receiver: Expr, amount: Expr) -> Expr:
+    return InnerTxnBuilder.Execute({
+        TxnField.type_enum: TxnType.Payment,
+        TxnField.receiver:  receiver,
+        TxnField.amount:    amount,
+        TxnField.fee:       Int(0),
+    })
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 0. CREATE (deploy the registry once)
+# ─────────────────────────────────────────────────────────────────────────────
+@app.create(bare=True)
+def create() -> Expr:
+    return Approve()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 1. CREATE WILL / ADD HEIRS
+# ─────────────────────────────────────────────────────────────────────────────
+@app.external
+def create_will(
+    storage: abi.PaymentTransaction,
+    period:  abi.Uint64,
+    heirs:   abi.DynamicArray[HeirShare],
+    *,
+    output:  abi.Uint64,
+) -> Expr:
+    """
+    Register a new will owned by the caller and return its id.
+    `storage` pays the box MBR: will_storage_cost(len(heirs)) plus one
+    INDEX_BOX_MBR per distinct heir.  Each heir needs its heir and index
+    box references, so large estates continue with add_heirs.
+    """
+    will       = _WillFields()
+    will_id    = ScratchVar(TealType.uint64)
+    index_cost = ScratchVar(TealType.uint64)
+    return Seq(
+        Assert(period.get() >= Int(MIN_INACTIVITY_SECONDS), comment="Inactivity period too short"),
+        index_cost.store(Int(0)),
+        will_count.set(will_count.get() + Int(1)),
+        will_id.store(will_count.get()),
+        will.owner.set(Txn.sender()),
+        will.period.set(period),
+        will.last_checkin.set(Global.latest_timestamp()),
+        will.total_locked.set(Int(0)),
+        will.heir_count.set(Int(0)),
+        will.percent_total.set(Int(0)),
+        will.active.set(False),
+        _append_heirs(will, will_id.load(), heirs, index_cost),
+        _pay_storage(storage, Int(WILL_BOX_MBR) + Int(HEIR_BOX_MBR) * heirs.length() + index_cost.load()),
+        will.save(will_id.load()),
+        output.set(will_id.load()),
+    )
+
+
+@app.external
+def add_heirs(
+    storage: abi.PaymentTransaction,
+    will_id: abi.Uint64,
+    heirs:   abi.DynamicArray[HeirShare],
+    *,
+    output:  abi.Uint64,
+) -> Expr:
+    """Owner appends beneficiaries before activation. Returns the new heir count."""
+    will       = _WillFields()
+    index_cost = ScratchVar(TealType.uint64)
+    return Seq(
+        will.load(will_id.get()),
+        Assert(Txn.sender() == will.owner.get(), comment="Only owner can add heirs"),
+        Assert(Not(will.active.get()),           comment=ERR_INHERITANCE_ACTIVE),
+        index_cost.store(Int(0)),
+        _append_heirs(will, will_id.get(), heirs, index_cost),
+        _pay_storage(storage, Int(HEIR_BOX_MBR) * heirs.length() + index_cost.load()),
+        will.save(will_id.get()),
+        output.set(will.heir_count.get()),
+    )
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 2. DEPOSIT / CHECK-IN
+# ─────────────────────────────────────────────────────────────────────────────
+@app.external
+def deposit(payment: abi.PaymentTransaction, will_id: abi.Uint64, *, output: abi.Uint64) -> Expr:
+    """Lock ALGO into will `will_id`. Returns the will's locked total."""
+    will = _WillFields()
+    return Seq(
+        will.load(will_id.get()),
+        Assert(Txn.sender() == will.owner.get(),           comment="Only owner can deposit"),
+        Assert(Not(will.active.get()),                     comment=ERR_INHERITANCE_ACTIVE),
+        Assert(will.percent_total.get() == Int(100),       comment=ERR_PERCENT_TOTAL),
+        Assert(payment.get().receiver() == Global.current_application_address(),
+               comment="Payment must go to contract"),
+        Assert(payment.get().amount() >= Int(MIN_DEPOSIT_MICROALGOS), comment="Minimum deposit is 1 ALGO"),
+        will.total_locked.set(will.total_locked.get() + payment.get().amount()),
+        will.save(will_id.get()),
+        output.set(will.total_locked.get()),
+    )
+
+
+@app.external
+def check_in(will_id: abi.Uint64, *, output: abi.Uint64) -> Expr:
+    """Owner resets the inactivity clock of will `will_id`."""
+    will = _WillFields()
+    return Seq(
+        will.load(will_id.get()),
+        Assert(Txn.sender() == will.owner.get(), comment="Only owner can check in"),
+        Assert(Not(will.active.get()),           comment=ERR_INHERITANCE_ACTIVE),
+        will.last_checkin.set(Global.latest_timestamp()),
+        will.save(will_id.get()),
+        output.set(Global.latest_timestamp()),
+    )
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 3. ACTIVATE / CLAIM
+# ─────────────────────────────────────────────────────────────────────────────
+@app.external
+def activate_inheritance(will_id: abi.Uint64, *, output: abi.String) -> Expr:
+    """Anyone can activate will `will_id` once its inactivity deadline passes."""
+    will = _WillFields()
+    return Seq(
+        will.load(will_id.get()),
+        Assert(Not(will.active.get()),                         comment="Already activated"),
+        Assert(Global.latest_timestamp() > will.deadline(),    comment="Inactivity period not yet elapsed"),
+        will.active.set(True),
+        will.save(will_id.get()),
+        output.set("Inheritance activated"),
+    )
+
+
+@app.external
+def claim(will_id: abi.Uint64, beneficiary_slot: abi.Uint64, *, output: abi.Uint64) -> Expr:
+    """Beneficiary claims their share of will `will_id`. Fee must cover one inner payment."""
+    slot  = beneficiary_slot.get()
+    will  = _WillFields()
+    heir  = _HeirFields()
+    share = (will.total_locked.get() * heir.percent.get()) / Int(100)
+    return Seq(
+        will.load(will_id.get()),
+        Assert(will.active.get(),                  comment="Inheritance not active"),
+        Assert(will.total_locked.get() > Int(0),   comment="No funds to claim"),
+        heir.load(will, will_id.get(), slot),
+        Assert(Txn.sender() == heir.address.get(), comment="Not the beneficiary for this slot"),
+        Assert(Not(heir.claimed.get()),            comment="Slot already claimed"),
+        _send_algo(heir.address.get(), share),
+        heir.claimed.set(True),
+        heir.save(will_id.get(), slot),
+        output.set(share),
+    )
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 4. REVOKE (owner only, before activation)
+# ─────────────────────────────────────────────────────────────────────────────
+@app.external
+def revoke_will(will_id: abi.Uint64, *, output: abi.Uint64) -> Expr:
+    """
+    Owner deletes will `will_id`: its boxes and index entries are freed and
+    the deposit plus the storage payment are returned in one inner payment
+    (the amount is returned). Every heir box of the will, and each heir's
+    index entry for it, must be referenced by the group.
+    """
+    i      = ScratchVar(TealType.uint64)
+    refund = ScratchVar(TealType.uint64)
+    will   = _WillFields()
+    heir   = _HeirFields()
+    return Seq(
+        will.load(will_id.get()),
+        Assert(Txn.sender() == will.owner.get(), comment="Only owner can revoke"),
+        Assert(Not(will.active.get()),           comment="Cannot revoke after activation"),
+        refund.store(
+            will.total_locked.get() + Int(WILL_BOX_MBR) + Int(HEIR_BOX_MBR) * will.heir_count.get()
+        ),
+        For(i.store(Int(1)), i.load() <= will.heir_count.get(), i.store(i.load() + Int(1))).Do(
+            heir.load(will, will_id.get(), i.load()),
+            _index_remove(heir.address.get(), will_id.get(), refund),
+            Pop(BoxDelete(_heir_key(will_id.get(), i.load()))),
+        ),
+        Pop(BoxDelete(_will_key(will_id.get()))),
+        _send_algo(will.owner.get(), refund.load()),
+        output.set(refund.load()),
+    )
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 5. READ-ONLY HELPERS
+# ─────────────────────────────────────────────────────────────────────────────
+@app.external(read_only=True)
+def get_will(will_id: abi.Uint64, *, output: WillRecord) -> Expr:
+    """The full will record."""
+    return Seq(
+        box := BoxGet(_will_key(will_id.get())),
+        Assert(box.hasValue(), comment=ERR_NO_WILL),
+        output.decode(box.value()),
+    )
+
+
+@app.external(read_only=True)
+def get_will_status(will_id: abi.Uint64, *, output: abi.String) -> Expr:
+    """Returns: NO_WILL | ALIVE | READY_TO_ACTIVATE | INHERITANCE_ACTIVE"""
+    will = _WillFields()
+    box  = BoxGet(_will_key(will_id.get()))
+    return Seq(
+        box,
+        If(box.hasValue(), will.load(will_id.get())),
+        output.set(
+            Cond(
+                [Not(box.hasValue()),                           Bytes("NO_WILL")],
+                [will.active.get(),                             Bytes("INHERITANCE_ACTIVE")],
+                [Global.latest_timestamp() > will.deadline(),   Bytes("READY_TO_ACTIVATE")],
+                [Int(1),                                        Bytes("ALIVE")],
+            )
+        ),
+    )
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Entry point — compile to TEAL artifacts
+# ─────────────────────────────────────────────────────────────────────────────
+if __name__ == "__main__":
+    import json, pathlib
+
+    spec = app.build()
+    out  = pathlib.Path(__file__).parent / "artifacts"
+    out.mkdir(exist_ok=True)
+    (out / "AlgoLegacyRegistry.approval.teal").write_text(spec.approval_program)
+    (out / "AlgoLegacyRegistry.clear.teal").write_text(spec.clear_program)
+    (out / "AlgoLegacyRegistry.abi.json").write_text(json.dumps(spec.contract.dictify(), indent=2))
+    print("✅ Registry artifacts written to contracts/artifacts/")
@@ -0,0 +1,111 @@
+"""
+sourcemap — which contract source line each TEAL line came from
+================================================================
+PyTEAL can map every line of the TEAL it emits back to the Python
+expression that produced it, but only if stack frames were recorded while
+the contract module was being imported (`FeatureGates` must be set before
+`import contracts.algolegacy`).  `source_map` therefore builds in a
+subprocess and caches the result next to the other artifacts:
+
+    lines = source_map("AlgoLegacy")      # {teal line: (path, line, expression)}
+
+    <Name>.approval.map.json   {"key": build key, "teal": sha256 of the TEAL, "lines": {...}}
+
+Paths are relative to the project root; lines are 1-based on both sides.
+TEAL lines the router or compiler generated (method dispatch, ABI
+encoding) have no contract source and are absent.  The map is rebuilt
+when the sources change (the build key), even if the TEAL does not: its
+line numbers are the sources'.
+
+The TEAL is identical to the regular build: source maps only change what
+is recorded, not what is emitted.
+"""
+
+import hashlib
+import json
+import os
+import pathlib
+import subprocess
+import sys
+
+from contracts.build_cache import APPS, ARTIFACTS, build, build_key
+
+ROOT = pathlib.Path(__file__).parent.parent
+
+
+def source_map(name: str = "AlgoLegacy", program: str = "approval") -> dict[int, tuple[str, int, str]]:
+    """TEAL line → (source path, source line, expression) for `program` of `name`."""
+    spec, _ = build(name)
+    teal    = spec.approval_program if program == "approval" else spec.clear_program
+    path    = ARTIFACTS / f"{name}.{program}.map.json"
+    try:
+        cached = json.loads(path.read_text())
+    except (OSError, ValueError):
+        cached = {}
+    if cached.get("key") != build_key(name) or cached.get("teal") != _digest(teal):
+        subprocess.run([sys.executable, "-m", "contracts.sourcemap", name], cwd=ROOT, check=True)
+        cached = json.loads(path.read_text())
+        if cached.get("teal") != _digest(teal):
+            raise RuntimeError(f"source-mapped build of {name} emitted different TEAL from the cached build")
+    return {int(line): tuple(entry) for line, entry in cached["lines"].items()}
+
+
+def _digest(teal: str) -> str:
+    return hashlib.sha256(teal.encode()).hexdigest()
+
+
+def _write_maps(name: str) -> None:
+    """Build `name` with source maps on and write its .map.json files (run in a fresh interpreter)."""
+    import dataclasses
+    import importlib
+    import re
+
+    from feature_gates import FeatureGates
+
+    FeatureGates.set_sourcemap_enabled(True)
+    from pyteal import Router
+    from pyteal.stack_frame import StackFrame
+
+    # PyTEAL skips frames in its own files and in beaker's, but its list
+    # predates beaker's state/ package; without this, every global-state
+    # access is attributed to beaker/state/primitive.py
+    StackFrame._internal_paths    = [*StackFrame._internal_paths, "beaker/"]
+    StackFrame._internal_paths_re = re.compile("|".join(StackFrame._internal_paths))
+
+    module, attr = APPS[name].split(":")
+    app = getattr(importlib.import_module(module), attr)
+    app.build_options = dataclasses.replace(app.build_options, with_sourcemaps=True)
+
+    # beaker keeps the compile results (and their source maps) to itself
+    results = []
+    compile_router = Router.compile
+
+    def capture(self, **kwargs):
+        results.append(compile_router(self, **kwargs))
+        return results[-1]
+
+    Router.compile = capture
+    try:
+        spec = app.build()
+    finally:
+        Router.compile = compile_router
+
+    for program, teal, sourcemap in (
+        ("approval", spec.approval_program, results[-1].approval_sourcemap),
+        ("clear",    spec.clear_program,    results[-1].clear_sourcemap),
+    ):
+        r3    = sourcemap.r3_sourcemap
+        lines = {}
+        for (teal_line, _), entry in r3.entries.items():
+            source = r3.source_files[entry.source] if isinstance(entry.source, int) else entry.source
+            if source.startswith("contracts/") and source != "contracts/sourcemap.py":
+                lines[teal_line + 1] = (source, entry.source_line + 1, entry.source_extract)
+        ARTIFACTS.mkdir(exist_ok=True)
+        path    = ARTIFACTS / f"{name}.{program}.map.json"
+        partial = path.with_suffix(f".{os.getpid()}.tmp")            # concurrent builders each replace whole
+        partial.write_text(json.dumps({"key": build_key(name), "teal": _digest(teal), "lines": lines}))
+        os.replace(partial, path)
+
+
+if __name__ == "__main__":
+    _write_maps(sys.argv[1] if len(sys.argv) > 1 else "AlgoLegacy")
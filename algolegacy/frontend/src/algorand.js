@@ -22,6 +22,9 @@ export const algodClient   = new algosdk.Algodv2(ALGOD_TOKEN, ALGOD_SERVER, ALGO
 const algodBackup           = new algosdk.Algodv2(ALGOD_TOKEN, ALGOD_SERVER_BACKUP, ALGOD_PORT);
 export const indexerClient = new algosdk.Indexer(INDEXER_TOKEN, INDEXER_SERVER, INDEXER_PORT);
 
+// Optional read API (scripts/read_api.py): cached will state, revalidated by ETag
+const READ_API = process.env.REACT_APP_READ_API || "";
+
 // Wrapper: try primary algod, fall back to backup on rate-limit / network errors
 async function getSuggestedParams() {
   try {
@@ -91,6 +94,17 @@ export function removeStoredWillId(walletAddr, appId) {
 // Then verifies on-chain that the address actually has an allocation.
 export async function discoverBeneficiaryWills(walletAddr) {
   if (!walletAddr) return [];
+  if (READ_API) {
+    try {
+      const { wills } = await readApi(`/wills?address=${walletAddr}`);
+      const mine = await Promise.all(wills.filter((w) => w.will_created).map((w) => getAppGlobalState(w.app_id)));
+      return mine
+        .filter((s) => s?.heirs.some((h) => h.address === walletAddr && (h.percent > 0 || h.asa_amount > 0)))
+        .map((s) => s.app_id);
+    } catch (e) {
+      console.warn("discoverBeneficiaryWills read API error, using indexer:", e.message);
+    }
+  }
   const discovered = new Set();
   try {
     let nextToken = undefined;
@@ -170,9 +184,10 @@ export async function deployWillApp(sender, signer) {
   ]);
 
   // Build create transaction
-  // Schema: 4 byte-slices (owner, b1/b2/b3 addr)
-  //         11 ints      (inactivity_period, last_checkin, inheritance_active,
-  //                       total_locked, will_created, b1/b2/b3 percent+claimed)
+  // Schema: 1 byte-slice (owner)
+  //         5 ints       (inactivity_period, last_checkin, total_locked,
+  //                       locked_asa_id, status — see decodeStatus)
+  // Beneficiaries live in boxes, paid for by the app account (see heirBoxName)
   const sp = await getSuggestedParams();
 
   // Extra pages needed if approval > 2048 bytes (each page = 2048 bytes)
@@ -184,8 +199,8 @@ export async function deployWillApp(sender, signer) {
     onComplete:       algosdk.OnApplicationComplete.NoOpOC,
     approvalProgram,
     clearProgram,
-    numGlobalByteSlices: 4,
-    numGlobalInts:       18,  // 11 original + 7 ASA (locked_asa_id, b1/b2/b3 asa_amount + asa_claimed)
+    numGlobalByteSlices: 1,
+    numGlobalInts:       5,
     numLocalByteSlices:  0,
     numLocalInts:        0,
     extraPages,
@@ -217,6 +232,48 @@ export async function deployWillApp(sender, signer) {
   return Number(appId);
 }
 
+// ── Beneficiary boxes ─────────────────────────────────────────────────────────
+// Each beneficiary is one box named "h" + uint64(slot) holding
+// (address,uint64 percent,uint64 asa_amount,bool claimed,bool asa_claimed).
+// Every call that touches a slot must list that slot's box reference.
+const HEIR_RECORD     = algosdk.ABIType.from("(address,uint64,uint64,bool,bool)");
+const APP_MIN_BALANCE = 100_000;
+export const HEIR_BOX_MBR = 2_500 + 400 * (9 + 49);   // µALGO per beneficiary box
+
+export function heirBoxName(slot) {
+  return new Uint8Array([0x68, ...algosdk.encodeUint64(slot)]);   // "h" + itob(slot)
+}
+
+// µALGO the app account needs before create_will can write `heirCount` boxes
+export const willAccountFunding = (heirCount) => APP_MIN_BALANCE + HEIR_BOX_MBR * heirCount;
+
+// The packed `status` global (algolegacy.py, decode_status):
+//   bit 0 will_created · bit 1 inheritance_active · bits 8..15 percent_total · bits 16.. heir_count
+export function decodeStatus(word) {
+  const w = BigInt(word);
+  return {
+    will_created:       Number(w & 1n),
+    inheritance_active: Number((w >> 1n) & 1n),
+    percent_total:      Number((w >> 8n) & 0xffn),
+    heir_count:         Number(w >> 16n),
+  };
+}
+
+// claim_all pays one inner transaction per unclaimed ALGO share / ASA allocation
+export const claimAllFee = (payouts) => 1000 * (1 + payouts);
+
+// Slots whose boxes a call reads or writes, derived from its ABI arguments
+function heirBoxSlots(methodName, methodArgs = []) {
+  switch (methodName) {
+    case "create_will": return methodArgs[1].map((_, i) => i + 1);
+    case "lock_asa":    return methodArgs[0].map(([slot]) => Number(slot));
+    case "claim":
+    case "claim_asa":
+    case "claim_everything": return [Number(methodArgs[0])];
+    default:            return [];
+  }
+}
+
 // ── ABI Method helpers ────────────────────────────────────────────────────────
 
 // Outer transaction fee per method:
@@ -228,6 +285,8 @@ const METHOD_FEES = {
   opt_in_asa: 2000,   // inner opt-in txn
   lock_asa:   1000,   // no inner txn (just state update)
   claim_asa:  2000,   // inner ASA transfer txn
+  claim_everything: 3000,  // inner ALGO payment + inner ASA transfer, one group
+  // claim_all: 1000 per inner payout, passed by the caller (see claimAllFee)
   revoke_will: 2000,  // may contain inner ALGO payment
 };
 
@@ -239,11 +298,16 @@ const METHOD_FEES = {
  * assetTransfer — { assetId, amount } for ASA transfer args (for "axfer" args)
  * foreignAssets — extra asset IDs to include in the foreign-assets array
  * accounts      — extra accounts
+ * boxSlots      — beneficiary slots to reference (default: derived from methodArgs;
+ *                 add_heirs callers must pass the new slots themselves)
+ * prefund       — microALGO paid to the app account ahead of the call, in the
+ *                 same group (create_will: box storage, see willAccountFunding)
+ * feeOverride   — outer fee in microALGO, for calls whose inner count varies
  */
-export async function callMethod({ sender, signer, methodName, methodArgs, appId, payment, assetTransfer, foreignAssets, accounts }) {
+export async function callMethod({ sender, signer, methodName, methodArgs, appId, payment, assetTransfer, foreignAssets, accounts, boxSlots, prefund, feeOverride }) {
   const sp     = await getSuggestedParams();
   const appRef = algosdk.getApplicationAddress(appId);
-  const fee    = METHOD_FEES[methodName] ?? 2000;
+  const fee    = feeOverride ?? METHOD_FEES[methodName] ?? 2000;
 
   const method  = algosdk.ABIMethod.fromSignature(ABI_SIGNATURES[methodName]);
   const atc     = new algosdk.AtomicTransactionComposer();
@@ -254,8 +318,22 @@ export async function callMethod({ sender, signer, methodName, methodArgs, appId
     suggestedParams:  { ...sp, fee, flatFee: true },
     ...(foreignAssets ? { appForeignAssets: foreignAssets } : {}),
     ...(accounts      ? { appAccounts:      accounts }      : {}),
+    boxes: (boxSlots ?? heirBoxSlots(methodName, methodArgs))
+      .map((slot) => ({ appIndex: 0, name: heirBoxName(slot) })),
   };
 
+  if (prefund) {
+    atc.addTransaction({
+      txn: algosdk.makePaymentTxnWithSuggestedParamsFromObject({
+        from:            sender,
+        to:              appRef,
+        amount:          prefund,
+        suggestedParams: { ...sp, fee: 1000, flatFee: true },
+      }),
+      signer,
+    });
+  }
+
   if (payment) {
     const payTxn = algosdk.makePaymentTxnWithSuggestedParamsFromObject({
       from:            sender,
@@ -298,25 +376,36 @@ export async function callMethod({ sender, signer, methodName, methodArgs, appId
 // ── ABI Method signatures ─────────────────────────────────────────────────────
 // Keep in sync with algolegacy.py.
 export const ABI_SIGNATURES = {
-  create_will:           "create_will(uint64,address,uint64,address,uint64,address,uint64)string",
+  create_will:           "create_will(uint64,(address,uint64)[])string",
+  add_heirs:             "add_heirs((address,uint64)[])uint64",
   deposit:               "deposit(pay)uint64",
   check_in:              "check_in()uint64",
   activate_inheritance:  "activate_inheritance()string",
   force_activate:        "force_activate()string",
   claim:                 "claim(uint64)uint64",
+  claim_all:             "claim_all()uint64",
   revoke_will:           "revoke_will()string",
   get_will_status:       "get_will_status()string",
   get_time_remaining:    "get_time_remaining()uint64",
   get_locked_balance:    "get_locked_balance()uint64",
+  get_will_snapshot:     "get_will_snapshot()(string,uint64,uint64,uint64,bool[])",
   // Digital asset (ASA) methods
   opt_in_asa:            "opt_in_asa(asset)string",
-  lock_asa:              "lock_asa(axfer,uint64,uint64,uint64)string",
+  lock_asa:              "lock_asa(axfer,(uint64,uint64)[])string",
   claim_asa:             "claim_asa(uint64)uint64",
+  claim_everything:      "claim_everything(uint64)(uint64,uint64)",
 };
 
 // ── Read contract state ───────────────────────────────────────────────────────
 export async function getAppGlobalState(appId) {
   if (!appId) return null;
+  if (READ_API) {
+    try {
+      return withSlotKeys(await readApi(`/wills/${appId}`));
+    } catch (e) {
+      console.warn("getAppGlobalState read API error, using algod:", e.message);
+    }
+  }
   try {
     let raw;
     try {
@@ -343,42 +432,67 @@ export async function getAppGlobalState(appId) {
     });
 
     const s = {
-      will_created:          state["will_created"]       ?? 0,
-      inheritance_active:    state["inheritance_active"] ?? 0,
+      ...decodeStatus(state["status"] ?? 0),
       total_locked:          state["total_locked"]       ?? 0,
       last_checkin:          state["last_checkin"]       ?? 0,
       inactivity_period:     state["inactivity_period"]  ?? 0,
       owner:                 state["owner"]              ?? "",
-      beneficiary1_address:  state["b1_address"]         ?? "",
-      beneficiary1_percent:  state["b1_percent"]         ?? 0,
-      beneficiary1_claimed:  state["b1_claimed"]         ?? 0,
-      beneficiary2_address:  state["b2_address"]         ?? "",
-      beneficiary2_percent:  state["b2_percent"]         ?? 0,
-      beneficiary2_claimed:  state["b2_claimed"]         ?? 0,
-      beneficiary3_address:  state["b3_address"]         ?? "",
-      beneficiary3_percent:  state["b3_percent"]         ?? 0,
-      beneficiary3_claimed:  state["b3_claimed"]         ?? 0,
       // Digital assets (ASA)
       locked_asa_id:         state["locked_asa_id"]      ?? 0,
-      b1_asa_amount:         state["b1_asa_amount"]      ?? 0,
-      b1_asa_claimed:        state["b1_asa_claimed"]     ?? 0,
-      b2_asa_amount:         state["b2_asa_amount"]      ?? 0,
-      b2_asa_claimed:        state["b2_asa_claimed"]     ?? 0,
-      b3_asa_amount:         state["b3_asa_amount"]      ?? 0,
-      b3_asa_claimed:        state["b3_asa_claimed"]     ?? 0,
     };
 
-    const nowSec   = Math.floor(Date.now() / 1000);
-    const deadline = Number(s.last_checkin) + Number(s.inactivity_period);
-    s.time_remaining = Math.max(0, deadline - nowSec);
-
-    return s;
+    // Beneficiary records, one box per slot
+    s.heirs = await Promise.all(
+      Array.from({ length: Number(s.heir_count) }, (_, i) => getHeir(appId, i + 1)),
+    );
+    return withSlotKeys(s);
   } catch (err) {
     console.error("getAppGlobalState error", err);
     return null;
   }
 }
 
+// Per-slot keys the dashboard components read (beneficiaryN_*, bN_asa_*), and
+// the seconds left before the will can be activated
+function withSlotKeys(s) {
+  s.heirs.forEach((h) => {
+    s[`beneficiary${h.slot}_address`] = h.address;
+    s[`beneficiary${h.slot}_percent`] = h.percent;
+    s[`beneficiary${h.slot}_claimed`] = h.claimed;
+    s[`b${h.slot}_asa_amount`]        = h.asa_amount;
+    s[`b${h.slot}_asa_claimed`]       = h.asa_claimed;
+  });
+  const nowSec   = Math.floor(Date.now() / 1000);
+  const deadline = Number(s.last_checkin) + Number(s.inactivity_period);
+  s.time_remaining = Math.max(0, deadline - nowSec);
+  return s;
+}
+
+// GET from the read API; a 304 answers from the copy its ETag names
+const readApiCache = new Map(); // path -> { etag, body }
+async function readApi(path) {
+  const cached = readApiCache.get(path);
+  const resp   = await fetch(READ_API + path, { headers: cached ? { "If-None-Match": cached.etag } : {} });
+  if (resp.status === 304 && cached) return structuredClone(cached.body);
+  if (!resp.ok) throw new Error(`read API ${path}: HTTP ${resp.status}`);
+  const body = await resp.json();
+  readApiCache.set(path, { etag: resp.headers.get("ETag"), body });
+  return structuredClone(body);
+}
+
+async function getHeir(appId, slot) {
+  const box = await algodClient.getApplicationBoxByName(appId, heirBoxName(slot)).do();
+  const [address, percent, asaAmount, claimed, asaClaimed] = HEIR_RECORD.decode(box.value);
+  return {
+    slot,
+    address,
+    percent:     Number(percent),
+    asa_amount:  Number(asaAmount),
+    claimed:     claimed ? 1 : 0,
+    asa_claimed: asaClaimed ? 1 : 0,
+  };
+}
+
 // ── Beneficiary self opt-in to an ASA ────────────────────────────────────────
 // Beneficiaries must opt in to the ASA from their own wallet before they can
 // receive a token transfer from the contract.
@@ -190,6 +190,36 @@ function SingleWillClaimCard({ willId, activeAddr, makeSigner, onAnyChange }) {
     }
   };
 
+  // ── ALGO + ASA in one call (claim_everything) ───────────────────────────
+  const handleClaimEverything = async (slot) => {
+    setAlgoLoading(true);
+    setLoading(true);
+    try {
+      if (canActivate && !isActive) await ensureActivated();
+      const fresh   = await getAppGlobalState(willId);
+      const freshId = Number(fresh?.locked_asa_id ?? 0);
+      const result = await callMethod({
+        sender: activeAddr,
+        signer: makeSigner(),
+        methodName: "claim_everything",
+        appId: willId,
+        methodArgs:    [BigInt(slot)],
+        foreignAssets: freshId ? [freshId] : undefined,
+      });
+      const [payout, units] = (result.returnValue ?? [0, 0]).map(Number);
+      toast.success(
+        <span>Claimed {toAlgo(payout)} ALGO and {units} units! <TxLink txId={result.txId} /></span>
+      );
+      await fetchState();
+      onAnyChange?.();
+    } catch (e) {
+      toast.error(parseActionError(e, "Claim"), { autoClose: 8000 });
+    } finally {
+      setAlgoLoading(false);
+      setLoading(false);
+    }
+  };
+
   // ── Opt-in handler ──────────────────────────────────────────────────────
   const handleOptIn = async () => {
     setOptInLoading(true);
@@ -221,6 +251,13 @@ function SingleWillClaimCard({ willId, activeAddr, makeSigner, onAnyChange }) {
     toast.info("Inheritance activated automatically");
   };
 
+  // A slot with both an ALGO share and an ASA allocation outstanding can be
+  // settled with one claim_everything call instead of claim + claim_asa
+  const combinedSlot = myOptedIn
+    ? algoSlots.find((b) => !b.claimed &&
+        asaSlots.some((a) => a.slot === b.slot && !a.asaClaimed))
+    : undefined;
+
   // Determine overall status label
   const allAlgoClaimed = algoSlots.every((b) => b.claimed);
   const allAsaClaimed  = asaSlots.every((b) => b.asaClaimed);
@@ -304,6 +341,19 @@ function SingleWillClaimCard({ willId, activeAddr, makeSigner, onAnyChange }) {
             </div>
           )}
 
+          {/* ── Claim everything (ALGO + token in one transaction) ── */}
+          {combinedSlot && (isActive || canActivate) && (
+            <div style={{ display: "flex", justifyContent: "flex-end", marginBottom: 14 }}>
+              <button
+                className="btn btn-gold"
+                disabled={algoLoading || loading}
+                onClick={() => handleClaimEverything(combinedSlot.slot)}
+              >
+                {algoLoading && loading ? <><span className="spinner" /> Claiming…</> : "Claim ALGO + Tokens"}
+              </button>
+            </div>
+          )}
+
           {/* ── ALGO Claims ── */}
           {(algoSlots.length > 0 || (hasAlgoAllocation && totalLocked === 0)) && (
             <div style={{ marginBottom: asaSlots.length > 0 ? 16 : 0 }}>
@@ -6,7 +6,7 @@
 import React, { useState } from "react";
 import algosdk from "algosdk";
 import { useWallet } from "./WalletContext";
-import { callMethod, deployWillApp, addStoredWillId } from "../algorand";
+import { callMethod, deployWillApp, addStoredWillId, willAccountFunding } from "../algorand";
 import { toast } from "react-toastify";
 import { parseError } from "../utils/errorMessages";
 
@@ -72,10 +72,6 @@ export default function CreateWillForm({ onSuccess }) {
         return toast.error(`Beneficiary ${i + 1}: invalid Algorand address`);
     }
 
-    // Pad to 3 slots — unused slots get owner address + 0%
-    const slots = [...beneficiaries];
-    while (slots.length < 3) slots.push({ address: activeAddr, percent: 0 });
-
     try {
       const signer = makeSigner();
 
@@ -95,13 +91,10 @@ export default function CreateWillForm({ onSuccess }) {
         appId:      newAppId,
         methodArgs: [
           BigInt(secondsUntilDeadline),
-          slots[0].address.trim(),
-          BigInt(Number(slots[0].percent)),
-          slots[1].address.trim(),
-          BigInt(Number(slots[1].percent)),
-          slots[2].address.trim(),
-          BigInt(Number(slots[2].percent)),
+          beneficiaries.map((b) => [b.address.trim(), BigInt(Number(b.percent))]),
         ],
+        // The app account pays for one storage box per beneficiary
+        prefund:    willAccountFunding(beneficiaries.length),
       });
 
       addStoredWillId(activeAddr, newAppId);
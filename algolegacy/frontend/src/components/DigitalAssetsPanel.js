@@ -412,7 +412,8 @@ export function WillTokensTab({ state, appId, onRefresh, activeAddr, makeSigner
                   const b1 = BigInt(amounts.b1 || 0), b2 = BigInt(amounts.b2 || 0), b3 = BigInt(amounts.b3 || 0);
                   const total = Number(b1 + b2 + b3);
                   if (total <= 0) return toast.error("Enter at least one non-zero amount");
-                  doCall("Lock ASA", { methodName: "lock_asa", methodArgs: [b1, b2, b3], assetTransfer: { assetId: lockedId, amount: total }, foreignAssets: [lockedId] });
+                  const allocations = [[1n, b1], [2n, b2], [3n, b3]].filter(([, units]) => units > 0n);
+                  doCall("Lock ASA", { methodName: "lock_asa", methodArgs: [allocations], assetTransfer: { assetId: lockedId, amount: total }, foreignAssets: [lockedId] });
                 }}>
                 {loading === "Lock ASA" ? <><span className="spinner" /> Lockingâ€¦</> : "Lock Tokens"}
               </button>
@@ -771,7 +772,7 @@ function NftWillTab({ state, appId, onRefresh, activeAddr, makeSigner }) {
                               const fresh = await getAppGlobalState(appId);
                               const freshId = Number(fresh?.locked_asa_id ?? contractLockedId);
                               if (!freshId) return toast.error("Contract not opted in yet â€” do Step 1 first");
-                              const amts = [BigInt(slot===1?1:0), BigInt(slot===2?1:0), BigInt(slot===3?1:0)];
+                              const amts = [[[BigInt(slot), 1n]]];   // one (slot, units) allocation
                               const result = await callMethod({ sender:activeAddr, signer:makeSigner(), appId,
                                 methodName:"lock_asa", methodArgs:amts,
                                 assetTransfer:{ assetId:freshId, amount:1 }, foreignAssets:[freshId] });
@@ -863,7 +864,7 @@ function NftWillTab({ state, appId, onRefresh, activeAddr, makeSigner }) {
                           onClick={async () => {
                             setExistLock(true);
                             try {
-                              const amts = [BigInt(slot===1?1:0), BigInt(slot===2?1:0), BigInt(slot===3?1:0)];
+                              const amts = [[[BigInt(slot), 1n]]];   // one (slot, units) allocation
                               const result = await callMethod({ sender:activeAddr, signer:makeSigner(), appId,
                                 methodName:"lock_asa", methodArgs:amts,
                                 assetTransfer:{ assetId:existInfo.id, amount:1 }, foreignAssets:[existInfo.id] });
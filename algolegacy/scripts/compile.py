@@ -2,28 +2,82 @@
 compile.py — Compile AlgoLegacy contract to TEAL artifacts
 ===========================================================
 Usage:
-    python scripts/compile.py
+    python scripts/compile.py            # rebuild only what changed
+    python scripts/compile.py --force    # rebuild everything
+    python scripts/compile.py --profile optimised
+                                         # the optimised build profile, as AlgoLegacy-profile-optimised.*
 
 Outputs to contracts/artifacts/:
     AlgoLegacy.approval.teal
     AlgoLegacy.clear.teal
     AlgoLegacy.abi.json
+    AlgoLegacy.{approval,clear}.bin       bytecode, assembled offline
+    AlgoLegacy-max_beneficiaries-N.*      the same, per beneficiary-count variant
+    AlgoLegacyRegistry.{approval.teal,clear.teal,abi.json,approval.bin,clear.bin}
+
+and copies the default AlgoLegacy TEAL to frontend/public/, which the
+dashboard fetches, compiles and deploys (deployWillApp); with --profile,
+the default build is made too, so the copy is never missing or stale.
+
+It ends with each AlgoLegacy variant's size and minimum balances: the
+creator's (program pages + global schema) and the app account's with
+the variant's full complement of heir boxes.
+
+Builds are cached (see contracts/build_cache.py): when neither the contract
+sources nor the pyteal/beaker versions changed, the artifacts are left as
+they are, without importing beaker or PyTEAL.  Build profiles other than
+the default are named apart and built in a subprocess (see OPTIONS there).
 """
 
-import sys, json, pathlib
+import sys, json, math, pathlib, time
 
 sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
-from contracts.algolegacy import app
+from avm.ledger import APP_PAGE_MIN_BALANCE, MIN_BALANCE, SCHEMA_BYTES_MIN_BALANCE, SCHEMA_UINT_MIN_BALANCE
+from contracts.build_cache import APPS, ARTIFACTS, OPTIONS, artifact_name, build, compiled, is_current
+from contracts.constants import GLOBAL_NUM_BYTE_SLICES, GLOBAL_NUM_UINTS, HEIR_BOX_MBR
 
-out = pathlib.Path(__file__).parent.parent / "contracts" / "artifacts"
-out.mkdir(exist_ok=True)
+FRONTEND = pathlib.Path(__file__).parent.parent / "frontend" / "public"
+FORCE    = "--force" in sys.argv
+PROFILE = {"profile": sys.argv[sys.argv.index("--profile") + 1]} if "--profile" in sys.argv else {}
+BUILDS  = [(name, PROFILE) for name in APPS] + [
+    ("AlgoLegacy", {**PROFILE, "max_beneficiaries": bound}) for bound in OPTIONS["max_beneficiaries"] if bound
+]
+if PROFILE:
+    BUILDS.append(("AlgoLegacy", {}))        # the default build, copied to the frontend below
 
-spec = app.build()
+sizes = {}
+for name, options in BUILDS:
+    start = time.perf_counter()
+    stem   = artifact_name(name, options)
+    cached = not FORCE and is_current(name, options)
+    if not cached:
+        build(name, options, force=True)
+    elapsed = (time.perf_counter() - start) * 1000
 
-(out / "AlgoLegacy.approval.teal").write_text(spec.approval_program)
-(out / "AlgoLegacy.clear.teal").write_text(spec.clear_program)
-(out / "AlgoLegacy.abi.json").write_text(json.dumps(spec.contract.dictify(), indent=2))
+    approval = (ARTIFACTS / f"{stem}.approval.teal").read_text()
+    methods  = json.loads((ARTIFACTS / f"{stem}.abi.json").read_text())["methods"]
+    print(f"   {stem}  ({'cached' if cached else 'built'}, {elapsed:.0f} ms)")
+    print(f"   Approval TEAL : {len(approval.splitlines())} lines, "
+          f"{len(compiled(stem, 'approval', approval))} bytes assembled")
+    print(f"   Methods       : {[m['name'] for m in methods]}")
+    if name == "AlgoLegacy":
+        clear = (ARTIFACTS / f"{stem}.clear.teal").read_text()
+        sizes[stem, options.get("max_beneficiaries")] = (
+            len(compiled(stem, "approval", approval)) + len(compiled(stem, "clear", clear))
+        )
 
+for program in ("approval", "clear"):
+    served = FRONTEND / f"AlgoLegacy.{program}.teal"
+    teal   = (ARTIFACTS / f"AlgoLegacy.{program}.teal").read_bytes()
+    if not served.exists() or served.read_bytes() != teal:
+        served.write_bytes(teal)
 print("✅ Artifacts written to contracts/artifacts/")
-print(f"   Approval TEAL : {len(spec.approval_program.splitlines())} lines")
-print(f"   Methods       : {[m.name for m in spec.contract.methods]}")
+print("   frontend/public/AlgoLegacy.{approval,clear}.teal match the default build")
+
+print(f"\n   {'build':<34}{'bytes':>7}{'pages':>7}{'creator MBR':>13}{'app MBR':>22}")
+for (stem, bound), size in sizes.items():
+    pages   = math.ceil(size / 2048)
+    creator = (APP_PAGE_MIN_BALANCE * pages
+               + SCHEMA_UINT_MIN_BALANCE * GLOBAL_NUM_UINTS + SCHEMA_BYTES_MIN_BALANCE * GLOBAL_NUM_BYTE_SLICES)
+    app     = f"{MIN_BALANCE + HEIR_BOX_MBR * bound:,}" if bound else f"{MIN_BALANCE:,} + {HEIR_BOX_MBR:,}/heir"
+    print(f"   {stem:<34}{size:>7}{pages:>7}{creator:>13,}{app:>22}")
@@ -2,7 +2,35 @@
 deploy.py — AlgoLegacy contract deployment script
 ==================================================
 Usage:
-    python scripts/deploy.py
+    python scripts/deploy.py                # one AlgoLegacy will app
+    python scripts/deploy.py --registry     # the multi-will AlgoLegacyRegistry
+    python scripts/deploy.py --verify-compile
+                                            # also compile on algod and compare bytes
+    python scripts/deploy.py --bulk wills.csv [--out results.json]
+                                            # one AlgoLegacy app per manifest entry
+    python scripts/deploy.py --profile optimised
+                                            # from the optimised build profile
+                                            # (contracts/build_cache.py OPTIONS)
+    python scripts/deploy.py --heirs 2      # the smallest program for a will of 2 heirs
+
+Programs are assembled offline (avm/assembler.py), so a deploy makes no
+algod.compile calls unless --verify-compile asks for the cross-check.
+
+AlgoLegacy is built in variants bounded to 1, 2, 4 or 8 beneficiaries, or
+unbounded (contracts/algolegacy.py, MAX_BENEFICIARIES).  --heirs picks the
+smallest program that holds that many; without it the will is unbounded.
+Bulk mode picks per will, from its manifest row, and deploys each
+variant's wills with that variant's program.
+
+Bulk mode reads a JSON or CSV manifest of wills (owner, period,
+beneficiaries, deposit; see client/bulk.py) and deploys them all from one
+build: app creations 16 to a group, then funding, add_heirs and deposit
+grouped per will, signed on a thread pool.  One results file lists every
+will's app id and status (default contracts/artifacts/bulk.deployed.json).
+
+Requests go through client.transport.PooledAlgodClient: one keep-alive
+connection pool, a token-bucket limit of ALGOD_RPS requests/s (burst
+ALGOD_BURST), and HTTP 429 retried after the server's Retry-After.
 
 Requirements:
     pip install beaker-pyteal algokit-utils python-dotenv algosdk
@@ -12,89 +40,52 @@ After deploy, copy the printed APP_ID into frontend/.env:
     REACT_APP_APP_ID=<your-app-id>
 """
 
-import os, sys, json, base64, pathlib, time, math, functools
-from dotenv import load_dotenv
-from algosdk import mnemonic, account
-from algosdk.v2client import algod as algod_client_module
+import os, sys, json, base64, pathlib, math, time
+from algosdk import mnemonic
 from algosdk.transaction import (
     ApplicationCreateTxn, StateSchema, wait_for_confirmation, OnComplete
 )
-from algosdk.error import AlgodHTTPError
-
-# ── Rate-limit helpers ────────────────────────────────────────────────────────
-# AlgoNode free tier: ~1 req/s on algod; add backoff on HTTP 429.
-_CALL_DELAY = 0.5          # seconds between sequential API calls
-_MAX_RETRIES = 5
-_BACKOFF_BASE = 2          # exponential base (2 ** attempt seconds)
-
-def _retry_on_429(fn, *args, **kwargs):
-    """Call fn(*args, **kwargs) retrying up to _MAX_RETRIES times on HTTP 429."""
-    for attempt in range(_MAX_RETRIES):
-        try:
-            result = fn(*args, **kwargs)
-            time.sleep(_CALL_DELAY)   # polite pause after every successful call
-            return result
-        except AlgodHTTPError as exc:
-            if "429" in str(exc) or getattr(exc, "code", None) == 429:
-                wait = _BACKOFF_BASE ** attempt
-                print(f"   ⏳ Rate limited – retrying in {wait}s (attempt {attempt+1}/{_MAX_RETRIES})...")
-                time.sleep(wait)
-            else:
-                raise
-    raise RuntimeError("AlgoNode rate limit: max retries exceeded")
-
-load_dotenv()
-
-# ── Config ────────────────────────────────────────────────────────────────────
-NETWORK = os.getenv("NETWORK", "testnet")
-
-ALGOD_SERVERS = {
-    "testnet":  ("https://testnet-api.algonode.network", "", ""),
-    "localnet": ("http://localhost", 4001, "a" * 64),
-}
-
-if NETWORK not in ALGOD_SERVERS:
-    sys.exit(f"Unsupported network: {NETWORK}")
-
-algod_server, algod_port, algod_token = ALGOD_SERVERS[NETWORK]
 
-# ── Load deployer account ──────────────────────────────────────────────────────
-raw_mnemonic = os.getenv("ALGO_MNEMONIC")
-if not raw_mnemonic:
-    sys.exit(
-        "❌  ALGO_MNEMONIC environment variable not set.\n"
-        "    Export your 25-word mnemonic:\n"
-        "    set ALGO_MNEMONIC=word1 word2 ... word25"
-    )
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+from network import NETWORK, load_account, make_algod
+
+# Registry: every will is a box record in one app (see contracts/registry.py)
+REGISTRY      = "--registry" in sys.argv
+CONTRACT_NAME = "AlgoLegacyRegistry" if REGISTRY else "AlgoLegacy"
+VERIFY        = "--verify-compile" in sys.argv
+BULK          = sys.argv[sys.argv.index("--bulk") + 1] if "--bulk" in sys.argv else None
+BULK_OUT      = sys.argv[sys.argv.index("--out") + 1] if "--out" in sys.argv else None
+PROFILE       = {"profile": sys.argv[sys.argv.index("--profile") + 1]} if "--profile" in sys.argv else {}
+HEIRS         = int(sys.argv[sys.argv.index("--heirs") + 1]) if "--heirs" in sys.argv else None
 
-private_key = mnemonic.to_private_key(raw_mnemonic)
-address     = account.address_from_private_key(private_key)
+# ── Load deployer account ──────────────────────────────────────────────────────
+private_key, address = load_account()
 
 
 def compile_program(algod, source: str) -> bytes:
-    """Compile TEAL source and return raw bytes (rate-limit safe)."""
-    response = _retry_on_429(algod.compile, source)
+    """Compile TEAL source on algod and return raw bytes."""
+    response = algod.compile(source)
     return base64.b64decode(response["result"])
 
 
 def main():
-    sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+    from contracts.build_cache import ARTIFACTS, artifact_name, build, compiled, smallest_variant
 
-    artifacts = pathlib.Path(__file__).parent.parent / "contracts" / "artifacts"
-    approval_teal = (artifacts / "AlgoLegacy.approval.teal").read_text()
-    clear_teal    = (artifacts / "AlgoLegacy.clear.teal").read_text()
+    # Rebuilt only if the contract sources changed since the last compile
+    options       = smallest_variant(CONTRACT_NAME, HEIRS, PROFILE) if HEIRS is not None else PROFILE
+    spec, _       = build(CONTRACT_NAME, options)
+    stem          = artifact_name(CONTRACT_NAME, options)
+    approval_teal = spec.approval_program
+    clear_teal    = spec.clear_program
 
-    # Build algod client
-    url = algod_server if not algod_port else f"{algod_server}:{algod_port}"
-    headers = {"User-Agent": "algosdk", "x-api-key": algod_token} if algod_token else {"User-Agent": "algosdk"}
-    algod = algod_client_module.AlgodClient(algod_token, url, headers=headers)
+    algod = make_algod()
 
-    print(f"\n🚀 Deploying AlgoLegacy to {NETWORK.upper()}...")
+    print(f"\n🚀 Deploying {stem} to {NETWORK.upper()}...")
     print(f"   Deployer : {address}")
 
     # Check balance
     try:
-        info = _retry_on_429(algod.account_info, address)
+        info = algod.account_info(address)
         balance_algo = info.get("amount", 0) / 1_000_000
         print(f"   Balance  : {balance_algo:.4f} ALGO")
         if balance_algo < 0.2:
@@ -106,11 +97,15 @@ def main():
     except Exception as e:
         sys.exit(f"❌  Cannot reach Algorand node: {e}")
 
-    # Compile TEAL
-    print("   Compiling approval program...")
-    approval_bytes = compile_program(algod, approval_teal)
-    print("   Compiling clear program...")
-    clear_bytes    = compile_program(algod, clear_teal)
+    # Bytecode: assembled offline and cached per TEAL source in contracts/artifacts/
+    approval_bytes = compiled(stem, "approval", approval_teal)
+    clear_bytes    = compiled(stem, "clear", clear_teal)
+    if VERIFY:
+        print("   Verifying bytecode against algod.compile...")
+        for label, teal, local in (("approval", approval_teal, approval_bytes),
+                                   ("clear", clear_teal, clear_bytes)):
+            if compile_program(algod, teal) != local:
+                sys.exit(f"❌  Offline {label} bytecode differs from algod.compile — deploy aborted")
 
     # Extra program pages: each page = 2048 bytes (max 3 extra pages)
     extra_pages = max(0, math.ceil(len(approval_bytes) / 2048) - 1)
@@ -118,16 +113,19 @@ def main():
         print(f"   Program size : {len(approval_bytes)} bytes — using {extra_pages} extra page(s)")
 
     # State schema (exact count from algolegacy.py):
-    #   Uint64 (18): inactivity_period, last_checkin, inheritance_active, total_locked,
-    #                will_created, b1_percent, b1_claimed, b2_percent, b2_claimed,
-    #                b3_percent, b3_claimed,
-    #                locked_asa_id, b1_asa_amount, b1_asa_claimed,
-    #                b2_asa_amount, b2_asa_claimed, b3_asa_amount, b3_asa_claimed
-    #   Bytes  (4) : owner, b1_address, b2_address, b3_address
-    global_schema = StateSchema(num_uints=18, num_byte_slices=4)
+    #   Uint64 (5): inactivity_period, last_checkin, total_locked, locked_asa_id,
+    #               status (will_created | inheritance_active | percent_total | heir_count,
+    #               packed; see decode_status)
+    #   Bytes  (1): owner
+    # Beneficiaries are stored in boxes; fund the app account before create_will
+    # (0.1 ALGO + 0.0257 ALGO per beneficiary).
+    #   Registry   : will_count (1 uint); wills and heirs are all boxes
+    global_schema = StateSchema(num_uints=5, num_byte_slices=1)
+    if REGISTRY:
+        global_schema = StateSchema(num_uints=1, num_byte_slices=0)
     local_schema  = StateSchema(num_uints=0, num_byte_slices=0)
 
-    sp = _retry_on_429(algod.suggested_params)
+    sp = algod.suggested_params()
 
     txn = ApplicationCreateTxn(
         sender=address,
@@ -141,7 +139,7 @@ def main():
     )
 
     signed_txn = txn.sign(private_key)
-    txid = _retry_on_429(algod.send_transaction, signed_txn)
+    txid = algod.send_transaction(signed_txn)
 
     print(f"   Tx sent  : {txid}")
     print("   Waiting for confirmation...")
@@ -159,27 +157,96 @@ def main():
     print(f"  🌐 Explorer     : https://testnet.explorer.perawallet.app/application/{app_id}")
     print("═" * 60)
     print("\nNext steps:")
-    print("  1. Fund the app address with at least 0.5 ALGO for inner txn fees:")
+    if REGISTRY:
+        print("  1. Fund the app address with its 0.1 ALGO base balance (wills pay their own boxes):")
+    else:
+        print("  1. Fund the app address with at least 0.5 ALGO for inner txn fees:")
     print(f"     Send ALGO to {app_addr}")
     print("  2. Update frontend/.env:")
     print(f"     REACT_APP_APP_ID={app_id}")
     print("  3. Restart the frontend (Ctrl+C then npm start)\n")
 
     # Write app ID to artifacts
-    out = artifacts
+    out = ARTIFACTS
     out.mkdir(exist_ok=True)
-    (out / "deployed.json").write_text(json.dumps({
+    (out / ("registry.deployed.json" if REGISTRY else "deployed.json")).write_text(json.dumps({
         "network": NETWORK,
         "app_id": app_id,
         "app_address": app_addr,
         "deploy_txid": txid,
         "deployer": address,
+        "build": stem,
     }, indent=2))
-    print("  Saved to contracts/artifacts/deployed.json")
+    print(f"  Saved to contracts/artifacts/{'registry.' if REGISTRY else ''}deployed.json")
 
     return app_id, app_addr
 
 
+def main_bulk(manifest: str, out: str | None = None) -> list[dict]:
+    from client.bulk import BulkDeployer, load_manifest, write_results
+    from contracts.algolegacy import GLOBAL_NUM_BYTE_SLICES, GLOBAL_NUM_UINTS
+    from contracts.build_cache import ARTIFACTS, artifact_name, build, compiled, smallest_variant
+
+    if REGISTRY:
+        sys.exit("❌  --bulk deploys AlgoLegacy apps; registry wills are created with create_will instead")
+
+    def owner_key(label: str) -> str:
+        if not label:
+            return private_key
+        if not os.getenv(label):
+            sys.exit(f"❌  Manifest owner {label!r}: environment variable {label} not set")
+        return mnemonic.to_private_key(os.environ[label])
+
+    try:
+        orders = load_manifest(manifest, owner_key)
+    except (OSError, KeyError, ValueError) as e:
+        sys.exit(f"❌  Cannot read manifest {manifest}: {e}")
+
+    # The smallest program that holds each will's heirs; one deployer per variant
+    variants: dict[str, list[int]] = {}
+    for index, order in enumerate(orders):
+        options = smallest_variant(CONTRACT_NAME, len(order.heirs), PROFILE)
+        variants.setdefault(json.dumps(options, sort_keys=True), []).append(index)
+
+    algod   = make_algod()
+    results = [None] * len(orders)
+    groups  = 0
+    print(f"\n🚀 Bulk-deploying {len(orders)} wills to {NETWORK.upper()}...")
+    print(f"   Deployer : {address}")
+    start = time.perf_counter()
+    for key, indices in variants.items():
+        options  = json.loads(key)
+        spec, _  = build(CONTRACT_NAME, options)
+        stem     = artifact_name(CONTRACT_NAME, options)
+        approval = compiled(stem, "approval", spec.approval_program)
+        clear    = compiled(stem, "clear", spec.clear_program)
+        deployer = BulkDeployer(
+            algod, private_key, spec, approval, clear,
+            global_schema=StateSchema(num_uints=GLOBAL_NUM_UINTS, num_byte_slices=GLOBAL_NUM_BYTE_SLICES),
+            extra_pages=max(0, math.ceil(len(approval) / 2048) - 1),
+        )
+        print(f"   {stem:<34}: {len(indices)} wills, {len(approval)} bytes")
+        for index, result in zip(indices, deployer.deploy([orders[i] for i in indices])):
+            results[index] = {**result, "index": index, "build": stem}
+        groups += deployer.groups
+    elapsed = time.perf_counter() - start
+
+    ok  = sum(r["status"] == "ok" for r in results)
+    out = pathlib.Path(out) if out else ARTIFACTS / "bulk.deployed.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    write_results(out, results)
+    print(f"   Deployed : {ok}/{len(results)} wills in {elapsed:.1f}s "
+          f"({len(results) / elapsed:.1f} wills/s, {groups} groups)")
+    for r in results:
+        if r["status"] != "ok":
+            print(f"   ❌ entry {r['index'] + 1} ({r['owner']}): {r['error']}")
+    print(f"   Saved to {out}")
+    return results
+
+
 if __name__ == "__main__":
-    main()
+    if BULK:
+        main_bulk(BULK, BULK_OUT)
+    else:
+        main()
 
@@ -0,0 +1,49 @@
+"""
+indexer.py — keep a local SQLite database of every AlgoLegacy will
+===================================================================
+Usage:
+    python scripts/indexer.py START_ROUND [DB]   # default DB: contracts/artifacts/wills.db
+
+Follows algod block by block from START_ROUND (the round the first will
+was deployed in) and applies AlgoLegacy calls to DB; see client/indexer.py.
+Only apps created with the approval program of an AlgoLegacy build are
+indexed.
+Restarted, it resumes after the last round it committed and START_ROUND
+is ignored.  Query the database directly, or through client.indexer.WillIndex:
+
+    sqlite3 contracts/artifacts/wills.db \\
+        "SELECT app_id, deadline FROM wills WHERE will_created AND NOT inheritance_active ORDER BY deadline"
+
+Uses the network settings in network.py (NETWORK, ALGOD_RPS, ALGOD_BURST).
+"""
+
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+from network import NETWORK, make_algod
+
+from client.indexer import BlockIndexer, WillIndex, will_programs
+from contracts.build_cache import ARTIFACTS, build
+
+
+def main():
+    if len(sys.argv) < 2:
+        sys.exit(__doc__)
+    start = int(sys.argv[1])
+    path  = pathlib.Path(sys.argv[2]) if len(sys.argv) > 2 else ARTIFACTS / "wills.db"
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    index   = WillIndex(str(path), build("AlgoLegacy")[0].contract, will_programs())
+    indexer = BlockIndexer(make_algod(), index, start_round=start)
+    print(f"\n📚 Indexing {NETWORK.upper()} wills into {path} from round {indexer.next_round}")
+    try:
+        indexer.run()
+    except KeyboardInterrupt:
+        print(f"\n   Stopped at round {index.round}: {indexer.blocks} blocks applied")
+    finally:
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
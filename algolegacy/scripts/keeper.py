@@ -0,0 +1,69 @@
+"""
+keeper.py — activate inheritances as soon as their deadlines pass
+==================================================================
+Usage:
+    python scripts/keeper.py                       # wills from contracts/artifacts
+    python scripts/keeper.py APP_ID [APP_ID ...]   # these wills only
+
+Tracks every will in deployed.json and bulk.deployed.json (or the app ids
+given), then follows the chain block by block: check-ins move deadlines,
+and wills whose inactivity period has run out are activated, up to 16 per
+atomic group.  Each activation costs the keeper account a 0.001 ALGO fee.
+Stop with Ctrl+C.
+
+Uses the network settings in network.py (NETWORK, ALGOD_RPS,
+ALGOD_BURST); the keeper account is ALGO_MNEMONIC.
+"""
+
+import json
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+from network import NETWORK, load_account, make_algod
+
+from client.confirm import ConfirmationTracker
+from client.keeper import Keeper
+from contracts.build_cache import ARTIFACTS, build
+
+
+def deployed_app_ids() -> list[int]:
+    """App ids from the single and bulk deploy artifacts, whichever exist."""
+    app_ids = []
+    single = ARTIFACTS / "deployed.json"
+    if single.exists():
+        app_ids.append(json.loads(single.read_text())["app_id"])
+    bulk = ARTIFACTS / "bulk.deployed.json"
+    if bulk.exists():
+        app_ids += [r["app_id"] for r in json.loads(bulk.read_text()) if r.get("app_id")]
+    return app_ids
+
+
+def _report_activated(rnd: int, app_ids: list[int]) -> None:
+    for app_id in app_ids:
+        print(f"   ✅ round {rnd}: activated app {app_id}")
+
+
+def main():
+    app_ids = [int(arg) for arg in sys.argv[1:]] or deployed_app_ids()
+    if not app_ids:
+        sys.exit("❌  No wills to watch: deploy first, or pass app ids")
+
+    private_key, address = load_account()
+    spec, _ = build("AlgoLegacy")
+    algod   = make_algod()
+    with ConfirmationTracker(algod) as tracker:
+        keeper = Keeper(algod, private_key, spec.contract, tracker=tracker)
+        keeper.track(app_ids)
+        print(f"\n⏰ Keeper on {NETWORK.upper()} as {address}")
+        print(f"   Watching {len(keeper.deadlines)} of {len(app_ids)} wills "
+              f"(the rest are activated or not created)")
+        keeper.on_activated = _report_activated
+        try:
+            keeper.run()
+        except KeyboardInterrupt:
+            print(f"\n   Stopped: {len(keeper.activated)} activated, {len(keeper.failed)} failed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+network.py — algod connection settings shared by the scripts
+=============================================================
+NETWORK picks the algod server (testnet or localnet); ALGOD_RPS and
+ALGOD_BURST override its default rate limit.  Importing this module reads
+no key and no command line, so read-only scripts (indexer.py,
+read_api.py) run without ALGO_MNEMONIC; load_account() reads it for the
+scripts that sign.
+"""
+
+import os, sys, pathlib
+from dotenv import load_dotenv
+from algosdk import mnemonic, account
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+from client.transport import MAX_RETRIES, PooledAlgodClient
+
+load_dotenv()
+
+# ── Config ────────────────────────────────────────────────────────────────────
+NETWORK = os.getenv("NETWORK", "testnet")
+
+ALGOD_SERVERS = {
+    "testnet":  ("https://testnet-api.algonode.network", "", ""),
+    "localnet": ("http://localhost", 4001, "a" * 64),
+}
+# Default requests/s per network (None: unlimited); ALGOD_RPS / ALGOD_BURST override
+ALGOD_RATES = {"testnet": 10.0, "localnet": None}
+
+if NETWORK not in ALGOD_SERVERS:
+    sys.exit(f"Unsupported network: {NETWORK}")
+
+algod_server, algod_port, algod_token = ALGOD_SERVERS[NETWORK]
+algod_rps   = float(os.environ["ALGOD_RPS"]) if os.getenv("ALGOD_RPS") else ALGOD_RATES[NETWORK]
+algod_burst = int(os.getenv("ALGOD_BURST", "0")) or max(1, int(algod_rps or 1))
+
+
+def load_account() -> tuple[str, str]:
+    """(private key, address) of the ALGO_MNEMONIC account; exits if unset."""
+    raw_mnemonic = os.getenv("ALGO_MNEMONIC")
+    if not raw_mnemonic:
+        sys.exit(
+            "❌  ALGO_MNEMONIC environment variable not set.\n"
+            "    Export your 25-word mnemonic:\n"
+            "    set ALGO_MNEMONIC=word1 word2 ... word25"
+        )
+    private_key = mnemonic.to_private_key(raw_mnemonic)
+    return private_key, account.address_from_private_key(private_key)
+
+
+def _report_rate_limit(wait: float, attempt: int) -> None:
+    print(f"   ⏳ Rate limited – retrying in {wait:.1f}s (attempt {attempt}/{MAX_RETRIES})...")
+
+
+def make_algod() -> PooledAlgodClient:
+    """algod client: pooled connections, token-bucket rate limit."""
+    url = algod_server if not algod_port else f"{algod_server}:{algod_port}"
+    headers = {"User-Agent": "algosdk", "x-api-key": algod_token} if algod_token else {"User-Agent": "algosdk"}
+    algod = PooledAlgodClient(algod_token, url, headers=headers, rate=algod_rps, burst=algod_burst)
+    algod.on_rate_limited = _report_rate_limit
+    return algod
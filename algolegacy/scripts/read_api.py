@@ -0,0 +1,51 @@
+"""
+read_api.py — serve cached will state to dashboards, in front of algod
+=======================================================================
+Usage:
+    python scripts/read_api.py START_ROUND [PORT] [DB]   # default: 8980, contracts/artifacts/wills.db
+
+Follows algod from START_ROUND into DB, as scripts/indexer.py does, and
+answers `GET /wills/{app-id}`, `GET /wills?address=X` and long-polls from
+it; see client/read_api.py.  Point the frontend at it with
+REACT_APP_READ_API=http://localhost:8980 and every dashboard's polling
+is served from the index, revalidated by ETag.
+
+Uses the network settings in network.py (NETWORK, ALGOD_RPS, ALGOD_BURST).
+"""
+
+import pathlib
+import sys
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+from network import NETWORK, make_algod
+
+from client.indexer import BlockIndexer, WillIndex, will_programs
+from client.read_api import ReadAPI, WillReader
+from contracts.build_cache import ARTIFACTS, build
+
+
+def main():
+    if len(sys.argv) < 2:
+        sys.exit(__doc__)
+    start = int(sys.argv[1])
+    port  = int(sys.argv[2]) if len(sys.argv) > 2 else 8980
+    path  = pathlib.Path(sys.argv[3]) if len(sys.argv) > 3 else ARTIFACTS / "wills.db"
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    algod  = make_algod()
+    index  = WillIndex(str(path), build("AlgoLegacy")[0].contract, will_programs())
+    reader = WillReader(algod, index, BlockIndexer(algod, index, start_round=start))
+    api    = ReadAPI(reader, host="0.0.0.0", port=port)
+    print(f"\n📡 Serving {NETWORK.upper()} wills from {path} on {api.url}")
+    try:
+        api.run()
+    except KeyboardInterrupt:
+        status = api.status()
+        print(f"\n   Stopped at round {status['round']}: {status['requests']} requests, "
+              f"{status['not_modified']} not modified, {status['upstream']} upstream reads")
+    finally:
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
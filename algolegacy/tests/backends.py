@@ -0,0 +1,347 @@
+"""
+Test backends — where the AlgoLegacy suite executes
+====================================================
+Both backends expose the same small surface so tests are written once:
+
+    backend.new_account(amount)          -> {"pk": ..., "address": ...}
+    backend.generate_account()           -> same, unfunded (fund it in a batch)
+    backend.fund(address, amount)
+    backend.deploy(account)              -> client
+    backend.client_for(app_id, account)  -> client signing as `account`
+    backend.payment(account, receiver, amount)   (for `pay` ABI args)
+    backend.advance_time(seconds)
+    backend.batch()                      -> Batch (see below)
+
+and every client has `.app_id`, `.app_address`, `.get_global_state()` and
+`.call(method, fee=None, boxes=None, accounts=None, foreign_assets=None,
+**abi_kwargs)` returning an object with
+`.return_value`.
+
+  avm       In-process: contracts are run by `avm.Ledger`.  No network and
+            no waiting; `advance_time` moves `latest_timestamp` instantly.
+  localnet  A real AlgoKit localnet on :4001 (`algokit localnet start`);
+            `advance_time` shifts the dev-mode block timestamp offset.
+
+Batches queue payments, app creations and ABI calls, then `send()` them as
+atomic groups of up to 16 transactions — one confirmation per group rather
+than one per transaction.  A unit (e.g. a `pay` argument and its app call)
+is never split across groups.
+"""
+
+import base64
+import copy
+import functools
+
+from algosdk import account, transaction
+from algosdk.atomic_transaction_composer import (
+    AccountTransactionSigner,
+    AtomicTransactionComposer,
+    TransactionWithSigner,
+)
+from algosdk.v2client import algod
+
+from avm import AppClient, Ledger, Payment
+from client.bulk import pack_groups
+from contracts.algolegacy import GLOBAL_NUM_BYTE_SLICES, GLOBAL_NUM_UINTS
+from contracts.build_cache import build, compiled
+from tests.chain_time import advance_localnet_time
+
+ALGOD_TOKEN  = "a" * 64
+ALGOD_SERVER = "http://localhost"
+ALGOD_PORT   = 4001
+
+GLOBAL_SCHEMA     = (GLOBAL_NUM_UINTS, GLOBAL_NUM_BYTE_SLICES)
+EXTRA_PAGES       = 1
+DISPENSER_BALANCE = 10**15       # avm stand-in for the localnet dispenser
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# In-process AVM
+# ─────────────────────────────────────────────────────────────────────────────
+class AvmBackend:
+    name = "avm"
+
+    def __init__(self, ledger: Ledger | None = None, dispenser: str | None = None):
+        self.ledger    = ledger or Ledger()
+        self.spec      = _app_spec()
+        self.dispenser = dispenser or self.ledger.new_account(DISPENSER_BALANCE)
+
+    def fork(self) -> "AvmBackend":
+        """An independent backend starting from this one's current ledger state."""
+        ledger = Ledger()
+        ledger.restore(self.ledger.snapshot())
+        return AvmBackend(ledger, self.dispenser)
+
+    def new_account(self, amount: int) -> dict:
+        return {"pk": None, "address": self.ledger.new_account(amount)}
+
+    def generate_account(self) -> dict:
+        return self.new_account(0)
+
+    def fund(self, address: str, amount: int) -> None:
+        self.ledger.fund(address, amount)
+
+    def deploy(self, owner: dict) -> AppClient:
+        client = AppClient(self.ledger, self.spec, sender=owner["address"])
+        client.create(global_schema=GLOBAL_SCHEMA, extra_pages=EXTRA_PAGES)
+        return client
+
+    def client_for(self, app_id: int, acct: dict) -> AppClient:
+        return AppClient(self.ledger, self.spec, sender=acct["address"], app_id=app_id)
+
+    def payment(self, sender: dict, receiver: str, amount: int):
+        return Payment(sender=sender["address"], receiver=receiver, amount=amount)
+
+    def advance_time(self, seconds: int) -> None:
+        self.ledger.advance(seconds)
+
+    def batch(self) -> "AvmBatch":
+        return AvmBatch(self)
+
+
+class AvmBatch:
+    """Queued transactions, sent to the in-memory ledger in groups of ≤ 16."""
+
+    def __init__(self, backend: AvmBackend):
+        self.backend = backend
+        self.groups  = 0                 # groups sent, i.e. confirmations
+        self._units: list[tuple[list, object]] = []   # (txns, finish(results, offset))
+
+    def pay(self, receiver: str, amount: int, sender: dict | None = None) -> None:
+        """Queue a payment; `sender=None` pays from the dispenser."""
+        source = sender["address"] if sender else self.backend.dispenser
+        self._units.append(([Payment(sender=source, receiver=receiver, amount=amount)], None))
+
+    def create(self, owner: dict, method: str | None = None, **kwargs) -> None:
+        """Queue an app creation, bare or as an ABI create call; yields a client."""
+        client = AppClient(self.backend.ledger, self.backend.spec, sender=owner["address"])
+        txns, call_txn = client.compose_create(
+            method, global_schema=GLOBAL_SCHEMA, extra_pages=EXTRA_PAGES, **kwargs,
+        )
+        index = txns.index(call_txn)
+
+        def finish(results, offset):
+            client.app_id = results[offset + index].application_index
+            return client
+        self._units.append((txns, finish))
+
+    def call(self, client: AppClient, method: str, *, sender: dict, **kwargs) -> None:
+        """Queue an ABI call signed by `sender`."""
+        txns, _ = client.compose(method, sender=sender["address"], **kwargs)
+        self._units.append((txns, None))
+
+    def send(self) -> list:
+        """Send everything queued; returns one entry per item: a client for creates, else None."""
+        out: list = []
+        for group in pack_groups(self._units, size=lambda unit: len(unit[0])):
+            txns    = [txn for unit, _ in group for txn in unit]
+            results = self.backend.ledger.send(txns)
+            self.groups += 1
+            offset = 0
+            for unit, finish in group:
+                out.append(finish(results, offset) if finish else None)
+                offset += len(unit)
+        self._units.clear()
+        return out
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# AlgoKit localnet
+# ─────────────────────────────────────────────────────────────────────────────
+class LocalnetClient:
+    """`algokit_utils.ApplicationClient` with the avm client's `call(fee=, boxes=)` shape."""
+
+    def __init__(self, algod_client, app_client):
+        self.algod      = algod_client
+        self.app_client = app_client
+
+    @property
+    def app_id(self) -> int:
+        return self.app_client.app_id
+
+    @property
+    def app_address(self) -> str:
+        return self.app_client.app_address
+
+    def get_global_state(self) -> dict:
+        return self.app_client.get_global_state()
+
+    def call(self, method: str, *, fee: int | None = None, boxes=None,
+             accounts=None, foreign_assets=None, **kwargs):
+        params: dict = {}
+        if fee is not None:
+            sp = self.algod.suggested_params()
+            sp.flat_fee, sp.fee = True, fee
+            params["suggested_params"] = sp
+        if boxes:
+            params["boxes"] = boxes
+        if accounts:
+            params["accounts"] = accounts
+        if foreign_assets:
+            params["foreign_assets"] = foreign_assets
+        return self.app_client.call(method, transaction_parameters=params or None, **kwargs)
+
+
+class LocalnetBackend:
+    name = "localnet"
+
+    def __init__(self):
+        from algokit_utils import get_localnet_default_account
+
+        self.algod     = algod.AlgodClient(ALGOD_TOKEN, f"{ALGOD_SERVER}:{ALGOD_PORT}")
+        self.dispenser = get_localnet_default_account(self.algod)
+        self.spec, _   = build("AlgoLegacy")   # mutated below, so not the shared one
+        self.spec.global_state_schema = transaction.StateSchema(*GLOBAL_SCHEMA)
+
+    def new_account(self, amount: int) -> dict:
+        acct = self.generate_account()
+        self.fund(acct["address"], amount)
+        return acct
+
+    def generate_account(self) -> dict:
+        pk, addr = account.generate_account()
+        return {"pk": pk, "address": addr}
+
+    def fund(self, address: str, amount: int) -> None:
+        sp  = self.algod.suggested_params()
+        txn = transaction.PaymentTransaction(self.dispenser.address, sp, address, amount)
+        txid = self.algod.send_transaction(txn.sign(self.dispenser.private_key))
+        transaction.wait_for_confirmation(self.algod, txid, 4)
+
+    def _app_client(self, app_id: int, acct: dict):
+        from algokit_utils import ApplicationClient
+
+        return ApplicationClient(
+            self.algod, self.spec, app_id=app_id,
+            signer=AccountTransactionSigner(acct["pk"]), sender=acct["address"],
+        )
+
+    def deploy(self, owner: dict) -> LocalnetClient:
+        client = self._app_client(0, owner)
+        client.create(transaction_parameters={"extra_pages": EXTRA_PAGES})
+        return LocalnetClient(self.algod, client)
+
+    def client_for(self, app_id: int, acct: dict) -> LocalnetClient:
+        return LocalnetClient(self.algod, self._app_client(app_id, acct))
+
+    def payment(self, sender: dict, receiver: str, amount: int) -> TransactionWithSigner:
+        sp = self.algod.suggested_params()
+        return TransactionWithSigner(
+            txn=transaction.PaymentTransaction(sender["address"], sp, receiver, amount),
+            signer=AccountTransactionSigner(sender["pk"]),
+        )
+
+    def advance_time(self, seconds: int) -> None:
+        advance_localnet_time(self.algod, seconds, sender=self.dispenser)
+
+    def batch(self) -> "LocalnetBatch":
+        return LocalnetBatch(self)
+
+    @functools.cached_property
+    def programs(self) -> tuple[bytes, bytes]:
+        """(approval, clear) bytecode for batched app creation, assembled offline."""
+        return (
+            compiled("AlgoLegacy", "approval", self.spec.approval_program),
+            compiled("AlgoLegacy", "clear", self.spec.clear_program),
+        )
+
+    def compile_teal(self, source: str) -> bytes:
+        """algod's own assembly of `source`, to check the offline assembler against."""
+        return base64.b64decode(self.algod.compile(source)["result"])
+
+
+class LocalnetBatch:
+    """Queued transactions, each group of ≤ 16 confirmed by one `AtomicTransactionComposer`."""
+
+    def __init__(self, backend: LocalnetBackend):
+        self.backend = backend
+        self.groups  = 0
+        self._units: list[tuple[int, object, object]] = []   # (size, add(atc, sp), finish(txids, offset))
+
+    def pay(self, receiver: str, amount: int, sender: dict | None = None) -> None:
+        if sender:
+            source, signer = sender["address"], AccountTransactionSigner(sender["pk"])
+        else:
+            source, signer = self.backend.dispenser.address, self.backend.dispenser.signer
+
+        def add(atc, sp):
+            atc.add_transaction(TransactionWithSigner(
+                transaction.PaymentTransaction(source, sp, receiver, amount), signer,
+            ))
+        self._units.append((1, add, None))
+
+    def _method_call(self, app_id: int, sender: dict, method: str | None, *,
+                     fee: int | None = None, create: bool = False, **kwargs):
+        spec_method = None
+        args: list = []
+        if method is not None:
+            spec_method = next(m for m in self.backend.spec.contract.methods if m.name == method)
+            args = [kwargs.pop(arg.name) for arg in spec_method.args]
+        signer = AccountTransactionSigner(sender["pk"])
+        size   = 1 + sum(isinstance(a, TransactionWithSigner) for a in args)
+        extra: dict = {}
+        if create:
+            approval, clear = self.backend.programs
+            extra = {
+                "approval_program": approval, "clear_program": clear,
+                "global_schema": transaction.StateSchema(*GLOBAL_SCHEMA),
+                "local_schema": transaction.StateSchema(0, 0),
+                "extra_pages": EXTRA_PAGES,
+            }
+
+        def add(atc, sp):
+            if fee is not None:
+                sp = copy.copy(sp)
+                sp.flat_fee, sp.fee = True, fee
+            if spec_method is None:
+                atc.add_transaction(TransactionWithSigner(transaction.ApplicationCallTxn(
+                    sender["address"], sp, app_id, transaction.OnComplete.NoOpOC,
+                    approval_program=extra.get("approval_program"),
+                    clear_program=extra.get("clear_program"),
+                    global_schema=extra.get("global_schema"),
+                    local_schema=extra.get("local_schema"),
+                    extra_pages=extra.get("extra_pages", 0),
+                ), signer))
+            else:
+                atc.add_method_call(
+                    app_id, spec_method, sender["address"], sp, signer,
+                    method_args=args, **extra, **kwargs,
+                )
+        return size, add
+
+    def create(self, owner: dict, method: str | None = None, **kwargs) -> None:
+        size, add = self._method_call(0, owner, method, create=True, **kwargs)
+
+        def finish(txids, offset):
+            info = self.backend.algod.pending_transaction_info(txids[offset + size - 1])
+            return self.backend.client_for(info["application-index"], owner)
+        self._units.append((size, add, finish))
+
+    def call(self, client: LocalnetClient, method: str, *, sender: dict, **kwargs) -> None:
+        size, add = self._method_call(client.app_id, sender, method, **kwargs)
+        self._units.append((size, add, None))
+
+    def send(self) -> list:
+        out: list = []
+        for group in pack_groups(self._units, size=lambda unit: unit[0]):
+            atc = AtomicTransactionComposer()
+            sp  = self.backend.algod.suggested_params()
+            for _, add, _ in group:
+                add(atc, sp)
+            txids = atc.execute(self.backend.algod, 4).tx_ids
+            self.groups += 1
+            offset = 0
+            for size, _, finish in group:
+                out.append(finish(txids, offset) if finish else None)
+                offset += size
+        self._units.clear()
+        return out
+
+
+BACKENDS = {"avm": AvmBackend, "localnet": LocalnetBackend}
+
+
+@functools.cache
+def _app_spec():
+    """`app.build()` costs ~0.3s; reuse the cached build (contracts/build_cache.py)."""
+    return build("AlgoLegacy")[0]
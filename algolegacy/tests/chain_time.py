@@ -0,0 +1,44 @@
+"""
+chain_time — deterministic block time on localnet
+==================================================
+AlgoKit localnet runs algod in dev mode: a block is closed for every
+transaction, and each block's timestamp can be pinned to
+`previous block timestamp + offset` via `/v2/devmode/blocks/offset`.
+
+`advance_localnet_time` uses that to move `Global.latest_timestamp()`
+forward by an exact number of seconds, instead of `time.sleep`-ing until
+the wall clock catches up:
+
+    set offset = seconds  ->  close one block  ->  restore previous offset
+
+After the restore, later blocks keep the advanced clock (an offset of 0
+means "same timestamp as the previous block"), so chain time never runs
+backwards between tests.
+"""
+
+from algosdk import transaction
+
+
+def advance_localnet_time(algod_client, seconds: int, *, sender) -> int:
+    """Advance localnet chain time by `seconds`; return the new block timestamp.
+
+    `sender` is any funded `algokit_utils.Account` (the localnet dispenser
+    is the usual choice); it pays for the zero-amount transaction that
+    closes the block.
+    """
+    previous = algod_client.get_timestamp_offset().get("offset", 0)
+    algod_client.set_timestamp_offset(seconds)
+    try:
+        confirmed_round = _close_block(algod_client, sender)
+    finally:
+        algod_client.set_timestamp_offset(previous)
+    return algod_client.block_info(confirmed_round)["block"]["ts"]
+
+
+def _close_block(algod_client, sender) -> int:
+    sp  = algod_client.suggested_params()
+    txn = transaction.PaymentTransaction(
+        sender.address, sp, sender.address, 0, note=b"algolegacy:advance-time",
+    )
+    txid = algod_client.send_transaction(txn.sign(sender.private_key))
+    return transaction.wait_for_confirmation(algod_client, txid, 4)["confirmed-round"]
@@ -0,0 +1,77 @@
+"""
+Shared pytest configuration
+============================
+    pytest tests/                       # in-process AVM (default, no network)
+    pytest tests/ -n auto               # ... spread across all cores (pytest-xdist)
+    pytest tests/ --backend localnet    # against `algokit localnet start`
+
+Fixtures are function-scoped and independent: `make_will(Lifecycle.X)`
+returns a fresh will in state X (see tests/wills.py), and `chain` is a
+fresh ledger behind an algod stand-in, for the client/ tests (see
+tests/standin.py).
+"""
+
+import pytest
+
+from avm import AlgodStandIn, Ledger
+from client.transport import PooledAlgodClient
+from tests.backends import BACKENDS, AvmBackend
+from tests.standin import SPEC
+from tests.wills import Lifecycle, WillFactory, build_template
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--backend",
+        choices=sorted(BACKENDS),
+        default="avm",
+        help="where contracts execute: in-process AVM (default) or a running localnet",
+    )
+
+
+@pytest.fixture(scope="session")
+def _session_backend(request):
+    """Built once per worker: a localnet connection, or the avm template ledger."""
+    return BACKENDS[request.config.getoption("--backend")]()
+
+
+@pytest.fixture(scope="session")
+def _will_template(_session_backend):
+    """avm only: one will per `Lifecycle` on the template ledger, built once per worker."""
+    if not isinstance(_session_backend, AvmBackend):
+        return {}
+    return build_template(_session_backend)
+
+
+@pytest.fixture
+def backend(_session_backend, _will_template):
+    """Per test: a private fork of the template ledger (avm) or the shared localnet."""
+    if isinstance(_session_backend, AvmBackend):
+        return _session_backend.fork()
+    return _session_backend
+
+
+@pytest.fixture
+def advance_time(backend):
+    """`advance_time(seconds)` — move `Global.latest_timestamp()` forward without sleeping."""
+    return backend.advance_time
+
+
+@pytest.fixture
+def make_will(backend, _will_template):
+    """`make_will(lifecycle=Lifecycle.ALIVE)` → an independent `Will` on `backend`."""
+    return WillFactory(backend, _will_template)
+
+
+@pytest.fixture
+def will(make_will):
+    """A created, funded will whose owner has just checked in."""
+    return make_will(Lifecycle.ALIVE)
+
+
+@pytest.fixture
+def chain():
+    """(ledger, algod client, stand-in node): an empty ledger served over HTTP."""
+    ledger = Ledger()
+    with AlgodStandIn(ledger, programs=[SPEC.approval_program, SPEC.clear_program]) as node:
+        yield ledger, PooledAlgodClient("", node.url), node
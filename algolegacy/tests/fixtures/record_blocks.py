@@ -0,0 +1,75 @@
+"""
+record_blocks.py — regenerate tests/fixtures/will_blocks.msgpack
+=================================================================
+Plays one scripted history on `avm.algod.AlgodStandIn` and saves every
+block, as algod serves it in msgpack, with the accounts and app ids the
+indexer tests assert on.  Keys are deterministic (`fixed_account`).
+
+    alpha   alice's will: 60/40 to heir1/heir2, 2 ALGO; checked in, then
+            force-activated and settled with claim_all
+    beta    alice's will: 100% to heir1, 1 ALGO; activated by the keeper
+            once its 60 s period passes, then claimed by heir1
+    gamma   bob's will: 100% to heir2, no deposit; revoked
+
+Run:
+    python tests/fixtures/record_blocks.py
+"""
+
+import pathlib
+import sys
+
+import msgpack
+
+sys.path.insert(0, str(pathlib.Path(__file__).parents[2]))
+from avm import AlgodStandIn, Ledger
+from client.bulk import WillOrder
+from client.transport import PooledAlgodClient
+from contracts.algolegacy import heir_box_name
+from tests.standin import SPEC, bulk_deployer, call, fixed_account
+
+FIXTURE = pathlib.Path(__file__).parent / "will_blocks.msgpack"
+NAMES   = ("deployer", "alice", "bob", "heir1", "heir2", "keeper")
+
+
+def record() -> dict:
+    keys   = {name: fixed_account(n + 1) for n, name in enumerate(NAMES)}
+    ledger = Ledger()
+    for key, address in keys.values():
+        ledger.fund(address, 100_000_000)
+    (alice, _), (bob, _), (keeper, _) = keys["alice"], keys["bob"], keys["keeper"]
+    heir1, heir2 = keys["heir1"][1], keys["heir2"][1]
+
+    with AlgodStandIn(ledger, programs=[SPEC.approval_program, SPEC.clear_program]) as node:
+        algod   = PooledAlgodClient("", node.url)
+        results = bulk_deployer(algod, keys["deployer"][0]).deploy([
+            WillOrder(alice, period=3600, heirs=[(heir1, 60), (heir2, 40)], deposit=2_000_000),
+            WillOrder(alice, period=60,   heirs=[(heir1, 100)],             deposit=1_000_000),
+            WillOrder(bob,   period=3600, heirs=[(heir2, 100)],             deposit=0),
+        ])
+        alpha, beta, gamma = (r["app_id"] for r in results)
+
+        ledger.advance(600)
+        call(algod, alpha, alice, "check_in")
+        checked_in = node.last_round()
+        ledger.advance(120)
+        call(algod, beta, keeper, "activate_inheritance")
+        call(algod, beta, keys["heir1"][0], "claim", 1, fee=2000, boxes=[(0, heir_box_name(1))])
+        call(algod, gamma, bob, "revoke_will")
+        call(algod, alpha, alice, "force_activate")
+        call(algod, alpha, keeper, "claim_all", fee=3000,
+             boxes=[(0, heir_box_name(1)), (0, heir_box_name(2))], accounts=[heir1, heir2])
+
+        last   = node.last_round()
+        blocks = {rnd: msgpack.packb(node.block(rnd, msgpack_format=True), unicode_errors="surrogateescape")
+                  for rnd in range(1, last + 1)}
+    return {
+        "blocks":    blocks,
+        "accounts":  {name: address for name, (_, address) in keys.items()},
+        "apps":      {"alpha": alpha, "beta": beta, "gamma": gamma},
+        "rounds":    {"check_in": checked_in},
+    }
+
+
+if __name__ == "__main__":
+    FIXTURE.write_bytes(msgpack.packb(record()))
+    print(f"wrote {FIXTURE}")
@@ -0,0 +1,190 @@
+"""
+Stand-in helpers — wills on `avm.algod.AlgodStandIn`
+=====================================================
+Shared by the tests that drive client/ code over HTTP: wills are deployed
+with client/bulk.py, and blocks are closed on demand, since the stand-in
+makes one per submitted group.  The wrappers at the end put faults in
+front of an algod client (the `chain` fixture's, see tests/conftest.py).
+"""
+
+import base64
+
+from algosdk import account, transaction
+from algosdk.atomic_transaction_composer import AccountTransactionSigner
+from algosdk.error import AlgodHTTPError
+from algosdk.transaction import StateSchema
+from nacl.signing import SigningKey
+
+from client.bulk import BulkDeployer, WillOrder
+from contracts.algolegacy import GLOBAL_NUM_BYTE_SLICES, GLOBAL_NUM_UINTS, decode_status
+from contracts.build_cache import build, compiled
+
+SPEC     = build("AlgoLegacy")[0]
+APPROVAL = compiled("AlgoLegacy", "approval", SPEC.approval_program)
+
+
+def deploy_wills(ledger, algod, periods: list[int], owner_key: str | None = None) -> list[tuple[int, str]]:
+    """One will per period (each with its own owner unless `owner_key`); (app_id, owner_key) pairs."""
+    deployer_key, deployer = account.generate_account()
+    ledger.fund(deployer, 100_000_000)
+    heir = account.generate_account()[1]
+    if owner_key is not None:
+        ledger.fund(account.address_from_private_key(owner_key), 10_000_000 * len(periods))
+    orders = []
+    for period in periods:
+        key = owner_key
+        if key is None:
+            key, addr = account.generate_account()
+            ledger.fund(addr, 10_000_000)
+        orders.append(WillOrder(key, period=period, heirs=[(heir, 100)], deposit=0))
+    results = bulk_deployer(algod, deployer_key).deploy(orders)
+    assert all(r["status"] == "ok" for r in results), results
+    return [(r["app_id"], order.owner_key) for r, order in zip(results, orders)]
+
+
+def bulk_deployer(algod, deployer_key: str) -> BulkDeployer:
+    return BulkDeployer(
+        algod, deployer_key, SPEC,
+        APPROVAL,
+        compiled("AlgoLegacy", "clear", SPEC.clear_program),
+        global_schema=StateSchema(GLOBAL_NUM_UINTS, GLOBAL_NUM_BYTE_SLICES),
+        extra_pages=1,
+    )
+
+
+def call(algod, app_id: int, key: str, method: str, *args, fee: int | None = None, **fields) -> None:
+    """Submit one ABI call signed by `key`; `fields` go to ApplicationNoOpTxn (boxes, accounts)."""
+    abi_method = SPEC.contract.get_method_by_name(method)
+    sp = algod.suggested_params()
+    if fee is not None:
+        sp.flat_fee, sp.fee = True, fee
+    txn = transaction.ApplicationNoOpTxn(
+        account.address_from_private_key(key), sp, app_id,
+        app_args=[abi_method.get_selector(), *(a.type.encode(v) for a, v in zip(abi_method.args, args))],
+        **fields,
+    )
+    algod.send_transactions(AccountTransactionSigner(key).sign_transactions([txn], [0]))
+
+
+def fixed_account(n: int) -> tuple[str, str]:
+    """A deterministic (private key, address) pair, for recorded fixtures."""
+    signing = SigningKey(bytes([n]) * 32)
+    key = base64.b64encode(signing.encode() + signing.verify_key.encode()).decode()
+    return key, account.address_from_private_key(key)
+
+
+def tick(ledger, algod) -> None:
+    """Close a block at the ledger's current time."""
+    key, addr = account.generate_account()
+    ledger.fund(addr, 1_000_000)
+    txn = transaction.PaymentTxn(addr, algod.suggested_params(), addr, 0)
+    algod.send_transactions(AccountTransactionSigner(key).sign_transactions([txn], [0]))
+
+
+def is_active(ledger, app_id: int) -> bool:
+    return bool(decode_status(ledger.apps[app_id].global_state[b"status"])["inheritance_active"])
+
+
+# ── Faulty algod ─────────────────────────────────────────────────────────────
+class Passthrough:
+    """`algod`, unchanged; the wrappers below replace some of its methods."""
+
+    def __init__(self, algod):
+        self.algod = algod
+
+    def __getattr__(self, name):
+        return getattr(self.algod, name)
+
+
+class Offline(Passthrough):
+    """`algod`, with every request refused while `down` is set."""
+
+    down = False
+
+    def __getattr__(self, name):
+        method = getattr(self.algod, name)
+
+        def request(*args, **kwargs):
+            if self.down:
+                raise ConnectionRefusedError("algod unreachable")
+            return method(*args, **kwargs)
+        return request
+
+
+class Unavailable(Passthrough):
+    """`algod`, answering application reads with 503 while `down` is set."""
+
+    down = False
+
+    def application_info(self, app_id: int, **kwargs) -> dict:
+        if self.down:
+            raise AlgodHTTPError("service unavailable", 503)
+        return self.algod.application_info(app_id, **kwargs)
+
+
+class Rejecting(Passthrough):
+    """`algod`, rejecting every submitted group while `reject` is set."""
+
+    reject = True
+
+    def send_transactions(self, signed, **kwargs):
+        if self.reject:
+            raise AlgodHTTPError("transaction rejected", 400)
+        return self.algod.send_transactions(signed, **kwargs)
+
+
+class RejectingUnavailable(Rejecting, Unavailable):
+    """`Rejecting`, also answering application reads with 503 while `down` is set."""
+
+
+class Flaky(Passthrough):
+    """`algod`, with its next `failures` block waits raising `error` (default: a reset connection)."""
+
+    def __init__(self, algod, failures: int = 0, error: Exception | None = None):
+        super().__init__(algod)
+        self.failures, self.error = failures, error or OSError("connection reset")
+
+    def fail(self) -> None:
+        if self.failures:
+            self.failures -= 1
+            raise self.error
+
+    def status_after_block(self, rnd: int, **kwargs) -> dict:
+        self.fail()
+        return self.algod.status_after_block(rnd, **kwargs)
+
+
+class FlakyInfo(Flaky):
+    """`algod`, with its next `failures` pending-info lookups raising `error`."""
+
+    def status_after_block(self, rnd: int, **kwargs) -> dict:
+        return self.algod.status_after_block(rnd, **kwargs)
+
+    def pending_transaction_info(self, txid: str, **kwargs) -> dict:
+        self.fail()
+        return self.algod.pending_transaction_info(txid, **kwargs)
+
+
+class FlakySimulate(Flaky):
+    """`algod`, with its next `failures` simulate requests raising `error`."""
+
+    def status_after_block(self, rnd: int, **kwargs) -> dict:
+        return self.algod.status_after_block(rnd, **kwargs)
+
+    def simulate_transactions(self, request, **kwargs) -> dict:
+        self.fail()
+        return self.algod.simulate_transactions(request, **kwargs)
+
+
+class BoxFault(Passthrough):
+    """`algod`, with its next box read raising `error`."""
+
+    def __init__(self, algod, error: Exception):
+        super().__init__(algod)
+        self.error = error
+
+    def application_box_by_name(self, app_id: int, name: bytes) -> dict:
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+        return self.algod.application_box_by_name(app_id, name)
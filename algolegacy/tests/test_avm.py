@@ -0,0 +1,342 @@
+"""
+In-process AVM — executor tests
+================================
+Checks the `avm` package itself: TEAL parsing, opcode semantics, fee pooling,
+atomic rollback, and inner payments / asset transfers driven by AlgoLegacy,
+plus the offline assembler (byte-for-byte against algod with
+`--backend localnet`).
+
+Run:
+    pytest tests/test_avm.py -v
+"""
+
+import pytest
+from algosdk import encoding
+
+from avm import (
+    AppCall,
+    AppClient,
+    AssemblerError,
+    AssetCreate,
+    AssetTransfer,
+    Ledger,
+    LedgerError,
+    LogicError,
+    Payment,
+    Program,
+    TealParseError,
+    assemble,
+)
+from contracts.algolegacy import (
+    GLOBAL_NUM_BYTE_SLICES,
+    GLOBAL_NUM_UINTS,
+    HEIR_BOX_MBR,
+    decode_status,
+    heir_box_name,
+)
+from contracts.build_cache import APPS, build
+
+SPEC  = build("AlgoLegacy")[0]
+BOXES = [(0, heir_box_name(slot)) for slot in (1, 2, 3)]
+
+
+def _run(ledger: Ledger, teal: str, *, args: list[bytes] | None = None, fee: int = 1000):
+    """Create an app from raw TEAL, then call it once."""
+    creator = ledger.new_account(10_000_000)
+    program = Program(teal)
+    create  = ledger.send(AppCall(
+        sender=creator, app_id=0, approval_program=program,
+        clear_program=Program("#pragma version 8\nint 1"),
+    ))[0]
+    return ledger.send(AppCall(
+        sender=creator, app_id=create.application_index, args=args or [], fee=fee,
+    ))[0]
+
+
+@pytest.fixture
+def ledger():
+    return Ledger()
+
+
+@pytest.fixture
+def will(ledger):
+    """A funded AlgoLegacy will: 50/30/20 split, 3 ALGO deposited."""
+    owner  = ledger.new_account(20_000_000)
+    heirs  = [ledger.new_account(1_000_000) for _ in range(3)]
+    client = AppClient(ledger, SPEC, sender=owner)
+    client.create(global_schema=(GLOBAL_NUM_UINTS, GLOBAL_NUM_BYTE_SLICES), extra_pages=1)
+    ledger.fund(client.app_address, 1_000_000)
+    client.call(
+        "create_will", period=60,
+        heirs=[(heirs[0], 50), (heirs[1], 30), (heirs[2], 20)], boxes=BOXES,
+    )
+    client.call("deposit", payment=client.pay(owner, 3_000_000))
+    return client, owner, heirs
+
+
+def _will_with_heirs(ledger: Ledger, n: int) -> tuple[AppClient, list[str]]:
+    """An activated will with `n` heirs (n ≤ 100), added 8 per call."""
+    owner  = ledger.new_account(20_000_000)
+    heirs  = [ledger.new_account(1_000_000) for _ in range(n)]
+    pcts   = [100 - (n - 1)] + [1] * (n - 1)
+    client = AppClient(ledger, SPEC, sender=owner)
+    client.create(global_schema=(GLOBAL_NUM_UINTS, GLOBAL_NUM_BYTE_SLICES), extra_pages=1)
+    ledger.fund(client.app_address, 100_000 + HEIR_BOX_MBR * n)
+    client.call("create_will", period=60, heirs=[], boxes=[])
+    for start in range(0, n, 8):
+        chunk = list(zip(heirs, pcts))[start:start + 8]
+        client.call("add_heirs", heirs=chunk,
+                    boxes=[(0, heir_box_name(start + i + 1)) for i in range(len(chunk))])
+    client.call("deposit", payment=client.pay(owner, 3_000_000))
+    client.call("force_activate")
+    return client, heirs
+
+
+class TestProgram:
+    def test_pseudo_ops_are_lowered(self):
+        program = Program('#pragma version 8\nint 7\nbyte "hi"\nbyte 0x01ff\npop\npop')
+        assert program.version == 8
+        assert [i.op for i in program.instructions][:3] == ["pushint", "pushbytes", "pushbytes"]
+        assert program.instructions[2].args == (b"\x01\xff",)
+
+    def test_labels_resolve_to_instruction_index(self):
+        program = Program("#pragma version 8\nb end\nint 0\nend:\nint 1")
+        assert program.instructions[0].args == (2,)
+
+    def test_unknown_opcode_rejected(self):
+        with pytest.raises(TealParseError, match="unknown opcode"):
+            Program("#pragma version 8\nfrobnicate")
+
+    def test_opcode_newer_than_pragma_rejected(self):
+        with pytest.raises(TealParseError, match="requires version"):
+            Program("#pragma version 2\nint 1\nlog")
+
+
+class TestAssembler:
+    # Expected bytes follow the AVM encoding rules: varuint immediates, and
+    # 16-bit branch offsets counted from the end of the instruction.
+    @pytest.mark.parametrize("teal, expected", [
+        ("pushint 1\nbnz end\nerr\nend:\npushint 1\nreturn", "08 8101 40 0001 00 8101 43"),
+        ("loop:\npushint 0\nbz loop", "08 8100 41 fffb"),
+        ("callsub f\nreturn\nf:\nproto 1 1\nframe_dig -1\nretsub", "08 88 0001 43 8a 0101 8b ff 89"),
+        ("pushint 1\nswitch a b\na:\npushint 1\nreturn\nb:\npushint 0\nreturn",
+         "08 8101 8d 02 0000 0003 8101 43 8100 43"),
+        ("intcblock 0 300\nbytecblock 0x 0x6869\ntxna ApplicationArgs 0\nglobal LatestTimestamp",
+         "08 20 02 00 ac02 26 02 00 02 6869 36 1a 00 32 07"),
+    ])
+    def test_encoding(self, teal, expected):
+        assert assemble("#pragma version 8\n" + teal).hex() == expected.replace(" ", "")
+
+    def test_pseudo_ops_rejected(self):
+        with pytest.raises(AssemblerError, match="pseudo-op 'int'"):
+            assemble("#pragma version 8\nint 1")
+
+    @pytest.mark.parametrize("name", APPS)
+    def test_artifacts_match_algod(self, backend, name):
+        if backend.name != "localnet":
+            pytest.skip("needs algod's compile endpoint (--backend localnet)")
+        spec = build(name)[0]
+        for teal in (spec.approval_program, spec.clear_program):
+            assert assemble(teal) == backend.compile_teal(teal)
+
+
+class TestInterpreter:
+    def test_arithmetic_and_log(self, ledger):
+        result = _run(ledger, "#pragma version 8\nint 6\nint 7\n*\nitob\nlog\nint 1")
+        assert result.logs == [(42).to_bytes(8, "big")]
+
+    def test_overflow_fails(self, ledger):
+        with pytest.raises(LogicError, match="overflow"):
+            _run(ledger, "#pragma version 8\nint 18446744073709551615\nint 1\n+")
+
+    def test_assert_reports_pyteal_comment(self, ledger):
+        with pytest.raises(LogicError, match="must be positive"):
+            _run(ledger, "#pragma version 8\nint 0\n// must be positive\nassert\nint 1")
+
+    def test_budget_exceeded(self, ledger):
+        loop = "#pragma version 8\nint 0\nloop:\nint 1\n+\ndup\nint 1000\n<\nbnz loop\n"
+        with pytest.raises(LogicError, match="budget"):
+            _run(ledger, loop)
+
+    def test_callsub_and_frames(self, ledger):
+        teal = (
+            "#pragma version 8\nint 20\nint 22\ncallsub add\nint 42\n==\nreturn\n"
+            "add:\nproto 2 1\nframe_dig -2\nframe_dig -1\n+\nretsub"
+        )
+        assert _run(ledger, teal).cost > 0
+
+    def test_retsub_returns_values_above_frame_not_locals(self, ledger):
+        # PyTEAL's layout: output in frame slot 0, further locals pushed above it
+        teal = (
+            "#pragma version 8\ncallsub f\nint 7\n==\nreturn\n"
+            "f:\nproto 0 1\nint 0\nbyte \"local\"\nint 7\nframe_bury 0\nretsub"
+        )
+        assert _run(ledger, teal).cost > 0
+
+
+class TestLedger:
+    def test_failed_group_rolls_back(self, ledger):
+        alice, bob = ledger.new_account(5_000_000), ledger.new_account(0)
+        with pytest.raises(LedgerError):
+            ledger.send([
+                Payment(sender=alice, receiver=bob, amount=1_000_000),
+                Payment(sender=bob, receiver=alice, amount=10_000_000),
+            ])
+        assert ledger.balance(alice) == 5_000_000
+        assert ledger.balance(bob) == 0
+
+    def test_min_balance_enforced(self, ledger):
+        alice, bob = ledger.new_account(150_000), ledger.new_account(1_000_000)
+        with pytest.raises(LedgerError, match="below min"):
+            ledger.send(Payment(sender=alice, receiver=bob, amount=100_000))
+
+    def test_advance_moves_latest_timestamp(self, ledger):
+        before = ledger.timestamp
+        ledger.advance(3600)
+        assert ledger.timestamp == before + 3600
+
+    def test_snapshot_restore(self, ledger):
+        alice = ledger.new_account(1_000_000)
+        snap  = ledger.snapshot()
+        ledger.fund(alice, 5)
+        ledger.restore(snap)
+        assert ledger.balance(alice) == 1_000_000
+
+
+class TestAlgoLegacyOnAvm:
+    def test_claim_needs_pooled_fee(self, ledger, will):
+        client, _, heirs = will
+        ledger.advance(61)
+        client.call("activate_inheritance")
+        heir = client.prepare(sender=heirs[0])
+        with pytest.raises(LedgerError, match="fee"):
+            heir.call("claim", beneficiary_slot=1, boxes=BOXES[:1])
+        result = heir.call("claim", beneficiary_slot=1, boxes=BOXES[:1], fee=2000)
+        assert result.return_value == 1_500_000
+        assert ledger.balance(heirs[0]) == 1_000_000 - 2000 + 1_500_000
+
+    def test_read_only_call_is_not_committed(self, ledger, will):
+        client, _, _ = will
+        round_before = ledger.round
+        assert client.call("get_will_status").return_value == "ALIVE"
+        assert ledger.round == round_before
+
+    def test_revoke_returns_deposit(self, ledger, will):
+        client, owner, _ = will
+        before = ledger.balance(owner)
+        client.call("revoke_will", fee=2000)
+        assert ledger.balance(owner) == before - 2000 + 3_000_000
+        assert decode_status(client.get_global_state()["status"])["will_created"] == 0
+
+    def test_heir_records_live_in_boxes(self, will):
+        client, _, heirs = will
+        assert decode_status(client.get_global_state()["status"])["heir_count"] == 3
+        box = client.get_box(heir_box_name(2))
+        assert len(box) == 49
+        assert box[:32] == encoding.decode_address(heirs[1])
+        assert box[32:40] == (30).to_bytes(8, "big")
+
+    def test_status_word_packs_flags_and_counters(self, will):
+        client, _, _ = will
+        state = client.get_global_state()
+        assert "will_created" not in state and "heir_count" not in state
+        assert state["status"] == 1 | 100 << 8 | 3 << 16
+        client.call("force_activate")
+        assert decode_status(client.get_global_state()["status"]) == {
+            "will_created": 1, "inheritance_active": 1, "percent_total": 100, "heir_count": 3,
+        }
+
+    def test_asa_lock_and_claim(self, ledger, will):
+        client, owner, heirs = will
+        asset_id = ledger.send(AssetCreate(sender=owner, total=1000, unit_name="NFT"))[0].asset_index
+        for heir in heirs:
+            ledger.send(AssetTransfer(sender=heir, receiver=heir, asset_id=asset_id, amount=0))
+
+        client.call("opt_in_asa", asset=asset_id, fee=2000)
+        assert ledger.asset_balance(client.app_address, asset_id) == 0
+        client.call(
+            "lock_asa", transfer=client.asset_transfer(owner, asset_id, 600),
+            allocations=[(1, 300), (2, 200), (3, 100)], boxes=BOXES,
+        )
+        ledger.advance(61)
+        client.call("activate_inheritance")
+
+        heir = client.prepare(sender=heirs[1])
+        # Inner axfers need the asset in the outer call's foreign-asset array
+        refs = {"foreign_assets": [asset_id], "boxes": BOXES[1:2], "fee": 2000}
+        assert heir.call("claim_asa", beneficiary_slot=2, **refs).return_value == 200
+        assert ledger.asset_balance(heirs[1], asset_id) == 200
+        assert ledger.asset_balance(client.app_address, asset_id) == 400
+        with pytest.raises(LogicError, match="Already claimed"):
+            heir.call("claim_asa", beneficiary_slot=2, **refs)
+
+    def test_claim_cost_is_flat_in_heir_count(self, ledger, will):
+        client, _, heirs = will
+        client.call("force_activate")
+        small = client.prepare(sender=heirs[2]).call(
+            "claim", beneficiary_slot=3, boxes=BOXES[2:], fee=2000,
+        ).cost
+
+        big, big_heirs = _will_with_heirs(ledger, 20)
+        assert decode_status(big.get_global_state()["status"])["heir_count"] == 20
+        large = big.prepare(sender=big_heirs[19]).call(
+            "claim", beneficiary_slot=20, boxes=[(0, heir_box_name(20))], fee=2000,
+        ).cost
+        assert large == small
+
+    def test_add_heirs_cannot_exceed_100_percent(self, ledger, will):
+        client, _, _ = will
+        stranger = ledger.new_account(1_000_000)
+        with pytest.raises(LogicError, match="sum to 100"):
+            client.call("add_heirs", heirs=[(stranger, 1)], boxes=[(0, heir_box_name(4))])
+
+    def test_claim_all_groups_algo_and_asa_payouts(self, ledger, will):
+        client, owner, heirs = will
+        asset_id = ledger.send(AssetCreate(sender=owner, total=1000, unit_name="NFT"))[0].asset_index
+        for heir in heirs[:2]:                      # heir 3 never opts in
+            ledger.send(AssetTransfer(sender=heir, receiver=heir, asset_id=asset_id, amount=0))
+        client.call("opt_in_asa", asset=asset_id, fee=2000)
+        client.call(
+            "lock_asa", transfer=client.asset_transfer(owner, asset_id, 600),
+            allocations=[(1, 300), (2, 200), (3, 100)], boxes=BOXES,
+        )
+        client.call("force_activate")
+
+        caller = client.prepare(sender=ledger.new_account(1_000_000))
+        result = caller.call(
+            "claim_all", accounts=heirs, foreign_assets=[asset_id], boxes=BOXES, fee=1000 * 6,
+        )
+        assert result.return_value == 3_000_000
+        assert len(result.tx_info.inner_txns) == 5           # 3 payments + 2 asset transfers
+        assert [ledger.asset_balance(h, asset_id) for h in heirs] == [300, 200, None]
+        # The skipped allocation is still claimable once heir 3 opts in
+        ledger.send(AssetTransfer(sender=heirs[2], receiver=heirs[2], asset_id=asset_id, amount=0))
+        client.prepare(sender=heirs[2]).call(
+            "claim_asa", beneficiary_slot=3, foreign_assets=[asset_id], boxes=BOXES[2:], fee=2000,
+        )
+        assert ledger.asset_balance(heirs[2], asset_id) == 100
+
+    def test_claim_everything_pays_algo_and_asa_together(self, ledger, will):
+        client, owner, heirs = will
+        asset_id = ledger.send(AssetCreate(sender=owner, total=1000, unit_name="NFT"))[0].asset_index
+        ledger.send(AssetTransfer(sender=heirs[0], receiver=heirs[0], asset_id=asset_id, amount=0))
+        client.call("opt_in_asa", asset=asset_id, fee=2000)
+        client.call(
+            "lock_asa", transfer=client.asset_transfer(owner, asset_id, 300),
+            allocations=[(1, 300)], boxes=BOXES[:1],
+        )
+        client.call("force_activate")
+
+        heir   = client.prepare(sender=heirs[0])
+        before = ledger.balance(heirs[0])
+        result = heir.call(
+            "claim_everything", beneficiary_slot=1, foreign_assets=[asset_id],
+            boxes=BOXES[:1], fee=3000,
+        )
+        assert result.return_value == [1_500_000, 300]
+        assert len(result.tx_info.inner_txns) == 2
+        assert ledger.balance(heirs[0]) == before - 3000 + 1_500_000
+        assert ledger.asset_balance(heirs[0], asset_id) == 300
+        with pytest.raises(LogicError, match="Nothing left to claim"):
+            heir.call("claim_everything", beneficiary_slot=1, foreign_assets=[asset_id],
+                      boxes=BOXES[:1], fee=3000)
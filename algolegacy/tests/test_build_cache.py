@@ -0,0 +1,87 @@
+"""
+Build cache — reuse of contract build outputs
+==============================================
+Checks contracts/build_cache.py against a scratch artifacts directory: a
+warm build is served from disk, and any change to the key inputs rebuilds.
+scripts/compile.py on a warm cache imports neither beaker nor PyTEAL.
+
+Run:
+    pytest tests/test_build_cache.py -v
+"""
+
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+from contracts import build_cache
+
+
+@pytest.fixture
+def artifacts(tmp_path, monkeypatch):
+    monkeypatch.setattr(build_cache, "ARTIFACTS", tmp_path)
+    return tmp_path
+
+
+class TestBuildCache:
+    def test_warm_build_is_served_from_disk(self, artifacts):
+        built, hit = build_cache.build("AlgoLegacy")
+        assert not hit
+        assert (artifacts / "AlgoLegacy.approval.teal").read_text() == built.approval_program
+        cached, hit = build_cache.build("AlgoLegacy")
+        assert hit
+        assert cached.approval_program == built.approval_program
+        assert cached.contract.dictify() == built.contract.dictify()
+
+    def test_key_covers_options_and_sources(self, artifacts, monkeypatch):
+        build_cache.build("AlgoLegacy")
+        assert build_cache.is_current("AlgoLegacy")
+        assert not build_cache.is_current("AlgoLegacy", {"profile": "optimised"})
+        assert build_cache.build_key("AlgoLegacy") != build_cache.build_key("AlgoLegacyRegistry")
+
+        source_dir = artifacts / "src"
+        source_dir.mkdir()
+        (source_dir / "algolegacy.py").write_text("# edited\n")
+        monkeypatch.setattr(build_cache, "CONTRACTS", source_dir)
+        assert not build_cache.is_current("AlgoLegacy")
+
+    def test_options_name_their_own_artifacts(self, artifacts):
+        assert build_cache.artifact_name("AlgoLegacy", {"profile": "default"}) == "AlgoLegacy"
+        assert build_cache.artifact_name("AlgoLegacy", {"profile": "optimised"}) == "AlgoLegacy-profile-optimised"
+        assert build_cache.build_key("AlgoLegacy", {"profile": "default"}) == build_cache.build_key("AlgoLegacy")
+        with pytest.raises(ValueError):
+            build_cache.build("AlgoLegacy", {"profile": "fastest"})
+        with pytest.raises(ValueError):
+            build_cache.build("AlgoLegacy", {"inline": True})
+
+    def test_bytecode_is_compiled_once_per_teal(self, artifacts):
+        calls = []
+
+        def compile_teal(teal: str) -> bytes:
+            calls.append(teal)
+            return teal.encode()[::-1]
+
+        first = build_cache.compiled("AlgoLegacy", "clear", "#pragma version 8\nint 1", compile_teal)
+        again = build_cache.compiled("AlgoLegacy", "clear", "#pragma version 8\nint 1", compile_teal)
+        assert first == again and len(calls) == 1
+        build_cache.compiled("AlgoLegacy", "clear", "#pragma version 8\nint 0", compile_teal)
+        assert len(calls) == 2
+
+    def test_frontend_serves_the_current_build(self):
+        """deployWillApp deploys frontend/public's TEAL; scripts/compile.py keeps it current."""
+        spec, _ = build_cache.build("AlgoLegacy")
+        public  = pathlib.Path(__file__).parent.parent / "frontend" / "public"
+        assert (public / "AlgoLegacy.approval.teal").read_text() == spec.approval_program
+        assert (public / "AlgoLegacy.clear.teal").read_text() == spec.clear_program
+
+    def test_warm_compile_script_skips_pyteal(self):
+        root   = pathlib.Path(__file__).parent.parent
+        script = (
+            "import runpy, sys; runpy.run_path('scripts/compile.py', run_name='__main__'); "
+            "sys.exit(' '.join(m for m in ('beaker', 'pyteal') if m in sys.modules) or None)"
+        )
+        subprocess.run([sys.executable, "scripts/compile.py"], cwd=root, check=True, capture_output=True)
+        warm = subprocess.run([sys.executable, "-c", script], cwd=root, capture_output=True, text=True)
+        assert warm.returncode == 0, warm.stderr
+        assert warm.stdout.index("Artifacts written") > warm.stdout.rindex("Methods")
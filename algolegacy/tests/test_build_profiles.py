@@ -0,0 +1,224 @@
+"""
+Build profiles — the optimised build behaves exactly like the default one
+==========================================================================
+Differential test of build("AlgoLegacy", {"profile": "optimised"}): the
+same random call sequences (right and wrong senders, slots, amounts and
+clock jumps, through every lifecycle state) are run against a will on
+each build, on two ledgers kept in lockstep.  After every step the two
+must agree on the return value, logs, inner transactions or rejection,
+and on every balance, global and box.  Only opcode costs may differ.
+The beneficiary-count variants ({"max_beneficiaries": N}) get the same
+treatment with a bound the sequences stay under, and must refuse heirs
+past it.
+
+The first run builds each variant in a subprocess, a few seconds apiece.
+
+Run:
+    pytest tests/test_build_profiles.py -v
+"""
+
+import random
+
+import pytest
+from algosdk import encoding
+
+from avm import AppClient, AssetCreate, AssetTransfer, Ledger, LedgerError
+from contracts.algolegacy import ERR_TOO_MANY_HEIRS, GLOBAL_NUM_BYTE_SLICES, GLOBAL_NUM_UINTS, HEIR_BOX_MBR, heir_box_name
+from contracts.build_cache import build, smallest_variant
+from tests.standin import SPEC
+
+SLOTS = 6                                          # box references: at most 8 per call
+BOXES = [(0, heir_box_name(slot)) for slot in range(1, SLOTS + 1)]
+STEPS = 80
+METHODS = [
+    "create_will", "add_heirs", "deposit", "check_in", "opt_in_asa", "lock_asa", "activate_inheritance",
+    "force_activate", "revoke_will", "claim", "claim_asa", "claim_everything", "claim_all",
+    "get_will_status", "get_time_remaining", "get_locked_balance", "get_will_snapshot",
+]
+# What is mostly tried in each phase (anything else, a quarter of the time), so sequences get to payouts
+LIKELY = {
+    "NO_WILL": ["create_will"],
+    "ALIVE":   ["add_heirs", "deposit", "deposit", "deposit", "check_in", "opt_in_asa", "opt_in_asa",
+                "lock_asa", "lock_asa", "lock_asa", "heir_opt_in", "heir_opt_in", "advance",
+                "get_time_remaining"],                                 # activation: the random quarter
+    "ACTIVE":  ["claim", "claim", "claim", "claim_asa", "claim_asa", "claim_everything", "claim_everything",
+                "claim_all", "heir_opt_in", "get_locked_balance"],
+}
+
+
+@pytest.fixture(scope="module")
+def optimised():
+    spec, _ = build("AlgoLegacy", {"profile": "optimised"})
+    assert spec.approval_program != SPEC.approval_program
+    return spec
+
+
+@pytest.fixture(scope="module")
+def bounded():
+    spec, _ = build("AlgoLegacy", {"max_beneficiaries": 8})     # sequences append at most SLOTS heirs
+    assert spec.approval_program != SPEC.approval_program
+    return spec
+
+
+class Twins:
+    """One will per build, on two ledgers that receive the same transactions."""
+
+    def __init__(self, specs):
+        self.ledgers = [Ledger(timestamp=1_700_000_000) for _ in specs]
+        first        = self.ledgers[0]
+        self.owner   = first.new_account()
+        self.heirs   = [first.new_account() for _ in range(3)]
+        self.people  = [self.owner, *self.heirs, first.new_account()]
+        for ledger in self.ledgers:
+            for person in self.people:
+                ledger.fund(person, 100_000_000)
+        self.clients = [AppClient(ledger, spec, sender=self.owner) for ledger, spec in zip(self.ledgers, specs)]
+        for ledger, client in zip(self.ledgers, self.clients):
+            client.create(global_schema=(GLOBAL_NUM_UINTS, GLOBAL_NUM_BYTE_SLICES), extra_pages=1)
+            ledger.fund(client.app_address, 1_000_000 + HEIR_BOX_MBR * SLOTS)
+        self.asset_id = self.send(lambda ledger: AssetCreate(sender=self.owner, total=10_000, unit_name="NFT"))
+        self.outcomes: list[tuple[str, object]] = []
+
+    def send(self, txn):
+        ids = {ledger.send(txn(ledger))[0].asset_index for ledger in self.ledgers}
+        assert len(ids) == 1
+        return ids.pop()
+
+    def call(self, method: str, sender: str, **kwargs) -> None:
+        """Make the call on both wills; `kwargs` values may be functions of the client."""
+        outcomes = []
+        for client in self.clients:
+            args = {key: value(client) if callable(value) else value for key, value in kwargs.items()}
+            try:
+                result = client.call(method, sender=sender, **args)
+            except LedgerError as error:
+                outcomes.append(("rejected", getattr(error, "message", str(error)), getattr(error, "source", "")))
+            else:
+                info = result.tx_info
+                outcomes.append((result.return_value, info.logs, [inner.txn for inner in info.inner_txns]))
+        assert outcomes[0] == outcomes[1], method
+        self.outcomes.append((method, outcomes[0]))
+        assert self.state(0) == self.state(1), method
+
+    def holder(self, slot: int) -> str | None:
+        """The address in heir box `slot`, if there is one."""
+        box = self.ledgers[0].apps[self.clients[0].app_id].boxes.get(heir_box_name(slot))
+        return encoding.encode_address(box[:32]) if box else None
+
+    @property
+    def phase(self) -> str:
+        status = self.ledgers[0].apps[self.clients[0].app_id].global_state.get(b"status", 0)
+        return "ACTIVE" if status & 2 else "ALIVE" if status & 1 else "NO_WILL"
+
+    def state(self, i: int) -> tuple:
+        ledger, client = self.ledgers[i], self.clients[i]
+        app = ledger.apps[client.app_id]
+        return (
+            {address: (account.balance, account.assets) for address, account in ledger.accounts.items()},
+            app.global_state, app.boxes, ledger.round, ledger.timestamp,
+        )
+
+
+def shares(rng: random.Random, heirs: list[str], total: int) -> list[tuple[str, int]]:
+    """One or two heirs splitting `total` percent; now and then, any percentages at all."""
+    chosen = rng.sample(heirs, rng.randint(1, 2))
+    if rng.random() < 0.1:
+        return [(heir, rng.randint(0, 80)) for heir in chosen]
+    cut = rng.randint(1, total - 1)
+    return list(zip(chosen, [cut, total - cut] if len(chosen) == 2 else [total]))
+
+
+def random_step(will: Twins, rng: random.Random) -> None:
+    owner, heirs, asset = will.owner, will.heirs, will.asset_id
+    anyone = rng.choice(will.people)
+    sender = owner if rng.random() < 0.85 else anyone
+    slot   = rng.choice([0, 1, 1, 2, 2, 3])
+    heir   = will.holder(slot) if rng.random() < 0.8 else anyone
+    action = rng.choice(METHODS + ["advance", "heir_opt_in"] if rng.random() < 0.25 else LIKELY[will.phase])
+    if action == "create_will":
+        will.call(action, sender, period=rng.choice([60, 3600]), heirs=shares(rng, heirs, rng.choice([100, 100, 100, 60])),
+                  boxes=BOXES)
+    elif action == "add_heirs":
+        will.call(action, sender, heirs=shares(rng, heirs, 40), boxes=BOXES)
+    elif action == "deposit":
+        amount = rng.choice([500_000, 1_000_000, 3_333_333])
+        will.call(action, sender, payment=lambda client: client.pay(sender, amount))
+    elif action == "opt_in_asa":
+        will.call(action, sender, asset=asset, fee=2000)
+    elif action == "lock_asa":
+        allocations = [(rng.randint(1, 2), rng.randint(1, 50)) for _ in range(rng.randint(1, 3))]
+        units       = sum(units for _, units in allocations) + (rng.random() < 0.1)
+        will.call(action, sender, transfer=lambda client: client.asset_transfer(sender, asset, units),
+                  allocations=allocations, boxes=BOXES)
+    elif action == "revoke_will":
+        will.call(action, sender, fee=5000, foreign_assets=[asset])
+    elif action in ("claim", "claim_asa", "claim_everything"):
+        will.call(action, heir, beneficiary_slot=slot, boxes=BOXES, foreign_assets=[asset], fee=3000)
+    elif action == "claim_all":
+        will.call(action, anyone, accounts=heirs, foreign_assets=[asset], boxes=BOXES[:4], fee=7000)
+    elif action == "get_will_snapshot":
+        will.call(action, sender, boxes=BOXES)
+    elif action == "advance":
+        seconds = rng.choice([10, 61, 4000])
+        for ledger in will.ledgers:
+            ledger.advance(seconds)
+    elif action == "heir_opt_in":
+        who = rng.choice(heirs)
+        for ledger in will.ledgers:
+            if ledger.asset_balance(who, asset) is None:
+                ledger.send(AssetTransfer(sender=who, receiver=who, asset_id=asset, amount=0))
+    else:
+        will.call(action, sender)
+
+
+class TestBuildProfiles:
+    @pytest.mark.parametrize("seed", range(16))
+    def test_random_call_sequences_agree(self, optimised, seed):
+        rng  = random.Random(seed)
+        will = Twins([SPEC, optimised])
+        for _ in range(STEPS):
+            random_step(will, rng)
+
+    def test_sequences_reach_the_optimised_paths(self, optimised):
+        paid = set()
+        for seed in range(16):
+            rng  = random.Random(seed)
+            will = Twins([SPEC, optimised])
+            for _ in range(STEPS):
+                random_step(will, rng)
+            paid |= {method for method, outcome in will.outcomes if outcome[0] != "rejected" and outcome[2]}
+        assert {"claim", "claim_all", "claim_everything"} <= paid
+
+    def test_optimised_claims_cost_less(self, optimised):
+        from benchmarks.bench_methods import measure
+
+        default, fast = measure(SPEC)["methods"], measure(optimised)["methods"]
+        assert all(fast[key] <= cost for key, cost in default.items() if key.startswith(("claim@", "claim_all@")))
+        assert fast["claim_all@INHERITANCE_ACTIVE"] < default["claim_all@INHERITANCE_ACTIVE"]
+
+
+class TestBeneficiaryVariants:
+    @pytest.mark.parametrize("seed", range(8))
+    def test_random_call_sequences_agree(self, bounded, seed):
+        rng  = random.Random(seed)
+        will = Twins([SPEC, bounded])
+        for _ in range(STEPS):
+            random_step(will, rng)
+
+    def test_heirs_past_the_bound_are_refused(self):
+        spec, _ = build("AlgoLegacy", {"max_beneficiaries": 2})
+        will    = Twins([spec, spec])
+        appended, created = will.clients
+        first, second, third = will.heirs
+        appended.call("create_will", period=3600, heirs=[(first, 50), (second, 30)], boxes=BOXES)
+        with pytest.raises(LedgerError, match=ERR_TOO_MANY_HEIRS):
+            appended.call("add_heirs", heirs=[(third, 20)], boxes=BOXES)
+        with pytest.raises(LedgerError, match=ERR_TOO_MANY_HEIRS):
+            created.call("create_will", period=3600, heirs=[(first, 40), (second, 30), (third, 30)], boxes=BOXES)
+
+    def test_smallest_variant_fits_the_heirs(self):
+        bounds = {heirs: smallest_variant("AlgoLegacy", heirs)["max_beneficiaries"] for heirs in (1, 2, 3, 8, 9)}
+        assert bounds == {1: 1, 2: 2, 3: 4, 8: 8, 9: None}
+        assert smallest_variant("AlgoLegacy", 3, {"profile": "optimised"}) == {
+            "profile": "optimised", "max_beneficiaries": 4,
+        }
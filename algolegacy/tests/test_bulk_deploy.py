@@ -0,0 +1,149 @@
+"""
+Bulk deployment — many wills from one manifest
+===============================================
+Runs client/bulk.py end to end against `avm.algod.AlgodStandIn`: real
+algosdk transactions, signed and grouped as on a live network, evaluated
+by the in-process AVM.
+
+Run:
+    pytest tests/test_bulk_deploy.py -v
+"""
+
+import json
+
+import pytest
+from algosdk import account, encoding
+from algosdk.transaction import StateSchema
+
+from client.bulk import BulkDeployer, WillOrder, load_manifest
+from contracts.algolegacy import GLOBAL_NUM_BYTE_SLICES, GLOBAL_NUM_UINTS, decode_status, heir_box_name
+from contracts.build_cache import build, compiled
+
+SPEC = build("AlgoLegacy")[0]
+
+
+def keypair() -> tuple[str, str]:
+    return account.generate_account()
+
+
+def deployer_for(algod, key: str) -> BulkDeployer:
+    return BulkDeployer(
+        algod, key, SPEC,
+        compiled("AlgoLegacy", "approval", SPEC.approval_program),
+        compiled("AlgoLegacy", "clear", SPEC.clear_program),
+        global_schema=StateSchema(GLOBAL_NUM_UINTS, GLOBAL_NUM_BYTE_SLICES),
+        extra_pages=1,
+    )
+
+
+class _Patched:
+    """`algod` with some of its methods replaced."""
+
+    def __init__(self, algod, **methods):
+        self.algod, self.methods = algod, methods
+
+    def __getattr__(self, name):
+        return self.methods.get(name) or getattr(self.algod, name)
+
+
+class TestBulkDeploy:
+    def test_wills_are_created_funded_and_deposited(self, chain):
+        ledger, algod, node = chain
+        deployer_key, deployer = keypair()
+        ledger.fund(deployer, 100_000_000)
+        owners = [keypair() for _ in range(20)]
+        for _, addr in owners:
+            ledger.fund(addr, 10_000_000)
+        heirs = [keypair()[1] for _ in range(3)]
+        orders = [
+            WillOrder(key, period=3600, heirs=[(heirs[0], 50), (heirs[1], 30), (heirs[2], 20)],
+                      deposit=2_000_000)
+            for key, _ in owners
+        ]
+
+        bulk    = deployer_for(algod, deployer_key)
+        results = bulk.deploy(orders)
+
+        assert [r["status"] for r in results] == ["ok"] * 20
+        # 20 creations → 2 groups; 4 setup txns per will → 4 wills per group → 5 groups
+        assert bulk.groups == node.submitted == 2 + 5
+        for (_, owner), result in zip(owners, results):
+            app = ledger.apps[result["app_id"]]
+            status = decode_status(app.global_state[b"status"])
+            assert encoding.encode_address(app.global_state[b"owner"]) == owner
+            assert (status["heir_count"], status["percent_total"]) == (3, 100)
+            assert app.global_state[b"total_locked"] == 2_000_000
+            assert heir_box_name(3) in app.boxes
+
+    def test_failed_group_is_reported_not_fatal(self, chain):
+        ledger, algod, _ = chain
+        deployer_key, deployer = keypair()
+        ledger.fund(deployer, 100_000_000)
+        rich, poor = keypair(), keypair()
+        ledger.fund(rich[1], 10_000_000)
+        ledger.fund(poor[1], 1_000_000)        # pays for the app, not a 1 ALGO deposit
+        heir = keypair()[1]
+        orders = [WillOrder(k, period=3600, heirs=[(heir, 100)], deposit=1_000_000) for k, _ in (poor, rich)]
+        orders[1].deposit = 0
+
+        results = deployer_for(algod, deployer_key).deploy(orders)
+        assert results[0]["status"] == "failed" and results[0]["error"].startswith("setup:")
+        assert results[0]["app_id"]            # created; only its setup group was rejected
+        assert results[1]["status"] == "ok"
+
+    def test_network_error_fails_the_group_not_the_run(self, chain):
+        ledger, algod, _ = chain
+        deployer_key, deployer = keypair()
+        ledger.fund(deployer, 100_000_000)
+        owner = keypair()
+        ledger.fund(owner[1], 10_000_000)
+        orders = [WillOrder(owner[0], period=3600 + i, heirs=[(keypair()[1], 100)]) for i in range(2)]
+        bulk   = deployer_for(algod, deployer_key)
+        sends  = bulk.algod.send_transactions
+
+        def send(signed, **kwargs):                  # the setup group's connection drops
+            if signed[0].transaction.type == "pay":
+                raise TimeoutError("timed out")
+            return sends(signed, **kwargs)
+        bulk.algod = _Patched(algod, send_transactions=send)
+
+        results = bulk.deploy(orders)
+        assert [r["status"] for r in results] == ["failed"] * 2
+        assert all(r["app_id"] and r["error"] == "setup: timed out" for r in results)
+
+    def test_oversized_will_fails_alone(self, chain):
+        ledger, algod, _ = chain
+        deployer_key, deployer = keypair()
+        ledger.fund(deployer, 100_000_000)
+        owner = keypair()
+        ledger.fund(owner[1], 10_000_000)
+        many  = [(keypair()[1], 1 if i < 100 else 0) for i in range(121)]   # 1 + 16 add_heirs calls
+        orders = [WillOrder(owner[0], period=3600, heirs=many),
+                  WillOrder(owner[0], period=7200, heirs=[(keypair()[1], 100)])]
+
+        results = deployer_for(algod, deployer_key).deploy(orders)
+        assert results[0]["status"] == "failed" and results[0]["app_id"] is None
+        assert results[0]["error"] == "invalid: will 0: 121 beneficiaries need 17 setup transactions, more than one group of 16"
+        assert results[1]["status"] == "ok"
+
+    def test_manifest_formats(self, tmp_path):
+        heir_a, heir_b = keypair()[1], keypair()[1]
+        key = keypair()[0]
+        (tmp_path / "wills.csv").write_text(
+            "owner,period,beneficiaries,deposit\n"
+            f",3600,{heir_a}:60;{heir_b}:40,1000000\n"
+        )
+        (tmp_path / "wills.json").write_text(json.dumps([{
+            "period": 3600, "deposit": 1_000_000,
+            "beneficiaries": [{"address": heir_a, "percent": 60}, {"address": heir_b, "percent": 40}],
+        }]))
+        from_csv  = load_manifest(tmp_path / "wills.csv", lambda label: key)
+        from_json = load_manifest(tmp_path / "wills.json", lambda label: key)
+        assert from_csv == from_json
+        assert from_csv[0].heirs == [(heir_a, 60), (heir_b, 40)]
+
+        (tmp_path / "bad.json").write_text(json.dumps([
+            {"period": 3600, "deposit": 1_000_000, "beneficiaries": [{"address": heir_a, "percent": 60}]},
+        ]))
+        with pytest.raises(ValueError, match="entry 1: a deposit needs percentages adding up to 100"):
+            load_manifest(tmp_path / "bad.json", lambda label: key)
@@ -0,0 +1,188 @@
+"""
+Check-in scheduler — one owner, many wills
+===========================================
+Runs client/checkin.py against `avm.algod.AlgodStandIn`: an owner's wills
+are deployed with client/bulk.py, chain time is moved with
+`ledger.advance`, and check-ins go out in shared atomic groups.
+
+Run:
+    pytest tests/test_checkin.py -v
+"""
+
+import threading
+import time
+
+import pytest
+from algosdk import account
+from algosdk.error import AlgodHTTPError
+
+from client import checkin
+from client.checkin import DAY, RETRY, CheckInScheduler
+from tests.standin import (
+    SPEC, Offline, Rejecting, RejectingUnavailable, call, deploy_wills, is_active, tick,
+)
+
+
+class TestCheckInScheduler:
+    def test_due_wills_share_groups(self, chain):
+        ledger, algod, node = chain
+        owner_key = account.generate_account()[0]
+        wills = deploy_wills(ledger, algod, [10 * DAY] * 18 + [10 * DAY + DAY // 2] * 2 + [20 * DAY], owner_key)
+        app_ids = [app_id for app_id, _ in wills]
+        scheduler = CheckInScheduler(algod, owner_key, SPEC.contract, margin=DAY)
+        scheduler.load(app_ids)
+        start = scheduler.last_checkin[app_ids[0]]
+        assert scheduler.next_check_in() == start + 9 * DAY
+
+        ledger.advance(9 * DAY - 10)
+        tick(ledger, algod)
+        assert scheduler.due(scheduler.chain_time()) == []
+
+        ledger.advance(20)
+        tick(ledger, algod)
+        due = scheduler.due(scheduler.chain_time())
+        assert set(due) == set(app_ids[:20])                 # 10.5-day wills pulled forward, not the 20-day one
+
+        before = node.submitted
+        assert sorted(scheduler.check_in(due)) == sorted(due)
+        assert node.submitted - before == 2                  # 16 + 4 calls
+        for app_id in due:
+            assert ledger.apps[app_id].global_state[b"last_checkin"] >= scheduler.last_checkin[app_id] > start
+        assert scheduler.next_check_in() == scheduler.last_checkin[app_ids[0]] + 9 * DAY
+
+    def test_short_periods_get_half_the_period(self, chain):
+        ledger, algod, _ = chain
+        owner_key = account.generate_account()[0]
+        (app_id, _), = deploy_wills(ledger, algod, [60], owner_key)
+        scheduler = CheckInScheduler(algod, owner_key, SPEC.contract)
+        scheduler.load([app_id])
+        assert scheduler.safe_time(app_id) == scheduler.last_checkin[app_id] + 30
+
+    def test_only_live_wills_of_the_owner_are_scheduled(self, chain):
+        ledger, algod, _ = chain
+        owner_key = account.generate_account()[0]
+        (mine, _), (active, _) = deploy_wills(ledger, algod, [3600, 3600], owner_key)
+        (theirs, _), = deploy_wills(ledger, algod, [3600])
+        call(algod, active, owner_key, "force_activate")
+
+        scheduler = CheckInScheduler(algod, owner_key, SPEC.contract)
+        scheduler.load([mine, active, theirs, 999_999])
+        assert list(scheduler.periods) == [mine]
+        assert scheduler.skipped == {
+            active:  "inheritance already active",
+            theirs:  "not owned by this account",
+            999_999: "application not found",
+        }
+
+    def test_rejected_will_falls_out_of_the_group(self, chain):
+        ledger, algod, _ = chain
+        owner_key = account.generate_account()[0]
+        wills = [app_id for app_id, _ in deploy_wills(ledger, algod, [60] * 3, owner_key)]
+        scheduler = CheckInScheduler(algod, owner_key, SPEC.contract)
+        scheduler.load(wills)
+        call(algod, wills[1], owner_key, "force_activate")   # after the scheduler read it
+
+        assert sorted(scheduler.check_in(wills)) == [wills[0], wills[2]]
+        assert wills[1] in scheduler.failed
+        assert scheduler.skipped[wills[1]] == "inheritance already active"
+        assert is_active(ledger, wills[1])
+
+    def test_failing_check_in_backs_off(self, chain):
+        ledger, algod, _ = chain
+        owner_key = account.generate_account()[0]
+        (app_id, _), = deploy_wills(ledger, algod, [DAY], owner_key)
+        failing   = Rejecting(algod)
+        scheduler = CheckInScheduler(failing, owner_key, SPEC.contract)
+        scheduler.load([app_id])
+        ledger.advance(scheduler.safe_time(app_id) - ledger.timestamp)
+
+        delays = []
+        while len(delays) < 12:
+            tick(ledger, algod)
+            now = scheduler.chain_time()
+            assert scheduler.due(now) == [app_id]
+            assert scheduler.check_in([app_id]) == []
+            delays.append(scheduler.retry_at[app_id] - now)
+            assert scheduler.due(now) == [] and scheduler.next_check_in() == scheduler.retry_at[app_id]
+            ledger.advance(delays[-1])
+        assert delays == [min(RETRY * 2**n, DAY // 2) for n in range(12)]     # capped at the safe window
+        assert app_id in scheduler.periods and app_id in scheduler.failed
+
+        failing.reject = False
+        tick(ledger, algod)
+        assert scheduler.check_in(scheduler.due(scheduler.chain_time())) == [app_id]
+        assert app_id not in scheduler.retry_at and app_id not in scheduler.failed
+
+    def test_failed_re_read_keeps_the_will_scheduled(self, chain):
+        ledger, algod, _ = chain
+        owner_key = account.generate_account()[0]
+        (app_id, _), = deploy_wills(ledger, algod, [DAY], owner_key)
+        failing   = RejectingUnavailable(algod)
+        scheduler = CheckInScheduler(failing, owner_key, SPEC.contract)
+        scheduler.load([app_id])
+        ledger.advance(scheduler.safe_time(app_id) - ledger.timestamp)
+        tick(ledger, algod)
+
+        failing.down = True
+        now = scheduler.chain_time()
+        assert scheduler.check_in(scheduler.due(now)) == []
+        assert app_id in scheduler.periods and app_id not in scheduler.skipped
+        assert scheduler.retry_at[app_id] == now + RETRY and "re-read failed" in scheduler.failed[app_id]
+        with pytest.raises(AlgodHTTPError):
+            scheduler.load([app_id])
+        assert app_id in scheduler.periods
+
+        failing.reject = failing.down = False
+        ledger.advance(RETRY)
+        tick(ledger, algod)
+        assert scheduler.check_in(scheduler.due(scheduler.chain_time())) == [app_id]
+
+    def test_run_checks_in_when_due(self, chain):
+        ledger, algod, _ = chain
+        owner_key = account.generate_account()[0]
+        (app_id, _), = deploy_wills(ledger, algod, [60], owner_key)
+        scheduler = CheckInScheduler(algod, owner_key, SPEC.contract)
+        scheduler.load([app_id])
+        first = scheduler.last_checkin[app_id]
+
+        ledger.advance(40)                                   # past the 30 s safe time
+        tick(ledger, algod)
+        checked_in = threading.Event()
+        scheduler.on_checked_in = lambda app_ids: checked_in.set()
+        thread = threading.Thread(target=scheduler.run, daemon=True)
+        thread.start()
+        assert checked_in.wait(5)
+        scheduler.stop()
+        thread.join(timeout=5)
+
+        assert ledger.apps[app_id].global_state[b"last_checkin"] > first
+        assert not is_active(ledger, app_id)
+
+    def test_run_recovers_after_algod_is_down(self, chain, monkeypatch):
+        monkeypatch.setattr(checkin, "RETRY_DELAY", 0.01)
+        ledger, algod, _ = chain
+        owner_key = account.generate_account()[0]
+        (app_id, _), = deploy_wills(ledger, algod, [60], owner_key)
+        offline   = Offline(algod)
+        scheduler = CheckInScheduler(offline, owner_key, SPEC.contract)
+        scheduler.load([app_id])
+        first = scheduler.last_checkin[app_id]
+
+        ledger.advance(40)                                   # past the 30 s safe time
+        tick(ledger, algod)
+        checked_in = threading.Event()
+        scheduler.on_checked_in = lambda app_ids: checked_in.set()
+        offline.down = True
+        thread = threading.Thread(target=scheduler.run, daemon=True)
+        thread.start()
+        for _ in range(200):
+            if scheduler.errors >= 3:
+                break
+            time.sleep(0.01)
+        assert scheduler.errors >= 3 and thread.is_alive()
+
+        offline.down = False
+        assert checked_in.wait(5)
+        scheduler.stop()
+        thread.join(timeout=5)
+        assert ledger.apps[app_id].global_state[b"last_checkin"] > first
@@ -0,0 +1,98 @@
+"""
+Confirmation tracker — many pending txids, one polling loop
+============================================================
+Checks client/confirm.py against `avm.AlgodStandIn` with short blocks.
+
+Run:
+    pytest tests/test_confirm.py -v
+"""
+
+import pytest
+from algosdk import account, transaction
+from algosdk.atomic_transaction_composer import AccountTransactionSigner
+from algosdk.error import ConfirmationTimeoutError
+
+from avm import AlgodStandIn, Ledger
+from client import confirm
+from client.confirm import ConfirmationTracker
+from client.transport import PooledAlgodClient
+from tests.standin import Flaky, FlakyInfo
+
+BLOCK_SECONDS = 0.05
+
+
+@pytest.fixture
+def fast_chain():
+    """(algod client, `payments(n)`): a stand-in closing a block every BLOCK_SECONDS, unlike `chain`."""
+    ledger = Ledger()
+    key, sender = account.generate_account()
+    ledger.fund(sender, 10**12)
+    with AlgodStandIn(ledger, block_time=BLOCK_SECONDS) as node:
+        algod = PooledAlgodClient("", node.url)
+
+        def payments(n: int) -> list:
+            sp   = algod.suggested_params()
+            txns = [transaction.PaymentTxn(sender, sp, sender, i) for i in range(n)]
+            return AccountTransactionSigner(key).sign_transactions(txns, list(range(n)))
+        yield algod, payments
+
+
+class TestConfirmationTracker:
+    def test_many_txids_share_one_loop(self, fast_chain):
+        algod, payments = fast_chain
+        with ConfirmationTracker(algod) as tracker:
+            txids   = [algod.send_transaction(stxn) for stxn in payments(100)]
+            results = tracker.wait(txids)
+        assert all(r["confirmed-round"] > 0 for r in results)
+        assert tracker.polls <= 3                 # rounds waited, not txids
+
+    def test_info_and_late_tracking(self, fast_chain):
+        algod, payments = fast_chain
+        with ConfirmationTracker(algod) as tracker:
+            first, second = (algod.send_transaction(stxn) for stxn in payments(2))
+            confirmed = tracker.track(first).result()["confirmed-round"]
+            # `second` was in the same block, already scanned: served from history
+            info = tracker.track(second, info=True).result(timeout=1)
+        assert info["confirmed-round"] == confirmed and info["pool-error"] == ""
+
+    def test_unknown_txid_times_out(self, fast_chain):
+        algod, _ = fast_chain
+        with ConfirmationTracker(algod) as tracker:
+            future = tracker.track("A" * 52, wait_rounds=2)
+            with pytest.raises(ConfirmationTimeoutError):
+                future.result(timeout=2)
+
+    def test_failed_polls_are_retried(self, fast_chain, monkeypatch):
+        monkeypatch.setattr(confirm, "RETRY_DELAY", 0.01)
+        algod, payments = fast_chain
+        flaky = Flaky(algod, 3, OSError("connection reset"))
+        with ConfirmationTracker(flaky) as tracker:
+            txids   = [algod.send_transaction(stxn) for stxn in payments(5)]
+            results = tracker.wait(txids)
+        assert all(r["confirmed-round"] > 0 for r in results)
+        assert tracker.errors == 3 and tracker._thread.is_alive()
+
+    def test_unreachable_algod_times_out_each_txid(self, fast_chain, monkeypatch):
+        monkeypatch.setattr(confirm, "RETRY_DELAY", 0.01)
+        monkeypatch.setattr(confirm, "ROUND_SECONDS", 0.05)
+        algod, payments = fast_chain
+        flaky = Flaky(algod, 10**6, TimeoutError("timed out"))
+        with ConfirmationTracker(flaky) as tracker:
+            future = tracker.track(algod.send_transaction(payments(1)[0]), wait_rounds=2)
+            with pytest.raises(ConfirmationTimeoutError) as raised:
+                future.result(timeout=5)
+        assert isinstance(raised.value.__cause__, TimeoutError)
+
+    def test_failed_info_lookup_fails_only_its_txid(self, fast_chain):
+        algod, payments = fast_chain
+        flaky = FlakyInfo(algod, 1, OSError("connection reset"))
+        with ConfirmationTracker(flaky) as tracker:
+            first, second = (algod.send_transaction(stxn) for stxn in payments(2))
+            with pytest.raises(OSError):
+                tracker.track(first, info=True).result(timeout=2)
+            assert tracker.track(second, info=True).result(timeout=2)["confirmed-round"] > 0
+            # A lost txid is still timed out when its expiry lookup fails
+            flaky.failures = 1
+            with pytest.raises(ConfirmationTimeoutError):
+                tracker.track("A" * 52, wait_rounds=1).result(timeout=2)
+            assert tracker._thread.is_alive()
@@ -0,0 +1,193 @@
+"""
+Will indexer — SQLite state from a recorded block stream
+=========================================================
+Replays tests/fixtures/will_blocks.msgpack (recorded from the algod
+stand-in by tests/fixtures/record_blocks.py) through client/indexer.py:
+creations, check-ins, activation, claims and a revoke, with no algod.
+
+Run:
+    pytest tests/test_indexer.py -v
+"""
+
+import pathlib
+import threading
+import time
+
+import msgpack
+import pytest
+from algosdk import account, transaction
+from algosdk.atomic_transaction_composer import AccountTransactionSigner
+
+from avm import AlgodStandIn, Ledger
+from avm.assembler import assemble
+from avm.program import Program
+from client import indexer as indexer_module
+from client.indexer import BlockIndexer, WillIndex
+from client.transport import PooledAlgodClient
+from tests.standin import APPROVAL, SPEC, deploy_wills
+
+FIXTURE = msgpack.unpackb(
+    (pathlib.Path(__file__).parent / "fixtures" / "will_blocks.msgpack").read_bytes(), strict_map_key=False,
+)
+ACCOUNTS = FIXTURE["accounts"]
+APPS     = FIXTURE["apps"]
+LAST     = max(FIXTURE["blocks"])
+IMPOSTOR = "#pragma version 8\nbytecblock 0x6f776e6572\nintcblock 1\nbytec_0\ntxn Sender\napp_global_put\nintc_0"
+
+
+class RecordedAlgod:
+    """The three algod calls a BlockIndexer makes, answered from the fixture."""
+
+    def __init__(self, last: int = LAST):
+        self.last    = last
+        self.fetched: list[int] = []
+
+    def status(self) -> dict:
+        return {"last-round": self.last}
+
+    def status_after_block(self, rnd: int) -> dict:
+        return {"last-round": self.last}
+
+    def block_info(self, rnd: int, response_format: str = "json") -> bytes:
+        assert response_format == "msgpack" and rnd <= self.last
+        self.fetched.append(rnd)
+        return FIXTURE["blocks"][rnd]
+
+
+class FlakyAlgod(RecordedAlgod):
+    """RecordedAlgod whose next `failures` block fetches raise OSError."""
+
+    def __init__(self, failures: int):
+        super().__init__()
+        self.failures = failures
+
+    def block_info(self, rnd: int, response_format: str = "json") -> bytes:
+        if self.failures:
+            self.failures -= 1
+            raise OSError("connection reset")
+        return super().block_info(rnd, response_format)
+
+    def status_after_block(self, rnd: int) -> dict:
+        time.sleep(0.01)
+        return super().status_after_block(rnd)
+
+
+@pytest.fixture
+def index():
+    index = WillIndex(":memory:", SPEC.contract, [APPROVAL])
+    BlockIndexer(RecordedAlgod(), index).sync()
+    yield index
+    index.close()
+
+
+class TestWillIndex:
+    def test_wills_by_owner_and_beneficiary(self, index):
+        alpha, beta, gamma = APPS["alpha"], APPS["beta"], APPS["gamma"]
+        assert [w["app_id"] for w in index.wills_for(ACCOUNTS["alice"])] == [alpha, beta]
+        assert [w["app_id"] for w in index.wills_for(ACCOUNTS["heir1"])] == [alpha, beta]
+        assert [w["app_id"] for w in index.wills_for(ACCOUNTS["heir2"])] == [alpha]   # gamma was revoked
+        assert index.wills_for(ACCOUNTS["keeper"]) == []
+
+    def test_global_state_follows_the_deltas(self, index):
+        alpha, beta, gamma = (index.will(APPS[name]) for name in ("alpha", "beta", "gamma"))
+        assert alpha["owner"] == ACCOUNTS["alice"]
+        assert (alpha["heir_count"], alpha["percent_total"], alpha["total_locked"]) == (2, 100, 2_000_000)
+        assert alpha["inheritance_active"] and beta["inheritance_active"]
+        assert alpha["deadline"] == alpha["last_checkin"] + 3600
+        assert beta["last_checkin"] < alpha["last_checkin"]                  # alpha was checked in
+        assert gamma["owner"] is None and not gamma["will_created"] and index.heirs(APPS["gamma"]) == []
+
+    def test_claims_replayed_from_arguments(self, index):
+        heirs = index.heirs(APPS["alpha"])
+        assert [(h["slot"], h["address"], h["percent"], h["claimed"]) for h in heirs] == [
+            (1, ACCOUNTS["heir1"], 60, 1),
+            (2, ACCOUNTS["heir2"], 40, 1),
+        ]
+        assert [h["claimed"] for h in index.heirs(APPS["beta"])] == [1]
+
+    def test_deadlines_in_a_window(self):
+        index = WillIndex(":memory:", SPEC.contract, [APPROVAL])
+        BlockIndexer(RecordedAlgod(), index).sync(until=FIXTURE["rounds"]["check_in"])
+        alpha, beta, gamma = (index.will(APPS[name]) for name in ("alpha", "beta", "gamma"))
+
+        assert [w["app_id"] for w in index.due_between(0, 2**62)] == [beta["app_id"], gamma["app_id"], alpha["app_id"]]
+        assert [w["app_id"] for w in index.due_between(alpha["deadline"], alpha["deadline"] + 1)] == [alpha["app_id"]]
+        assert index.due_between(beta["deadline"] + 1, gamma["deadline"]) == []
+
+    def test_resumes_from_its_checkpoint(self, tmp_path):
+        path = str(tmp_path / "wills.db")
+        first = RecordedAlgod(last=LAST // 2)
+        index = WillIndex(path, SPEC.contract, [APPROVAL])
+        assert BlockIndexer(first, index).sync() == LAST // 2
+        index.close()
+
+        rest  = RecordedAlgod()
+        index = WillIndex(path, SPEC.contract, [APPROVAL])
+        assert BlockIndexer(rest, index).sync() == LAST
+        assert rest.fetched == list(range(LAST // 2 + 1, LAST + 1))         # nothing fetched twice
+
+        whole = WillIndex(":memory:", SPEC.contract, [APPROVAL])
+        BlockIndexer(RecordedAlgod(), whole).sync()
+        dump  = lambda ix: (list(map(tuple, ix.db.execute("SELECT * FROM wills ORDER BY app_id"))),
+                            list(map(tuple, ix.db.execute("SELECT * FROM heirs ORDER BY app_id, slot"))))
+        assert dump(index) == dump(whole)
+
+
+    def test_run_retries_failed_fetches(self, monkeypatch):
+        monkeypatch.setattr(indexer_module, "RETRY_DELAY", 0.01)
+        index   = WillIndex(":memory:", SPEC.contract, [APPROVAL])
+        algod   = FlakyAlgod(failures=3)
+        indexer = BlockIndexer(algod, index)
+        thread  = threading.Thread(target=indexer.run, daemon=True)
+        thread.start()
+        for _ in range(300):
+            if index.round == LAST:
+                break
+            time.sleep(0.01)
+        indexer.stop()
+        thread.join(timeout=5)
+        assert index.round == LAST and indexer.errors == 3
+        assert algod.fetched == list(range(1, LAST + 1))                      # resumed, nothing twice
+
+    def test_follows_the_algod_stand_in(self):
+        ledger = Ledger()
+        with AlgodStandIn(ledger, programs=[SPEC.approval_program, SPEC.clear_program]) as node:
+            algod = PooledAlgodClient("", node.url)
+            owner_key = account.generate_account()[0]
+            wills = [app_id for app_id, _ in deploy_wills(ledger, algod, [60, 3600], owner_key)]
+            index = WillIndex(":memory:", SPEC.contract, [APPROVAL])
+            BlockIndexer(algod, index).sync()
+
+        owner = account.address_from_private_key(owner_key)
+        assert [w["app_id"] for w in index.wills_for(owner)] == wills
+        assert [w["inactivity_period"] for w in index.wills_for(owner)] == [60, 3600]
+        assert index.round == node.last_round()
+
+    def test_only_accepted_programs_are_indexed(self):
+        ledger = Ledger()
+        with AlgodStandIn(ledger, programs=[SPEC.approval_program, SPEC.clear_program, IMPOSTOR]) as node:
+            algod = PooledAlgodClient("", node.url)
+            owner_key = account.generate_account()[0]
+            (will, _), = deploy_wills(ledger, algod, [60], owner_key)
+            key, sender = account.generate_account()
+            ledger.fund(sender, 10_000_000)
+            create_will = SPEC.contract.get_method_by_name("create_will")
+            program = assemble(Program(IMPOSTOR))
+            txn = transaction.ApplicationCreateTxn(
+                sender, algod.suggested_params(), transaction.OnComplete.NoOpOC, program, program,
+                transaction.StateSchema(0, 1), transaction.StateSchema(0, 0),
+                app_args=[create_will.get_selector(), (60).to_bytes(8, "big"), create_will.args[1].type.encode([])],
+            )
+            algod.send_transactions(AccountTransactionSigner(key).sign_transactions([txn], [0]))
+            impostor = max(ledger.apps)                                    # sets `owner`, approves anything
+
+            index = WillIndex(":memory:", SPEC.contract, [APPROVAL])
+            BlockIndexer(algod, index).sync()
+            allowed = WillIndex(":memory:", SPEC.contract, app_ids=[impostor])
+            BlockIndexer(algod, allowed).sync()
+
+        assert index.will(will) is not None and index.accepts(will)
+        assert index.will(impostor) is None and not index.accepts(impostor)
+        assert index.wills_for(sender) == []
+        assert allowed.will(will) is None                                  # its program was not accepted
+        assert allowed.will(impostor)["owner"] == sender
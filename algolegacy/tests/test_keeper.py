@@ -0,0 +1,215 @@
+"""
+Keeper — activating wills as their deadlines pass
+==================================================
+Runs client/keeper.py against `avm.algod.AlgodStandIn`: wills are
+deployed with client/bulk.py, chain time is moved with `ledger.advance`,
+and the keeper is fed the stand-in's blocks one round at a time.
+
+Run:
+    pytest tests/test_keeper.py -v
+"""
+
+import base64
+import threading
+import time
+
+import pytest
+from algosdk import account
+from algosdk.error import AlgodHTTPError
+
+from client import keeper as keeper_module
+from client.keeper import Keeper
+from tests.standin import SPEC, Offline, Unavailable, call, deploy_wills, is_active, tick
+
+CREATE_WILL = SPEC.contract.get_method_by_name("create_will").get_selector()
+
+
+def keeper_for(ledger, algod) -> Keeper:
+    key, addr = account.generate_account()
+    ledger.fund(addr, 10_000_000)
+    return Keeper(algod, key, SPEC.contract)
+
+
+class TestDeadlineHeap:
+    def test_stale_entries_are_skipped(self):
+        keeper = Keeper.__new__(Keeper)
+        keeper.heap, keeper.deadlines, keeper.periods = [], {}, {}
+        keeper.schedule(1, 100, 60)
+        keeper.schedule(2, 100, 90)
+        keeper.schedule(1, 150, 60)            # checked in: (160, 1) is now stale
+        keeper.unschedule(2)
+
+        assert keeper.due(200) == []           # nothing live before 210
+        assert keeper.heap == [(210, 1)]
+        assert keeper.due(211) == [1]
+        assert keeper.next_deadline() is None
+
+    def test_heap_is_compacted(self):
+        keeper = Keeper.__new__(Keeper)
+        keeper.heap, keeper.deadlines, keeper.periods = [], {}, {}
+        for ts in range(3000):
+            keeper.schedule(7, ts, 60)
+        assert len(keeper.heap) <= 2 * len(keeper.deadlines) + 1024
+        assert keeper.due(10**9) == [7]
+
+
+class TestKeeper:
+    def test_activates_due_wills_in_groups(self, chain):
+        ledger, algod, node = chain
+        wills  = deploy_wills(ledger, algod, [60] * 20 + [3600] * 2)
+        keeper = keeper_for(ledger, algod)
+        keeper.track(app_id for app_id, _ in wills)
+        assert len(keeper.deadlines) == 22
+
+        ledger.advance(120)
+        tick(ledger, algod)
+        before = node.submitted
+        done   = keeper.step(node.block(node.last_round())["block"])
+
+        assert sorted(done) == sorted(app_id for app_id, _ in wills[:20])
+        assert node.submitted - before == 2                  # 16 + 4
+        assert all(is_active(ledger, app_id) for app_id in done)
+        assert not is_active(ledger, wills[20][0])
+        assert set(keeper.deadlines) == {app_id for app_id, _ in wills[20:]}
+
+    def test_check_in_moves_the_deadline(self, chain):
+        ledger, algod, node = chain
+        (app_id, owner_key), = deploy_wills(ledger, algod, [60])
+        keeper = keeper_for(ledger, algod)
+        keeper.track([app_id])
+        first = keeper.deadlines[app_id]
+
+        ledger.advance(50)
+        call(algod, app_id, owner_key, "check_in")
+        assert keeper.step(node.block(node.last_round())["block"]) == []
+        assert keeper.deadlines[app_id] == first + 50
+
+        ledger.advance(30)                                   # past the old deadline only
+        assert keeper.activate(keeper.due(ledger.timestamp)) == []
+        assert not is_active(ledger, app_id)
+
+        ledger.advance(60)
+        assert keeper.activate(keeper.due(ledger.timestamp)) == [app_id]
+        assert is_active(ledger, app_id)
+
+    def test_stale_will_falls_back_to_single_calls(self, chain):
+        ledger, algod, node = chain
+        wills  = deploy_wills(ledger, algod, [60] * 3)
+        keeper = keeper_for(ledger, algod)
+        keeper.track(app_id for app_id, _ in wills)
+
+        ledger.advance(120)
+        stale_id, stale_key = wills[1]
+        call(algod, stale_id, stale_key, "check_in")                 # a check-in the keeper has not seen
+        done = keeper.activate(keeper.due(ledger.timestamp))
+
+        assert sorted(done) == sorted([wills[0][0], wills[2][0]])
+        assert stale_id in keeper.failed
+        assert keeper.deadlines[stale_id] == ledger.timestamp + 60   # rescheduled from chain state
+
+    def test_failed_re_read_keeps_the_will_scheduled(self, chain):
+        ledger, algod, node = chain
+        (app_id, owner_key), = deploy_wills(ledger, algod, [60])
+        flaky  = Unavailable(algod)
+        keeper = keeper_for(ledger, flaky)
+        keeper.track([app_id])
+
+        ledger.advance(120)
+        call(algod, app_id, owner_key, "check_in")                   # a check-in the keeper has not seen
+        flaky.down = True
+        assert keeper.activate(keeper.due(ledger.timestamp), ledger.timestamp) == []
+        assert keeper.deadlines == {app_id: ledger.timestamp}        # retried next round, not dropped
+        with pytest.raises(AlgodHTTPError):                          # run() retries the block
+            keeper.observe_block({"ts": ledger.timestamp, "txns": [
+                {"txn": {"type": "appl", "apid": app_id, "apaa": [base64.b64encode(CREATE_WILL).decode()]}},
+            ]})
+        assert app_id in keeper.deadlines
+
+        flaky.down = False
+        assert keeper.activate(keeper.due(ledger.timestamp + 1)) == []
+        assert keeper.deadlines[app_id] == ledger.timestamp + 60     # rescheduled from chain state
+
+    def test_unreadable_will_is_tracked_for_retry(self, chain):
+        ledger, algod, _ = chain
+        (app_id, _), = deploy_wills(ledger, algod, [60])
+        flaky = Unavailable(algod)
+        flaky.down = True
+        keeper = keeper_for(ledger, flaky)
+        keeper.track([app_id])
+        assert keeper.deadlines == {app_id: 0}
+
+        flaky.down = False
+        assert keeper.activate(keeper.due(ledger.timestamp + 1)) == []
+        assert keeper.deadlines[app_id] == ledger.apps[app_id].global_state[b"last_checkin"] + 60
+
+    def test_unsubmitted_wills_go_back_in_the_heap(self, chain):
+        ledger, algod, node = chain
+        wills   = [app_id for app_id, _ in deploy_wills(ledger, algod, [60] * 3)]
+        offline = Offline(algod)
+        keeper  = keeper_for(ledger, offline)
+        keeper.track(wills)
+
+        ledger.advance(120)
+        tick(ledger, algod)
+        block = node.block(node.last_round())["block"]
+        offline.down = True
+        assert keeper.step(block) == []
+        assert sorted(keeper.deadlines) == wills and keeper.next_deadline() == block["ts"]
+        assert not any(is_active(ledger, app_id) for app_id in wills)
+
+        offline.down = False
+        ledger.advance(4)
+        tick(ledger, algod)                                  # the retry round
+        assert sorted(keeper.step(node.block(node.last_round())["block"])) == wills
+        assert keeper.deadlines == {}
+
+    def test_run_backs_off_while_algod_is_down(self, chain, monkeypatch):
+        monkeypatch.setattr(keeper_module, "RETRY_DELAY", 0.01)
+        ledger, algod, _ = chain
+        (app_id, _), = deploy_wills(ledger, algod, [60])
+        offline = Offline(algod)
+        keeper  = keeper_for(ledger, offline)
+        keeper.track([app_id])
+
+        offline.down = True
+        thread = threading.Thread(target=keeper.run, daemon=True)
+        thread.start()
+        for _ in range(200):
+            if keeper.errors >= 3:
+                break
+            time.sleep(0.01)
+        assert keeper.errors >= 3 and thread.is_alive()
+
+        offline.down = False
+        ledger.advance(120)
+        tick(ledger, algod)
+        tick(ledger, algod)
+        for _ in range(300):
+            if keeper.activated:
+                break
+            time.sleep(0.01)
+        keeper.stop()
+        tick(ledger, algod)                                  # wake the status_after_block wait
+        thread.join(timeout=5)
+        assert keeper.activated == [app_id]
+
+    def test_run_follows_the_chain(self, chain):
+        ledger, algod, node = chain
+        (app_id, _), = deploy_wills(ledger, algod, [60])
+        keeper = keeper_for(ledger, algod)
+        keeper.track([app_id])
+
+        thread = threading.Thread(target=keeper.run, daemon=True)
+        thread.start()
+        ledger.advance(120)
+        tick(ledger, algod)
+        for _ in range(200):
+            if keeper.activated:
+                break
+            time.sleep(0.01)
+        keeper.stop()
+        tick(ledger, algod)                                  # wake the status_after_block wait
+        thread.join(timeout=5)
+
+        assert keeper.activated == [app_id]
+        assert is_active(ledger, app_id)
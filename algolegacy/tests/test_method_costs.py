@@ -0,0 +1,43 @@
+"""
+Method costs — opcode and program-size regression gate
+=======================================================
+Measures every AlgoLegacy method in each lifecycle state with
+benchmarks/bench_methods.py and fails if anything grew past the committed
+baseline (benchmarks/baselines/methods.json).  After an intended change:
+
+    python benchmarks/bench_methods.py --update
+
+Run:
+    pytest tests/test_method_costs.py -v
+"""
+
+import pytest
+
+from benchmarks.bench_methods import OPCODE_BUDGET, compare, load_baseline, measure
+from tests.standin import SPEC
+
+
+@pytest.fixture(scope="module")
+def current():
+    return measure(SPEC)
+
+
+class TestMethodCosts:
+    def test_no_regressions_against_the_baseline(self, current):
+        assert compare(current, load_baseline()) == []
+
+    def test_every_abi_method_is_measured(self, current):
+        measured = {key.split("@")[0] for key in current["methods"]}
+        assert measured == {method.name for method in SPEC.contract.methods}
+
+    def test_growth_past_the_tolerance_is_a_regression(self):
+        baseline = {"program": {"approval_bytes": 1000, "extra_pages": 1}, "methods": {"claim@ACTIVE": 100}}
+        current  = {"program": {"approval_bytes": 1015, "extra_pages": 2}, "methods": {"claim@ACTIVE": 103}}
+        assert compare(current, baseline, tolerance=0.02) == [
+            "program.extra_pages: 1 → 2",
+            "methods.claim@ACTIVE: 100 → 103 (+3.0%)",
+        ]
+        assert compare({"program": {}, "methods": {"claim@ACTIVE": OPCODE_BUDGET + 1}}, {}) == [
+            f"methods.claim@ACTIVE: {OPCODE_BUDGET + 1} opcodes is over the {OPCODE_BUDGET} budget of one app call",
+        ]
+        assert compare({"program": {}, "methods": {}}, baseline)[-1] == "methods.claim@ACTIVE: no longer measured (was 100)"
@@ -0,0 +1,65 @@
+"""
+Profiler — opcode cost by contract source line
+===============================================
+Traces the bench_methods.py lifecycle and checks avm/profiler.py charges
+exactly what the interpreter did, to the contract lines that emitted it.
+The first run builds the PyTEAL source map (contracts/sourcemap.py) in a
+subprocess, a few seconds; later runs read it from contracts/artifacts.
+
+Run:
+    pytest tests/test_profile.py -v
+"""
+
+import re
+
+import pytest
+
+from avm import Program
+from avm.profiler import Profile
+from benchmarks.bench_methods import program_metrics, run_lifecycle
+from contracts.sourcemap import ROOT, source_map
+from tests.standin import SPEC
+
+SOURCE = "contracts/algolegacy.py"
+
+
+@pytest.fixture(scope="module")
+def traced():
+    will    = run_lifecycle(SPEC, program_metrics(SPEC)["extra_pages"], trace=True)
+    program = Program(SPEC.approval_program)
+    return will, program, source_map("AlgoLegacy")
+
+
+def line_of(text: str) -> int:
+    lines = (ROOT / SOURCE).read_text().splitlines()
+    return next(n for n, line in enumerate(lines, start=1) if text in line)
+
+
+class TestProfile:
+    def test_profile_adds_up_to_each_calls_cost(self, traced):
+        will, program, lines = traced
+        overall = Profile(program, lines)
+        for key, result in will.results.items():
+            assert Profile(program, lines).add(result.trace, key) == will.costs[key] == result.cost
+            overall.add(result.trace, key)
+        assert overall.total == sum(will.costs.values())
+        assert sum(overall.by_source().values()) == sum(overall.teal.values()) == overall.total
+
+    def test_cost_lands_on_the_contract_line(self, traced):
+        will, program, lines = traced
+        profile = Profile(program, lines)
+        profile.add(will.results["check_in@ALIVE"].trace, "check_in")
+        owner_check = line_of("comment=\"Only owner can check in\"")
+        assert profile.by_source()[SOURCE, owner_check] == 4           # txn Sender; byte "owner"; app_global_get; ==
+        assert f"{owner_check:>5}  " in profile.listing(SOURCE, (ROOT / SOURCE).read_text())
+        mapped = sum(cost for (path, _), cost in profile.by_source().items() if path == SOURCE)
+        assert mapped > profile.total * 0.6
+
+    def test_folded_stacks(self, traced):
+        will, program, lines = traced
+        profile = Profile(program, lines)
+        profile.add(will.results["claim_all@INHERITANCE_ACTIVE"].trace, "claim_all")
+        folded = profile.folded().splitlines()
+        assert all(re.fullmatch(r"claim_all(;[^; ]+)+ \d+", line) for line in folded)
+        assert sum(int(line.rsplit(" ", 1)[1]) for line in folded) == profile.total
+        assert any(";claimall_" in line for line in folded)            # the method's subroutine frame
@@ -0,0 +1,229 @@
+"""
+Read API — cached will state, ETags and long-polls in front of algod
+=====================================================================
+Serves client/read_api.py from a `WillIndex` following
+`avm.algod.AlgodStandIn`, and counts what reaches the stand-in: repeated
+reads of an unchanged will must not.
+
+Run:
+    pytest tests/test_read_api.py -v
+"""
+
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+from algosdk import account
+from algosdk.error import AlgodHTTPError
+
+from client import read_api
+from client.indexer import BlockIndexer, WillIndex
+from client.read_api import ReadAPI, WillReader
+from tests.standin import APPROVAL, SPEC, BoxFault, Flaky, call, deploy_wills, tick
+
+
+class LockProbe:
+    """`algod`, recording whether another thread could take `lock` during each app read."""
+
+    def __init__(self, algod, lock):
+        self.algod, self.lock, self.free = algod, lock, []
+
+    def __getattr__(self, name):
+        return getattr(self.algod, name)
+
+    def application_info(self, app_id: int) -> dict:
+        def take():
+            taken = self.lock.acquire(timeout=2)
+            self.free.append(taken)
+            if taken:
+                self.lock.release()
+        thread = threading.Thread(target=take)
+        thread.start()
+        thread.join()
+        return self.algod.application_info(app_id)
+
+
+def serve(algod, start_round: int = 1, **limits) -> ReadAPI:
+    index = WillIndex(":memory:", SPEC.contract, [APPROVAL])
+    return ReadAPI(WillReader(algod, index, BlockIndexer(algod, index, start_round=start_round), **limits))
+
+
+def get(url: str, etag: str | None = None) -> tuple[int, dict, dict | None]:
+    """(status, headers, JSON body or None) of one GET."""
+    request = urllib.request.Request(url, headers={"If-None-Match": etag} if etag else {})
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status, dict(response.headers), json.loads(response.read())
+    except urllib.error.HTTPError as error:
+        return error.code, dict(error.headers), None
+
+
+class TestReadAPI:
+    def test_will_state_with_etag(self, chain):
+        ledger, algod, _ = chain
+        owner_key = account.generate_account()[0]
+        (app_id, _), = deploy_wills(ledger, algod, [3600], owner_key)
+        with serve(algod) as api:
+            status, headers, will = get(f"{api.url}/wills/{app_id}")
+            assert status == 200
+            assert will["owner"] == account.address_from_private_key(owner_key)
+            assert (will["will_created"], will["inheritance_active"], will["heir_count"]) == (1, 0, 1)
+            assert will["deadline"] == will["last_checkin"] + 3600
+            assert [h["percent"] for h in will["heirs"]] == [100]
+            assert headers["ETag"] == f'"{app_id}-{will["updated_round"]}"'
+
+            status, _, body = get(f"{api.url}/wills/{app_id}", headers["ETag"])
+            assert (status, body) == (304, None)
+            assert get(f"{api.url}/wills/999999")[0] == 404
+
+    def test_repeated_reads_stay_off_algod(self, chain):
+        ledger, algod, node = chain
+        wills = [app_id for app_id, _ in deploy_wills(ledger, algod, [3600] * 3)]
+        with serve(algod) as api:
+            etags = {app_id: get(f"{api.url}/wills/{app_id}")[1]["ETag"] for app_id in wills}
+            before = node.requests
+            for _ in range(50):
+                for app_id in wills:
+                    assert get(f"{api.url}/wills/{app_id}", etags[app_id])[0] == 304
+            assert node.requests - before <= 2                 # the follower's wait, not the reads
+            assert api.not_modified == 150
+            assert api.reader.upstream == 0                    # all three came from blocks
+
+    def test_check_in_wakes_a_long_poll(self, chain):
+        ledger, algod, _ = chain
+        owner_key = account.generate_account()[0]
+        (app_id, _), = deploy_wills(ledger, algod, [3600], owner_key)
+        with serve(algod) as api:
+            _, headers, will = get(f"{api.url}/wills/{app_id}")
+            first = will["updated_round"]
+            assert get(f"{api.url}/wills/{app_id}?after={first}&timeout=0.2")[0] == 304
+
+            answer = {}
+            poll = threading.Thread(target=lambda: answer.update(r=get(f"{api.url}/wills/{app_id}?after={first}")))
+            poll.start()
+            ledger.advance(60)
+            tick(ledger, algod)
+            call(algod, app_id, owner_key, "check_in")
+            poll.join(timeout=10)
+
+            status, new_headers, fresh = answer["r"]
+            assert status == 200 and fresh["updated_round"] > first
+            assert fresh["last_checkin"] > will["last_checkin"]
+            assert new_headers["ETag"] != headers["ETag"]
+
+    def test_bad_long_poll_parameters(self, chain):
+        ledger, algod, _ = chain
+        (app_id, _), = deploy_wills(ledger, algod, [3600])
+        with serve(algod) as api:
+            for query in ("after=x", "after=1&timeout=abc", "after=-1", "after=1&timeout=-5", "after=1&timeout=nan"):
+                status, _, _ = get(f"{api.url}/wills/{app_id}?{query}")
+                assert status == 400, query
+            assert get(f"{api.url}/wills/{app_id}?after=0&timeout=0")[0] == 200
+
+    def test_wills_created_before_the_start_round_are_seeded(self, chain):
+        ledger, algod, node = chain
+        (app_id, _), = deploy_wills(ledger, algod, [3600])
+        with serve(algod, start_round=node.last_round() + 1) as api:
+            _, _, will = get(f"{api.url}/wills/{app_id}")
+            assert will["will_created"] and [h["percent"] for h in will["heirs"]] == [100]
+            seeded = api.reader.upstream
+            assert seeded == 3                                 # global state, one box, status
+            get(f"{api.url}/wills/{app_id}")
+            assert api.reader.upstream == seeded
+            assert api.reader.index.will(app_id)["inactivity_period"] == 3600
+
+    def test_seeding_refreshes_listings(self, chain):
+        ledger, algod, node = chain
+        owner_key = account.generate_account()[0]
+        (app_id, _), = deploy_wills(ledger, algod, [3600], owner_key)
+        owner = account.address_from_private_key(owner_key)
+        with serve(algod, start_round=node.last_round() + 1) as api:
+            assert get(f"{api.url}/wills?address={owner}")[2]["wills"] == []
+            assert get(f"{api.url}/wills/{app_id}")[0] == 200
+            listing = get(f"{api.url}/wills?address={owner}")[2]
+            assert [w["app_id"] for w in listing["wills"]] == [app_id]
+
+    @pytest.mark.parametrize("error", [OSError("connection reset"), AlgodHTTPError("box not found", 404)])
+    def test_failed_seed_is_a_bad_gateway(self, chain, error):
+        ledger, algod, node = chain
+        (app_id, _), = deploy_wills(ledger, algod, [3600])
+        with serve(BoxFault(algod, error), start_round=node.last_round() + 1) as api:
+            assert get(f"{api.url}/wills/{app_id}")[0] == 502
+            assert api.status()["errors"] == 1
+            assert get(f"{api.url}/wills/{app_id}")[0] == 200     # not remembered as missing
+
+    def test_wills_by_address(self, chain):
+        ledger, algod, _ = chain
+        owner_key = account.generate_account()[0]
+        wills = [app_id for app_id, _ in deploy_wills(ledger, algod, [60, 3600], owner_key)]
+        owner = account.address_from_private_key(owner_key)
+        with serve(algod) as api:
+            status, headers, listing = get(f"{api.url}/wills?address={owner}")
+            assert status == 200
+            assert [w["app_id"] for w in listing["wills"]] == wills
+            assert get(f"{api.url}/wills?address={owner}", headers["ETag"])[0] == 304
+            assert get(f"{api.url}/wills")[0] == 400
+
+    def test_follower_waits_for_the_start_round(self, chain):
+        ledger, algod, node = chain
+        deploy_wills(ledger, algod, [3600])
+        with serve(algod, start_round=node.last_round() + 1) as api:
+            before = node.requests
+            time.sleep(0.3)
+            assert node.requests - before <= 2                 # one held wait, not a busy loop
+            assert api.reader.round == node.last_round()
+
+    def test_unknown_ids_cannot_drive_algod(self, chain):
+        ledger, algod, node = chain
+        (app_id, _), = deploy_wills(ledger, algod, [3600])
+        with serve(algod, start_round=node.last_round() + 1, seed_rate=0.01, seed_burst=2) as api:
+            assert get(f"{api.url}/wills/999999")[0] == 404       # one seed: no such app
+            seeded = api.reader.upstream
+            for _ in range(20):
+                assert get(f"{api.url}/wills/999999")[0] == 404
+            tick(ledger, algod)
+            assert get(f"{api.url}/wills/999999")[0] == 404
+            assert api.reader.upstream == seeded                  # not asked again, even a round later
+            assert get(f"{api.url}/wills/{app_id}")[0] == 200     # the burst's second seed
+            status, headers, _ = get(f"{api.url}/wills/999998")
+            assert status == 503 and headers["Retry-After"] == "1"
+            assert api.status()["limited"] == 1
+
+    def test_seeding_reads_algod_outside_the_index_lock(self, chain):
+        ledger, algod, node = chain
+        (app_id, _), = deploy_wills(ledger, algod, [3600])
+        api   = serve(algod, start_round=node.last_round() + 1)
+        probe = LockProbe(algod, api.reader.index.lock)
+        api.reader.algod = probe
+        assert api.reader.will(app_id) is not None
+        assert probe.free == [True]
+
+    def test_follower_retries_failed_refreshes(self, chain, monkeypatch):
+        monkeypatch.setattr(read_api, "RETRY_DELAY", 0.01)
+        ledger, algod, _ = chain
+        owner_key = account.generate_account()[0]
+        (app_id, _), = deploy_wills(ledger, algod, [3600], owner_key)
+        flaky = Flaky(algod)
+        with serve(flaky) as api:
+            first = get(f"{api.url}/wills/{app_id}")[2]["updated_round"]
+            flaky.failures = 3
+            tick(ledger, algod)                                # the follower's next waits fail
+            deadline = time.monotonic() + 5
+            while api.reader.errors < 3 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert api.reader.errors == 3 and api.status()["errors"] == 3
+
+            ledger.advance(60)
+            call(algod, app_id, owner_key, "check_in")
+            status, _, will = get(f"{api.url}/wills/{app_id}?after={first}")
+            assert status == 200 and will["updated_round"] > first
+
+    def test_stop_without_start(self, chain):
+        api     = serve(chain[1])
+        stopper = threading.Thread(target=api.stop)
+        stopper.start()
+        stopper.join(timeout=5)
+        assert not stopper.is_alive()
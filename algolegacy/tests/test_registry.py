@@ -0,0 +1,231 @@
+"""
+AlgoLegacy Registry — many wills in one app
+============================================
+Runs the registry contract on the in-process AVM: wills are created with a
+single app call, keep their funds apart, and free their boxes on revoke.
+
+Run:
+    pytest tests/test_registry.py -v
+"""
+
+import pytest
+
+from avm import AlgodStandIn, AppClient, Ledger, LogicError
+from client.registry import RegistryClient, create_will_boxes, decode_will_ids, index_storage_cost
+from client.transport import PooledAlgodClient
+from contracts.registry import (
+    GLOBAL_NUM_BYTE_SLICES,
+    GLOBAL_NUM_UINTS,
+    INDEX_BOX_MBR,
+    heir_box_name,
+    index_box_name,
+    will_box_name,
+    will_storage_cost,
+)
+from contracts.build_cache import build
+
+SPEC      = build("AlgoLegacyRegistry")[0]
+PERIOD    = 60
+DEPOSIT   = 3_000_000
+SHARES    = (50, 30, 20)
+INNER_FEE = 2000
+
+
+def will_boxes(will_id: int, slots) -> list[tuple[int, bytes]]:
+    return [(0, will_box_name(will_id))] + [(0, heir_box_name(will_id, s)) for s in slots]
+
+
+class Registry:
+    """One deployed registry plus helpers that fill in payments and box references."""
+
+    def __init__(self, ledger: Ledger):
+        self.ledger  = ledger
+        self.creator = ledger.new_account(10_000_000)
+        self.client  = AppClient(ledger, SPEC, sender=self.creator)
+        self.client.create(global_schema=(GLOBAL_NUM_UINTS, GLOBAL_NUM_BYTE_SLICES), extra_pages=1)
+        ledger.fund(self.client.app_address, 100_000)
+
+    def as_(self, sender: str) -> AppClient:
+        return self.client.prepare(sender=sender)
+
+    def indexed(self, address: str, will_id: int) -> bool:
+        return self.client.get_box(index_box_name(address, will_id)) is not None
+
+    def storage_cost(self, heirs: list[str], will_id: int) -> int:
+        return will_storage_cost(len(heirs)) + index_storage_cost(heirs, will_id, self.indexed)
+
+    def wills_for(self, address: str) -> list[int]:
+        return decode_will_ids(self.ledger.apps[self.client.app_id].boxes, address)
+
+    def create_will(self, owner: str, heirs: list[str], pcts=SHARES, deposit=DEPOSIT) -> int:
+        will_id = self.client.get_global_state().get("will_count", 0) + 1
+        client  = self.as_(owner)
+        boxes   = create_will_boxes(will_id, heirs)
+        result  = client.call(
+            "create_will", storage=client.pay(owner, self.storage_cost(heirs, will_id)),
+            period=PERIOD, heirs=list(zip(heirs, pcts)), boxes=boxes,
+        )
+        assert result.return_value == will_id
+        if deposit:
+            client.call("deposit", payment=client.pay(owner, deposit), will_id=will_id,
+                        boxes=boxes[:1])
+        return will_id
+
+
+@pytest.fixture
+def ledger():
+    return Ledger()
+
+
+@pytest.fixture
+def registry(ledger):
+    return Registry(ledger)
+
+
+@pytest.fixture
+def people(ledger):
+    owner = ledger.new_account(20_000_000)
+    heirs = [ledger.new_account(1_000_000) for _ in range(3)]
+    return owner, heirs
+
+
+class TestRegistryWills:
+    def test_create_will_is_one_call_with_no_deployment(self, ledger, registry, people):
+        owner, heirs = people
+        apps_before = len(ledger.apps)
+        will_id = registry.create_will(owner, heirs, deposit=0)
+        assert will_id == 1
+        assert len(ledger.apps) == apps_before
+        record = registry.as_(owner).call("get_will", will_id=will_id, boxes=will_boxes(1, [])).return_value
+        assert record[0] == owner
+        assert record[4:] == [3, 100, False]
+
+    def test_storage_payment_must_match(self, registry, people):
+        owner, heirs = people
+        client = registry.as_(owner)
+        with pytest.raises(LogicError, match="storage cost"):
+            client.call(
+                "create_will", storage=client.pay(owner, will_storage_cost(3)),  # index not paid
+                period=PERIOD, heirs=list(zip(heirs, SHARES)),
+                boxes=create_will_boxes(1, heirs),
+            )
+
+    def test_wills_keep_funds_apart(self, ledger, registry, people):
+        owner, heirs = people
+        other_owner = ledger.new_account(20_000_000)
+        other_heirs = [ledger.new_account(1_000_000) for _ in range(3)]
+        first  = registry.create_will(owner, heirs)
+        second = registry.create_will(other_owner, other_heirs, deposit=6_000_000)
+
+        ledger.advance(PERIOD + 1)
+        registry.as_(owner).call("activate_inheritance", will_id=second, boxes=will_boxes(second, []))
+        heir = registry.as_(other_heirs[0])
+        paid = heir.call("claim", will_id=second, beneficiary_slot=1, fee=INNER_FEE,
+                         boxes=will_boxes(second, [1])).return_value
+        assert paid == 3_000_000
+
+        status = registry.as_(owner).call("get_will_status", will_id=first, boxes=will_boxes(first, []))
+        assert status.return_value == "READY_TO_ACTIVATE"
+        registry.as_(owner).call("activate_inheritance", will_id=first, boxes=will_boxes(first, []))
+        with pytest.raises(LogicError, match="Not the beneficiary"):
+            heir.call("claim", will_id=first, beneficiary_slot=1, fee=INNER_FEE,
+                      boxes=will_boxes(first, [1]))
+        paid = registry.as_(heirs[0]).call("claim", will_id=first, beneficiary_slot=1, fee=INNER_FEE,
+                                           boxes=will_boxes(first, [1])).return_value
+        assert paid == DEPOSIT // 2
+
+    def test_missing_heir_box_is_a_bad_slot(self, ledger, registry, people):
+        owner, heirs = people
+        will_id = registry.create_will(owner, heirs)
+        del ledger.apps[registry.client.app_id].boxes[heir_box_name(will_id, 2)]
+        ledger.advance(PERIOD + 1)
+        registry.as_(owner).call("activate_inheritance", will_id=will_id, boxes=will_boxes(will_id, []))
+        with pytest.raises(LogicError, match="Invalid beneficiary slot"):
+            registry.as_(heirs[1]).call("claim", will_id=will_id, beneficiary_slot=2, fee=INNER_FEE,
+                                        boxes=will_boxes(will_id, [2]))
+
+    def test_check_in_only_by_owner(self, registry, people):
+        owner, heirs = people
+        will_id = registry.create_will(owner, heirs)
+        with pytest.raises(LogicError, match="Only owner"):
+            registry.as_(heirs[0]).call("check_in", will_id=will_id, boxes=will_boxes(will_id, []))
+
+    def test_revoke_frees_boxes_and_refunds_storage(self, ledger, registry, people):
+        owner, heirs = people
+        will_id = registry.create_will(owner, heirs)
+        before  = ledger.balance(owner)
+        refund  = registry.as_(owner).call(
+            "revoke_will", will_id=will_id, fee=INNER_FEE, boxes=create_will_boxes(will_id, heirs),
+        ).return_value
+        assert refund == DEPOSIT + will_storage_cost(3) + 3 * INDEX_BOX_MBR
+        assert ledger.balance(owner) == before - INNER_FEE + refund
+        assert ledger.apps[registry.client.app_id].boxes == {}
+        status = registry.as_(owner).call("get_will_status", will_id=will_id, boxes=will_boxes(will_id, []))
+        assert status.return_value == "NO_WILL"
+
+
+class TestBeneficiaryIndex:
+    def test_lists_every_will_naming_the_address(self, ledger, registry, people):
+        owner, heirs = people
+        shared = heirs[0]
+        others = [ledger.new_account(1_000_000) for _ in range(2)]
+        first  = registry.create_will(owner, heirs)
+        second = registry.create_will(owner, [others[0], shared, others[1]])
+        assert registry.wills_for(shared) == [first, second]
+        assert registry.wills_for(heirs[1]) == [first]
+        assert registry.wills_for(owner) == []
+
+    def test_each_will_pays_for_its_own_entries(self, ledger, registry, people):
+        owner, heirs = people
+        first = registry.create_will(owner, heirs)
+        assert registry.storage_cost(heirs, first + 1) == will_storage_cost(3) + 3 * INDEX_BOX_MBR
+        # A heir named twice is indexed once, and not again by add_heirs
+        assert index_storage_cost([heirs[0], heirs[0]], first + 1, registry.indexed) == INDEX_BOX_MBR
+        assert index_storage_cost([heirs[0]], first, registry.indexed) == 0
+        entry = ledger.apps[registry.client.app_id].boxes[index_box_name(heirs[0], first)]
+        assert entry == b""
+
+    def test_duplicate_heir_is_indexed_and_refunded_once(self, ledger, registry, people):
+        owner, heirs = people
+        twice   = [heirs[0], heirs[1], heirs[0]]
+        will_id = registry.create_will(owner, twice)
+        assert registry.wills_for(heirs[0]) == [will_id]
+        refund = registry.as_(owner).call(
+            "revoke_will", will_id=will_id, fee=INNER_FEE, boxes=create_will_boxes(will_id, twice),
+        ).return_value
+        assert refund == DEPOSIT + will_storage_cost(3) + 2 * INDEX_BOX_MBR
+        assert ledger.apps[registry.client.app_id].boxes == {}
+
+    def test_revoke_drops_the_will_from_the_index(self, ledger, registry, people):
+        owner, heirs = people
+        first  = registry.create_will(owner, heirs)
+        second = registry.create_will(owner, heirs)
+        registry.as_(owner).call(
+            "revoke_will", will_id=first, fee=INNER_FEE, boxes=create_will_boxes(first, heirs),
+        )
+        assert registry.wills_for(heirs[2]) == [second]
+        assert not registry.indexed(heirs[2], first) and registry.indexed(heirs[2], second)
+        registry.as_(owner).call(
+            "revoke_will", will_id=second, fee=INNER_FEE, boxes=create_will_boxes(second, heirs),
+        )
+        assert registry.wills_for(heirs[2]) == []
+        assert ledger.apps[registry.client.app_id].boxes == {}
+
+    def test_lookup_pages_through_the_address_prefix_only(self, ledger, registry, people):
+        owner, heirs = people
+        wills = [registry.create_will(owner, heirs, deposit=0) for _ in range(5)]
+        others = [ledger.new_account(1_000_000) for _ in range(3)]
+        registry.create_will(owner, others, deposit=0)
+        with AlgodStandIn(ledger) as node:
+            client = RegistryClient(PooledAlgodClient("", node.url), registry.client.app_id, page_size=2)
+            before = node.requests
+            assert client.wills_for(heirs[1]) == wills
+            assert node.requests - before == 3          # 2 + 2 + 1 entries, nothing else listed
+            assert client.wills_for(others[0]) == [wills[-1] + 1]
+            assert client.wills_for(owner) == []
+
+    def test_box_reference_limit(self, ledger, people):
+        _, heirs = people
+        assert len(create_will_boxes(1, heirs)) == 7
+        with pytest.raises(ValueError, match="add_heirs"):
+            create_will_boxes(1, heirs + [ledger.new_account(0)])
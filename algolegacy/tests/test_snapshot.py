@@ -0,0 +1,109 @@
+"""
+Will snapshots — get_will_snapshot, batched through simulate
+=============================================================
+Reads wills on `avm.algod.AlgodStandIn` with client/snapshot.py: one
+simulate request per 16 wills, each snapshot agreeing with the separate
+read-only methods, and an unreadable or non-will app costing only its
+own entry.
+
+Run:
+    pytest tests/test_snapshot.py -v
+"""
+
+from algosdk import account
+
+from avm import AppCall, AppClient
+from client.snapshot import SnapshotReader
+from contracts.algolegacy import GLOBAL_NUM_BYTE_SLICES, GLOBAL_NUM_UINTS, HEIR_BOX_MBR, heir_box_name
+from tests.standin import SPEC, FlakySimulate, call, deploy_wills
+
+# Approve any call without returning a value; and return one that is not a snapshot
+SILENT = "#pragma version 8\nintcblock 1\nintc_0"
+BOGUS  = "#pragma version 8\nbytecblock 0x151f7c7500\nintcblock 1\nbytec_0\nlog\nintc_0"
+
+
+def reader_for(ledger, algod) -> SnapshotReader:
+    sender = ledger.new_account()
+    ledger.fund(sender, 1_000_000)
+    return SnapshotReader(algod, sender)
+
+
+class TestSnapshots:
+    def test_one_simulate_per_sixteen_wills(self, chain):
+        ledger, algod, node = chain
+        owner_key = account.generate_account()[0]
+        wills = [app_id for app_id, _ in deploy_wills(ledger, algod, [3600] * 20, owner_key)]
+        call(algod, wills[0], owner_key, "force_activate")
+
+        before = node.simulated
+        snapshots, failed = reader_for(ledger, algod).read(wills)
+        assert node.simulated - before == 2 and not failed
+        assert list(snapshots) == wills
+        assert snapshots[wills[0]].status == "INHERITANCE_ACTIVE"
+        for app_id in wills[1:]:
+            state = ledger.apps[app_id].global_state
+            assert snapshots[app_id].status == "ALIVE"
+            assert snapshots[app_id].time_remaining == state[b"last_checkin"] + 3600 - ledger.timestamp
+            assert (snapshots[app_id].locked_balance, snapshots[app_id].asa_id) == (0, 0)
+            assert snapshots[app_id].claimed == (False,)
+
+    def test_unreadable_app_fails_alone(self, chain):
+        ledger, algod, node = chain
+        wills = [app_id for app_id, _ in deploy_wills(ledger, algod, [60, 120, 180])]
+        before = node.simulated
+        snapshots, failed = reader_for(ledger, algod).read([wills[0], 999_999, *wills[1:]])
+        assert list(failed) == [999_999]
+        assert sorted(snapshots) == wills
+        assert node.simulated - before == 1 + 4                 # the group, then each of its calls
+
+    def test_unreachable_algod_fails_the_group(self, chain):
+        ledger, algod, node = chain
+        wills = [app_id for app_id, _ in deploy_wills(ledger, algod, [60, 120, 180])]
+        flaky = FlakySimulate(algod, 1)                         # the group; each will alone then reads
+        snapshots, failed = reader_for(ledger, flaky).read(wills)
+        assert sorted(snapshots) == wills and not failed
+
+        flaky.failures = 10**6
+        snapshots, failed = reader_for(ledger, flaky).read(wills)
+        assert snapshots == {} and sorted(failed) == wills
+        assert set(failed.values()) == {"connection reset"}
+
+    def test_non_will_app_fails_alone_in_its_group(self, chain):
+        ledger, algod, node = chain
+        wills = [app_id for app_id, _ in deploy_wills(ledger, algod, [60, 120, 180])]
+        creator = ledger.new_account(1_000_000)
+        others  = [
+            ledger.send([AppCall(creator, approval_program=teal, clear_program=SILENT)])[0].application_index
+            for teal in (SILENT, BOGUS)
+        ]
+        before = node.simulated
+        snapshots, failed = reader_for(ledger, algod).read([wills[0], others[0], *wills[1:], others[1]])
+        assert node.simulated - before == 1                     # the group succeeded: no per-app retries
+        assert sorted(failed) == others
+        assert "returned no value" in failed[others[0]] and "malformed" in failed[others[1]]
+        assert sorted(snapshots) == wills
+
+    def test_agrees_with_the_separate_reads(self, chain):
+        ledger, algod, _ = chain
+        owner  = ledger.new_account()
+        heirs  = [ledger.new_account() for _ in range(9)]        # more heir boxes than one call may name
+        for person in (owner, *heirs):
+            ledger.fund(person, 10_000_000)
+        client = AppClient(ledger, SPEC, sender=owner)
+        client.create(global_schema=(GLOBAL_NUM_UINTS, GLOBAL_NUM_BYTE_SLICES), extra_pages=1)
+        ledger.fund(client.app_address, 100_000 + HEIR_BOX_MBR * len(heirs))
+        boxes = [(0, heir_box_name(slot)) for slot in range(1, len(heirs) + 1)]
+        client.call("create_will", period=60, heirs=[(heir, 10) for heir in heirs[:5]], boxes=boxes[:5])
+        client.call("add_heirs", heirs=list(zip(heirs[5:], [10, 10, 10, 20])), boxes=boxes[5:])
+        client.call("deposit", payment=client.pay(owner, 2_000_000))
+        client.call("force_activate")
+        client.call("claim", sender=heirs[2], beneficiary_slot=3, boxes=boxes[2:3], fee=2000)
+
+        snapshot = reader_for(ledger, algod).read([client.app_id])[0][client.app_id]
+        assert (snapshot.status, snapshot.time_remaining, snapshot.locked_balance) == (
+            client.call("get_will_status").return_value,
+            client.call("get_time_remaining").return_value,
+            client.call("get_locked_balance").return_value,
+        )
+        assert snapshot.claimed == (False, False, True, False, False, False, False, False, False)
+        assert snapshot.unclaimed_slots == [1, 2, 4, 5, 6, 7, 8, 9]
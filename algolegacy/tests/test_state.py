@@ -0,0 +1,70 @@
+"""
+Will state — batched global-state reads decoded into WillState
+===============================================================
+Decodes algod `global-state` lists with client/state.py, and reads live
+wills concurrently from `avm.algod.AlgodStandIn`.
+
+Run:
+    pytest tests/test_state.py -v
+"""
+
+import base64
+import os
+
+from algosdk import account, encoding
+
+from client.state import WillState, _address, decode_global_state, read_states
+from tests.standin import call, deploy_wills
+
+
+def item(key: bytes, value: int | bytes) -> dict:
+    if isinstance(value, bytes):
+        return {"key": base64.b64encode(key).decode(), "value": {"type": 1, "bytes": base64.b64encode(value).decode(), "uint": 0}}
+    return {"key": base64.b64encode(key).decode(), "value": {"type": 2, "bytes": "", "uint": value}}
+
+
+class TestWillState:
+    def test_owner_address_matches_algosdk(self):
+        keys = [bytes(32), b"\xff" * 32] + [os.urandom(32) for _ in range(50)]
+        for key in keys:
+            assert _address(key) == encoding.encode_address(key)
+
+    def test_decodes_fields_and_derives_status_and_deadline(self):
+        owner = account.generate_account()[1]
+        items = [
+            item(b"owner", encoding.decode_address(owner)),
+            item(b"inactivity_period", 3600),
+            item(b"last_checkin", 1_000_000),
+            item(b"status", 1 | 60 << 8 | 2 << 16),
+            item(b"unrelated", 7),
+        ]
+        state = WillState.decode(42, items)
+        assert (state.app_id, state.owner, state.total_locked) == (42, owner, 0)   # absent uints are zero
+        assert (state.will_created, state.inheritance_active, state.percent_total, state.heir_count) == (1, 0, 60, 2)
+        assert state.deadline == 1_003_600 and state.is_live
+        assert not state.is_due(1_003_600) and state.is_due(1_003_601)
+        assert (state.time_remaining(1_000_600), state.time_remaining(2_000_000)) == (3000, 0)
+        assert not hasattr(state, "__dict__")
+
+    def test_agrees_with_the_dict_decoder(self):
+        items = [item(b"owner", bytes(range(32))), item(b"total_locked", 5), item(b"status", 3)]
+        state, raw = WillState.decode(1, items), decode_global_state(items)
+        assert state.owner_bytes == raw[b"owner"]
+        assert (state.total_locked, state.status, state.inheritance_active) == (5, 3, 1)
+        assert not state.is_live and WillState.decode(2, []).owner is None
+
+    def test_reads_many_apps_concurrently(self, chain):
+        ledger, algod, _ = chain
+        owner_key = account.generate_account()[0]
+        wills = [app_id for app_id, _ in deploy_wills(ledger, algod, [60 * (i + 1) for i in range(12)], owner_key)]
+        call(algod, wills[0], owner_key, "force_activate")
+
+        states, missing, failed = read_states(algod, [*wills, 999_999, wills[1]], workers=4)
+        assert list(missing) == [999_999] and failed == {}
+        assert list(states) == wills
+        assert [states[a].inactivity_period for a in wills] == [60 * (i + 1) for i in range(12)]
+        assert {states[a].owner for a in wills} == {account.address_from_private_key(owner_key)}
+        assert [states[a].is_live for a in wills[:2]] == [False, True]
+        for app_id in wills:
+            on_chain = ledger.apps[app_id].global_state
+            assert states[app_id].deadline == on_chain[b"last_checkin"] + on_chain[b"inactivity_period"]
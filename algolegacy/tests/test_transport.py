@@ -0,0 +1,125 @@
+"""
+Transport — rate limiting, keep-alive and 429 handling
+=======================================================
+Checks client/transport.py: the token bucket against a fake clock, and
+`PooledAlgodClient` against a local HTTP server that counts connections
+and answers 429 with a Retry-After.
+
+Run:
+    pytest tests/test_transport.py -v
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from algosdk.error import AlgodHTTPError
+
+from client.transport import PooledAlgodClient, RateLimiter, retry_after
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def algod():
+    """A fake algod: `/v2/status` answers the queued statuses, then 200."""
+    state = {"ports": set(), "requests": 0, "queue": []}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            state["ports"].add(self.client_address[1])
+            state["requests"] += 1
+            status, headers = state["queue"].pop(0) if state["queue"] else (200, {})
+            body = json.dumps({"last-round": 7} if status == 200 else {"message": "slow down"}).encode()
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    state["url"] = f"http://127.0.0.1:{server.server_address[1]}"
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+class TestRateLimiter:
+    def test_burst_then_steady_rate(self, clock):
+        limiter = RateLimiter(4, burst=2, clock=clock, sleep=clock.sleep)
+        for _ in range(2):
+            limiter.acquire()
+        assert clock.now == 100.0                 # the burst is free
+        for _ in range(4):
+            limiter.acquire()
+        assert clock.now == pytest.approx(101.0)  # then 4 per second
+
+    def test_waiters_queue_without_sharing_a_token(self, clock):
+        limiter = RateLimiter(2, burst=1, clock=clock, sleep=clock.sleep)
+        assert [limiter.reserve() for _ in range(3)] == pytest.approx([0, 0.5, 1.0])
+
+    def test_pause_delays_everyone(self, clock):
+        limiter = RateLimiter(10, burst=10, clock=clock, sleep=clock.sleep)
+        limiter.pause(3)
+        assert limiter.reserve() == pytest.approx(3.1)
+        assert RateLimiter(None, clock=clock).reserve() == 0
+
+    def test_try_acquire_refuses_instead_of_waiting(self, clock):
+        limiter = RateLimiter(2, burst=2, clock=clock, sleep=clock.sleep)
+        assert [limiter.try_acquire() for _ in range(3)] == [True, True, False]
+        clock.now += 0.5
+        assert limiter.try_acquire() and not limiter.try_acquire()
+        limiter.reserve()                         # a waiter holds the next token
+        clock.now += 0.5
+        assert not limiter.try_acquire()
+
+    def test_retry_after_header(self):
+        assert retry_after("2") == 2
+        assert retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0   # in the past
+        assert retry_after(None) is None and retry_after("soon") is None
+
+
+class TestPooledAlgodClient:
+    def test_connections_are_reused(self, algod):
+        client = PooledAlgodClient("", algod["url"])
+        for _ in range(5):
+            assert client.status()["last-round"] == 7
+        assert algod["requests"] == 5
+        assert client.pool.opened == 1 and len(algod["ports"]) == 1
+
+    def test_429_waits_for_retry_after(self, algod):
+        waits = []
+        algod["queue"] = [(429, {"Retry-After": "0"}), (429, {"Retry-After": "0"})]
+        client = PooledAlgodClient("", algod["url"])
+        client.on_rate_limited = lambda wait, attempt: waits.append((wait, attempt))
+        assert client.status()["last-round"] == 7
+        assert waits == [(0, 1), (0, 2)]
+
+    def test_gives_up_after_max_retries(self, algod):
+        algod["queue"] = [(429, {"Retry-After": "0"})] * 3
+        client = PooledAlgodClient("", algod["url"], max_retries=2)
+        with pytest.raises(AlgodHTTPError) as exc:
+            client.status()
+        assert exc.value.code == 429 and str(exc.value) == "slow down"
@@ -0,0 +1,184 @@
+"""
+Will fixtures — independent wills in a chosen lifecycle state
+==============================================================
+Every test gets its own will, already created, funded and driven to the
+state it needs, so tests no longer depend on running in file order and
+can be spread across cores with `pytest -n auto`.
+
+  avm       One template ledger per worker holds a will in every state.
+            Each test forks it (a state copy, no re-execution).
+  localnet  Wills are built on demand with fresh accounts.  Chain time is
+            shared by every worker, so advancing it in one test ages the
+            ALIVE wills of others; run localnet serially when that matters.
+"""
+
+from dataclasses import dataclass
+from enum import Enum
+
+from contracts.algolegacy import heir_box_name
+
+DEMO_INACTIVITY_PERIOD = 60       # seconds; the contract minimum
+DEPOSIT                = 3_000_000
+SHARES                 = (50, 30, 20)
+INNER_TXN_FEE          = 2000     # outer fee covering one zero-fee inner payment
+
+
+class Lifecycle(str, Enum):
+    """Will states; the first four match `get_will_status()`."""
+    NO_WILL            = "NO_WILL"             # deployed + funded, create_will not called
+    ALIVE              = "ALIVE"               # created, deposited, owner just checked in
+    READY_TO_ACTIVATE  = "READY_TO_ACTIVATE"   # inactivity period has elapsed
+    INHERITANCE_ACTIVE = "INHERITANCE_ACTIVE"  # activated, nothing claimed
+    PARTLY_CLAIMED     = "PARTLY_CLAIMED"      # activated, slot 1 claimed
+
+
+@dataclass
+class Will:
+    backend:  object
+    client:   object           # app client signing as the owner
+    owner:    dict
+    heirs:    list[dict]       # beneficiaries for slots 1..3
+    stranger: dict             # funded account with no role in the will
+
+    @property
+    def app_id(self) -> int:
+        return self.client.app_id
+
+    def client_as(self, acct: dict):
+        return self.backend.client_for(self.app_id, acct)
+
+    def rebind(self, backend) -> "Will":
+        """The same will, seen through another backend (e.g. a forked ledger)."""
+        return Will(backend, backend.client_for(self.app_id, self.owner),
+                    self.owner, self.heirs, self.stranger)
+
+
+def heir_boxes(*slots: int) -> list[tuple[int, bytes]]:
+    """Box references for beneficiary `slots` of the called app."""
+    return [(0, heir_box_name(slot)) for slot in slots]
+
+
+def claim_args(slot: int) -> dict:
+    """`claim` keyword arguments for `slot`: its box reference and the inner-payment fee."""
+    return {"beneficiary_slot": slot, "fee": INNER_TXN_FEE, "boxes": heir_boxes(slot)}
+
+
+def claim_all_args(will: Will, payouts: int) -> dict:
+    """`claim_all` keyword arguments: every heir's box and account, one inner fee per payout."""
+    return {
+        "fee":      1000 * (1 + payouts),
+        "boxes":    heir_boxes(*range(1, len(will.heirs) + 1)),
+        "accounts": [heir["address"] for heir in will.heirs],
+    }
+
+
+def will_args(heirs: list[dict], pcts=SHARES, period=DEMO_INACTIVITY_PERIOD) -> dict:
+    """`create_will` keyword arguments (box references included) for slots 1..len(heirs)."""
+    return {
+        "period": period,
+        "heirs":  [(heir["address"], pct) for heir, pct in zip(heirs, pcts)],
+        "boxes":  heir_boxes(*range(1, len(heirs) + 1)),
+    }
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Building
+# ─────────────────────────────────────────────────────────────────────────────
+def bootstrap_wills(backend, lifecycles: list[Lifecycle]) -> list[Will]:
+    """Deploy and fund one will per entry, up to ALIVE (or NO_WILL).
+
+    Everything goes out in atomic groups of ≤ 16 via `backend.batch()`:
+
+      1. fund owner, heirs and stranger, then create the app
+      2. fund each app account — its balance backs the beneficiary boxes —
+         then `create_will` and the owner's `deposit` (skipped for NO_WILL)
+
+    so a single will costs two confirmations however many accounts it has.
+    No time is advanced.
+    """
+    people = [
+        (backend.generate_account(), [backend.generate_account() for _ in range(3)],
+         backend.generate_account())
+        for _ in lifecycles
+    ]
+
+    setup = backend.batch()
+    for lifecycle, (owner, heirs, stranger) in zip(lifecycles, people):
+        setup.pay(owner["address"], 10_000_000)
+        for heir in heirs:
+            setup.pay(heir["address"], 1_000_000)
+        setup.pay(stranger["address"], 2_000_000)
+        setup.create(owner)
+    clients = [c for c in setup.send() if c is not None]
+
+    funding = backend.batch()
+    for lifecycle, client, (owner, heirs, _) in zip(lifecycles, clients, people):
+        funding.pay(client.app_address, 1_000_000)
+        if lifecycle is not Lifecycle.NO_WILL:
+            funding.call(client, "create_will", sender=owner, **will_args(heirs))
+            funding.call(
+                client, "deposit", sender=owner,
+                payment=backend.payment(owner, client.app_address, DEPOSIT),
+            )
+    funding.send()
+
+    return [
+        Will(backend, backend.client_for(client.app_id, owner), owner, heirs, stranger)
+        for client, (owner, heirs, stranger) in zip(clients, people)
+    ]
+
+
+def deploy_will(backend, lifecycle: Lifecycle) -> Will:
+    """Deploy and fund a single will up to ALIVE (or NO_WILL)."""
+    return bootstrap_wills(backend, [lifecycle])[0]
+
+
+def finish_will(will: Will, lifecycle: Lifecycle) -> None:
+    """Drive a will whose inactivity period has elapsed on to `lifecycle`."""
+    if lifecycle in (Lifecycle.INHERITANCE_ACTIVE, Lifecycle.PARTLY_CLAIMED):
+        will.client.call("activate_inheritance")
+    if lifecycle is Lifecycle.PARTLY_CLAIMED:
+        will.client_as(will.heirs[0]).call("claim", **claim_args(1))
+
+
+def _needs_elapsed_period(lifecycle: Lifecycle) -> bool:
+    return lifecycle not in (Lifecycle.NO_WILL, Lifecycle.ALIVE)
+
+
+def build_will(backend, lifecycle: Lifecycle) -> Will:
+    """Build one will from scratch in `lifecycle`."""
+    will = deploy_will(backend, lifecycle)
+    if _needs_elapsed_period(lifecycle):
+        backend.advance_time(DEMO_INACTIVITY_PERIOD + 5)
+        finish_will(will, lifecycle)
+    return will
+
+
+def build_template(backend) -> dict[Lifecycle, Will]:
+    """One will per lifecycle state, all on `backend`'s ledger.
+
+    The expired-period states are built first and time is advanced once;
+    NO_WILL and ALIVE are built afterwards so their clocks start fresh.
+    """
+    late  = [s for s in Lifecycle if _needs_elapsed_period(s)]
+    early = [s for s in Lifecycle if not _needs_elapsed_period(s)]
+    wills = dict(zip(late, bootstrap_wills(backend, late)))
+    backend.advance_time(DEMO_INACTIVITY_PERIOD + 5)
+    for state in late:
+        finish_will(wills[state], state)
+    wills.update(zip(early, bootstrap_wills(backend, early)))
+    return wills
+
+
+class WillFactory:
+    """`make_will(lifecycle)` — hands out template wills first, then builds new ones."""
+
+    def __init__(self, backend, template: dict[Lifecycle, Will] | None = None):
+        self.backend  = backend
+        self.template = dict(template or {})
+
+    def __call__(self, lifecycle: Lifecycle = Lifecycle.ALIVE) -> Will:
+        will = self.template.pop(lifecycle, None)
+        if will is not None:
+            return will.rebind(self.backend)
+        return build_will(self.backend, lifecycle)